@@ -14,7 +14,8 @@ from langflow.api.utils import (
     CurrentActiveUser,
     EventDeliveryType,
     build_graph_from_data,
-    build_graph_from_db,
+    build_graph_from_db_no_cache,
+    flow_version,
     format_elapsed_time,
     format_exception_message,
     get_top_level_vertices,
@@ -27,6 +28,7 @@ from langflow.api.v1.schemas import (
     VertexBuildResponse,
 )
 from langflow.events.event_manager import EventManager
+from langflow.events.event_queue import EventQueue
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.graph.base import Graph
 from langflow.graph.utils import log_vertex_build
@@ -34,7 +36,8 @@ from langflow.schema.message import ErrorMessage
 from langflow.schema.schema import OutputValue
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.deps import get_chat_service, get_telemetry_service, session_scope
-from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
+from langflow.services.job_queue.event_store import JOB_STATUS_RUNNING
+from langflow.services.job_queue.service import DistributedJobQueueService, JobQueueNotFoundError, JobQueueService
 from langflow.services.telemetry.schema import ComponentPayload, PlaygroundPayload
 
 
@@ -60,6 +63,8 @@ async def start_flow_build(
     job_id = str(uuid.uuid4())
     try:
         _, event_manager = queue_service.create_queue(job_id)
+        if isinstance(queue_service, DistributedJobQueueService):
+            await queue_service.register_job(job_id)
         task_coro = generate_flow_events(
             flow_id=flow_id,
             background_tasks=background_tasks,
@@ -85,8 +90,16 @@ async def get_flow_events_response(
     job_id: str,
     queue_service: JobQueueService,
     event_delivery: EventDeliveryType,
+    last_event_id: str | None = None,
 ):
     """Get events for a specific build job, either as a stream or single event."""
+    if isinstance(queue_service, DistributedJobQueueService):
+        return await get_distributed_flow_events_response(
+            job_id=job_id,
+            queue_service=queue_service,
+            event_delivery=event_delivery,
+            last_event_id=last_event_id,
+        )
     try:
         main_queue, event_manager, event_task, _ = queue_service.get_queue_data(job_id)
         if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
@@ -146,8 +159,55 @@ async def get_flow_events_response(
         raise HTTPException(status_code=500, detail=f"Unexpected error: {exc!s}") from exc
 
 
+async def get_distributed_flow_events_response(
+    *,
+    job_id: str,
+    queue_service: DistributedJobQueueService,
+    event_delivery: EventDeliveryType,
+    last_event_id: str | None = None,
+):
+    """Get events for a build job run by any worker, resuming after `last_event_id` if given.
+
+    The id of the last event returned by a poll is sent in the `X-Last-Event-Id` header.
+    """
+    try:
+        await queue_service.get_job_status(job_id)
+        if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
+
+            async def consume_and_yield() -> AsyncIterator[str]:
+                async for _, value in queue_service.stream_events(job_id, last_event_id):
+                    yield value.decode("utf-8")
+
+            async def on_disconnect() -> None:
+                logger.debug("Client disconnected, cancelling job")
+                await queue_service.cancel_job(job_id)
+
+            return DisconnectHandlerStreamingResponse(
+                consume_and_yield(),
+                media_type="application/x-ndjson",
+                on_disconnect=on_disconnect,
+            )
+
+        # Polling mode - wait for at least one event unless the job is over
+        entries = await queue_service.read_events(job_id, last_event_id, block=1.0)
+        while not entries and await queue_service.get_job_status(job_id) == JOB_STATUS_RUNNING:
+            entries = await queue_service.read_events(job_id, last_event_id, block=1.0)
+        content = "\n".join(value.decode("utf-8") for _, value in entries if value is not None)
+        headers = {"X-Last-Event-Id": entries[-1][0]} if entries else None
+        return Response(content=content, media_type="application/x-ndjson", headers=headers)
+    except JobQueueNotFoundError as exc:
+        logger.error(f"Job not found: {job_id}. Error: {exc!s}")
+        raise HTTPException(status_code=404, detail=f"Job not found: {exc!s}") from exc
+    except asyncio.CancelledError as exc:
+        logger.info(f"Event polling was cancelled for job {job_id}")
+        raise HTTPException(status_code=499, detail="Event polling was cancelled") from exc
+    except Exception as exc:
+        logger.exception(f"Unexpected error processing flow events for job {job_id}")
+        raise HTTPException(status_code=500, detail=f"Unexpected error: {exc!s}") from exc
+
+
 async def create_flow_response(
-    queue: asyncio.Queue,
+    queue: asyncio.Queue | EventQueue,
     event_manager: EventManager,
     event_task: asyncio.Task,
 ) -> DisconnectHandlerStreamingResponse:
@@ -225,7 +285,7 @@ async def generate_flow_events(
             components_count = len(graph.vertices)
             vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
 
-            await chat_service.set_cache(flow_id_str, graph)
+            await graph.checkpointer.save_base(graph)
             await log_telemetry(start_time, components_count, success=True)
 
         except Exception as exc:
@@ -257,23 +317,22 @@ async def generate_flow_events(
             effective_session_id = flow_id_str
 
         if not data:
-            return await build_graph_from_db(
+            return await build_graph_from_db_no_cache(
                 flow_id=flow_id,
                 session=fresh_session,
-                chat_service=chat_service,
                 user_id=str(current_user.id),
                 session_id=effective_session_id,
             )
 
-        if not flow_name:
-            result = await fresh_session.exec(select(Flow.name).where(Flow.id == flow_id))
-            flow_name = result.first()
+        result = await fresh_session.exec(select(Flow.name, Flow.updated_at).where(Flow.id == flow_id))
+        saved_flow = result.first()
 
         return await build_graph_from_data(
             flow_id=flow_id_str,
             payload=data.model_dump(),
             user_id=str(current_user.id),
-            flow_name=flow_name,
+            flow_name=flow_name or (saved_flow.name if saved_flow else None),
+            flow_version=flow_version(saved_flow.updated_at) if saved_flow else None,
             session_id=effective_session_id,
         )
 
@@ -293,7 +352,7 @@ async def generate_flow_events(
         try:
             vertex = graph.get_vertex(vertex_id)
             try:
-                lock = chat_service.async_cache_locks[flow_id_str]
+                lock = chat_service.async_cache_locks[graph.checkpointer.key]
                 vertex_build_result = await graph.build_vertex(
                     vertex_id=vertex_id,
                     user_id=str(current_user.id),
@@ -342,7 +401,7 @@ async def generate_flow_events(
                     artifacts=artifacts,
                 )
             else:
-                await chat_service.set_cache(flow_id_str, graph)
+                await graph.checkpointer.save(graph, [vertex_id])
 
             timedelta = time.perf_counter() - start_time
             duration = format_elapsed_time(timedelta)
@@ -470,12 +529,23 @@ async def generate_flow_events(
         )
         event_manager.on_error(data=error_message.data)
         raise
+    finally:
+        # Nothing reads the graph of the build once it ended, rather than waiting for the cache to expire it
+        await clear_run_cache(graph)
 
     event_manager.on_end(data={})
     await graph.end_all_traces()
     await event_manager.queue.put((None, None, time.time()))
 
 
+async def clear_run_cache(graph: Graph) -> None:
+    """Delete the graph of a build and its checkpoints from the chat cache."""
+    try:
+        await graph.checkpointer.clear()
+    except Exception:  # noqa: BLE001
+        logger.exception("Error clearing cache")
+
+
 async def cancel_flow_build(
     *,
     job_id: str,
@@ -495,6 +565,10 @@ async def cancel_flow_build(
         ValueError: If the job doesn't exist
         asyncio.CancelledError: If the task cancellation failed
     """
+    if isinstance(queue_service, DistributedJobQueueService):
+        # The job may run in another worker
+        return await queue_service.cancel_job(job_id)
+
     # Get the event task and event manager for the job
     _, _, event_task, _ = queue_service.get_queue_data(job_id)
 
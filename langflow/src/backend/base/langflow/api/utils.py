@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 from ast import literal_eval
-from datetime import timedelta
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import TYPE_CHECKING, Annotated, Any
 
@@ -13,13 +13,15 @@ from sqlalchemy import delete
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.graph.graph.base import Graph
+from langflow.graph.graph.checkpoint import cache_legacy_run
+from langflow.memory import message_history_cache
 from langflow.services.auth.utils import get_current_active_user, get_current_active_user_mcp
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.user.model import User
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
-from langflow.services.deps import get_session, session_scope
+from langflow.services.deps import get_run_log_service, get_session, session_scope
 from langflow.services.store.utils import get_lf_version_from_pypi
 
 if TYPE_CHECKING:
@@ -158,6 +160,11 @@ async def _get_flow_name(flow_id: uuid.UUID) -> str:
     return flow.name
 
 
+def flow_version(updated_at: datetime | None) -> str | None:
+    """The version of a saved flow, which changes whenever the flow is edited."""
+    return updated_at.isoformat() if updated_at else None
+
+
 async def build_graph_from_data(flow_id: uuid.UUID | str, payload: dict, **kwargs):
     """Build and cache the graph."""
     # Get flow name
@@ -169,6 +176,7 @@ async def build_graph_from_data(flow_id: uuid.UUID | str, payload: dict, **kwarg
     session_id = kwargs.get("session_id") or str_flow_id
 
     graph = Graph.from_payload(payload, str_flow_id, flow_name, kwargs.get("user_id"))
+    graph.flow_version = kwargs.get("flow_version")
     for vertex_id in graph.has_session_id_vertices:
         vertex = graph.get_vertex(vertex_id)
         if vertex is None:
@@ -189,12 +197,13 @@ async def build_graph_from_db_no_cache(flow_id: uuid.UUID, session: AsyncSession
         msg = "Invalid flow ID"
         raise ValueError(msg)
     kwargs["user_id"] = kwargs.get("user_id") or str(flow.user_id)
+    kwargs["flow_version"] = kwargs.get("flow_version") or flow_version(flow.updated_at)
     return await build_graph_from_data(flow_id, flow.data, flow_name=flow.name, **kwargs)
 
 
 async def build_graph_from_db(flow_id: uuid.UUID, session: AsyncSession, chat_service: ChatService, **kwargs):
     graph = await build_graph_from_db_no_cache(flow_id=flow_id, session=session, **kwargs)
-    await chat_service.set_cache(str(flow_id), graph)
+    await cache_legacy_run(chat_service, graph)
     return graph
 
 
@@ -207,7 +216,8 @@ async def build_and_cache_graph_from_data(
     # Convert flow_id to str if it's UUID
     str_flow_id = str(flow_id) if isinstance(flow_id, uuid.UUID) else flow_id
     graph = Graph.from_payload(graph_data, str_flow_id)
-    await chat_service.set_cache(str_flow_id, graph)
+    graph.set_run_id()
+    await cache_legacy_run(chat_service, graph)
     return graph
 
 
@@ -303,10 +313,13 @@ async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None
         # If we delete messages directly, rather than setting flow_id to null,
         # it might cause unexpected behaviors because the session id could still be
         # used elsewhere to search for these messages.
+        # Write the pending run logs of the flow first so they are deleted too
+        await get_run_log_service().flush()
         await session.exec(delete(MessageTable).where(MessageTable.flow_id == flow_id))
         await session.exec(delete(TransactionTable).where(TransactionTable.flow_id == flow_id))
         await session.exec(delete(VertexBuildTable).where(VertexBuildTable.flow_id == flow_id))
         await session.exec(delete(Flow).where(Flow.id == flow_id))
+        message_history_cache.evict_flow(flow_id)
     except Exception as e:
         msg = f"Unable to cascade delete flow: {flow_id}"
         raise RuntimeError(msg, e) from e
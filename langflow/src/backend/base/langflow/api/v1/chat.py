@@ -30,6 +30,7 @@ from langflow.api.utils import (
     EventDeliveryType,
     build_and_cache_graph_from_data,
     build_graph_from_db,
+    build_graph_from_db_no_cache,
     format_elapsed_time,
     format_exception_message,
     get_top_level_vertices,
@@ -46,7 +47,7 @@ from langflow.api.v1.schemas import (
     VerticesOrderResponse,
 )
 from langflow.exceptions.component import ComponentBuildError
-from langflow.graph.graph.base import Graph
+from langflow.graph.graph.checkpoint import cache_legacy_run, get_legacy_run_key, load_graph_checkpoint
 from langflow.graph.utils import log_vertex_build
 from langflow.schema.schema import OutputValue
 from langflow.services.cache.utils import CacheMiss
@@ -113,7 +114,7 @@ async def retrieve_vertices_order(
         # and return the same structure but only with the ids
         components_count = len(graph.vertices)
         vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
-        await chat_service.set_cache(str(flow_id), graph)
+        await cache_legacy_run(chat_service, graph)
         background_tasks.add_task(
             telemetry_service.log_package_playground,
             PlaygroundPayload(
@@ -213,12 +214,17 @@ async def get_build_events(
     queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
     *,
     event_delivery: EventDeliveryType = EventDeliveryType.STREAMING,
+    last_event_id: str | None = None,
 ):
-    """Get events for a specific build job."""
+    """Get events for a specific build job.
+
+    With a distributed job queue, `last_event_id` resumes the events after the given event.
+    """
     return await get_flow_events_response(
         job_id=job_id,
         queue_service=queue_service,
         event_delivery=event_delivery,
+        last_event_id=last_event_id,
     )
 
 
@@ -261,6 +267,7 @@ async def build_vertex(
     background_tasks: BackgroundTasks,
     inputs: Annotated[InputValueRequest | None, Body(embed=True)] = None,
     files: list[str] | None = None,
+    run_id: str | None = None,
     current_user: CurrentActiveUser,
 ) -> VertexBuildResponse:
     """Build a vertex instead of the entire graph.
@@ -271,6 +278,7 @@ async def build_vertex(
         background_tasks (BackgroundTasks): The background tasks dependency.
         inputs (Optional[InputValueRequest], optional): The input values for the vertex. Defaults to None.
         files (List[str], optional): The files to use. Defaults to None.
+        run_id (str, optional): The run returned by the vertices order. Defaults to the last run of the flow.
         current_user (Any, optional): The current user dependency. Defaults to Depends(get_current_active_user).
 
     Returns:
@@ -289,27 +297,23 @@ async def build_vertex(
     start_time = time.perf_counter()
     error_message = None
     try:
-        graph: Graph = await chat_service.get_cache(flow_id_str)
-    except KeyError as exc:
-        raise HTTPException(status_code=404, detail="Graph not found") from exc
-
-    try:
-        cache = await chat_service.get_cache(flow_id_str)
-        if isinstance(cache, CacheMiss):
+        run_key = await get_legacy_run_key(chat_service, flow_id_str, run_id)
+        cached_graph = await load_graph_checkpoint(chat_service, run_key)
+        if isinstance(cached_graph, CacheMiss):
             # If there's no cache
-            logger.warning(f"No cache found for {flow_id_str}. Building graph starting at {vertex_id}")
-            graph = await build_graph_from_db(
-                flow_id=flow_id,
-                session=await anext(get_session()),
-                chat_service=chat_service,
-            )
+            logger.warning(f"No cache found for {run_key}. Building graph starting at {vertex_id}")
+            graph = await build_graph_from_db_no_cache(flow_id=flow_id, session=await anext(get_session()))
+            if run_id is not None:
+                # The next requests of the run find the graph under the run they send
+                graph.set_run_id(run_id)
+            await cache_legacy_run(chat_service, graph)
         else:
-            graph = cache.get("result")
+            graph = cached_graph
             await graph.initialize_run()
         vertex = graph.get_vertex(vertex_id)
 
         try:
-            lock = chat_service.async_cache_locks[flow_id_str]
+            lock = chat_service.async_cache_locks[graph.checkpointer.key]
             vertex_build_result = await graph.build_vertex(
                 vertex_id=vertex_id,
                 user_id=str(current_user.id),
@@ -343,7 +347,7 @@ async def build_vertex(
             background_tasks.add_task(graph.end_all_traces_in_context(error=exc))
             # If there's an error building the vertex
             # we need to clear the cache
-            await chat_service.clear_cache(flow_id_str)
+            await graph.checkpointer.clear()
 
         result_data_response.message = artifacts
 
@@ -368,7 +372,7 @@ async def build_vertex(
         graph.reset_inactivated_vertices()
         graph.reset_activated_vertices()
 
-        await chat_service.set_cache(flow_id_str, graph)
+        await graph.checkpointer.save(graph, [vertex_id])
 
         # graph.stop_vertex tells us if the user asked
         # to stop the build of the graph at a certain vertex
@@ -415,24 +419,25 @@ async def build_vertex(
     return build_response
 
 
-async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService):
+async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService, run_id: str | None = None):
     graph = None
     try:
         try:
-            cache = await chat_service.get_cache(flow_id)
+            cached_graph = await load_graph_checkpoint(
+                chat_service, await get_legacy_run_key(chat_service, flow_id, run_id)
+            )
         except Exception as exc:  # noqa: BLE001
             logger.exception("Error building Component")
             yield str(StreamData(event="error", data={"error": str(exc)}))
             return
 
-        if isinstance(cache, CacheMiss):
+        if isinstance(cached_graph, CacheMiss):
             # If there's no cache
             msg = f"No cache found for {flow_id}."
             logger.error(msg)
             yield str(StreamData(event="error", data={"error": msg}))
             return
-        else:
-            graph = cache.get("result")
+        graph = cached_graph
 
         try:
             vertex: InterfaceVertex = graph.get_vertex(vertex_id)
@@ -493,7 +498,7 @@ async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService
     finally:
         logger.debug("Closing stream")
         if graph:
-            await chat_service.set_cache(flow_id, graph)
+            await graph.checkpointer.save(graph, [vertex_id])
         yield str(StreamData(event="close", data={"message": "Stream closed"}))
 
 
@@ -505,15 +510,16 @@ async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService
 async def build_vertex_stream(
     flow_id: uuid.UUID,
     vertex_id: str,
+    run_id: str | None = None,
 ):
     """Build a vertex instead of the entire graph.
 
     This function is responsible for building a single vertex instead of the entire graph.
-    It takes the `flow_id` and `vertex_id` as required parameters, and an optional `session_id`.
+    It takes the `flow_id` and `vertex_id` as required parameters, and an optional `run_id`, which defaults to
+    the last run of the flow.
     It also depends on the `ChatService` and `SessionService` services.
 
-    If `session_id` is not provided, it retrieves the graph from the cache using the `chat_service`.
-    If `session_id` is provided, it loads the session data using the `session_service`.
+    It retrieves the graph of the run from the cache using the `chat_service`.
 
     Once the graph is obtained, it retrieves the specified vertex using the `vertex_id`.
     If the vertex does not support streaming, an error is raised.
@@ -533,7 +539,7 @@ async def build_vertex_stream(
     """
     try:
         return StreamingResponse(
-            _stream_vertex(str(flow_id), vertex_id, get_chat_service()),
+            _stream_vertex(str(flow_id), vertex_id, get_chat_service(), run_id),
             media_type="text/event-stream",
         )
     except Exception as exc:
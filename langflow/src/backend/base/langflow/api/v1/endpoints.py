@@ -34,6 +34,7 @@ from langflow.custom.utils import (
     update_component_build_config,
 )
 from langflow.events.event_manager import create_stream_tokens_event_manager
+from langflow.events.event_queue import EventQueue, create_event_queue
 from langflow.exceptions.api import APIException, InvalidChatInputError
 from langflow.exceptions.serialization import SerializationError
 from langflow.graph.graph.base import Graph
@@ -48,7 +49,12 @@ from langflow.services.cache.utils import save_uploaded_file
 from langflow.services.database.models.flow.model import Flow, FlowRead
 from langflow.services.database.models.flow.utils import get_all_webhook_components_in_flow
 from langflow.services.database.models.user.model import User, UserRead
-from langflow.services.deps import get_session_service, get_settings_service, get_telemetry_service
+from langflow.services.deps import (
+    get_flow_template_service,
+    get_session_service,
+    get_settings_service,
+    get_telemetry_service,
+)
 from langflow.services.telemetry.schema import RunPayload
 from langflow.utils.compression import compress_response
 from langflow.utils.version import get_version_info
@@ -122,12 +128,9 @@ async def simple_run_flow(
         task_result: list[RunOutputs] = []
         user_id = api_key_user.id if api_key_user else None
         flow_id_str = str(flow.id)
-        if flow.data is None:
-            msg = f"Flow {flow_id_str} has no data"
-            raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
+        graph = get_flow_template_service().get_graph(
+            flow, input_request.tweaks or {}, stream=stream, user_id=str(user_id)
+        )
         inputs = None
         if input_request.input_value is not None:
             inputs = [
@@ -187,7 +190,7 @@ async def simple_run_flow_task(
         logger.exception(f"Error running flow {flow.id} task")
 
 
-async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio.Queue) -> AsyncGenerator:
+async def consume_and_yield(queue: asyncio.Queue | EventQueue, client_consumed_queue: asyncio.Queue) -> AsyncGenerator:
     """Consumes events from a queue and yields them to the client while tracking timing metrics.
 
     This coroutine continuously pulls events from the input queue and yields them to the client.
@@ -195,7 +198,7 @@ async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio
     to process them.
 
     Args:
-        queue (asyncio.Queue): The queue containing events to be consumed and yielded
+        queue (asyncio.Queue | EventQueue): The queue containing events to be consumed and yielded
         client_consumed_queue (asyncio.Queue): A queue for tracking when the client has consumed events
 
     Yields:
@@ -267,7 +270,7 @@ async def run_flow_generator(
         logger.error(f"Error running flow: {e}")
         event_manager.on_error(data={"error": str(e)})
     finally:
-        await event_manager.queue.put((None, None, time.time))
+        await event_manager.queue.put((None, None, time.time()))
 
 
 @router.post("/run/{flow_id_or_name}", response_model=None, response_model_exclude_none=True)
@@ -317,7 +320,7 @@ async def simplified_run_flow(
     start_time = time.perf_counter()
 
     if stream:
-        asyncio_queue: asyncio.Queue = asyncio.Queue()
+        asyncio_queue = create_event_queue()
         asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
         event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
         main_task = asyncio.create_task(
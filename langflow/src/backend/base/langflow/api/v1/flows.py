@@ -11,7 +11,7 @@ from uuid import UUID
 import orjson
 from aiofile import async_open
 from anyio import Path
-from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
@@ -24,6 +24,11 @@ from langflow.api.v1.schemas import FlowListCreate
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.logging import logger
+from langflow.services.database.models.flow.header_index import (
+    aget_flow_headers,
+    aget_flow_headers_page,
+    decode_cursor,
+)
 from langflow.services.database.models.flow.model import (
     AccessTypeEnum,
     Flow,
@@ -35,7 +40,7 @@ from langflow.services.database.models.flow.model import (
 from langflow.services.database.models.flow.utils import get_webhook_component_in_flow
 from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
 from langflow.services.database.models.folder.model import Folder
-from langflow.services.deps import get_settings_service
+from langflow.services.deps import get_flow_template_service, get_settings_service
 from langflow.utils.compression import compress_response
 
 # build router
@@ -194,6 +199,8 @@ async def read_flows(
     folder_id: UUID | None = None,
     params: Annotated[Params, Depends()],
     header_flows: bool = False,
+    limit: Annotated[int | None, Query(ge=1)] = None,
+    cursor: str | None = None,
 ):
     """Retrieve a list of flows with pagination support.
 
@@ -210,11 +217,19 @@ async def read_flows(
         params (Params): Pagination parameters.
         remove_example_flows (bool, optional): Whether to remove example flows. Defaults to False.
         header_flows (bool, optional): Whether to return only specific headers of the flows. Defaults to False.
+        limit (int, optional): Maximum number of flow headers returned, newest first. The cursor of the next
+            page is returned in the `X-Next-Cursor` header. Defaults to all the headers.
+        cursor (str, optional): The `X-Next-Cursor` of the previous page of flow headers.
 
     Returns:
         list[FlowRead] | Page[FlowRead] | list[FlowHeader]
         A list of flows or a paginated response containing the list of flows or a list of flow headers.
     """
+    try:
+        position = decode_cursor(cursor) if cursor is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
     try:
         auth_settings = get_settings_service().auth_settings
 
@@ -233,6 +248,32 @@ async def read_flows(
         if not folder_id:
             folder_id = default_folder_id
 
+        if header_flows and (limit is not None or position is not None):
+            headers, next_cursor = await aget_flow_headers_page(
+                session,
+                current_user.id,
+                include_unowned=auth_settings.AUTO_LOGIN,
+                folder_id=None if get_all else folder_id,
+                exclude_folder_id=starter_folder_id if remove_example_flows else None,
+                components_only=components_only,
+                limit=limit,
+                position=position,
+            )
+            response = compress_response([FlowHeader.model_validate(header) for header in headers])
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+            return response
+
+        if header_flows:
+            headers = await aget_flow_headers(session, current_user.id, include_unowned=auth_settings.AUTO_LOGIN)
+            if not get_all:
+                headers = [header for header in headers if header["folder_id"] == folder_id]
+            if components_only:
+                headers = [header for header in headers if header["is_component"]]
+            if remove_example_flows and starter_folder_id:
+                headers = [header for header in headers if header["folder_id"] != starter_folder_id]
+            return compress_response([FlowHeader.model_validate(header) for header in headers])
+
         if auth_settings.AUTO_LOGIN:
             stmt = select(Flow).where(
                 (Flow.user_id == None) | (Flow.user_id == current_user.id)  # noqa: E711
@@ -253,10 +294,6 @@ async def read_flows(
                 flows = [flow for flow in flows if flow.is_component]
             if remove_example_flows and starter_folder_id:
                 flows = [flow for flow in flows if flow.folder_id != starter_folder_id]
-            if header_flows:
-                # Convert to FlowHeader objects and compress the response
-                flow_headers = [FlowHeader.model_validate(flow, from_attributes=True) for flow in flows]
-                return compress_response(flow_headers)
 
             # Compress the full flows response
             return compress_response(flows)
@@ -360,6 +397,7 @@ async def update_flow(
         session.add(db_flow)
         await session.commit()
         await session.refresh(db_flow)
+        get_flow_template_service().invalidate(flow_id)
 
         await _save_flow_to_fs(db_flow)
 
@@ -399,6 +437,7 @@ async def delete_flow(
         raise HTTPException(status_code=404, detail="Flow not found")
     await cascade_delete_flow(session, flow.id)
     await session.commit()
+    get_flow_template_service().invalidate(flow.id)
     return {"message": "Flow deleted successfully"}
 
 
@@ -492,6 +531,9 @@ async def delete_multiple_flows(
             await cascade_delete_flow(db, flow.id)
 
         await db.commit()
+        flow_template_service = get_flow_template_service()
+        for flow in flows_to_delete:
+            flow_template_service.invalidate(flow.id)
         return {"deleted": len(flows_to_delete)}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
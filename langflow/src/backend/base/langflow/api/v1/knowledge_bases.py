@@ -1,15 +1,15 @@
+import asyncio
 import json
 import shutil
 from http import HTTPStatus
 from pathlib import Path
 
-import pandas as pd
-from fastapi import APIRouter, HTTPException
-from langchain_chroma import Chroma
+from fastapi import APIRouter, BackgroundTasks, HTTPException
 from loguru import logger
 from pydantic import BaseModel
 
 from langflow.api.utils import CurrentActiveUser
+from langflow.base.data.kb_utils import read_kb_stats, reconcile_kb_stats
 from langflow.services.deps import get_settings_service
 
 router = APIRouter(tags=["Knowledge Bases"], prefix="/knowledge_bases")
@@ -44,18 +44,6 @@ def get_kb_root_path() -> Path:
     return KNOWLEDGE_BASES_DIR
 
 
-def get_directory_size(path: Path) -> int:
-    """Calculate the total size of all files in a directory."""
-    total_size = 0
-    try:
-        for file_path in path.rglob("*"):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
-    except (OSError, PermissionError):
-        pass
-    return total_size
-
-
 def detect_embedding_provider(kb_path: Path) -> str:
     """Detect the embedding provider from config files and directory structure."""
     # Provider patterns to check for
@@ -163,50 +151,17 @@ def detect_embedding_model(kb_path: Path) -> str:
     return "Unknown"
 
 
-def get_text_columns(df: pd.DataFrame, schema_data: list | None = None) -> list[str]:
-    """Get the text columns to analyze for word/character counts."""
-    # First try schema-defined text columns
-    if schema_data:
-        text_columns = [
-            col["column_name"]
-            for col in schema_data
-            if col.get("vectorize", False) and col.get("data_type") == "string"
-        ]
-        if text_columns:
-            return [col for col in text_columns if col in df.columns]
-
-    # Fallback to common text column names
-    common_names = ["text", "content", "document", "chunk"]
-    text_columns = [col for col in df.columns if col.lower() in common_names]
-    if text_columns:
-        return text_columns
-
-    # Last resort: all string columns
-    return [col for col in df.columns if df[col].dtype == "object"]
-
-
-def calculate_text_metrics(df: pd.DataFrame, text_columns: list[str]) -> tuple[int, int]:
-    """Calculate total words and characters from text columns."""
-    total_words = 0
-    total_characters = 0
-
-    for col in text_columns:
-        if col not in df.columns:
-            continue
-
-        text_series = df[col].astype(str).fillna("")
-        total_characters += text_series.str.len().sum()
-        total_words += text_series.str.split().str.len().sum()
-
-    return int(total_words), int(total_characters)
+def get_kb_metadata(kb_path: Path, stats: dict[str, int] | None = None) -> dict:
+    """Extract metadata from a knowledge base directory.
 
-
-def get_kb_metadata(kb_path: Path) -> dict:
-    """Extract metadata from a knowledge base directory."""
+    The chunks, words, characters and size come from the statistics recorded by the ingestion, the collection
+    of the knowledge base is never read. They are left at zero when `stats` is None.
+    """
     metadata: dict[str, float | int | str] = {
         "chunks": 0,
         "words": 0,
         "characters": 0,
+        "size": 0,
         "avg_chunk_size": 0.0,
         "embedding_provider": "Unknown",
         "embedding_model": "Unknown",
@@ -233,66 +188,41 @@ def get_kb_metadata(kb_path: Path) -> dict:
         if metadata["embedding_model"] == "Unknown":
             metadata["embedding_model"] = detect_embedding_model(kb_path)
 
-        # Read schema for text column information
-        schema_data = None
-        schema_file = kb_path / "schema.json"
-        if schema_file.exists():
-            try:
-                with schema_file.open("r", encoding="utf-8") as f:
-                    schema_data = json.load(f)
-                    if not isinstance(schema_data, list):
-                        schema_data = None
-            except (ValueError, TypeError, OSError) as _:
-                logger.exception("Error reading schema file '%s'", schema_file)
-
-        # Create vector store
-        chroma = Chroma(
-            persist_directory=str(kb_path),
-            collection_name=kb_path.name,
-        )
-
-        # Access the raw collection
-        collection = chroma._collection
-
-        # Fetch all documents and metadata
-        results = collection.get(include=["documents", "metadatas"])
-
-        # Convert to pandas DataFrame
-        source_chunks = pd.DataFrame(
-            {
-                "document": results["documents"],
-                "metadata": results["metadatas"],
-            }
-        )
-
-        # Process the source data for metadata
-        try:
-            metadata["chunks"] = len(source_chunks)
-
-            # Get text columns and calculate metrics
-            text_columns = get_text_columns(source_chunks, schema_data)
-            if text_columns:
-                words, characters = calculate_text_metrics(source_chunks, text_columns)
-                metadata["words"] = words
-                metadata["characters"] = characters
-
-                # Calculate average chunk size
-                if int(metadata["chunks"]) > 0:
-                    metadata["avg_chunk_size"] = round(int(characters) / int(metadata["chunks"]), 1)
-
-        except (OSError, ValueError, TypeError) as _:
-            logger.exception("Error processing Chroma DB '%s'", kb_path.name)
-
     except (OSError, ValueError, TypeError) as _:
         logger.exception("Error processing knowledge base directory '%s'", kb_path)
 
+    if stats is not None:
+        metadata.update({key: stats[key] for key in ("chunks", "words", "characters", "size")})
+        if stats["chunks"] > 0:
+            metadata["avg_chunk_size"] = round(stats["characters"] / stats["chunks"], 1)
+
     return metadata
 
 
+def kb_info_from_metadata(kb_name: str, metadata: dict) -> KnowledgeBaseInfo:
+    return KnowledgeBaseInfo(
+        id=kb_name,
+        name=kb_name.replace("_", " ").replace("-", " ").title(),
+        embedding_provider=metadata["embedding_provider"],
+        embedding_model=metadata["embedding_model"],
+        size=metadata["size"],
+        words=metadata["words"],
+        characters=metadata["characters"],
+        chunks=metadata["chunks"],
+        avg_chunk_size=metadata["avg_chunk_size"],
+    )
+
+
 @router.get("", status_code=HTTPStatus.OK)
 @router.get("/", status_code=HTTPStatus.OK)
-async def list_knowledge_bases(current_user: CurrentActiveUser) -> list[KnowledgeBaseInfo]:
-    """List all available knowledge bases."""
+async def list_knowledge_bases(
+    current_user: CurrentActiveUser, background_tasks: BackgroundTasks
+) -> list[KnowledgeBaseInfo]:
+    """List all available knowledge bases.
+
+    The statistics of the knowledge bases that have none recorded yet are computed in the background, they are
+    listed with empty statistics until then.
+    """
     try:
         kb_root_path = get_kb_root_path()
         kb_user = current_user.username
@@ -308,25 +238,13 @@ async def list_knowledge_bases(current_user: CurrentActiveUser) -> list[Knowledg
                 continue
 
             try:
-                # Get size of the directory
-                size = get_directory_size(kb_dir)
+                stats = read_kb_stats(kb_dir)
+                if stats is None:
+                    background_tasks.add_task(reconcile_kb_stats, kb_dir)
 
                 # Get metadata from KB files
-                metadata = get_kb_metadata(kb_dir)
-
-                kb_info = KnowledgeBaseInfo(
-                    id=kb_dir.name,
-                    name=kb_dir.name.replace("_", " ").replace("-", " ").title(),
-                    embedding_provider=metadata["embedding_provider"],
-                    embedding_model=metadata["embedding_model"],
-                    size=size,
-                    words=metadata["words"],
-                    characters=metadata["characters"],
-                    chunks=metadata["chunks"],
-                    avg_chunk_size=metadata["avg_chunk_size"],
-                )
-
-                knowledge_bases.append(kb_info)
+                metadata = get_kb_metadata(kb_dir, stats)
+                knowledge_bases.append(kb_info_from_metadata(kb_dir.name, metadata))
 
             except OSError as _:
                 # Log the exception and skip directories that can't be read
@@ -353,23 +271,15 @@ async def get_knowledge_base(kb_name: str, current_user: CurrentActiveUser) -> K
         if not kb_path.exists() or not kb_path.is_dir():
             raise HTTPException(status_code=404, detail=f"Knowledge base '{kb_name}' not found")
 
-        # Get size of the directory
-        size = get_directory_size(kb_path)
+        # A single knowledge base without statistics is reconciled right away
+        stats = read_kb_stats(kb_path)
+        if stats is None:
+            stats = await asyncio.to_thread(reconcile_kb_stats, kb_path)
 
         # Get metadata from KB files
-        metadata = get_kb_metadata(kb_path)
-
-        return KnowledgeBaseInfo(
-            id=kb_name,
-            name=kb_name.replace("_", " ").replace("-", " ").title(),
-            embedding_provider=metadata["embedding_provider"],
-            embedding_model=metadata["embedding_model"],
-            size=size,
-            words=metadata["words"],
-            characters=metadata["characters"],
-            chunks=metadata["chunks"],
-            avg_chunk_size=metadata["avg_chunk_size"],
-        )
+        metadata = get_kb_metadata(kb_path, stats)
+
+        return kb_info_from_metadata(kb_name, metadata)
 
     except HTTPException:
         raise
@@ -12,17 +12,19 @@ from typing import Any, ParamSpec, TypeVar
 from urllib.parse import quote, unquote, urlparse
 from uuid import uuid4
 
+from cachetools import TTLCache
 from loguru import logger
 from mcp import types
-from sqlmodel import select
+from sqlmodel import col, select
 
 from langflow.api.v1.endpoints import simple_run_flow
 from langflow.api.v1.schemas import SimplifiedAPIRequest
 from langflow.base.mcp.constants import MAX_MCP_TOOL_NAME_LENGTH
 from langflow.base.mcp.util import get_flow_snake_case, get_unique_name, sanitize_mcp_name
-from langflow.helpers.flow import json_schema_from_flow
+from langflow.helpers.flow import get_cached_json_schema, json_schema_from_flow
 from langflow.schema.message import Message
 from langflow.services.database.models import Flow
+from langflow.services.database.models.flow.header_index import flow_header_index
 from langflow.services.database.models.user.model import User
 from langflow.services.deps import get_settings_service, get_storage_service, session_scope
 from langflow.services.storage.utils import build_content_type_from_extension
@@ -30,6 +32,8 @@ from langflow.services.storage.utils import build_content_type_from_extension
 T = TypeVar("T")
 P = ParamSpec("P")
 
+MCP_TOOL_CATALOG_CACHE_SIZE = 256
+
 # Create context variables
 current_user_ctx: ContextVar[User] = ContextVar("current_user_ctx")
 
@@ -275,6 +279,49 @@ async def handle_call_tool(
         raise
 
 
+class MCPToolCatalog:
+    """Keeps the tools listed by the MCP servers in memory.
+
+    A catalog is kept for each project, and one for all the flows, until a flow is written through this worker
+    or the catalog expires. Rebuilding a catalog only reads the columns the tools are made of, and the data of the
+    flows saved since their input schema was last computed.
+    """
+
+    def __init__(self) -> None:
+        # Maps a project id and whether only MCP-enabled flows are listed to the flow writes seen and the tools
+        self._catalogs: TTLCache[tuple[str | None, bool], tuple[int, list[types.Tool]]] | None = None
+        self._configured = False
+
+    @property
+    def enabled(self) -> bool:
+        if not self._configured:
+            ttl = get_settings_service().settings.mcp_tool_catalog_ttl
+            self._catalogs = TTLCache(maxsize=MCP_TOOL_CATALOG_CACHE_SIZE, ttl=ttl) if ttl > 0 else None
+            self._configured = True
+        return self._catalogs is not None
+
+    def get(self, key: tuple[str | None, bool]) -> list[types.Tool] | None:
+        if not self.enabled or self._catalogs is None:
+            return None
+        entry = self._catalogs.get(key)
+        # The writes of flows are counted by the flow header index, a catalog built before one is outdated
+        if entry is None or entry[0] != flow_header_index.writes:
+            return None
+        return list(entry[1])
+
+    def set(self, key: tuple[str | None, bool], tools: list[types.Tool], writes: int) -> None:
+        if self._catalogs is not None:
+            self._catalogs[key] = (writes, tools)
+
+    def reset(self) -> None:
+        """Drops every catalog; the settings are read again on the next listing."""
+        self._catalogs = None
+        self._configured = False
+
+
+mcp_tool_catalog = MCPToolCatalog()
+
+
 async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
     """Handle listing tools for MCP.
 
@@ -282,24 +329,51 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
         project_id: Optional project ID to filter tools by project
         mcp_enabled_only: Whether to filter for MCP-enabled flows only
     """
+    catalog_key = (str(project_id) if project_id else None, mcp_enabled_only)
+    if (tools := mcp_tool_catalog.get(catalog_key)) is not None:
+        return tools
+
+    writes = flow_header_index.writes
     tools = []
     try:
         async with session_scope() as session:
+            # Only the columns of the tools are read, the data is read for the flows without a cached schema
+            columns = (
+                Flow.id,
+                Flow.name,
+                Flow.description,
+                Flow.action_name,
+                Flow.action_description,
+                Flow.user_id,
+                Flow.updated_at,
+            )
             # Build query based on parameters
             if project_id:
                 # Filter flows by project and optionally by MCP enabled status
-                flows_query = select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
+                flows_query = select(*columns).where(
+                    Flow.folder_id == project_id,
+                    Flow.is_component == False,  # noqa: E712
+                )
                 if mcp_enabled_only:
                     flows_query = flows_query.where(Flow.mcp_enabled == True)  # noqa: E712
             else:
                 # Get all flows
-                flows_query = select(Flow)
+                flows_query = select(*columns)
 
-            flows = (await session.exec(flows_query)).all()
+            flows = [flow for flow in (await session.exec(flows_query)).all() if flow.user_id is not None]
+
+            schemas = {flow.id: get_cached_json_schema(flow.id, flow.updated_at) for flow in flows}
+            if missing_ids := [flow_id for flow_id, schema in schemas.items() if schema is None]:
+                for flow in (await session.exec(select(Flow).where(col(Flow.id).in_(missing_ids)))).all():
+                    try:
+                        schemas[flow.id] = json_schema_from_flow(flow)
+                    except Exception as e:  # noqa: BLE001
+                        msg = f"Error in listing tools: {e!s} from flow: {flow.name}"
+                        logger.warning(msg)
 
             existing_names = set()
             for flow in flows:
-                if flow.user_id is None:
+                if schemas.get(flow.id) is None:
                     continue
 
                 # For project-specific tools, use action names if available
@@ -333,7 +407,7 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
                     tool = types.Tool(
                         name=name,
                         description=description,
-                        inputSchema=json_schema_from_flow(flow),
+                        inputSchema=schemas[flow.id],
                     )
                     tools.append(tool)
                     existing_names.add(name)
@@ -345,4 +419,5 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
         msg = f"Error in listing tools: {e!s}"
         logger.exception(msg)
         raise
-    return tools
+    mcp_tool_catalog.set(catalog_key, tools, writes)
+    return list(tools)
@@ -8,6 +8,7 @@ from sqlalchemy import delete
 from sqlmodel import col, select
 
 from langflow.api.utils import DbSession, custom_params
+from langflow.memory import message_history_cache
 from langflow.schema.message import MessageResponse
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
@@ -18,6 +19,7 @@ from langflow.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.deps import get_run_log_service
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
@@ -25,6 +27,7 @@ router = APIRouter(prefix="/monitor", tags=["Monitor"])
 @router.get("/builds")
 async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
     try:
+        await get_run_log_service().flush()
         vertex_builds = await get_vertex_builds_by_flow_id(session, flow_id)
         return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
     except Exception as e:
@@ -34,6 +37,7 @@ async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSessio
 @router.delete("/builds", status_code=204)
 async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> None:
     try:
+        await get_run_log_service().flush()
         await delete_vertex_builds_by_flow_id(session, flow_id)
         await session.commit()
     except Exception as e:
@@ -94,6 +98,7 @@ async def delete_messages(message_ids: list[UUID], session: DbSession) -> None:
     try:
         await session.exec(delete(MessageTable).where(MessageTable.id.in_(message_ids)))  # type: ignore[attr-defined]
         await session.commit()
+        message_history_cache.remove(message_ids)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -120,6 +125,7 @@ async def update_message(
         session.add(db_message)
         await session.commit()
         await session.refresh(db_message)
+        message_history_cache.update([db_message.model_dump()])
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
     return db_message
@@ -152,6 +158,8 @@ async def update_session_id(
         session.add_all(messages)
 
         await session.commit()
+        message_history_cache.evict(old_session_id)
+        message_history_cache.evict(new_session_id)
         message_responses = []
         for message in messages:
             await session.refresh(message)
@@ -174,6 +182,7 @@ async def delete_messages_session(
             .execution_options(synchronize_session="fetch")
         )
         await session.commit()
+        message_history_cache.evict(session_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -187,6 +196,7 @@ async def get_transactions(
     params: Annotated[Params | None, Depends(custom_params)],
 ) -> Page[TransactionTable]:
     try:
+        await get_run_log_service().flush()
         stmt = (
             select(TransactionTable)
             .where(TransactionTable.flow_id == flow_id)
@@ -13,7 +13,6 @@ from fastapi.responses import StreamingResponse
 from fastapi_pagination import Params
 from fastapi_pagination.ext.sqlmodel import apaginate
 from sqlalchemy import or_, update
-from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, custom_params, remove_api_keys
@@ -127,11 +126,7 @@ async def read_project(
 ):
     try:
         project = (
-            await session.exec(
-                select(Folder)
-                .options(selectinload(Folder.flows))
-                .where(Folder.id == project_id, Folder.user_id == current_user.id)
-            )
+            await session.exec(select(Folder).where(Folder.id == project_id, Folder.user_id == current_user.id))
         ).first()
     except Exception as e:
         if "No result found" in str(e):
@@ -166,9 +161,17 @@ async def read_project(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
-    flows_from_current_user_in_project = [flow for flow in project.flows if flow.user_id == current_user.id]
-    project.flows = flows_from_current_user_in_project
-    return project
+    try:
+        # The flows are only read when the whole project is returned, a page reads its own flows
+        flows_from_current_user_in_project = (
+            await session.exec(select(Flow).where(Flow.folder_id == project_id, Flow.user_id == current_user.id))
+        ).all()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+    return FolderReadWithFlows(
+        **FolderRead.model_validate(project).model_dump(),
+        flows=[FlowRead.model_validate(flow, from_attributes=True) for flow in flows_from_current_user_in_project],
+    )
 
 
 @router.patch("/{project_id}", response_model=FolderRead, status_code=200)
@@ -1,8 +1,10 @@
+import hashlib
 import io
 import re
+import time
 import uuid
 import zipfile
-from collections.abc import AsyncGenerator, AsyncIterable
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator
 from datetime import datetime
 from http import HTTPStatus
 from pathlib import Path
@@ -25,6 +27,8 @@ router = APIRouter(tags=["Files"], prefix="/files")
 # Set the static name of the MCP servers file
 MCP_SERVERS_FILE = "_mcp_servers"
 SAMPLE_DATA_DIR = Path(__file__).parent / "sample_data"
+# Uploads are read and saved in chunks of this size, so they are never held whole in memory
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 async def byte_stream_generator(file_input, chunk_size: int = 8192) -> AsyncGenerator[bytes, None]:
@@ -46,6 +50,52 @@ async def byte_stream_generator(file_input, chunk_size: int = 8192) -> AsyncGene
             yield chunk
 
 
+class _ZipOutput(io.RawIOBase):
+    """Unseekable output of a ZIP archive, the bytes written are drained as the archive is streamed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+async def zip_stream_generator(
+    entries: AsyncIterable[tuple[zipfile.ZipInfo, AsyncIterable[bytes]]],
+) -> AsyncGenerator[bytes, None]:
+    """Write a ZIP archive of the entries and yield its bytes as the content of the entries is read.
+
+    The output can't seek, so the sizes and CRC of each entry are written after its content, and only the
+    last chunk read is held in memory rather than the archive.
+    """
+    output = _ZipOutput()
+    with zipfile.ZipFile(output, "w") as zip_file:
+        async for zip_info, content in entries:
+            with zip_file.open(zip_info, "w") as entry:
+                async for chunk in content:
+                    entry.write(chunk)
+                    if data := output.drain():
+                        yield data
+            if data := output.drain():
+                yield data
+    yield output.drain()
+
+
 async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser, session: DbSession):
     # Fetch the file from the DB
     stmt = select(UserFile).where(UserFile.id == file_id)
@@ -63,12 +113,61 @@ async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser,
     return file
 
 
-async def save_file_routine(file, storage_service, current_user: CurrentActiveUser, file_content=None, file_name=None):
-    """Routine to save the file content to the storage service."""
+class UploadDigest:
+    """Size and SHA-256 of an upload, computed while its chunks are saved."""
+
+    def __init__(self) -> None:
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+
+    def update(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        self._sha256.update(chunk)
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+
+async def iter_upload(
+    file: UploadFile, digest: UploadDigest, *, max_size: int | None = None, chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Yield the chunks of an upload and add them to the digest.
+
+    Raises:
+        HTTPException: 413 once more than `max_size` bytes were read, the size sent by the client can't be trusted.
+    """
+    while chunk := await file.read(chunk_size):
+        digest.update(chunk)
+        if max_size is not None and digest.size > max_size:
+            raise HTTPException(status_code=413, detail=f"File size is larger than the maximum file size {max_size}B.")
+        yield chunk
+
+
+async def save_file_routine(
+    file,
+    storage_service,
+    current_user: CurrentActiveUser,
+    file_content=None,
+    file_name=None,
+    *,
+    digest: UploadDigest | None = None,
+    max_size: int | None = None,
+):
+    """Routine to save the file content to the storage service.
+
+    The upload is streamed to the storage service in chunks, while `digest` gets its size and hash.
+    """
     file_id = uuid.uuid4()
+    digest = digest if digest is not None else UploadDigest()
 
     if not file_content:
-        file_content = await file.read()
+        file_content = iter_upload(file, digest, max_size=max_size)
+        if file.size is not None and file.size <= UPLOAD_CHUNK_SIZE:
+            # A single chunk is saved as is, rather than through the streaming path of the storage service
+            file_content = b"".join([chunk async for chunk in file_content])
+    else:
+        digest.update(file_content)
     if not file_name:
         file_name = file.filename
 
@@ -98,8 +197,9 @@ async def upload_user_file(
     if not file or not file.filename:
         raise HTTPException(status_code=400, detail="No file provided")
 
-    # Validate file size (convert MB to bytes)
-    if file.size > max_file_size_upload * 1024 * 1024:
+    # Validate file size (convert MB to bytes), the size read is checked again while saving the file
+    max_size = max_file_size_upload * 1024 * 1024
+    if file.size is not None and file.size > max_size:
         raise HTTPException(
             status_code=413,
             detail=f"File size is larger than the maximum file size {max_file_size_upload}MB.",
@@ -144,19 +244,22 @@ async def upload_user_file(
             # Create the unique filename with extension for storage
             unique_filename = f"{root_filename}.{file_extension}" if file_extension else root_filename
 
-        # Read file content and save with unique filename
+        # Stream the file content to the storage with the unique filename, computing its size on the way
+        digest = UploadDigest()
         try:
             file_id, stored_file_name = await save_file_routine(
-                file, storage_service, current_user, file_name=unique_filename
+                file, storage_service, current_user, file_name=unique_filename, digest=digest, max_size=max_size
             )
+        except HTTPException as e:
+            # More bytes were sent than the size announced by the client
+            raise HTTPException(
+                status_code=413,
+                detail=f"File size is larger than the maximum file size {max_file_size_upload}MB.",
+            ) from e
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error saving file: {e}") from e
-
-        # Compute the file size based on the path
-        file_size = await storage_service.get_file_size(
-            flow_id=str(current_user.id),
-            file_name=stored_file_name,
-        )
+        file_size = digest.size
+        logger.debug(f"File {stored_file_name} saved with {file_size} bytes, sha256 {digest.sha256}")
 
         # Create a new file record
         new_file = UserFile(
@@ -170,6 +273,8 @@ async def upload_user_file(
 
         await session.commit()
         await session.refresh(new_file)
+    except HTTPException:
+        raise
     except Exception as e:
         # Optionally, you could also delete the file from disk if the DB insert fails.
         raise HTTPException(status_code=500, detail=f"Database error: {e}") from e
@@ -210,16 +315,14 @@ async def load_sample_files(current_user: CurrentActiveUser, session: DbSession,
         binary_data = sample_file_path.read_bytes()
 
         # Write the sample file content to the storage service
+        digest = UploadDigest()
         file_id, _ = await save_file_routine(
             sample_file_path,
             storage_service,
             current_user,
             file_content=binary_data,
             file_name=sample_file_name,
-        )
-        file_size = await storage_service.get_file_size(
-            flow_id=str(current_user.id),
-            file_name=sample_file_name,
+            digest=digest,
         )
         # Create a UserFile object for the sample file
         sample_file = UserFile(
@@ -227,7 +330,7 @@ async def load_sample_files(current_user: CurrentActiveUser, session: DbSession,
             user_id=current_user.id,
             name=root_filename,
             path=sample_file_name,
-            size=file_size,
+            size=digest.size,
         )
 
         session.add(sample_file)
@@ -309,34 +412,23 @@ async def download_files_batch(
         if not files:
             raise HTTPException(status_code=404, detail="No files found")
 
-        # Create a byte stream to hold the ZIP file
-        zip_stream = io.BytesIO()
-
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
+        async def iter_entries() -> AsyncIterator[tuple[zipfile.ZipInfo, AsyncIterable[bytes]]]:
             for file in files:
-                # Get the file content from storage
-                file_content = await storage_service.get_file(
+                # Name the entry with the extension of the stored file
+                zip_info = zipfile.ZipInfo(f"{file.name}{Path(file.path).suffix}", date_time=time.localtime()[:6])
+                zip_info.file_size = file.size
+                # Each file is opened when the archive reaches it
+                content = await storage_service.get_file_stream(
                     flow_id=str(current_user.id), file_name=file.path.split("/")[-1]
                 )
-
-                # Get the file extension from the original filename
-                file_extension = Path(file.path).suffix
-                # Create the filename with extension
-                filename_with_extension = f"{file.name}{file_extension}"
-
-                # Write the file to the ZIP with the proper extension
-                zip_file.writestr(filename_with_extension, file_content)
-
-        # Seek to the beginning of the byte stream
-        zip_stream.seek(0)
+                yield zip_info, content
 
         # Generate the filename with the current datetime
         current_time = datetime.now(tz=ZoneInfo("UTC")).astimezone().strftime("%Y%m%d_%H%M%S")
         filename = f"{current_time}_langflow_files.zip"
 
         return StreamingResponse(
-            zip_stream,
+            zip_stream_generator(iter_entries()),
             media_type="application/x-zip-compressed",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -411,17 +503,15 @@ async def download_file(
         # Get the basename of the file path
         file_name = file.path.split("/")[-1]
 
-        # Get file stream
-        file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
-
-        if file_stream is None:
-            raise HTTPException(status_code=404, detail="File stream not available")
-
         # If return_content is True, read the file content and return it
         if return_content:
-            return await read_file_content(file_stream, decode=True)
+            file_content = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
+            if file_content is None:
+                raise HTTPException(status_code=404, detail="File stream not available")
+            return await read_file_content(file_content, decode=True)
 
-        # For streaming, ensure file_stream is an async iterator returning bytes
+        # Stream the file from the storage without reading it in memory first
+        file_stream = await storage_service.get_file_stream(flow_id=str(current_user.id), file_name=file_name)
         byte_stream = byte_stream_generator(file_stream)
 
         # Create the filename with extension
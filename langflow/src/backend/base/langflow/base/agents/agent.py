@@ -184,6 +184,7 @@ class LCAgentComponent(Component):
                 cast("SendMessageFunctionType", self.send_message),
             )
         except ExceptionWithMessageError as e:
+            self._discard_message_writer()
             if hasattr(e, "agent_message") and hasattr(e.agent_message, "id"):
                 msg_id = e.agent_message.id
                 await delete_message(id_=msg_id)
@@ -191,10 +192,13 @@ class LCAgentComponent(Component):
             logger.error(f"ExceptionWithMessageError: {e}")
             raise
         except Exception as e:
+            self._discard_message_writer()
             # Log or handle any other exceptions
             logger.error(f"Error: {e}")
             raise
 
+        # The agent message was written as deltas while the agent ran, its full version is written once
+        result = await self._materialize_message(result)
         self.status = result
         return result
 
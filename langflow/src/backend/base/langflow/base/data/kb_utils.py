@@ -1,11 +1,29 @@
+import json
 import math
+import os
+import tempfile
+import threading
 from collections import Counter
+from collections.abc import Iterable
 from pathlib import Path
+from typing import Any
 from uuid import UUID
 
+from langchain_chroma import Chroma
+from loguru import logger
+
 from langflow.services.database.models.user.crud import get_user_by_id
 from langflow.services.deps import session_scope
 
+KB_STATS_FILE = "kb_stats.json"
+KB_STATS_VERSION = 1
+# Number of chunks read at once when the statistics of a knowledge base are computed from its collection
+KB_STATS_PAGE_SIZE = 1000
+
+_kb_stats_locks: dict[Path, threading.Lock] = {}
+_kb_stats_locks_lock = threading.Lock()
+_reconciling: set[Path] = set()
+
 
 def compute_tfidf(documents: list[str], query_terms: list[str]) -> list[float]:
     """Compute TF-IDF scores for query terms across a collection of documents.
@@ -135,3 +153,142 @@ async def get_knowledge_bases(kb_root: Path, user_id: UUID | str) -> list[str]:
         return []
 
     return [str(d.name) for d in kb_path.iterdir() if not d.name.startswith(".") and d.is_dir()]
+
+
+def _kb_stats_lock(kb_path: Path) -> threading.Lock:
+    with _kb_stats_locks_lock:
+        return _kb_stats_locks.setdefault(kb_path.resolve(), threading.Lock())
+
+
+def get_directory_size(path: Path) -> int:
+    """Calculate the total size of all files in a directory."""
+    total_size = 0
+    try:
+        for file_path in path.rglob("*"):
+            if file_path.is_file():
+                total_size += file_path.stat().st_size
+    except (OSError, PermissionError):
+        pass
+    return total_size
+
+
+def count_text(texts: Iterable[str | None]) -> tuple[int, int]:
+    """Count the words and characters of the chunks of a knowledge base.
+
+    Returns:
+        The number of words, split on whitespace, and the number of characters.
+    """
+    words = 0
+    characters = 0
+    for text in texts:
+        chunk = text or ""
+        words += len(chunk.split())
+        characters += len(chunk)
+    return words, characters
+
+
+def read_kb_stats(kb_path: Path) -> dict[str, int] | None:
+    """Read the statistics of a knowledge base from its sidecar file.
+
+    Returns:
+        The number of chunks, words and characters and the size of the knowledge base, or None if they were never
+        recorded, e.g. for the knowledge bases created before the statistics were kept.
+    """
+    stats_file = kb_path / KB_STATS_FILE
+    try:
+        stats = json.loads(stats_file.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.exception(f"Error reading knowledge base statistics file '{stats_file}'")
+        return None
+    if not isinstance(stats, dict) or stats.get("version") != KB_STATS_VERSION:
+        return None
+    return stats
+
+
+def write_kb_stats(kb_path: Path, stats: dict[str, Any]) -> None:
+    """Replace the statistics file of a knowledge base, readers never see a partially written file."""
+    stats = {**stats, "version": KB_STATS_VERSION}
+    fd, tmp_name = tempfile.mkstemp(dir=kb_path, prefix=f".{KB_STATS_FILE}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(stats, f)
+        Path(tmp_name).replace(kb_path / KB_STATS_FILE)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def compute_kb_stats(kb_path: Path, collection) -> dict[str, int]:
+    """Compute the statistics of a knowledge base by reading all the chunks of its collection, page by page."""
+    chunks = words = characters = 0
+    while True:
+        page = collection.get(include=["documents"], limit=KB_STATS_PAGE_SIZE, offset=chunks)
+        documents = page["documents"] or []
+        page_words, page_characters = count_text(documents)
+        chunks += len(documents)
+        words += page_words
+        characters += page_characters
+        if len(documents) < KB_STATS_PAGE_SIZE:
+            break
+    return {"chunks": chunks, "words": words, "characters": characters, "size": get_directory_size(kb_path)}
+
+
+def update_kb_stats(kb_path: Path, added_texts: list[str], collection) -> dict[str, int]:
+    """Add the chunks just ingested into a knowledge base to its statistics.
+
+    The statistics are computed from the collection instead when they were never recorded, or when they don't
+    match the number of chunks of the collection, e.g. after an ingestion whose statistics were not saved.
+
+    Args:
+        kb_path: The directory of the knowledge base.
+        added_texts: The text of the chunks added to the collection.
+        collection: The Chroma collection of the knowledge base, after the chunks were added.
+    """
+    with _kb_stats_lock(kb_path):
+        stats = read_kb_stats(kb_path)
+        if stats is None or stats["chunks"] + len(added_texts) != collection.count():
+            stats = compute_kb_stats(kb_path, collection)
+        else:
+            words, characters = count_text(added_texts)
+            stats = {
+                "chunks": stats["chunks"] + len(added_texts),
+                "words": stats["words"] + words,
+                "characters": stats["characters"] + characters,
+                "size": get_directory_size(kb_path),
+            }
+        write_kb_stats(kb_path, stats)
+    return stats
+
+
+def reconcile_kb_stats(kb_path: Path) -> dict[str, int] | None:
+    """Record the statistics of a knowledge base that has none, from a full read of its collection.
+
+    Meant to run in the background for the knowledge bases created before the statistics were kept; a knowledge
+    base already being reconciled is skipped.
+
+    Returns:
+        The statistics, or None if the knowledge base is already being reconciled or its collection can't be read.
+    """
+    key = kb_path.resolve()
+    with _kb_stats_locks_lock:
+        if key in _reconciling:
+            return None
+        _reconciling.add(key)
+    try:
+        with _kb_stats_lock(kb_path):
+            if (stats := read_kb_stats(kb_path)) is not None:
+                return stats
+            try:
+                collection = Chroma(persist_directory=str(kb_path), collection_name=kb_path.name)._collection
+                stats = compute_kb_stats(kb_path, collection)
+                write_kb_stats(kb_path, stats)
+            except Exception:  # noqa: BLE001
+                logger.exception(f"Error computing the statistics of knowledge base '{kb_path}'")
+                return None
+            logger.info(f"Recorded the statistics of knowledge base {kb_path.name}: {stats['chunks']} chunks")
+            return stats
+    finally:
+        with _kb_stats_locks_lock:
+            _reconciling.discard(key)
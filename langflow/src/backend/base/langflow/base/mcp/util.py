@@ -9,7 +9,7 @@ import unicodedata
 from collections.abc import Awaitable, Callable
 from typing import Any
 from urllib.parse import urlparse
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import httpx
 from anyio import ClosedResourceError
@@ -39,6 +39,10 @@ MAX_SESSIONS_PER_SERVER = (
 )  # Maximum number of sessions per server to prevent resource exhaustion
 SESSION_IDLE_TIMEOUT = settings.mcp_session_idle_timeout  # 5 minutes idle timeout for sessions
 SESSION_CLEANUP_INTERVAL = settings.mcp_session_cleanup_interval  # Cleanup interval in seconds
+MAX_CONCURRENT_CALLS_PER_SERVER = settings.mcp_max_concurrent_calls_per_server
+TOOLS_CACHE_TTL = settings.mcp_tools_cache_ttl  # Seconds the tools listed by a server are reused
+MAX_CALLS_PER_SESSION = 4  # In-flight requests on each session of a server before another session is opened
+MAX_CONSECUTIVE_FAILURES = 3  # Failed requests in a row after which a session is replaced
 # RFC 7230 compliant header name pattern: token = 1*tchar
 # tchar = "!" / "#" / "$" / "%" / "&" / "'" / "*" / "+" / "-" / "." /
 #         "^" / "_" / "`" / "|" / "~" / DIGIT / ALPHA
@@ -468,6 +472,17 @@ async def _validate_connection_params(mode: str, command: str | None = None, url
         raise ValueError(msg)
 
 
+def _is_connection_error(error: BaseException) -> bool:
+    """Whether an error means the connection of a session is lost, rather than a slow or failed request."""
+    if isinstance(error, asyncio.TimeoutError | TimeoutError):
+        return False
+    return (
+        isinstance(error, ClosedResourceError | ConnectionError)
+        or (isinstance(error, McpError) and "Connection closed" in str(error))
+        or "ClosedResourceError" in str(type(error))
+    )
+
+
 class MCPSessionManager:
     """Manages persistent MCP sessions with proper context manager lifecycle.
 
@@ -476,6 +491,11 @@ class MCPSessionManager:
     2. Maximum session limits per server to prevent resource exhaustion
     3. Idle timeout for automatic session cleanup
     4. Periodic cleanup of stale sessions
+
+    The sessions of a server form a pool shared by the requests sent to it. Sessions are not checked when they
+    are reused: their health is tracked from the outcome of the requests made on them (see `finish_request`),
+    and the sessions that served no request since the last cleanup are checked in the background. The tools
+    listed by a server are reused for `TOOLS_CACHE_TTL` seconds.
     """
 
     def __init__(self):
@@ -486,6 +506,12 @@ class MCPSessionManager:
         self._context_to_session: dict[str, tuple[str, str]] = {}
         # Reference count for each active (server_key, session_id)
         self._session_refcount: dict[tuple[str, str], int] = {}
+        # Per server: a lock so concurrent requests don't open several sessions at once, and the semaphore
+        # bounding the requests running on its sessions
+        self._server_locks: dict[str, asyncio.Lock] = {}
+        self._server_semaphores: dict[str, asyncio.Semaphore] = {}
+        # server_key -> (time the tools were listed, tools)
+        self._tools_by_server: dict[str, tuple[float, list]] = {}
         self._cleanup_task = None
         self._start_cleanup_task()
 
@@ -497,11 +523,12 @@ class MCPSessionManager:
             self._cleanup_task.add_done_callback(self._background_tasks.discard)
 
     async def _periodic_cleanup(self):
-        """Periodically clean up idle sessions."""
+        """Periodically clean up idle sessions and check the health of the sessions that were not used."""
         while True:
             try:
                 await asyncio.sleep(SESSION_CLEANUP_INTERVAL)
                 await self._cleanup_idle_sessions()
+                await self._probe_sessions()
             except asyncio.CancelledError:
                 break
             except (RuntimeError, KeyError, ClosedResourceError, ValueError, asyncio.TimeoutError) as e:
@@ -533,6 +560,32 @@ class MCPSessionManager:
         # Clean up empty server entries
         for server_key in servers_to_remove:
             del self.sessions_by_server[server_key]
+            self._tools_by_server.pop(server_key, None)
+
+    async def _probe_sessions(self):
+        """Check the sessions that served no request since the last cleanup and clean up the unhealthy ones."""
+        current_time = asyncio.get_event_loop().time()
+
+        for server_key, server_data in list(self.sessions_by_server.items()):
+            sessions = server_data.get("sessions", {})
+            for session_id, session_info in list(sessions.items()):
+                if session_info.get("in_flight", 0) > 0:
+                    continue
+                if current_time - session_info.get("last_success", 0) < SESSION_CLEANUP_INTERVAL:
+                    continue
+                try:
+                    healthy = not session_info["task"].done() and await self._validate_session_connectivity(
+                        session_info["session"]
+                    )
+                except Exception as e:  # noqa: BLE001
+                    logger.debug(f"Session connectivity test failed: {e}")
+                    healthy = False
+                if healthy:
+                    session_info["last_success"] = current_time
+                    session_info["failures"] = 0
+                else:
+                    logger.info(f"Session {session_id} for server {server_key} failed health check, cleaning up")
+                    await self._cleanup_session_by_id(server_key, session_id)
 
     def _get_server_key(self, connection_params, transport_type: str) -> str:
         """Generate a consistent server key based on connection parameters."""
@@ -603,6 +656,9 @@ class MCPSessionManager:
         The key insight is that we should reuse sessions based on the server
         identity (command + args for stdio, URL for SSE) rather than the context_id.
         This prevents creating a new subprocess for each unique context.
+
+        Requests share the least busy session of the server. Another session is only opened once every
+        session runs `MAX_CALLS_PER_SESSION` requests, up to `MAX_SESSIONS_PER_SERVER` sessions.
         """
         server_key = self._get_server_key(connection_params, transport_type)
 
@@ -613,60 +669,52 @@ class MCPSessionManager:
         server_data = self.sessions_by_server[server_key]
         sessions = server_data["sessions"]
 
-        # Try to find a healthy existing session
-        for session_id, session_info in sessions.items():
-            session = session_info["session"]
-            task = session_info["task"]
-
-            # Check if session is still alive
-            if not task.done():
-                # Update last used time
-                session_info["last_used"] = asyncio.get_event_loop().time()
-
-                # Quick health check
-                if await self._validate_session_connectivity(session):
+        async with self._server_locks.setdefault(server_key, asyncio.Lock()):
+            # Drop the sessions that stopped or kept failing
+            for session_id, session_info in list(sessions.items()):
+                if session_info["task"].done():
+                    logger.info(f"Session {session_id} for server {server_key} task is done, cleaning up")
+                    await self._cleanup_session_by_id(server_key, session_id)
+                elif session_info.get("failures", 0) >= MAX_CONSECUTIVE_FAILURES:
+                    logger.info(f"Session {session_id} for server {server_key} failed health check, cleaning up")
+                    await self._cleanup_session_by_id(server_key, session_id)
+
+            if sessions:
+                session_id = min(sessions, key=lambda x: sessions[x].get("in_flight", 0))
+                session_info = sessions[session_id]
+                if session_info.get("in_flight", 0) < MAX_CALLS_PER_SESSION or len(sessions) >= MAX_SESSIONS_PER_SERVER:
                     logger.debug(f"Reusing existing session {session_id} for server {server_key}")
+                    session_info["last_used"] = asyncio.get_event_loop().time()
                     # record mapping & bump ref-count for backwards compatibility
                     self._context_to_session[context_id] = (server_key, session_id)
                     self._session_refcount[(server_key, session_id)] = (
                         self._session_refcount.get((server_key, session_id), 0) + 1
                     )
-                    return session
-                logger.info(f"Session {session_id} for server {server_key} failed health check, cleaning up")
-                await self._cleanup_session_by_id(server_key, session_id)
-            else:
-                # Task is done, clean up
-                logger.info(f"Session {session_id} for server {server_key} task is done, cleaning up")
-                await self._cleanup_session_by_id(server_key, session_id)
+                    return session_info["session"]
 
-        # Check if we've reached the maximum number of sessions for this server
-        if len(sessions) >= MAX_SESSIONS_PER_SERVER:
-            # Remove the oldest session
-            oldest_session_id = min(sessions.keys(), key=lambda x: sessions[x]["last_used"])
-            logger.info(
-                f"Maximum sessions reached for server {server_key}, removing oldest session {oldest_session_id}"
-            )
-            await self._cleanup_session_by_id(server_key, oldest_session_id)
+            # Create new session
+            session_id = f"{server_key}_{uuid4().hex[:8]}"
+            logger.info(f"Creating new session {session_id} for server {server_key}")
 
-        # Create new session
-        session_id = f"{server_key}_{len(sessions)}"
-        logger.info(f"Creating new session {session_id} for server {server_key}")
-
-        if transport_type == "stdio":
-            session, task = await self._create_stdio_session(session_id, connection_params)
-        elif transport_type == "sse":
-            session, task = await self._create_sse_session(session_id, connection_params)
-        else:
-            msg = f"Unknown transport type: {transport_type}"
-            raise ValueError(msg)
+            if transport_type == "stdio":
+                session, task = await self._create_stdio_session(session_id, connection_params)
+            elif transport_type == "sse":
+                session, task = await self._create_sse_session(session_id, connection_params)
+            else:
+                msg = f"Unknown transport type: {transport_type}"
+                raise ValueError(msg)
 
-        # Store session info
-        sessions[session_id] = {
-            "session": session,
-            "task": task,
-            "type": transport_type,
-            "last_used": asyncio.get_event_loop().time(),
-        }
+            # Store session info
+            current_time = asyncio.get_event_loop().time()
+            sessions[session_id] = {
+                "session": session,
+                "task": task,
+                "type": transport_type,
+                "last_used": current_time,
+                "last_success": current_time,
+                "failures": 0,
+                "in_flight": 0,
+            }
 
         # register mapping & initial ref-count for the new session
         self._context_to_session[context_id] = (server_key, session_id)
@@ -674,6 +722,77 @@ class MCPSessionManager:
 
         return session
 
+    def _get_session_info(self, server_key: str, session_id: str) -> dict | None:
+        server_data = self.sessions_by_server.get(server_key)
+        if not isinstance(server_data, dict):
+            return None
+        return server_data.get("sessions", {}).get(session_id)
+
+    async def start_request(self, context_id: str | None) -> tuple[str, str] | None:
+        """Wait for the concurrency limit of the server used by a context before sending a request on its session.
+
+        Returns:
+            The server key and session id of the request, to pass to `finish_request` once it is done. None if
+            the context has no session.
+        """
+        request = self._context_to_session.get(context_id) if context_id else None
+        if request is None:
+            return None
+        server_key, session_id = request
+        semaphore = self._server_semaphores.setdefault(server_key, asyncio.Semaphore(MAX_CONCURRENT_CALLS_PER_SERVER))
+        await semaphore.acquire()
+        if (session_info := self._get_session_info(server_key, session_id)) is not None:
+            session_info["in_flight"] = session_info.get("in_flight", 0) + 1
+        return request
+
+    async def finish_request(self, request: tuple[str, str] | None, error: BaseException | None = None) -> None:
+        """Release the concurrency limit taken by `start_request` and record the outcome of the request.
+
+        A success marks the session healthy. A connection error gets the session replaced on the next
+        `get_session`, and so do `MAX_CONSECUTIVE_FAILURES` other errors in a row.
+        """
+        if request is None:
+            return
+        server_key, session_id = request
+        if (semaphore := self._server_semaphores.get(server_key)) is not None:
+            semaphore.release()
+        session_info = self._get_session_info(server_key, session_id)
+        if session_info is None:
+            return
+        session_info["in_flight"] = max(session_info.get("in_flight", 1) - 1, 0)
+        if error is None:
+            session_info["failures"] = 0
+            session_info["last_success"] = asyncio.get_event_loop().time()
+        elif _is_connection_error(error):
+            session_info["failures"] = MAX_CONSECUTIVE_FAILURES
+        elif isinstance(error, Exception):
+            # Cancellations say nothing about the session
+            session_info["failures"] = session_info.get("failures", 0) + 1
+
+    async def list_tools(self, context_id: str | None, session) -> list:
+        """List the tools of the server used by a context, reusing the tools listed in the last `TOOLS_CACHE_TTL`s."""
+        request = self._context_to_session.get(context_id) if context_id else None
+        server_key = request[0] if request else None
+        current_time = asyncio.get_event_loop().time()
+        if server_key is not None and TOOLS_CACHE_TTL > 0:
+            cached = self._tools_by_server.get(server_key)
+            if cached is not None and current_time - cached[0] < TOOLS_CACHE_TTL:
+                return cached[1]
+
+        request = await self.start_request(context_id)
+        error: BaseException | None = None
+        try:
+            response = await session.list_tools()
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            await self.finish_request(request, error)
+
+        if server_key is not None and TOOLS_CACHE_TTL > 0:
+            self._tools_by_server[server_key] = (current_time, response.tools)
+        return response.tools
+
     async def _create_stdio_session(self, session_id: str, connection_params):
         """Create a new stdio session as a background task to avoid context issues."""
         import asyncio
@@ -879,6 +998,9 @@ class MCPSessionManager:
         # Clear compatibility maps
         self._context_to_session.clear()
         self._session_refcount.clear()
+        self._server_locks.clear()
+        self._server_semaphores.clear()
+        self._tools_by_server.clear()
 
         # Clear all background tasks
         for task in list(self._background_tasks):
@@ -917,6 +1039,24 @@ class MCPSessionManager:
         self._context_to_session.pop(context_id, None)
 
 
+async def _call_tool(
+    session_manager: MCPSessionManager, context_id: str | None, session, tool_name: str, arguments: dict[str, Any]
+) -> Any:
+    """Call a tool on a pooled session, within the concurrency limit of its server."""
+    request = await session_manager.start_request(context_id)
+    error: BaseException | None = None
+    try:
+        return await asyncio.wait_for(
+            session.call_tool(tool_name, arguments=arguments),
+            timeout=30.0,  # 30 second timeout
+        )
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        await session_manager.finish_request(request, error)
+
+
 class MCPStdioClient:
     def __init__(self, component_cache=None):
         self.session: ClientSession | None = None
@@ -961,9 +1101,9 @@ class MCPStdioClient:
 
         # Get or create a persistent session
         session = await self._get_or_create_session()
-        response = await session.list_tools()
+        tools = await self._get_session_manager().list_tools(self._session_context, session)
         self._connected = True
-        return response.tools
+        return tools
 
     async def connect_to_server(self, command_str: str, env: dict[str, str] | None = None) -> list[StructuredTool]:
         """Connect to MCP server using stdio transport (SDK style)."""
@@ -1035,9 +1175,8 @@ class MCPStdioClient:
                 # Get or create persistent session
                 session = await self._get_or_create_session()
 
-                result = await asyncio.wait_for(
-                    session.call_tool(tool_name, arguments=arguments),
-                    timeout=30.0,  # 30 second timeout
+                result = await _call_tool(
+                    self._get_session_manager(), self._session_context, session, tool_name, arguments
                 )
             except Exception as e:
                 current_error_type = type(e).__name__
@@ -1255,9 +1394,9 @@ class MCPSseClient:
 
         # Get or create a persistent session
         session = await self._get_or_create_session()
-        response = await session.list_tools()
+        tools = await self._get_session_manager().list_tools(self._session_context, session)
         self._connected = True
-        return response.tools
+        return tools
 
     async def connect_to_server(self, url: str, headers: dict[str, str] | None = None) -> list[StructuredTool]:
         """Connect to MCP server using SSE transport (SDK style)."""
@@ -1340,12 +1479,8 @@ class MCPSseClient:
                 # Get or create persistent session
                 session = await self._get_or_create_session()
 
-                # Add timeout to prevent hanging
-                import asyncio
-
-                result = await asyncio.wait_for(
-                    session.call_tool(tool_name, arguments=arguments),
-                    timeout=30.0,  # 30 second timeout
+                result = await _call_tool(
+                    self._get_session_manager(), self._session_context, session, tool_name, arguments
                 )
             except Exception as e:
                 current_error_type = type(e).__name__
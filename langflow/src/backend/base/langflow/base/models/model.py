@@ -11,8 +11,18 @@ from langchain_core.output_parsers import BaseOutputParser
 from langflow.base.constants import STREAM_INFO_TEXT
 from langflow.custom.custom_component.component import Component
 from langflow.field_typing import LanguageModel
-from langflow.inputs.inputs import BoolInput, InputTypes, MessageInput, MultilineInput
+from langflow.inputs.inputs import (
+    BoolInput,
+    DropdownInput,
+    HandleInput,
+    InputTypes,
+    IntInput,
+    MessageInput,
+    MultilineInput,
+)
 from langflow.schema.message import Message
+from langflow.services.deps import get_llm_cache_service
+from langflow.services.llm_cache.service import CACHE_MODES
 from langflow.template.field.base import Output
 from langflow.utils.constants import MESSAGE_SENDER_AI
 
@@ -47,6 +57,29 @@ class LCModelComponent(Component):
             advanced=False,
         ),
         BoolInput(name="stream", display_name="Stream", info=STREAM_INFO_TEXT, advanced=True),
+        DropdownInput(
+            name="cache_mode",
+            display_name="Cache Responses",
+            options=CACHE_MODES,
+            value="Off",
+            info="Reuse the response of the model to the same messages with the same parameters ('Exact'), "
+            "or to similar messages ('Semantic', which needs a Cache Embedding model).",
+            advanced=True,
+        ),
+        IntInput(
+            name="cache_ttl",
+            display_name="Cache TTL",
+            value=3600,
+            info="Number of seconds a cached response is reused.",
+            advanced=True,
+        ),
+        HandleInput(
+            name="cache_embedding",
+            display_name="Cache Embedding",
+            input_types=["Embeddings"],
+            info="Embedding model the messages are compared with in the 'Semantic' cache mode.",
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -215,6 +248,8 @@ class LCModelComponent(Component):
             raise ValueError(msg)
         system_message_added = False
         message = None
+        model = runnable
+        prompt = None
         if input_value:
             if isinstance(input_value, Message):
                 with warnings.catch_warnings():
@@ -238,6 +273,11 @@ class LCModelComponent(Component):
         inputs: list | dict = messages or {}
         lf_message = None
         try:
+            cache_request = await self._get_cache_request(model, prompt, messages)
+            if cache_request is not None and (cached := await get_llm_cache_service().get(cache_request)) is not None:
+                self.status = cached
+                return Message(text=cached)
+
             # TODO: Depreciated Feature to be removed in upcoming release
             if hasattr(self, "output_parser") and self.output_parser is not None:
                 runnable |= self.output_parser
@@ -266,8 +306,34 @@ class LCModelComponent(Component):
             if message := self._get_exception_message(e):
                 raise ValueError(message) from e
             raise
+        if cache_request is not None and isinstance(result, str):
+            await get_llm_cache_service().set(cache_request, result)
         return lf_message or Message(text=result)
 
+    async def _get_cache_request(self, model, prompt, messages: list[BaseMessage]):
+        """Returns what the response of the model is cached under, None if the component does not cache it."""
+        mode = getattr(self, "cache_mode", "Off")
+        if mode == "Off":
+            return None
+        if prompt is not None:
+            messages = (await prompt.ainvoke({})).to_messages()
+        return get_llm_cache_service().build_request(
+            model,
+            messages,
+            mode=mode,
+            ttl=getattr(self, "cache_ttl", 0),
+            embeddings=getattr(self, "cache_embedding", None),
+            output_parser=self.output_parser,
+            scope=self._get_cache_scope(),
+        )
+
+    def _get_cache_scope(self) -> str:
+        """The responses are only reused by the same component of the same flow, run by the same user."""
+        graph = self._vertex.graph if self._vertex is not None else None
+        flow_id = graph.flow_id if graph is not None else None
+        user_id = getattr(self, "_user_id", None) or (graph.user_id if graph is not None else None)
+        return f"{flow_id}:{user_id}:{self._id}"
+
     async def _handle_stream(self, runnable, inputs):
         """Handle streaming responses from the language model.
 
@@ -26,7 +26,7 @@ from langflow.io import (
 )
 from langflow.schema.data import Data
 from langflow.schema.dotdict import dotdict
-from langflow.services.deps import get_settings_service
+from langflow.services.deps import get_http_client_service, get_settings_service
 from langflow.utils.component_utils import set_current_fields, set_field_advanced, set_field_display
 
 # Define fields for each mode
@@ -439,18 +439,17 @@ class APIRequestComponent(Component):
         body = self._process_body(body)
         url = self.add_query_params(url, query_params)
 
-        async with httpx.AsyncClient() as client:
-            result = await self.make_request(
-                client,
-                method,
-                url,
-                headers,
-                body,
-                timeout,
-                follow_redirects=follow_redirects,
-                save_to_file=save_to_file,
-                include_httpx_metadata=include_httpx_metadata,
-            )
+        result = await self.make_request(
+            get_http_client_service().get_client(url),
+            method,
+            url,
+            headers,
+            body,
+            timeout,
+            follow_redirects=follow_redirects,
+            save_to_file=save_to_file,
+            include_httpx_metadata=include_httpx_metadata,
+        )
         self.status = result
         return result
 
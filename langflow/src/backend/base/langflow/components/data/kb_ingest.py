@@ -16,7 +16,7 @@ from cryptography.fernet import InvalidToken
 from langchain_chroma import Chroma
 from loguru import logger
 
-from langflow.base.data.kb_utils import get_knowledge_bases
+from langflow.base.data.kb_utils import KB_STATS_FILE, get_knowledge_bases, update_kb_stats
 from langflow.base.models.openai_constants import OPENAI_EMBEDDING_MODEL_NAMES
 from langflow.custom import Component
 from langflow.io import BoolInput, DataFrameInput, DropdownInput, IntInput, Output, SecretStrInput, StrInput, TableInput
@@ -29,6 +29,11 @@ from langflow.services.deps import get_settings_service, get_variable_service, s
 
 HUGGINGFACE_MODEL_NAMES = ["sentence-transformers/all-MiniLM-L6-v2", "sentence-transformers/all-mpnet-base-v2"]
 COHERE_MODEL_NAMES = ["embed-english-v3.0", "embed-multilingual-v3.0"]
+# Number of batches of rows embedded at the same time
+MAX_CONCURRENT_EMBEDDING_BATCHES = 4
+# Number of row hashes looked up at once in the knowledge base to skip duplicates
+DUPLICATE_LOOKUP_BATCH_SIZE = 500
+INGESTION_CHECKPOINT_FILE = ".ingestion_checkpoint.json"
 
 settings = get_settings_service().settings
 knowledge_directory = settings.knowledge_bases_dir
@@ -336,7 +341,12 @@ class KBIngestionComponent(Component):
     async def _create_vector_store(
         self, df_source: pd.DataFrame, config_list: list[dict[str, Any]], embedding_model: str, api_key: str
     ) -> None:
-        """Create vector store following Local DB component pattern."""
+        """Embed the rows in batches and write them to the vector store, following Local DB component pattern.
+
+        Up to `MAX_CONCURRENT_EMBEDDING_BATCHES` batches of `chunk_size` rows are embedded at the same time, then
+        written in order. The rows written are recorded in a checkpoint, so an ingestion of the same rows that
+        failed midway resumes after the last rows written.
+        """
         try:
             # Set up vector store directory
             vector_store_dir = await self._kb_path()
@@ -348,9 +358,6 @@ class KBIngestionComponent(Component):
             # Create embeddings model
             embedding_function = self._build_embeddings(embedding_model, api_key)
 
-            # Convert DataFrame to Data objects (following Local DB pattern)
-            data_objects = await self._convert_df_to_data_objects(df_source, config_list)
-
             # Create vector store
             chroma = Chroma(
                 persist_directory=str(vector_store_dir),
@@ -358,47 +365,79 @@ class KBIngestionComponent(Component):
                 collection_name=self.knowledge_base,
             )
 
-            # Convert Data objects to LangChain Documents
-            documents = []
-            for data_obj in data_objects:
-                doc = data_obj.to_lc_document()
-                documents.append(doc)
+            texts, metadatas = self._prepare_rows(df_source, config_list)
+            ids = [metadata["_id"] for metadata in metadatas]
+            checkpoint_path = vector_store_dir / INGESTION_CHECKPOINT_FILE
+            fingerprint = _ingestion_fingerprint(texts, ids, allow_duplicates=self.allow_duplicates)
+            start = _read_checkpoint(checkpoint_path, fingerprint)
+            if start:
+                self.log(f"Resuming the ingestion into '{self.knowledge_base}' after row {start}")
+
+            batch_size = max(int(self.chunk_size or 1000), 1)
+            window_size = batch_size * MAX_CONCURRENT_EMBEDDING_BATCHES
+            seen_ids: set[str] = set()
+            added_texts: list[str] = []
+            for window_start in range(start, len(texts), window_size):
+                window_end = min(window_start + window_size, len(texts))
+                batches = [
+                    await self._new_rows(
+                        chroma, ids, range(batch_start, min(batch_start + batch_size, window_end)), seen_ids
+                    )
+                    for batch_start in range(window_start, window_end, batch_size)
+                ]
+                embeddings = await asyncio.gather(
+                    *(
+                        asyncio.to_thread(embedding_function.embed_documents, [texts[i] for i in rows])
+                        for rows in batches
+                        if rows
+                    )
+                )
+                for rows, vectors in zip((rows for rows in batches if rows), embeddings, strict=True):
+                    await asyncio.to_thread(
+                        chroma._collection.upsert,
+                        ids=[str(uuid.uuid4()) for _ in rows],
+                        embeddings=vectors,
+                        documents=[texts[i] for i in rows],
+                        metadatas=[metadatas[i] for i in rows],
+                    )
+                    added_texts.extend(texts[i] for i in rows)
+                _write_checkpoint(checkpoint_path, fingerprint, window_end)
+                self.log(f"Ingested {window_end}/{len(texts)} rows into '{self.knowledge_base}'")
 
-            # Add documents to vector store
-            if documents:
-                chroma.add_documents(documents)
-                self.log(f"Added {len(documents)} documents to vector store '{self.knowledge_base}'")
+            checkpoint_path.unlink(missing_ok=True)
+            if added_texts:
+                self.log(f"Added {len(added_texts)} documents to vector store '{self.knowledge_base}'")
+                await self._update_kb_stats(vector_store_dir, added_texts, chroma)
 
         except (OSError, ValueError, RuntimeError) as e:
             self.log(f"Error creating vector store: {e}")
 
-    async def _convert_df_to_data_objects(
+    async def _update_kb_stats(self, kb_path: Path, texts: list[str], chroma: Chroma) -> None:
+        """Add the documents to the statistics of the knowledge base, read when listing the knowledge bases."""
+        try:
+            await asyncio.to_thread(update_kb_stats, kb_path, texts, chroma._collection)
+        except (OSError, ValueError) as e:
+            self.log(f"Error updating knowledge base statistics: {e}")
+            # Stale statistics are dropped so they are computed again from the collection
+            with contextlib.suppress(OSError):
+                (kb_path / KB_STATS_FILE).unlink(missing_ok=True)
+
+    def _prepare_rows(
         self, df_source: pd.DataFrame, config_list: list[dict[str, Any]]
-    ) -> list[Data]:
-        """Convert DataFrame to Data objects for vector store."""
-        data_objects: list[Data] = []
-
-        # Set up vector store directory
-        kb_path = await self._kb_path()
-
-        # If we don't allow duplicates, we need to get the existing hashes
-        chroma = Chroma(
-            persist_directory=str(kb_path),
-            collection_name=self.knowledge_base,
-        )
-
-        # Get all documents and their metadata
-        all_docs = chroma.get()
-
-        # Extract all _id values from metadata
-        id_list = [metadata.get("_id") for metadata in all_docs["metadatas"] if metadata.get("_id")]
+    ) -> tuple[list[str], list[dict[str, str]]]:
+        """Build the text and the metadata of the document of each row, column by column.
 
+        The text joins the vectorized columns. The metadata holds the other columns as strings and the `_id` hash
+        of the identifier columns, or of the text when there are none.
+        """
         # Get column roles
-        content_cols = []
-        identifier_cols = []
+        content_cols: list[str] = []
+        identifier_cols: list[str] = []
 
         for config in config_list:
             col_name = config.get("column_name")
+            if col_name is None:
+                continue
             vectorize = config.get("vectorize") == "True" or config.get("vectorize") is True
             identifier = config.get("identifier") == "True" or config.get("identifier") is True
 
@@ -407,45 +446,37 @@ class KBIngestionComponent(Component):
             elif identifier:
                 identifier_cols.append(col_name)
 
-        # Convert each row to a Data object
-        for _, row in df_source.iterrows():
-            # Build content text from identifier columns using list comprehension
-            identifier_parts = [str(row[col]) for col in content_cols if col in row and pd.notna(row[col])]
-
-            # Join all parts into a single string
-            page_content = " ".join(identifier_parts)
-
-            # Build metadata from NON-vectorized columns only (simple key-value pairs)
-            data_dict = {
-                "text": page_content,  # Main content for vectorization
-            }
-
-            # Add identifier columns if they exist
-            if identifier_cols:
-                identifier_parts = [str(row[col]) for col in identifier_cols if col in row and pd.notna(row[col])]
-                page_content = " ".join(identifier_parts)
-
-            # Add metadata columns as simple key-value pairs
-            for col in df_source.columns:
-                if col not in content_cols and col in row and pd.notna(row[col]):
-                    # Convert to simple types for Chroma metadata
-                    value = row[col]
-                    data_dict[col] = str(value)  # Convert complex types to string
-
-            # Hash the page_content for unique ID
-            page_content_hash = hashlib.sha256(page_content.encode()).hexdigest()
-            data_dict["_id"] = page_content_hash
-
-            # If duplicates are disallowed, and hash exists, prevent adding this row
-            if not self.allow_duplicates and page_content_hash in id_list:
-                self.log(f"Skipping duplicate row with hash {page_content_hash}")
+        texts = _join_columns(df_source, content_cols).tolist()
+        id_sources = _join_columns(df_source, identifier_cols).tolist() if identifier_cols else texts
+        ids = [hashlib.sha256(id_source.encode()).hexdigest() for id_source in id_sources]
+
+        # Metadata from NON-vectorized columns only, as simple key-value pairs for Chroma
+        metadata_cols = [col for col in df_source.columns if col not in content_cols]
+        rows = df_source[metadata_cols].itertuples(index=False, name=None)
+        metadatas = []
+        for text, id_, values in zip(texts, ids, rows, strict=True):
+            # A non-vectorized "text" column replaces the text, as the text is the "text" key of the data
+            data_dict = {"text": text}
+            for col, value in zip(metadata_cols, values, strict=True):
+                if pd.notna(value):
+                    data_dict[col] = str(value)
+            data_dict["_id"] = id_
+            metadatas.append(data_dict)
+        return [data_dict.pop("text") for data_dict in metadatas], metadatas
+
+    async def _new_rows(self, chroma: Chroma, ids: list[str], rows: range, seen_ids: set[str]) -> list[int]:
+        """Return the rows to add, without the duplicates of documents of the knowledge base or of earlier rows."""
+        if self.allow_duplicates:
+            return list(rows)
+        existing_ids = await asyncio.to_thread(_find_existing_ids, chroma, list({ids[i] for i in rows}))
+        new_rows = []
+        for i in rows:
+            if ids[i] in existing_ids or ids[i] in seen_ids:
+                self.log(f"Skipping duplicate row with hash {ids[i]}")
                 continue
-
-            # Create Data object - everything except "text" becomes metadata
-            data_obj = Data(data=data_dict)
-            data_objects.append(data_obj)
-
-        return data_objects
+            seen_ids.add(ids[i])
+            new_rows.append(i)
+        return new_rows
 
     def is_valid_collection_name(self, name, min_length: int = 3, max_length: int = 63) -> bool:
         """Validates collection name against conditions 1-3.
@@ -655,3 +686,52 @@ class KBIngestionComponent(Component):
                 build_config["knowledge_base"]["value"] = None
 
         return build_config
+
+
+def _join_columns(df: pd.DataFrame, columns: list[str]) -> pd.Series:
+    """Join the values of the columns of each row with spaces, skipping the missing values."""
+    joined = pd.Series("", index=df.index, dtype=object)
+    has_value = pd.Series(data=False, index=df.index)
+    for col in columns:
+        if col not in df.columns:
+            continue
+        present = df[col].notna()
+        separator = has_value[present].map({True: " ", False: ""})
+        joined[present] = joined[present] + separator + df.loc[present, col].map(str)
+        has_value |= present
+    return joined
+
+
+def _find_existing_ids(chroma: Chroma, ids: list[str]) -> set[str]:
+    """Return the row hashes that are already in the knowledge base, looked up by batches."""
+    existing_ids: set[str] = set()
+    for i in range(0, len(ids), DUPLICATE_LOOKUP_BATCH_SIZE):
+        results = chroma.get(where={"_id": {"$in": ids[i : i + DUPLICATE_LOOKUP_BATCH_SIZE]}}, include=["metadatas"])
+        existing_ids.update(metadata["_id"] for metadata in results["metadatas"] if metadata and metadata.get("_id"))
+    return existing_ids
+
+
+def _ingestion_fingerprint(texts: list[str], ids: list[str], *, allow_duplicates: bool) -> str:
+    """Identify the rows of an ingestion, to only resume it from a checkpoint of the same rows."""
+    fingerprint = hashlib.sha256(f"{allow_duplicates}:{len(texts)}".encode())
+    for text, id_ in zip(texts, ids, strict=True):
+        fingerprint.update(id_.encode())
+        fingerprint.update(text.encode())
+    return fingerprint.hexdigest()
+
+
+def _read_checkpoint(checkpoint_path: Path, fingerprint: str) -> int:
+    """Return the number of rows already written by an ingestion of the same rows, 0 if there is none."""
+    try:
+        checkpoint = json.loads(checkpoint_path.read_text())
+    except (OSError, ValueError):
+        return 0
+    if not isinstance(checkpoint, dict) or checkpoint.get("fingerprint") != fingerprint:
+        return 0
+    return int(checkpoint.get("rows_written", 0))
+
+
+def _write_checkpoint(checkpoint_path: Path, fingerprint: str, rows_written: int) -> None:
+    tmp_path = checkpoint_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps({"fingerprint": fingerprint, "rows_written": rows_written}))
+    tmp_path.replace(checkpoint_path)
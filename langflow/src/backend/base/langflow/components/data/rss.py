@@ -1,11 +1,12 @@
+import httpx
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from langflow.custom import Component
 from langflow.io import IntInput, MessageTextInput, Output
 from langflow.logging import logger
 from langflow.schema import DataFrame
+from langflow.services.deps import get_http_client_service
 
 
 class RSSReaderComponent(Component):
@@ -34,9 +35,10 @@ class RSSReaderComponent(Component):
 
     outputs = [Output(name="articles", display_name="Articles", method="read_rss")]
 
-    def read_rss(self) -> DataFrame:
+    async def read_rss(self) -> DataFrame:
         try:
-            response = requests.get(self.rss_url, timeout=self.timeout)
+            client = get_http_client_service().get_client(self.rss_url)
+            response = await client.get(self.rss_url, timeout=self.timeout, follow_redirects=True)
             response.raise_for_status()
             if not response.content.strip():
                 msg = "Empty response received"
@@ -49,7 +51,7 @@ class RSSReaderComponent(Component):
                 raise ValueError(msg) from e
             soup = BeautifulSoup(response.content, "xml")
             items = soup.find_all("item")
-        except (requests.RequestException, ValueError) as e:
+        except (httpx.HTTPError, ValueError) as e:
             self.status = f"Failed to fetch RSS: {e}"
             return DataFrame(pd.DataFrame([{"title": "Error", "link": "", "published": "", "summary": str(e)}]))
 
@@ -1,14 +1,15 @@
+import asyncio
 import re
 from urllib.parse import parse_qs, unquote, urlparse
 
+import httpx
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from langflow.custom import Component
 from langflow.io import IntInput, MessageTextInput, Output
 from langflow.schema import DataFrame
-from langflow.services.deps import get_settings_service
+from langflow.services.deps import get_http_client_service, get_settings_service
 
 
 class WebSearchComponent(Component):
@@ -57,7 +58,21 @@ class WebSearchComponent(Component):
         # Remove potentially dangerous characters
         return re.sub(r'[<>"\']', "", query.strip())
 
-    def perform_search(self) -> DataFrame:
+    async def _fetch_content(self, link: str, headers: dict[str, str]) -> tuple[str, str]:
+        """Returns the URL and the text of a result page."""
+        try:
+            final_url = self.ensure_url(link)
+            page = (
+                await get_http_client_service()
+                .get_client(final_url)
+                .get(final_url, headers=headers, timeout=self.timeout, follow_redirects=True)
+            )
+            page.raise_for_status()
+        except httpx.HTTPError as e:
+            return link, f"(Failed to fetch: {e!s}"
+        return final_url, BeautifulSoup(page.text, "lxml").get_text(separator=" ", strip=True)
+
+    async def perform_search(self) -> DataFrame:
         query = self._sanitize_query(self.query)
         if not query:
             msg = "Empty search query"
@@ -67,9 +82,12 @@ class WebSearchComponent(Component):
         url = "https://html.duckduckgo.com/html/"
 
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=self.timeout)
+            client = get_http_client_service().get_client(url)
+            response = await client.get(
+                url, params=params, headers=headers, timeout=self.timeout, follow_redirects=True
+            )
             response.raise_for_status()
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.status = f"Failed request: {e!s}"
             return DataFrame(pd.DataFrame([{"title": "Error", "link": "", "snippet": str(e), "content": ""}]))
 
@@ -79,7 +97,7 @@ class WebSearchComponent(Component):
                 pd.DataFrame([{"title": "Error", "link": "", "snippet": "No results found", "content": ""}])
             )
         soup = BeautifulSoup(response.text, "html.parser")
-        results = []
+        found = []
 
         for result in soup.select("div.result"):
             title_tag = result.select_one("a.result__a")
@@ -89,24 +107,19 @@ class WebSearchComponent(Component):
                 parsed = urlparse(raw_link)
                 uddg = parse_qs(parsed.query).get("uddg", [""])[0]
                 decoded_link = unquote(uddg) if uddg else raw_link
-
-                try:
-                    final_url = self.ensure_url(decoded_link)
-                    page = requests.get(final_url, headers=headers, timeout=self.timeout)
-                    page.raise_for_status()
-                    content = BeautifulSoup(page.text, "lxml").get_text(separator=" ", strip=True)
-                except requests.RequestException as e:
-                    final_url = decoded_link
-                    content = f"(Failed to fetch: {e!s}"
-
-                results.append(
-                    {
-                        "title": title_tag.get_text(strip=True),
-                        "link": final_url,
-                        "snippet": snippet_tag.get_text(strip=True) if snippet_tag else "",
-                        "content": content,
-                    }
-                )
+                found.append((title_tag, snippet_tag, decoded_link))
+
+        # The result pages are fetched concurrently
+        pages = await asyncio.gather(*(self._fetch_content(link, headers) for _, _, link in found))
+        results = [
+            {
+                "title": title_tag.get_text(strip=True),
+                "link": final_url,
+                "snippet": snippet_tag.get_text(strip=True) if snippet_tag else "",
+                "content": content,
+            }
+            for (title_tag, snippet_tag, _), (final_url, content) in zip(found, pages, strict=True)
+        ]
 
         df_results = pd.DataFrame(results)
         return DataFrame(df_results)
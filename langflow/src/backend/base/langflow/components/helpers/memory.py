@@ -3,7 +3,7 @@ from typing import Any, cast
 from langflow.custom.custom_component.component import Component
 from langflow.helpers.data import data_to_text
 from langflow.inputs.inputs import DropdownInput, HandleInput, IntInput, MessageTextInput, MultilineInput, TabInput
-from langflow.memory import aget_messages, astore_message
+from langflow.memory import aget_messages, aget_recent_messages, astore_message
 from langflow.schema.data import Data
 from langflow.schema.dataframe import DataFrame
 from langflow.schema.dotdict import dotdict
@@ -160,11 +160,8 @@ class MemoryComponent(Component):
                 stored_messages = [m for m in stored_messages if m.sender == message.sender]
         else:
             await astore_message(message, flow_id=self.graph.flow_id)
-            stored_messages = (
-                await aget_messages(
-                    session_id=message.session_id, sender_name=message.sender_name, sender=message.sender
-                )
-                or []
+            stored_messages = await aget_recent_messages(
+                message.session_id, 1, sender_name=message.sender_name, sender=message.sender
             )
 
         if not stored_messages:
@@ -207,8 +204,16 @@ class MemoryComponent(Component):
             if sender_type:
                 expected_type = MESSAGE_SENDER_AI if sender_type == MESSAGE_SENDER_AI else MESSAGE_SENDER_USER
                 stored = [m for m in stored if m.type == expected_type]
+        elif n_messages:
+            # For internal memory, only the last N messages are read, from the cache of recent messages if possible
+            stored = await aget_recent_messages(
+                session_id,
+                n_messages,
+                sender=sender_type,
+                sender_name=sender_name,
+                order=order,
+            )
         else:
-            # For internal memory, we always fetch the last N messages by ordering by DESC
             stored = await aget_messages(
                 sender=sender_type,
                 sender_name=sender_name,
@@ -216,8 +221,6 @@ class MemoryComponent(Component):
                 limit=10000,
                 order=order,
             )
-            if n_messages:
-                stored = stored[-n_messages:] if order == "ASC" else stored[:n_messages]
 
         # self.status = stored
         return cast(Data, stored)
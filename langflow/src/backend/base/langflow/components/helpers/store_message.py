@@ -3,7 +3,7 @@ from langflow.inputs.inputs import (
     HandleInput,
     MessageTextInput,
 )
-from langflow.memory import aget_messages, astore_message
+from langflow.memory import aget_recent_messages, astore_message
 from langflow.schema.message import Message
 from langflow.template.field.base import Output
 from langflow.utils.constants import MESSAGE_SENDER_AI, MESSAGE_SENDER_NAME_AI
@@ -74,11 +74,8 @@ class MessageStoreComponent(Component):
                 stored_messages = [m for m in stored_messages if m.sender == message.sender]
         else:
             await astore_message(message, flow_id=self.graph.flow_id)
-            stored_messages = (
-                await aget_messages(
-                    session_id=message.session_id, sender_name=message.sender_name, sender=message.sender
-                )
-                or []
+            stored_messages = await aget_recent_messages(
+                message.session_id, 1, sender_name=message.sender_name, sender=message.sender
             )
 
         if not stored_messages:
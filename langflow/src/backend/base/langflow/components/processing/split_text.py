@@ -14,6 +14,7 @@ class SplitTextComponent(Component):
     documentation: str = "https://docs.langflow.org/components-processing#split-text"
     icon = "scissors-line-dashed"
     name = "SplitText"
+    cache_results = True
 
     inputs = [
         HandleInput(
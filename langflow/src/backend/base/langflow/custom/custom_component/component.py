@@ -22,6 +22,7 @@ from langflow.base.tools.constants import (
     TOOLS_METADATA_INPUT_NAME,
 )
 from langflow.custom.tree_visitor import RequiredInputsVisitor
+from langflow.events.event_manager import EventManager, TokenCoalescer
 from langflow.exceptions.component import StreamingError
 from langflow.field_typing import Tool  # noqa: TC001 Needed by _add_toolkit_output
 
@@ -30,7 +31,7 @@ from langflow.field_typing import Tool  # noqa: TC001 Needed by _add_toolkit_out
 # Lazy import to avoid circular dependency
 # from langflow.graph.utils import has_chat_output
 from langflow.helpers.custom import format_type
-from langflow.memory import astore_message, aupdate_messages, delete_message
+from langflow.memory import MessageDeltaWriter, astore_message, aupdate_messages, delete_message
 from langflow.schema.artifact import get_artifact_type, post_process_raw
 from langflow.schema.data import Data
 from langflow.schema.message import ErrorMessage, Message
@@ -47,7 +48,6 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
     from langflow.base.tools.component_tool import ComponentToolkit
-    from langflow.events.event_manager import EventManager
     from langflow.graph.edge.schema import EdgeData
     from langflow.graph.vertex.base import Vertex
     from langflow.inputs.inputs import InputTypes
@@ -99,6 +99,11 @@ class Component(CustomComponent):
     outputs: list[Output] = []
     selected_output: str | None = None
     code_class_base_inheritance: ClassVar[str] = "Component"
+    cache_results: ClassVar[bool] = False
+    """Whether the results are reused while the code and the inputs of the component don't change, see
+    `component_result_cache_size`. Only for components whose results only depend on their inputs."""
+    result_cache_ttl: ClassVar[int | None] = None
+    """Number of seconds the results are reused, `component_result_cache_ttl` if None."""
 
     def __init__(self, **kwargs) -> None:
         # Initialize instance-specific attributes first
@@ -120,6 +125,7 @@ class Component(CustomComponent):
         self._edges: list[EdgeData] = []
         self._components: list[Component] = []
         self._event_manager: EventManager | None = None
+        self._message_writer: MessageDeltaWriter | None = None
         self._state_model = None
 
         # Process input kwargs
@@ -1072,13 +1078,20 @@ class Component(CustomComponent):
         self._pre_run_setup_if_needed()
         self._handle_tool_mode()
 
-        for output in self._get_outputs_to_process():
-            self._current_output = output.name
-            result = await self._get_output_result(output)
-            results[output.name] = result
-            artifacts[output.name] = self._build_artifact(result)
-            self._log_output(output)
-
+        try:
+            for output in self._get_outputs_to_process():
+                self._current_output = output.name
+                result = await self._get_output_result(output)
+                results[output.name] = result
+                artifacts[output.name] = self._build_artifact(result)
+                self._log_output(output)
+
+            if self._message_writer is not None:
+                # Write the last update of a message that was not materialized by the component
+                await self._message_writer.flush()
+        finally:
+            # A failed build must not leave its pending update to the next build of the component
+            self._discard_message_writer()
         self._finalize_results(results, artifacts)
         return results, artifacts
 
@@ -1479,7 +1492,19 @@ class Component(CustomComponent):
             message.session_id = session_id
         if hasattr(message, "flow_id") and isinstance(message.flow_id, str):
             message.flow_id = UUID(message.flow_id)
-        stored_message = await self._store_message(message)
+        writer = self._message_writer
+        if writer is not None and self._is_partial_update(message, writer):
+            # The message is still being built: only its changes are written, coalesced over time
+            await writer.push(message)
+            stored_message = message
+        else:
+            if writer is not None:
+                if message.id and str(message.id) == str(writer.message_id):
+                    writer.discard()
+                else:
+                    await writer.flush()
+            stored_message = await self._store_message(message)
+            self._message_writer = self._create_message_writer(stored_message)
 
         self._stored_message_id = stored_message.id
         try:
@@ -1514,6 +1539,39 @@ class Component(CustomComponent):
         stored_message = stored_messages[0]
         return await Message.create(**stored_message.model_dump())
 
+    def _create_message_writer(self, stored_message: Message) -> MessageDeltaWriter | None:
+        from langflow.services.deps import get_settings_service
+
+        interval = get_settings_service().settings.message_persist_interval
+        if interval <= 0 or not stored_message.id or not isinstance(stored_message.text, str):
+            return None
+        if getattr(stored_message.properties, "state", None) != "partial":
+            return None
+        return MessageDeltaWriter(stored_message, interval)
+
+    @staticmethod
+    def _is_partial_update(message: Message, writer: MessageDeltaWriter) -> bool:
+        return (
+            bool(message.id)
+            and str(message.id) == str(writer.message_id)
+            and isinstance(message.text, str)
+            and getattr(message.properties, "state", None) == "partial"
+        )
+
+    async def _materialize_message(self, message: Message) -> Message:
+        """Writes the full message once it is complete, if it was built by writing its changes."""
+        writer = self._message_writer
+        if writer is None or not message.id or str(message.id) != str(writer.message_id):
+            return message
+        writer.discard()
+        self._message_writer = None
+        return await self._update_stored_message(message)
+
+    def _discard_message_writer(self) -> None:
+        if self._message_writer is not None:
+            self._message_writer.discard()
+            self._message_writer = None
+
     async def _send_message_event(self, message: Message, id_: str | None = None, category: str | None = None) -> None:
         if hasattr(self, "_event_manager") and self._event_manager:
             data_dict = message.model_dump()["data"] if hasattr(message, "data") else message.model_dump()
@@ -1565,54 +1623,63 @@ class Component(CustomComponent):
         message_table = message_tables[0]
         return await Message.create(**message_table.model_dump())
 
+    def _create_token_coalescer(self, message_id: str) -> TokenCoalescer:
+        from langflow.services.deps import get_settings_service
+
+        if self._event_manager is None:
+            # `_should_stream_message` only streams when there is an event manager
+            msg = "Cannot stream a message without an event manager."
+            raise ValueError(msg)
+        settings = get_settings_service().settings
+        return TokenCoalescer(
+            self._event_manager,
+            message_id,
+            frame_size=settings.stream_token_frame_size,
+            frame_interval=settings.stream_token_frame_interval,
+        )
+
     async def _stream_message(self, iterator: AsyncIterator | Iterator, message: Message) -> str:
         if not isinstance(iterator, AsyncIterator | Iterator):
             msg = "The message must be an iterator or an async iterator."
             raise TypeError(msg)
 
-        if isinstance(iterator, AsyncIterator):
-            return await self._handle_async_iterator(iterator, message.id, message)
+        tokens = self._create_token_coalescer(message.id)
         try:
-            complete_message = ""
-            first_chunk = True
-            for chunk in iterator:
-                complete_message = await self._process_chunk(
-                    chunk.content, complete_message, message.id, message, first_chunk=first_chunk
-                )
-                first_chunk = False
-        except Exception as e:
-            raise StreamingError(cause=e, source=message.properties.source) from e
-        else:
-            return complete_message
+            if isinstance(iterator, AsyncIterator):
+                await self._handle_async_iterator(iterator, tokens, message)
+            else:
+                try:
+                    first_chunk = True
+                    for chunk in iterator:
+                        await self._process_chunk(chunk.content, tokens, message, first_chunk=first_chunk)
+                        first_chunk = False
+                except Exception as e:
+                    raise StreamingError(cause=e, source=message.properties.source) from e
+        finally:
+            complete_message = tokens.close()
+        return complete_message
 
-    async def _handle_async_iterator(self, iterator: AsyncIterator, message_id: str, message: Message) -> str:
-        complete_message = ""
+    async def _handle_async_iterator(self, iterator: AsyncIterator, tokens: TokenCoalescer, message: Message) -> None:
         first_chunk = True
         async for chunk in iterator:
-            complete_message = await self._process_chunk(
-                chunk.content, complete_message, message_id, message, first_chunk=first_chunk
-            )
+            await self._process_chunk(chunk.content, tokens, message, first_chunk=first_chunk)
             first_chunk = False
-        return complete_message
 
     async def _process_chunk(
-        self, chunk: str, complete_message: str, message_id: str, message: Message, *, first_chunk: bool = False
-    ) -> str:
-        complete_message += chunk
-        if self._event_manager:
-            if first_chunk:
-                # Send the initial message only on the first chunk
-                msg_copy = message.model_copy()
-                msg_copy.text = complete_message
-                await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
-                data={
-                    "chunk": chunk,
-                    "id": str(message_id),
-                },
-            )
-        return complete_message
+        self, chunk: str, tokens: TokenCoalescer, message: Message, *, first_chunk: bool = False
+    ) -> None:
+        if first_chunk:
+            # Send the initial message only on the first chunk, and its token right after it
+            msg_copy = message.model_copy()
+            msg_copy.text = chunk
+            await self._send_message_event(msg_copy, id_=message.id)
+            tokens.push(chunk)
+            tokens.flush()
+        else:
+            tokens.push(chunk)
+        if isinstance(self._event_manager, EventManager):
+            # Slow the stream down to the pace of the client if the token events wait for it
+            await self._event_manager.wait_for_room(token=True)
 
     async def send_error(
         self,
@@ -1,12 +1,109 @@
+import hashlib
+import threading
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
+from cachetools import LRUCache
+from loguru import logger
+
 from langflow.utils import validate
 
 if TYPE_CHECKING:
     from langflow.custom.custom_component.custom_component import CustomComponent
 
 
+def get_code_hash(code: str) -> str:
+    """Returns the SHA-256 hex digest of the component code."""
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+class ComponentClassCache:
+    """A process-wide LRU cache of compiled component classes keyed by the hash of their code.
+
+    Compiling a component means parsing, compiling and executing its source, so the same class is
+    reused by every vertex, graph and request that runs the same code. The size is read from the
+    `component_class_cache_size` setting the first time it is needed; 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        self._maxsize = maxsize
+        self._cache: LRUCache[str, type] | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is None:
+            from langflow.services.deps import get_settings_service
+
+            self._maxsize = get_settings_service().settings.component_class_cache_size
+        return self._maxsize
+
+    def _get_cache(self) -> LRUCache[str, type] | None:
+        if self._cache is None and self.maxsize > 0:
+            self._cache = LRUCache(maxsize=self.maxsize)
+        return self._cache
+
+    def get_or_create(self, code: str) -> type["CustomComponent"]:
+        """Returns the class defined in `code`, compiling it only if it is not cached."""
+        code_hash = get_code_hash(code)
+        with self._lock:
+            cache = self._get_cache()
+            class_object = cache.get(code_hash) if cache is not None else None
+            if class_object is not None:
+                self.hits += 1
+                return class_object
+            self.misses += 1
+
+        class_name = validate.extract_class_name(code)
+        class_object = validate.create_class(code, class_name)
+        if cache is not None:
+            with self._lock:
+                cache[code_hash] = class_object
+        return class_object
+
+    def warm_up(self, codes: Iterable[str]) -> int:
+        """Compiles the given component codes ahead of time.
+
+        Code that fails to compile is skipped. Stops once the cache is full.
+
+        Returns:
+            int: The number of classes compiled.
+        """
+        compiled = 0
+        for code in codes:
+            if self.maxsize <= 0 or compiled >= self.maxsize:
+                break
+            with self._lock:
+                cache = self._get_cache()
+                if cache is not None and get_code_hash(code) in cache:
+                    continue
+            try:
+                self.get_or_create(code)
+            except Exception:  # noqa: BLE001
+                logger.debug("Skipping component that failed to compile during warm-up")
+                continue
+            compiled += 1
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._cache is not None:
+                self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache) if self._cache is not None else 0
+
+
+component_class_cache = ComponentClassCache()
+
+
 def eval_custom_component_code(code: str) -> type["CustomComponent"]:
-    """Evaluate custom component code."""
-    class_name = validate.extract_class_name(code)
-    return validate.create_class(code, class_name)
+    """Evaluate custom component code.
+
+    The compiled class is cached by the hash of the code, see `ComponentClassCache`.
+    """
+    return component_class_cache.get_or_create(code)
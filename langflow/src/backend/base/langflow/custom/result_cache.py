@@ -0,0 +1,242 @@
+"""Memoization of the results of components across runs.
+
+Components that set `cache_results` are only built once for the same code and inputs: the results are keyed
+by the hash of the code of the component and a canonical hash of its resolved inputs, so a change upstream
+is a different key rather than a stale result. Results are kept in memory, up to a number of bytes, and
+optionally on disk or in Redis, where they are shared by the workers and survive restarts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+from cachetools import LRUCache
+from loguru import logger
+from pydantic import BaseModel
+
+from langflow.custom.eval import get_code_hash
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.service import RedisCache
+
+if TYPE_CHECKING:
+    from langflow.custom.custom_component.component import Component
+    from langflow.services.cache.base import AsyncBaseCacheService
+
+RESULT_CACHE_DIR = "component_results"
+RESULT_KEY_PREFIX = "component_result"
+# Fields of the messages that change on every run without changing what a component computes from them
+VOLATILE_FIELDS = {"id", "timestamp", "flow_id"}
+
+
+class UncacheableInputError(TypeError):
+    """An input of the component has no canonical representation."""
+
+
+@dataclass
+class CachedResult:
+    """What a component build leaves on the component and returns, without the component itself."""
+
+    results: dict[str, Any]
+    artifacts: dict[str, Any]
+    output_logs: dict[str, Any]
+    status: Any
+    expires_at: float = 0.0
+
+    @classmethod
+    def from_component(cls, component: Component, ttl: float) -> CachedResult:
+        return cls(
+            results=component._results,
+            artifacts=component._artifacts,
+            output_logs=component._output_logs,
+            status=component.status,
+            expires_at=time.time() + ttl,
+        )
+
+    def restore(self, component: Component) -> tuple[Component, dict[str, Any], dict[str, Any]]:
+        """Sets the results on the component and returns them like `Component.build_results` does."""
+        component._results = self.results
+        component._artifacts = self.artifacts
+        component._output_logs = self.output_logs
+        component.status = self.status
+        return component, self.results, self.artifacts
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return {"__model__": type(value).__name__, **value.model_dump(mode="json", exclude=VOLATILE_FIELDS)}
+    if isinstance(value, pd.DataFrame):
+        return {"__dataframe__": value.to_json(orient="split", date_format="iso", default_handler=repr)}
+    if isinstance(value, set | frozenset):
+        return sorted(_canonical(item) for item in value)
+    if isinstance(value, bytes):
+        return {"__bytes__": hashlib.sha256(value).hexdigest()}
+    msg = f"Cannot fingerprint an input of type {type(value).__name__}"
+    raise UncacheableInputError(msg)
+
+
+def _canonical(value: Any) -> str:
+    try:
+        return json.dumps(value, sort_keys=True, separators=(",", ":"), default=_encode)
+    except UncacheableInputError:
+        raise
+    except (ValueError, TypeError) as exc:
+        # Keys that are not strings, circular references or models that cannot be dumped
+        raise UncacheableInputError(str(exc)) from exc
+
+
+def fingerprint_inputs(params: dict[str, Any], outputs: list[str] | None = None) -> str | None:
+    """Returns the hash of the inputs of a component, None if an input cannot be fingerprinted.
+
+    Args:
+        params (dict[str, Any]): The resolved inputs, with the results of the upstream components.
+        outputs (list[str] | None): The outputs that are built, None for all of them.
+    """
+    try:
+        canonical = _canonical({"params": params, "outputs": outputs})
+    except UncacheableInputError as exc:
+        logger.debug(f"Not caching the results of the component: {exc}")
+        return None
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def result_cache_key(component: Component, params: dict[str, Any]) -> str | None:
+    """Returns the key of the results of a component built with `params`, None if they are not cached."""
+    if not getattr(component, "cache_results", False) or not component._code:
+        return None
+    vertex = component._vertex
+    outputs = None
+    if vertex is not None and vertex.outgoing_edges:
+        outputs = sorted(name for name in vertex.edges_source_names if name is not None)
+    if (inputs_hash := fingerprint_inputs(params, outputs)) is None:
+        return None
+    return f"{RESULT_KEY_PREFIX}:{get_code_hash(component._code)}:{inputs_hash}"
+
+
+class ComponentResultCache:
+    """Caches the results of the components that opt in, in memory and optionally on disk or in Redis.
+
+    The memory tier is an LRU bounded by the number of bytes of the pickled results. Entries expire after the
+    TTL of their component. The settings are read the first time the cache is used.
+    """
+
+    def __init__(self) -> None:
+        self._memory: LRUCache[str, tuple[float, bytes]] | None = None
+        self._backend: AsyncBaseCacheService | None = None
+        self._default_ttl = 0.0
+        self._configured = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, max_bytes: int, ttl: float, backend: AsyncBaseCacheService | None = None) -> None:
+        self._memory = LRUCache(maxsize=max_bytes, getsizeof=lambda entry: len(entry[1])) if max_bytes > 0 else None
+        self._backend = backend
+        self._default_ttl = ttl
+        self._configured = True
+
+    def _configure_from_settings(self) -> None:
+        from langflow.services.deps import get_settings_service
+
+        settings = get_settings_service().settings
+        backend: AsyncBaseCacheService | None = None
+        if settings.component_result_cache_backend == "disk":
+            backend = AsyncDiskCache(
+                cache_dir=Path(settings.config_dir) / RESULT_CACHE_DIR,
+                expiration_time=settings.component_result_cache_ttl,
+                persistent=True,
+                size_limit=settings.component_result_cache_disk_size,
+            )
+        elif settings.component_result_cache_backend == "redis":
+            backend = RedisCache(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                db=settings.redis_db,
+                url=settings.redis_url,
+                expiration_time=settings.component_result_cache_ttl,
+            )
+        self.configure(settings.component_result_cache_size, settings.component_result_cache_ttl, backend)
+
+    @property
+    def enabled(self) -> bool:
+        if not self._configured:
+            self._configure_from_settings()
+        return self._memory is not None or self._backend is not None
+
+    async def get(self, key: str) -> CachedResult | None:
+        """Returns a copy of the cached results, None if they are not cached or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key) if self._memory is not None else None
+        result: CachedResult | None
+        if entry is not None and entry[0] > now:
+            result = self._decode(entry[1])
+        else:
+            result = await self._get_from_backend(key)
+            if result is not None and result.expires_at > now:
+                self._set_in_memory(key, result)
+        if result is None or result.expires_at <= now:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    async def set(self, key: str, component: Component) -> None:
+        """Caches the results the component was just built with, if they can be serialized."""
+        ttl = getattr(component, "result_cache_ttl", None) or self._default_ttl
+        result = CachedResult.from_component(component, ttl)
+        try:
+            blob = pickle.dumps(result)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            logger.debug(f"Could not serialize the results of {component.display_name}, not caching them")
+            return
+        self._set_in_memory(key, result, blob)
+        if self._backend is not None:
+            try:
+                await self._backend.set(key, result)
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).debug(f"Could not cache the results of {component.display_name}")
+
+    async def _get_from_backend(self, key: str) -> CachedResult | None:
+        if self._backend is None:
+            return None
+        try:
+            cached = await self._backend.get(key)
+        except Exception:  # noqa: BLE001
+            logger.debug("Ignoring an invalid cached component result")
+            return None
+        return cached if isinstance(cached, CachedResult) else None
+
+    def _set_in_memory(self, key: str, result: CachedResult, blob: bytes | None = None) -> None:
+        if self._memory is None:
+            return
+        blob = blob if blob is not None else pickle.dumps(result)
+        if len(blob) > self._memory.maxsize:
+            return
+        with self._lock:
+            self._memory[key] = (result.expires_at, blob)
+
+    @staticmethod
+    def _decode(blob: bytes) -> CachedResult:
+        return pickle.loads(blob)  # noqa: S301
+
+    def reset(self) -> None:
+        """Drops the memory tier and closes the backend; the settings are read again on the next use."""
+        with self._lock:
+            if isinstance(self._backend, AsyncDiskCache):
+                self._backend.cache.close()
+            self._memory = None
+            self._backend = None
+            self._configured = False
+            self.hits = 0
+            self.misses = 0
+
+
+component_result_cache = ComponentResultCache()
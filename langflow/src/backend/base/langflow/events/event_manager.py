@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import contextlib
 import inspect
 import json
 import time
 import uuid
+from datetime import datetime, timezone
 from functools import partial
 from typing import TYPE_CHECKING
 
@@ -11,11 +15,10 @@ from fastapi.encoders import jsonable_encoder
 from loguru import logger
 from typing_extensions import Protocol
 
+from langflow.events.event_queue import EventQueue
 from langflow.schema.playground_events import create_event_by_type
 
 if TYPE_CHECKING:
-    import asyncio
-
     from langflow.schema.log import LoggableType
 
 
@@ -28,9 +31,20 @@ class PartialEventCallback(Protocol):
 
 
 class EventManager:
-    def __init__(self, queue: asyncio.Queue):
+    """Encodes the events of a build and puts them in its queue.
+
+    Events can be sent from the event loop of the queue or from any other thread, such as the threads
+    callbacks run in. Events sent from another thread are handed over to the loop; if the queue is a full
+    `EventQueue`, the thread waits for room in it, which is how producers get backpressure.
+    """
+
+    def __init__(self, queue: asyncio.Queue | EventQueue):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        try:
+            self._loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -66,18 +80,60 @@ class EventManager:
         self.events[name] = callback_
 
     def send_event(self, *, event_type: str, data: LoggableType):
-        try:
-            if isinstance(data, dict) and event_type in {"message", "error", "warning", "info", "token"}:
-                data = create_event_by_type(event_type, **data)
-        except TypeError as e:
-            logger.debug(f"Error creating playground event: {e}")
-        except Exception:
-            raise
-        jsonable_data = jsonable_encoder(data)
+        token: dict | None = None
+        if event_type == "token" and isinstance(data, dict) and data.keys() == {"chunk", "id"}:
+            # Token events are by far the most frequent, build them without the model and the encoder
+            jsonable_data = token = {
+                "chunk": data["chunk"],
+                "id": str(data["id"]),
+                "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z"),
+            }
+        else:
+            try:
+                if isinstance(data, dict) and event_type in {"message", "error", "warning", "info", "token"}:
+                    data = create_event_by_type(event_type, **data)
+            except TypeError as e:
+                logger.debug(f"Error creating playground event: {e}")
+            except Exception:
+                raise
+            jsonable_data = jsonable_encoder(data)
         json_data = {"event": event_type, "data": jsonable_data}
         event_id = f"{event_type}-{uuid.uuid4()}"
         str_data = json.dumps(json_data) + "\n\n"
-        self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+        self._put((event_id, str_data.encode("utf-8"), time.time()), token)
+
+    def _put(self, item: tuple[str, bytes, float], token: dict | None) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed() or _get_running_loop() is loop:
+            self._put_nowait(item, token)
+            return
+        queue = self.queue
+        if not isinstance(queue, EventQueue) or (token is not None and queue.overflow_policy != "wait"):
+            loop.call_soon_threadsafe(self._put_nowait, item, token)
+        elif queue.reserve():
+            loop.call_soon_threadsafe(queue.put_reserved, item, token)
+        else:
+            # The client is behind: wait for room in the queue, the queue itself gives up after its put timeout
+            future = asyncio.run_coroutine_threadsafe(queue.put(item, token=token), loop)
+            with contextlib.suppress(concurrent.futures.TimeoutError):
+                future.result(timeout=queue.put_timeout)
+
+    def _put_nowait(self, item: tuple[str, bytes, float], token: dict | None) -> None:
+        if isinstance(self.queue, EventQueue):
+            self.queue.put_nowait(item, token=token)
+        else:
+            self.queue.put_nowait(item)
+
+    async def wait_for_room(self, *, token: bool = False) -> None:
+        """Waits until the queue has room for another event.
+
+        Producers running on the event loop can't be made to wait when they send an event, they call this
+        to get backpressure. Token producers only wait if the token events are not merged or dropped.
+        """
+        queue = self.queue
+        if not isinstance(queue, EventQueue) or (token and queue.overflow_policy != "wait"):
+            return
+        await queue.wait_for_room()
 
     def noop(self, *, data: LoggableType) -> None:
         pass
@@ -86,6 +142,72 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
+def _get_running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class TokenCoalescer:
+    """Groups the tokens of a streamed message into frames sent as a single token event.
+
+    A frame is sent once it holds `frame_size` characters or `frame_interval` seconds after its
+    first token arrived, whichever comes first, so the number of events to serialize and deliver
+    follows the number of frames instead of the number of tokens. The text of the message is kept
+    as a list of chunks and only joined when the stream is closed.
+
+    It must be used from the event loop, the timer of the time window runs on it.
+    """
+
+    def __init__(self, manager: EventManager, message_id: str, *, frame_size: int = 64, frame_interval: float = 0.05):
+        self.manager = manager
+        self.message_id = str(message_id)
+        self.frame_size = frame_size
+        self.frame_interval = frame_interval
+        self.frames_sent = 0
+        self._chunks: list[str] = []
+        self._frame: list[str] = []
+        self._frame_length = 0
+        self._frame_started_at = 0.0
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    def push(self, chunk: str) -> None:
+        if not chunk:
+            return
+        self._chunks.append(chunk)
+        if not self._frame:
+            self._frame_started_at = time.monotonic()
+        self._frame.append(chunk)
+        self._frame_length += len(chunk)
+        if self._frame_length >= self.frame_size or time.monotonic() - self._frame_started_at >= self.frame_interval:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.frame_interval, self.flush)
+
+    def flush(self) -> None:
+        """Sends the tokens of the current frame, if any."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._frame:
+            return
+        chunk = "".join(self._frame)
+        self._frame.clear()
+        self._frame_length = 0
+        self.manager.on_token(data={"chunk": chunk, "id": self.message_id})
+        self.frames_sent += 1
+
+    def close(self) -> str:
+        """Sends the last frame and returns the complete text."""
+        self.flush()
+        return self.text
+
+
 def create_default_event_manager(queue):
     manager = EventManager(queue)
     manager.register_event("on_token", "token")
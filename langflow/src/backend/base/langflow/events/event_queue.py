@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Literal
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+OverflowPolicy = Literal["merge", "drop", "wait"]
+EventItem = tuple[str | None, bytes | None, float]
+
+
+class EventQueue:
+    """Bounded queue of the events of a build, with the interface of `asyncio.Queue` used by the consumers.
+
+    It must only be used from the event loop it was created in; `EventManager` hands it the events sent from
+    other threads. Once `maxsize` events are waiting for the client:
+
+    - `put` waits until the client makes room, for at most `put_timeout` seconds, so the producers slow down
+      to the pace of the client instead of growing the queue;
+    - token events are merged into the last waiting event if it is a token event of the same message
+      ("merge"), dropped ("drop"), or wait like the other events ("wait");
+    - `put_nowait` and the end of the stream are never refused, those events can't wait and must not be lost.
+
+    The number of waiting events, the time events wait and the token events merged or dropped are reported as
+    OpenTelemetry metrics when `ot` is given.
+
+    Attributes:
+        merged (int): Number of token events merged into a waiting one.
+        dropped (int): Number of token events dropped.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        *,
+        overflow_policy: OverflowPolicy = "merge",
+        put_timeout: float = 30.0,
+        ot: OpenTelemetry | None = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.overflow_policy = overflow_policy
+        self.put_timeout = put_timeout
+        self.ot = ot
+        self.merged = 0
+        self.dropped = 0
+        self._items: deque[EventItem] = deque()
+        # Data and chunks of the last waiting event when it is a token event, the next tokens are merged into it
+        self._last_token: tuple[dict, list[str]] | None = None
+        self._getters: deque[asyncio.Future] = deque()
+        self._putters: deque[asyncio.Future] = deque()
+        # Events sent from other threads that have room in the queue but are not in it yet
+        self._incoming = 0
+        self._incoming_lock = threading.Lock()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._items)
+
+    def put_nowait(self, item: EventItem, *, token: dict | None = None) -> None:
+        """Queues an event without waiting for room.
+
+        Args:
+            item (EventItem): The id, the encoded event and the time it was sent. A None event ends the stream.
+            token (dict | None): The data of a token event with only a chunk and a message id, which can be merged.
+        """
+        if token is not None and self.full():
+            if self.overflow_policy == "merge" and self._merge_token(token):
+                return
+            if self.overflow_policy == "drop":
+                self.dropped += 1
+                self._report_overflow("dropped")
+                return
+        self._append(item, token)
+
+    def reserve(self) -> bool:
+        """Reserves room for an event sent from another thread, returns False if the queue is full.
+
+        The event must then be queued from the event loop with `put_reserved`.
+        """
+        with self._incoming_lock:
+            if 0 < self.maxsize <= len(self._items) + self._incoming:
+                return False
+            self._incoming += 1
+            return True
+
+    def put_reserved(self, item: EventItem, token: dict | None = None) -> None:
+        with self._incoming_lock:
+            self._incoming -= 1
+        self.put_nowait(item, token=token)
+
+    async def put(self, item: EventItem, *, token: dict | None = None) -> None:
+        """Queues an event, waiting for room if the queue is full."""
+        if item[1] is not None and not (token is not None and self.overflow_policy != "wait"):
+            await self.wait_for_room()
+        self.put_nowait(item, token=token)
+
+    async def wait_for_room(self) -> None:
+        """Waits until the queue is no longer full, for at most `put_timeout` seconds."""
+        if not self.full():
+            return
+        try:
+            await asyncio.wait_for(self._wait_for_room(), self.put_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"The client has not read the events of the build for {self.put_timeout}s")
+            self._report_overflow("timeout")
+
+    async def _wait_for_room(self) -> None:
+        while self.full():
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except BaseException:
+                putter.cancel()
+                with contextlib.suppress(ValueError):
+                    self._putters.remove(putter)
+                if not self.full() and not putter.cancelled():
+                    self._wakeup_next(self._putters)
+                raise
+
+    async def get(self) -> EventItem:
+        while not self._items:
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                with contextlib.suppress(ValueError):
+                    self._getters.remove(getter)
+                if self._items and not getter.cancelled():
+                    self._wakeup_next(self._getters)
+                raise
+        return self.get_nowait()
+
+    def get_nowait(self) -> EventItem:
+        if not self._items:
+            raise asyncio.QueueEmpty
+        if len(self._items) == 1:
+            self._seal_last_token()
+        item = self._items.popleft()
+        self._wakeup_next(self._putters)
+        self._report_get(item)
+        return item
+
+    def _append(self, item: EventItem, token: dict | None) -> None:
+        self._seal_last_token()
+        self._items.append(item)
+        if token is not None:
+            self._last_token = (token, [token["chunk"]])
+        self._report_put(item)
+        self._wakeup_next(self._getters)
+
+    def _merge_token(self, token: dict) -> bool:
+        if self._last_token is None or self._last_token[0]["id"] != token["id"]:
+            return False
+        self._last_token[1].append(token["chunk"])
+        self.merged += 1
+        self._report_overflow("merged")
+        return True
+
+    def _seal_last_token(self) -> None:
+        """Encodes the chunks merged into the last waiting token event, no more tokens can be merged into it."""
+        if self._last_token is None:
+            return
+        data, chunks = self._last_token
+        self._last_token = None
+        if len(chunks) == 1:
+            return
+        event_id, _, put_time = self._items[-1]
+        data = {**data, "chunk": "".join(chunks)}
+        value = (json.dumps({"event": "token", "data": data}) + "\n\n").encode("utf-8")
+        self._items[-1] = (event_id, value, put_time)
+
+    @staticmethod
+    def _wakeup_next(waiters: deque[asyncio.Future]) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    def _report_put(self, item: EventItem) -> None:
+        if self.ot is not None and item[1] is not None:
+            self.ot.up_down_counter("event_queue_depth", 1, {"event_type": _event_type(item)})
+
+    def _report_get(self, item: EventItem) -> None:
+        if self.ot is not None and item[1] is not None:
+            labels = {"event_type": _event_type(item)}
+            self.ot.up_down_counter("event_queue_depth", -1, labels)
+            self.ot.observe_histogram("event_queue_lag", time.time() - item[2], labels)
+
+    def _report_overflow(self, action: str) -> None:
+        if self.ot is not None:
+            self.ot.increment_counter("event_queue_overflow", {"action": action})
+
+
+def _event_type(item: EventItem) -> str:
+    # Event ids are made of the event type and a uuid
+    return (item[0] or "").rsplit("-", 5)[0] or "unknown"
+
+
+def create_event_queue() -> EventQueue:
+    """Creates the queue of the events of a build with the limits of the settings."""
+    from langflow.services.deps import get_settings_service
+    from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+    settings = get_settings_service().settings
+    return EventQueue(
+        settings.event_queue_max_size,
+        overflow_policy=settings.event_queue_overflow_policy,
+        put_timeout=settings.event_queue_put_timeout,
+        ot=OpenTelemetry(prometheus_enabled=settings.prometheus_enabled),
+    )
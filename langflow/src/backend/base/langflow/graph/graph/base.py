@@ -11,7 +11,6 @@ import traceback
 import uuid
 from collections import defaultdict, deque
 from datetime import datetime, timezone
-from functools import partial
 from itertools import chain
 from typing import TYPE_CHECKING, Any, cast
 
@@ -19,6 +18,7 @@ from loguru import logger
 
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.edge.base import CycleEdge, Edge
+from langflow.graph.graph.checkpoint import GraphCheckpointer, frozen_result_key, restore_vertex_state, run_cache_key
 from langflow.graph.graph.constants import Finish, lazy_load_vertex_dict
 from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
 from langflow.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
@@ -40,7 +40,13 @@ from langflow.logging.logger import LogConfig, configure
 from langflow.schema.dotdict import dotdict
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import (
+    get_chat_service,
+    get_settings_service,
+    get_tracing_service,
+    get_variable_service,
+    session_scope,
+)
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -87,6 +93,8 @@ class Graph:
         self._updates = 0
         self.flow_id = flow_id
         self.flow_name = flow_name
+        # The version of the saved flow the graph was built from, so edits invalidate its frozen results.
+        self.flow_version: str | None = None
         self.description = description
         self.user_id = user_id
         self._is_input_vertices: list[str] = []
@@ -125,6 +133,8 @@ class Graph:
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        self._checkpointer: GraphCheckpointer | None = None
+        self._pending_vertex_checkpoints: dict[str, bytes] = {}
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -614,6 +624,8 @@ class Graph:
             run_id = uuid.uuid4()
 
         self._run_id = str(run_id)
+        # The checkpoints of the graph are keyed by the run
+        self._checkpointer = None
 
     async def initialize_run(self) -> None:
         if not self._run_id:
@@ -626,6 +638,34 @@ class Graph:
                 user_id=self.user_id,
                 session_id=self.session_id,
             )
+        await self.load_variables()
+
+    def get_variable_names(self) -> set[str]:
+        """Returns the names of the variables the vertices of the graph load from the database."""
+        return {
+            vertex.params[field]
+            for vertex in self.vertices
+            for field in vertex.load_from_db_fields
+            if isinstance(vertex.params.get(field), str) and vertex.params[field]
+        }
+
+    async def load_variables(self) -> None:
+        """Fetches every variable used by the graph in a single query.
+
+        The variable service keeps them in its cache so building the vertices doesn't query and
+        decrypt them one at a time. Variables that can't be loaded here are looked up again by the
+        vertex that uses them, which reports the error.
+        """
+        if not self.user_id:
+            return
+        names = self.get_variable_names()
+        if not names:
+            return
+        try:
+            async with session_scope() as session:
+                await get_variable_service().load_variables(self.user_id, names, session)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Error loading the variables of the graph")
 
     def _end_all_traces_async(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
         task = asyncio.create_task(self.end_all_traces(outputs, error))
@@ -751,9 +791,8 @@ class Graph:
             vertex.update_raw_params({"session_id": session_id})
         # Process the graph
         try:
-            cache_service = get_chat_service()
             if self.flow_id:
-                await cache_service.set_cache(self.flow_id, self)
+                await self.checkpointer.save_base(self)
         except Exception:  # noqa: BLE001
             logger.exception("Error setting cache")
 
@@ -770,6 +809,8 @@ class Graph:
             self._end_all_traces_async(error=exc)
             msg = f"Error running graph: {exc}"
             raise ValueError(msg) from exc
+        finally:
+            await self._clear_checkpoint()
 
         self._end_all_traces_async()
         # Get the outputs
@@ -788,6 +829,15 @@ class Graph:
 
         return vertex_outputs
 
+    async def _clear_checkpoint(self) -> None:
+        """Deletes the checkpoint of the run from the chat cache once it ended."""
+        if self._checkpointer is None or not self._checkpointer.has_base:
+            return
+        try:
+            await self._checkpointer.clear()
+        except Exception:  # noqa: BLE001
+            logger.exception("Error clearing cache")
+
     async def arun(
         self,
         inputs: list[dict[str, str]],
@@ -973,6 +1023,7 @@ class Graph:
             "edges": self.edges,
             "flow_id": self.flow_id,
             "flow_name": self.flow_name,
+            "flow_version": self.flow_version,
             "description": self.description,
             "user_id": self.user_id,
             "raw_graph_data": self.raw_graph_data,
@@ -1037,8 +1088,11 @@ class Graph:
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
+        state.setdefault("flow_version", None)
         self.__dict__.update(state)
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
+        self._checkpointer = None
+        self._pending_vertex_checkpoints = {}
         self.tracing_service = get_tracing_service()
         self.set_run_id(self._run_id)
 
@@ -1079,6 +1133,61 @@ class Graph:
         else:
             return graph
 
+    def clone(self, user_id: str | None = None) -> Graph:
+        """Creates a new, unbuilt graph from this one without parsing the payload again.
+
+        The node data, edges and adjacency maps are copied from this graph. Vertex params are
+        rebuilt and components are instantiated from the classes already compiled for this graph,
+        so the returned graph can be run independently of this one.
+
+        Args:
+            user_id: The user ID of the new graph. Defaults to the user ID of this graph.
+
+        Returns:
+            Graph: The new graph.
+        """
+        new_graph = type(self)(
+            flow_id=self.flow_id,
+            flow_name=self.flow_name,
+            description=self.description,
+            user_id=user_id if user_id is not None else self.user_id,
+            context=dict(self.context),
+        )
+        new_graph._vertices = self._vertices
+        new_graph._edges = self._edges
+        new_graph.raw_graph_data = self.raw_graph_data
+        new_graph.top_level_vertices = list(self.top_level_vertices)
+        new_graph.vertices = [vertex.clone(new_graph) for vertex in self.vertices]
+        new_graph.vertex_map = {vertex.id: vertex for vertex in new_graph.vertices}
+        new_graph.edges = [copy.copy(edge) for edge in self.edges]
+        for edge in new_graph.edges:
+            if isinstance(edge, CycleEdge):
+                edge.is_fulfilled = False
+                edge.result = None
+        new_graph.predecessor_map = defaultdict(list, {key: list(value) for key, value in self.predecessor_map.items()})
+        new_graph.successor_map = defaultdict(list, {key: list(value) for key, value in self.successor_map.items()})
+        new_graph.in_degree_map = defaultdict(int, self.in_degree_map)
+        new_graph.parent_child_map = defaultdict(
+            list, {key: list(value) for key, value in self.parent_child_map.items()}
+        )
+        new_graph._is_input_vertices = list(self._is_input_vertices)
+        new_graph._is_output_vertices = list(self._is_output_vertices)
+        new_graph.has_session_id_vertices = list(self.has_session_id_vertices)
+        if self._is_state_vertices is not None:
+            new_graph._is_state_vertices = list(self._is_state_vertices)
+        new_graph._is_cyclic = self._is_cyclic
+        new_graph._cycles = self._cycles
+        new_graph._cycle_vertices = self._cycle_vertices
+        new_graph.run_manager = RunnableVerticesManager.from_dict(copy.deepcopy(self.run_manager.to_dict()))
+
+        new_graph._build_vertex_params()
+        for vertex, template_vertex in zip(new_graph.vertices, self.vertices, strict=True):
+            class_object = type(template_vertex.custom_component) if template_vertex.custom_component else None
+            vertex.instantiate_component(new_graph.user_id, class_object=class_object)
+        new_graph._set_cache_to_vertices_in_cycle()
+        new_graph._set_cache_if_listen_notify_components()
+        return new_graph
+
     def __eq__(self, /, other: object) -> bool:
         if not isinstance(other, Graph):
             return False
@@ -1285,10 +1394,34 @@ class Graph:
     def get_vertex(self, vertex_id: str) -> Vertex:
         """Returns a vertex by id."""
         try:
-            return self.vertex_map[vertex_id]
+            vertex = self.vertex_map[vertex_id]
         except KeyError as e:
             msg = f"Vertex {vertex_id} not found"
             raise ValueError(msg) from e
+        if self._pending_vertex_checkpoints and vertex_id in self._pending_vertex_checkpoints:
+            restore_vertex_state(vertex, self._pending_vertex_checkpoints.pop(vertex_id))
+        return vertex
+
+    @property
+    def checkpointer(self) -> GraphCheckpointer:
+        """The checkpointer that writes this graph's run state to the chat cache."""
+        if self._checkpointer is None:
+            key = run_cache_key(str(self.flow_id) if self.flow_id else None, self._run_id)
+            self._checkpointer = GraphCheckpointer(get_chat_service(), key)
+        return self._checkpointer
+
+    def frozen_result_key(self, vertex_id: str) -> str:
+        """The key of the result of a frozen vertex in the chat cache, shared by the runs of this flow version."""
+        return frozen_result_key(str(self.flow_id) if self.flow_id else None, vertex_id, self.flow_version)
+
+    def add_pending_vertex_checkpoint(self, vertex_id: str, blob: bytes) -> None:
+        """Registers a vertex checkpoint to be restored the first time the vertex is accessed."""
+        self._pending_vertex_checkpoints[vertex_id] = blob
+
+    def restore_pending_vertex_checkpoints(self) -> None:
+        """Restores every pending vertex checkpoint right away."""
+        for vertex_id in list(self._pending_vertex_checkpoints):
+            self.get_vertex(vertex_id)
 
     def get_root_of_group_node(self, vertex_id: str) -> Vertex:
         """Returns the root of a group node."""
@@ -1347,7 +1480,7 @@ class Graph:
         self.reset_inactivated_vertices()
         self.reset_activated_vertices()
 
-        await chat_service.set_cache(str(self.flow_id or self._run_id), self)
+        await self.checkpointer.save(self, [vertex_id])
         self._record_snapshot(vertex_id)
         return vertex_build_result
 
@@ -1428,7 +1561,7 @@ class Graph:
             else:
                 # Check the cache for the vertex
                 if get_cache is not None:
-                    cached_result = await get_cache(key=vertex.id)
+                    cached_result = await get_cache(key=self.frozen_result_key(vertex.id))
                 else:
                     cached_result = CacheMiss()
                 if isinstance(cached_result, CacheMiss):
@@ -1472,7 +1605,7 @@ class Graph:
                         "full_data": vertex.full_data,
                     }
 
-                    await set_cache(key=vertex.id, data=vertex_dict)
+                    await set_cache(key=self.frozen_result_key(vertex.id), data=vertex_dict)
 
         except Exception as exc:
             if not isinstance(exc, ComponentBuildError):
@@ -1526,49 +1659,88 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        max_concurrency: int | None = None,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph, starting each vertex as soon as its own predecessors have finished.
+
+        Instead of waiting for a whole layer to complete, completed vertices immediately release
+        their successors through the run manager, so a slow vertex only holds back the branch
+        that depends on it.
+
+        Args:
+            fallback_to_env_vars (bool): Whether to fallback to environment variables.
+            start_component_id (str | None): The ID of the component to start from.
+            event_manager (EventManager | None): The event manager for the graph.
+            max_concurrency (int | None): Maximum number of vertices built at the same time.
+                Defaults to the ``max_vertex_concurrency`` setting. ``0`` means no limit.
+        """
         has_webhook_component = "webhook" in start_component_id.lower() if start_component_id else False
         first_layer = self.sort_vertices(start_component_id=start_component_id)
+        if max_concurrency is None:
+            max_concurrency = get_settings_service().settings.max_vertex_concurrency
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency and max_concurrency > 0 else None
         vertex_task_run_count: dict[str, int] = {}
-        to_process = deque(first_layer)
-        layer_index = 0
+        running: dict[str, asyncio.Task] = {}
+        # Vertices activated again while they were running, e.g. by a cycle, to run once they finish
+        reactivated: set[str] = set()
         chat_service = get_chat_service()
         await self.initialize_run()
         lock = asyncio.Lock()
-        while to_process:
-            current_batch = list(to_process)  # Copy current deque items to a list
-            to_process.clear()  # Clear the deque for new items
-            tasks = []
-            for vertex_id in current_batch:
+
+        async def _build(vertex_id: str) -> VertexBuildResult:
+            build_coro = self.build_vertex(
+                vertex_id=vertex_id,
+                user_id=self.user_id,
+                inputs_dict={},
+                fallback_to_env_vars=fallback_to_env_vars,
+                get_cache=chat_service.get_cache,
+                set_cache=chat_service.set_cache,
+                event_manager=event_manager,
+            )
+            if semaphore is None:
+                return await build_coro
+            async with semaphore:
+                return await build_coro
+
+        def _schedule(vertex_ids: Iterable[str]) -> None:
+            for vertex_id in sorted(set(vertex_ids)):
+                if vertex_id in running:
+                    reactivated.add(vertex_id)
+                    continue
                 vertex = self.get_vertex(vertex_id)
-                task = asyncio.create_task(
-                    self.build_vertex(
-                        vertex_id=vertex_id,
-                        user_id=self.user_id,
-                        inputs_dict={},
-                        fallback_to_env_vars=fallback_to_env_vars,
-                        get_cache=chat_service.get_cache,
-                        set_cache=chat_service.set_cache,
-                        event_manager=event_manager,
-                    ),
+                # Mark it right away so that vertices finishing before this task starts
+                # do not consider it runnable again.
+                self.run_manager.add_to_vertices_being_run(vertex_id)
+                running[vertex_id] = asyncio.create_task(
+                    _build(vertex_id),
                     name=f"{vertex.id} Run {vertex_task_run_count.get(vertex_id, 0)}",
                 )
-                tasks.append(task)
                 vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
 
-            logger.debug(f"Running layer {layer_index} with {len(tasks)} tasks, {current_batch}")
-            try:
-                next_runnable_vertices = await self._execute_tasks(
-                    tasks, lock=lock, has_webhook_component=has_webhook_component
+        _schedule(first_layer)
+        try:
+            while running:
+                done, _ = await asyncio.wait(running.values(), return_when=asyncio.FIRST_COMPLETED)
+                done_tasks = sorted(done, key=lambda task: task.get_name())
+                finished = {v_id for v_id, task in running.items() if task in done}
+                for vertex_id in finished:
+                    del running[vertex_id]
+                logger.debug(f"Completed {[task.get_name() for task in done_tasks]}, {len(running)} still running")
+                next_runnable_vertices = await self._collect_task_results(
+                    done_tasks,
+                    [task.exception() or task.result() for task in done_tasks],
+                    lock=lock,
+                    has_webhook_component=has_webhook_component,
                 )
-            except Exception:
-                logger.exception(f"Error executing tasks in layer {layer_index}")
-                raise
-            if not next_runnable_vertices:
-                break
-            to_process.extend(next_runnable_vertices)
-            layer_index += 1
+                rerun = reactivated & finished
+                reactivated.difference_update(finished)
+                _schedule([*next_runnable_vertices, *rerun])
+        except Exception:
+            logger.exception("Error processing graph")
+            for task in running.values():
+                task.cancel()
+            await asyncio.gather(*running.values(), return_exceptions=True)
+            raise
 
         logger.debug("Graph processing complete")
         return self
@@ -1615,8 +1787,7 @@ class Graph:
                 else:
                     self.run_manager.add_to_vertices_being_run(next_v_id)
             if cache and self.flow_id is not None:
-                set_cache_coro = partial(get_chat_service().set_cache, key=self.flow_id)
-                await set_cache_coro(data=self, lock=lock)
+                await self.checkpointer.save(self, [v_id])
         if vertex.is_state:
             next_runnable_vertices.extend(self.activated_vertices)
         return next_runnable_vertices
@@ -1671,8 +1842,28 @@ class Graph:
             lock: Async lock for synchronization
             has_webhook_component: Whether the graph has a webhook component
         """
-        results = []
         completed_tasks = await asyncio.gather(*tasks, return_exceptions=True)
+        return await self._collect_task_results(
+            tasks, completed_tasks, lock=lock, has_webhook_component=has_webhook_component
+        )
+
+    async def _collect_task_results(
+        self,
+        tasks: list[asyncio.Task],
+        completed_tasks: list[Any],
+        lock: asyncio.Lock,
+        *,
+        has_webhook_component: bool = False,
+    ) -> list[str]:
+        """Logs the results of finished vertex tasks and returns the vertices they unblocked.
+
+        Args:
+            tasks: The finished tasks
+            completed_tasks: The result (or exception) of each task, in the same order
+            lock: Async lock for synchronization
+            has_webhook_component: Whether the graph has a webhook component
+        """
+        results = []
         vertices: list[Vertex] = []
 
         for i, result in enumerate(completed_tasks):
@@ -0,0 +1,249 @@
+"""Incremental checkpoints of a running graph.
+
+The full graph is written to the chat cache once, when a run starts. After that only a small
+manifest (the run manager state and the ids of the vertices that changed) and the result of
+each changed vertex are written, every vertex under its own key. Values are encoded as
+compressed dill blobs so external caches such as Redis only move the bytes that changed.
+
+Every run is cached under its own key, so concurrent builds of a flow never overwrite each other's graph,
+and its keys are deleted once the run ends. Results of frozen vertices are shared by the runs of a flow.
+The requests of the deprecated build endpoints may carry no run id, so the id of the last run they started
+is cached under the flow too.
+"""
+
+from __future__ import annotations
+
+import pickle
+import zlib
+from typing import TYPE_CHECKING, Any
+
+import dill
+from loguru import logger
+
+from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
+from langflow.graph.utils import UnbuiltObject, UnbuiltResult
+from langflow.services.cache.service import AsyncInMemoryCache, ThreadingInMemoryCache
+from langflow.services.cache.utils import CacheMiss
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from langflow.graph.graph.base import Graph
+    from langflow.graph.vertex.base import Vertex
+    from langflow.services.chat.service import ChatService
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_MAGIC = b"LFCP"
+COMPRESSION_LEVEL = 1
+
+# Vertex attributes that change when a vertex is built.
+VERTEX_CHECKPOINT_FIELDS = (
+    "built",
+    "built_object",
+    "built_result",
+    "results",
+    "result",
+    "artifacts",
+    "artifacts_raw",
+    "artifacts_type",
+    "outputs_logs",
+    "logs",
+    "state",
+    "build_times",
+    "use_result",
+)
+
+
+def encode_checkpoint(data: Any) -> bytes:
+    """Encodes a checkpoint payload into a compact binary blob."""
+    header = CHECKPOINT_MAGIC + CHECKPOINT_VERSION.to_bytes(1, "big")
+    return header + zlib.compress(dill.dumps(data, recurse=True), COMPRESSION_LEVEL)
+
+
+def decode_checkpoint(blob: bytes) -> Any:
+    """Decodes a blob produced by `encode_checkpoint`."""
+    header_size = len(CHECKPOINT_MAGIC) + 1
+    if not isinstance(blob, bytes) or not blob.startswith(CHECKPOINT_MAGIC):
+        msg = "Invalid graph checkpoint"
+        raise ValueError(msg)
+    version = blob[len(CHECKPOINT_MAGIC)]
+    if version != CHECKPOINT_VERSION:
+        msg = f"Unsupported graph checkpoint version: {version}"
+        raise ValueError(msg)
+    return dill.loads(zlib.decompress(blob[header_size:]))  # noqa: S301
+
+
+def run_cache_key(flow_id: str | None, run_id: str) -> str:
+    """Key of the graph of a run in the chat cache."""
+    return f"{flow_id}:run:{run_id}" if flow_id else run_id
+
+
+def latest_run_key(flow_id: str) -> str:
+    """Key of the id of the last run of a flow started by the deprecated build endpoints."""
+    return f"{flow_id}:latest_run"
+
+
+def frozen_result_key(flow_id: str | None, vertex_id: str, version: str | None = None) -> str:
+    """Key of the result of a frozen vertex in the chat cache, shared by the runs of a version of the flow."""
+    if not flow_id:
+        return vertex_id
+    if version:
+        return f"{flow_id}:{version}:frozen:{vertex_id}"
+    return f"{flow_id}:frozen:{vertex_id}"
+
+
+def manifest_key(key: str) -> str:
+    return f"{key}:checkpoint"
+
+
+def vertex_checkpoint_key(key: str, vertex_id: str) -> str:
+    return f"{key}:checkpoint:{vertex_id}"
+
+
+def dump_vertex_state(vertex: Vertex) -> dict[str, Any]:
+    state = {field: getattr(vertex, field, None) for field in VERTEX_CHECKPOINT_FIELDS}
+    if isinstance(state["built_object"], UnbuiltObject):
+        state["built_object"] = None
+    if isinstance(state["built_result"], UnbuiltResult):
+        state["built_result"] = None
+    return state
+
+
+def encode_vertex_state(vertex: Vertex) -> bytes:
+    state = dump_vertex_state(vertex)
+    try:
+        return encode_checkpoint(state)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # Built objects (clients, connections) are not always serializable.
+        # The results are still useful to rebuild the graph state without them.
+        logger.debug(f"Could not serialize the built object of vertex {vertex.id}, checkpointing without it")
+        state["built_object"] = None
+        state["built_result"] = None
+        return encode_checkpoint(state)
+
+
+def restore_vertex_state(vertex: Vertex, blob: bytes) -> None:
+    state = decode_checkpoint(blob)
+    for field, value in state.items():
+        setattr(vertex, field, value)
+    if vertex.built_object is None:
+        vertex.built_object = UnbuiltObject()
+    if vertex.built_result is None:
+        vertex.built_result = UnbuiltResult()
+
+
+class GraphCheckpointer:
+    """Writes a graph run to the chat cache as a base snapshot followed by per-vertex deltas.
+
+    In-memory caches keep a reference to the live graph, so for them only the base snapshot is
+    written and deltas are skipped altogether.
+    """
+
+    def __init__(self, chat_service: ChatService, key: str) -> None:
+        self.chat_service = chat_service
+        self.key = key
+        self.checkpointed_vertices: set[str] = set()
+        self.has_base = False
+
+    @property
+    def writes_deltas(self) -> bool:
+        return not isinstance(self.chat_service.cache_service, AsyncInMemoryCache | ThreadingInMemoryCache)
+
+    async def save_base(self, graph: Graph) -> None:
+        """Writes the whole graph and starts a new, empty list of deltas."""
+        self.checkpointed_vertices.clear()
+        await self.chat_service.set_cache(self.key, graph)
+        self.has_base = True
+        if self.writes_deltas:
+            await self._save_manifest(graph)
+
+    async def save(self, graph: Graph, vertex_ids: Iterable[str]) -> None:
+        """Writes the results of the given vertices and the current run state."""
+        if not self.has_base:
+            await self.save_base(graph)
+            return
+        if not self.writes_deltas:
+            return
+        for vertex_id in vertex_ids:
+            vertex = graph.get_vertex(vertex_id)
+            await self.chat_service.set_cache(vertex_checkpoint_key(self.key, vertex_id), encode_vertex_state(vertex))
+            self.checkpointed_vertices.add(vertex_id)
+        await self._save_manifest(graph)
+
+    async def _save_manifest(self, graph: Graph) -> None:
+        manifest = {
+            "run_id": graph._run_id,
+            "run_manager": graph.run_manager.to_dict(),
+            "run_queue": list(graph._run_queue),
+            "inactivated_vertices": set(graph.inactivated_vertices),
+            "activated_vertices": list(graph.activated_vertices),
+            "vertices": sorted(self.checkpointed_vertices),
+        }
+        await self.chat_service.set_cache(manifest_key(self.key), encode_checkpoint(manifest))
+
+    async def clear(self) -> None:
+        """Deletes the snapshot and the deltas of the run, and the locks of their keys."""
+        keys = [self.key, manifest_key(self.key)]
+        keys += [vertex_checkpoint_key(self.key, vertex_id) for vertex_id in self.checkpointed_vertices]
+        for key in keys:
+            await self.chat_service.clear_cache(key)
+        self.checkpointed_vertices.clear()
+        self.has_base = False
+
+
+async def load_graph_checkpoint(chat_service: ChatService, key: str) -> Graph | CacheMiss:
+    """Loads the graph stored under `key` and applies the deltas written since its base snapshot.
+
+    The run state is applied right away. Vertex results are only fetched as encoded blobs and
+    are decoded the first time the vertex is accessed through `Graph.get_vertex`.
+    """
+    cached = await chat_service.get_cache(key)
+    if isinstance(cached, CacheMiss):
+        return cached
+    graph = cached["result"]
+    checkpointer = graph.checkpointer
+    if checkpointer.key != key:
+        # The deltas are written where the graph was read from
+        checkpointer = graph._checkpointer = GraphCheckpointer(chat_service, key)
+    checkpointer.has_base = True
+
+    cached_manifest = await chat_service.get_cache(manifest_key(key))
+    if isinstance(cached_manifest, CacheMiss):
+        return graph
+    try:
+        manifest = decode_checkpoint(cached_manifest["result"])
+    except (ValueError, zlib.error):
+        logger.warning(f"Ignoring invalid graph checkpoint for {key}")
+        return graph
+    if manifest["run_id"] != graph._run_id:
+        # The deltas belong to a previous run of the same flow
+        return graph
+
+    cycle_vertices = graph.run_manager.cycle_vertices
+    graph.run_manager = RunnableVerticesManager.from_dict(manifest["run_manager"])
+    graph.run_manager.cycle_vertices = cycle_vertices
+    graph._run_queue.clear()
+    graph._run_queue.extend(manifest["run_queue"])
+    graph.inactivated_vertices = manifest["inactivated_vertices"]
+    graph.activated_vertices = manifest["activated_vertices"]
+    checkpointer.checkpointed_vertices = set(manifest["vertices"])
+    for vertex_id in manifest["vertices"]:
+        cached_vertex = await chat_service.get_cache(vertex_checkpoint_key(key, vertex_id))
+        if not isinstance(cached_vertex, CacheMiss):
+            graph.add_pending_vertex_checkpoint(vertex_id, cached_vertex["result"])
+    return graph
+
+
+async def cache_legacy_run(chat_service: ChatService, graph: Graph) -> None:
+    """Caches the graph of a run started by the deprecated build endpoints and makes it the last run of the flow."""
+    await graph.checkpointer.save_base(graph)
+    if graph.flow_id:
+        await chat_service.set_cache(latest_run_key(str(graph.flow_id)), graph.run_id)
+
+
+async def get_legacy_run_key(chat_service: ChatService, flow_id: str, run_id: str | None = None) -> str:
+    """Key of the run a request of the deprecated build endpoints reads: the given run, else the last one started."""
+    if run_id is None:
+        cached = await chat_service.get_cache(latest_run_key(flow_id))
+        run_id = "" if isinstance(cached, CacheMiss) else cached["result"]
+    return run_cache_key(flow_id, run_id)
@@ -12,12 +12,9 @@ from langflow.interface.utils import extract_input_variables_from_prompt
 from langflow.schema.data import Data
 from langflow.schema.message import Message
 from langflow.serialization.serialization import get_max_items_length, get_max_text_length, serialize
-from langflow.services.database.models.transactions.crud import log_transaction as crud_log_transaction
 from langflow.services.database.models.transactions.model import TransactionBase
-from langflow.services.database.models.vertex_builds.crud import log_vertex_build as crud_log_vertex_build
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase
-from langflow.services.database.utils import session_getter
-from langflow.services.deps import get_db_service, get_settings_service
+from langflow.services.deps import get_run_log_service, get_settings_service
 
 if TYPE_CHECKING:
     from langflow.api.v1.schemas import ResultDataResponse
@@ -155,11 +152,7 @@ async def log_transaction(
             error=error,
             flow_id=flow_id if isinstance(flow_id, UUID) else UUID(flow_id),
         )
-        async with session_getter(get_db_service()) as session:
-            with session.no_autoflush:
-                inserted = await crud_log_transaction(session, transaction)
-                if inserted:
-                    logger.debug(f"Logged transaction: {inserted.id}")
+        await get_run_log_service().log_transaction(transaction)
     except Exception as exc:  # noqa: BLE001
         logger.error(f"Error logging transaction: {exc!s}")
 
@@ -196,9 +189,7 @@ async def log_vertex_build(
             data=serialize(data, max_length=get_max_text_length(), max_items=get_max_items_length()),
             artifacts=serialize(artifacts, max_length=get_max_text_length(), max_items=get_max_items_length()),
         )
-        async with session_getter(get_db_service()) as session:
-            inserted = await crud_log_vertex_build(session, vertex_build)
-            logger.debug(f"Logged vertex build: {inserted.build_id}")
+        await get_run_log_service().log_vertex_build(vertex_build)
     except Exception:  # noqa: BLE001
         logger.exception("Error logging vertex build")
 
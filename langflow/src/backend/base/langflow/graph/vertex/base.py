@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import inspect
 import traceback
 import types
@@ -224,6 +225,42 @@ class Vertex:
         self.built_object = state.get("built_object") or UnbuiltObject()
         self.built_result = state.get("built_result") or UnbuiltResult()
 
+    def clone(self, graph: Graph) -> Vertex:
+        """Returns an unbuilt copy of this vertex that belongs to `graph`.
+
+        The parsed node data is shared with this vertex. The params and the component instance are
+        not copied, they are built by the new graph once all of its vertices exist.
+        """
+        new_vertex = copy.copy(self)
+        new_vertex._lock = asyncio.Lock()
+        new_vertex.graph = graph
+        new_vertex.custom_component = None
+        new_vertex.params = {}
+        new_vertex.raw_params = {}
+        new_vertex.updated_raw_params = False
+        new_vertex.load_from_db_fields = []
+        new_vertex.will_stream = False
+        new_vertex.built_object = UnbuiltObject()
+        new_vertex.built_result = None
+        new_vertex.built = False
+        new_vertex.steps = [getattr(new_vertex, step.__name__) for step in self.steps]
+        new_vertex.steps_ran = []
+        new_vertex.task_id = None
+        new_vertex.result = None
+        new_vertex.results = {}
+        new_vertex.artifacts = {}
+        new_vertex.artifacts_raw = {}
+        new_vertex.artifacts_type = {}
+        new_vertex.outputs_logs = {}
+        new_vertex.logs = {}
+        new_vertex.use_result = False
+        new_vertex.build_times = []
+        new_vertex.state = VertexStates.ACTIVE
+        new_vertex.log_transaction_tasks = set()
+        new_vertex._incoming_edges = None
+        new_vertex._outgoing_edges = None
+        return new_vertex
+
     def set_top_level(self, top_level_vertices: list[str]) -> None:
         self.parent_is_top_level = self.parent_node_id in top_level_vertices
 
@@ -364,11 +401,12 @@ class Vertex:
         self.params = self.raw_params.copy()
         self.updated_raw_params = True
 
-    def instantiate_component(self, user_id=None) -> None:
+    def instantiate_component(self, user_id=None, class_object: type[Component] | None = None) -> None:
         if not self.custom_component:
             self.custom_component, _ = initialize.loading.instantiate_class(
                 user_id=user_id,
                 vertex=self,
+                class_object=class_object,
             )
 
     async def _build(
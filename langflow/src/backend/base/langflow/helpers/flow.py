@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import copy
+import threading
 from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
+from cachetools import LRUCache
 from fastapi import HTTPException
 from loguru import logger
 from pydantic.v1 import BaseModel, Field, create_model
@@ -26,6 +29,11 @@ INPUT_TYPE_MAP = {
     "JSONInput": {"type_hint": "Optional[dict]", "default": "{}"},
 }
 
+FLOW_SCHEMA_CACHE_SIZE = 1024
+# Maps the id and `updated_at` of a flow to the JSON schema of its inputs
+_flow_schemas: LRUCache[tuple[str, str], dict] = LRUCache(maxsize=FLOW_SCHEMA_CACHE_SIZE)
+_flow_schemas_lock = threading.Lock()
+
 
 async def list_flows(*, user_id: str | None = None) -> list[Data]:
     if not user_id:
@@ -316,12 +324,31 @@ async def generate_unique_flow_name(flow_name, user_id, session):
         n += 1
 
 
+def get_cached_json_schema(flow_id: str | UUID, updated_at: Any) -> dict | None:
+    """Returns the JSON schema of a flow computed by `json_schema_from_flow` since the flow was last saved."""
+    if updated_at is None:
+        return None
+    with _flow_schemas_lock:
+        schema = _flow_schemas.get((str(flow_id), str(updated_at)))
+    return copy.deepcopy(schema) if schema is not None else None
+
+
 def json_schema_from_flow(flow: Flow) -> dict:
-    """Generate JSON schema from flow input nodes."""
-    from langflow.graph.graph.base import Graph
+    """Generate JSON schema from flow input nodes.
 
-    # Get the flow's data which contains the nodes and their configurations
-    flow_data = flow.data or {}
+    The schema is cached by flow id and `updated_at`, so the graph of a flow is only built again once it is saved.
+    """
+    if (schema := get_cached_json_schema(flow.id, flow.updated_at)) is not None:
+        return schema
+    schema = _json_schema_from_flow_data(flow.data or {})
+    if flow.updated_at is not None:
+        with _flow_schemas_lock:
+            _flow_schemas[str(flow.id), str(flow.updated_at)] = copy.deepcopy(schema)
+    return schema
+
+
+def _json_schema_from_flow_data(flow_data: dict) -> dict:
+    from langflow.graph.graph.base import Graph
 
     graph = Graph.from_payload(flow_data)
     input_nodes = [vertex for vertex in graph.vertices if vertex.is_input]
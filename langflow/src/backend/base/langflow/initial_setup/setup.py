@@ -32,6 +32,7 @@ from langflow.base.constants import (
     SKIPPED_COMPONENTS,
     SKIPPED_FIELD_ATTRIBUTES,
 )
+from langflow.custom.eval import component_class_cache
 from langflow.initial_setup.constants import STARTER_FOLDER_DESCRIPTION, STARTER_FOLDER_NAME
 from langflow.services.auth.utils import create_super_user
 from langflow.services.database.models.flow.model import Flow, FlowCreate
@@ -755,6 +756,28 @@ async def load_flows_from_directory() -> None:
             await upsert_flow_from_file(content, file_path.stem, session, user.id)
 
 
+async def warm_up_component_class_cache() -> None:
+    """On langflow startup, compiles the components of all stored flows if enabled in the settings.
+
+    The classes are kept in the component class cache, so the first run of each flow doesn't
+    have to compile them.
+    """
+    if not get_settings_service().settings.warm_up_component_class_cache:
+        return
+
+    async with session_scope() as session:
+        flows_data = (await session.exec(select(Flow.data).where(col(Flow.data).is_not(None)))).all()
+
+    codes: dict[str, None] = {}
+    for flow_data in flows_data:
+        for node in flow_data.get("nodes", []):
+            code = node.get("data", {}).get("node", {}).get("template", {}).get("code", {}).get("value")
+            if isinstance(code, str) and code:
+                codes[code] = None
+    compiled = await asyncio.to_thread(component_class_cache.warm_up, codes)
+    logger.debug(f"Compiled {compiled} component classes")
+
+
 async def detect_github_url(url: str) -> str:
     if matched := re.match(r"https?://(?:www\.)?github\.com/([\w.-]+)/([\w.-]+)?/?$", url):
         owner, repo = matched.groups()
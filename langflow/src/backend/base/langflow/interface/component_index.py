@@ -0,0 +1,96 @@
+"""On-disk index of the templates of the built-in components.
+
+Building the templates means importing every module under `langflow.components`, instantiating
+its components and parsing their source. The index stores the templates of each module along with
+the hash of its file, so on the next start only the modules whose file changed are processed again.
+The whole index is discarded when the Langflow or Python version changes, or when any file of the packages
+the components are built on changes, since the templates also depend on them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from langflow.utils.version import get_version_info
+
+INDEX_FORMAT_VERSION = 1
+INDEX_FILE_NAME = "component_index.json"
+# The packages of langflow the components import their base classes, inputs and outputs from
+BASE_PACKAGES = ("base", "custom", "field_typing", "inputs", "io", "template")
+
+
+def get_index_key() -> str:
+    python_version = ".".join(str(part) for part in sys.version_info[:2])
+    return f"{INDEX_FORMAT_VERSION}-{get_version_info()['version']}-py{python_version}-{hash_base_packages()}"
+
+
+@cache
+def hash_base_packages() -> str:
+    """Hashes the files of the base packages, so editing them in a source checkout rebuilds the index."""
+    root = Path(__file__).resolve().parent.parent
+    digest = hashlib.sha256()
+    for package in BASE_PACKAGES:
+        for path in sorted((root / package).rglob("*.py")):
+            digest.update(path.relative_to(root).as_posix().encode())
+            digest.update((hash_module_file(path) or "").encode())
+    return digest.hexdigest()[:16]
+
+
+def hash_module_file(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class ComponentIndex:
+    """The templates of the components of each module, keyed by the name of the module."""
+
+    def __init__(self, path: Path, modules: dict[str, dict[str, Any]] | None = None) -> None:
+        self.path = path
+        self.modules: dict[str, dict[str, Any]] = modules or {}
+
+    @classmethod
+    def load(cls, path: Path) -> ComponentIndex:
+        """Reads the index, or returns an empty one if it is missing, invalid or built by another version."""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring invalid component index {path}: {e}")
+            return cls(path)
+        if not isinstance(data, dict) or data.get("key") != get_index_key():
+            logger.debug(f"Component index {path} was built by another version, rebuilding it")
+            return cls(path)
+        return cls(path, data.get("modules"))
+
+    def get(self, module_name: str, file_hash: str | None) -> tuple[str, dict[str, Any]] | None:
+        """Returns the top level package and the templates of the module if its file didn't change."""
+        entry = self.modules.get(module_name)
+        if file_hash is None or entry is None or entry.get("hash") != file_hash:
+            return None
+        return entry["top_level"], entry["components"]
+
+    def set(self, module_name: str, file_hash: str, top_level: str, components: dict[str, Any]) -> None:
+        self.modules[module_name] = {"hash": file_hash, "top_level": top_level, "components": components}
+
+    def save(self) -> None:
+        """Writes the index atomically so workers starting at the same time never read a partial file."""
+        data = {"key": get_index_key(), "modules": self.modules}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not save the component index to {self.path}: {e}")
+            tmp_path.unlink(missing_ok=True)
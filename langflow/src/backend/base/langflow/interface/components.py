@@ -10,14 +10,17 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from langflow.custom.utils import abuild_custom_components, create_component_template
+from langflow.interface.component_index import INDEX_FILE_NAME, ComponentIndex, hash_module_file
 from langflow.services.settings.base import BASE_COMPONENTS_PATH
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from langflow.services.settings.service import SettingsService
 
 
 MIN_MODULE_PARTS = 2
-EXPECTED_RESULT_LENGTH = 2  # Expected length of the tuple returned by _process_single_module
+EXPECTED_RESULT_LENGTH = 2  # Top level package and components, followed by whether every class of the module loaded
 
 
 # Create a class to manage component cache instead of using globals
@@ -42,6 +45,9 @@ async def import_langflow_components():
     of `Component` or `CustomComponent`, and generates their templates. Components are grouped by their
     top-level subpackage name.
 
+    If `use_component_index` is enabled, the templates of the modules whose file didn't change since the last start
+    are read from the component index instead, and only the other modules are imported and processed.
+
     Returns:
         A dictionary with a "components" key mapping top-level package names to their component templates.
     """
@@ -52,34 +58,51 @@ async def import_langflow_components():
         logger.error(f"Failed to import langflow.components package: {e}", exc_info=True)
         return {"components": modules_dict}
 
-    # Collect all module names to process
-    module_names = []
-    for _, modname, _ in pkgutil.walk_packages(components_pkg.__path__, prefix=components_pkg.__name__ + "."):
+    # Collect all module names to process along with their files
+    module_files: dict[str, Path | None] = {}
+    for module_info in _walk_module_files(components_pkg.__path__, prefix=components_pkg.__name__ + "."):
         # Skip if the module is in the deactivated folder
-        if "deactivated" not in modname:
-            module_names.append(modname)
+        if "deactivated" not in module_info.name:
+            module_files[module_info.name] = _get_module_file(module_info)
 
-    if not module_names:
+    if not module_files:
         return {"components": modules_dict}
 
+    index = _load_component_index()
+    module_results: list[Any] = []
+    module_names = list(module_files)
+    file_hashes: dict[str, str | None] = {}
+    if index is not None:
+        file_hashes = await asyncio.to_thread(_hash_module_files, module_files)
+        module_names = []
+        for modname, file_hash in file_hashes.items():
+            if (indexed := index.get(modname, file_hash)) is not None:
+                module_results.append(indexed)
+            else:
+                module_names.append(modname)
+
     # Create tasks for parallel module processing
     tasks = [asyncio.to_thread(_process_single_module, modname) for modname in module_names]
 
     # Wait for all modules to be processed
     try:
-        module_results = await asyncio.gather(*tasks, return_exceptions=True)
+        processed_results = await asyncio.gather(*tasks, return_exceptions=True)
     except Exception as e:  # noqa: BLE001
         logger.error(f"Error during parallel module processing: {e}", exc_info=True)
         return {"components": modules_dict}
 
+    if index is not None:
+        _update_component_index(index, module_names, processed_results, file_hashes)
+        logger.debug(f"Read {len(module_results)} modules from the component index, processed {len(module_names)}")
+
     # Merge results from all modules
-    for result in module_results:
+    for result in [*module_results, *processed_results]:
         if isinstance(result, Exception):
             logger.warning(f"Module processing failed: {result}")
             continue
 
-        if result and isinstance(result, tuple) and len(result) == EXPECTED_RESULT_LENGTH:
-            top_level, components = result
+        if result and isinstance(result, tuple) and len(result) >= EXPECTED_RESULT_LENGTH:
+            top_level, components = result[:EXPECTED_RESULT_LENGTH]
             if top_level and components:
                 if top_level not in modules_dict:
                     modules_dict[top_level] = {}
@@ -88,14 +111,75 @@ async def import_langflow_components():
     return {"components": modules_dict}
 
 
-def _process_single_module(modname: str) -> tuple[str, dict] | None:
+def _walk_module_files(path: list[str], prefix: str) -> Iterator[pkgutil.ModuleInfo]:
+    """Yields the modules of the packages in the same order as `pkgutil.walk_packages`, without importing them.
+
+    `pkgutil.walk_packages` imports every package to find its submodules, which imports every component of the
+    packages that import their modules eagerly.
+    """
+    for module_info in pkgutil.iter_modules(path, prefix):
+        yield module_info
+        if module_info.ispkg and (package_dir := _get_module_file(module_info)) is not None:
+            yield from _walk_module_files([str(package_dir.parent)], f"{module_info.name}.")
+
+
+def _get_module_file(module_info: pkgutil.ModuleInfo) -> Path | None:
+    finder_path = getattr(module_info.module_finder, "path", None)
+    if finder_path is None:
+        return None
+    if module_info.ispkg:
+        return Path(finder_path) / module_info.name.rsplit(".", 1)[-1] / "__init__.py"
+    return Path(finder_path) / f"{module_info.name.rsplit('.', 1)[-1]}.py"
+
+
+def _hash_module_files(module_files: dict[str, Path | None]) -> dict[str, str | None]:
+    return {modname: hash_module_file(path) if path else None for modname, path in module_files.items()}
+
+
+def _load_component_index() -> ComponentIndex | None:
+    from langflow.services.deps import get_settings_service
+
+    settings = get_settings_service().settings
+    if not settings.use_component_index or not settings.config_dir:
+        return None
+    return ComponentIndex.load(Path(settings.config_dir) / INDEX_FILE_NAME)
+
+
+def _update_component_index(
+    index: ComponentIndex,
+    module_names: list[str],
+    results: list[Any],
+    file_hashes: dict[str, str | None],
+) -> None:
+    """Stores the processed modules in the index and saves it if anything changed.
+
+    Modules where a component failed to load are left out of the index, so they are retried on the next start.
+    """
+    changed = False
+    for modname in list(index.modules):
+        if modname not in file_hashes:
+            del index.modules[modname]
+            changed = True
+    for modname, result in zip(module_names, results, strict=True):
+        file_hash = file_hashes.get(modname)
+        if isinstance(result, tuple) and result[2] and file_hash is not None:
+            index.set(modname, file_hash, result[0], result[1])
+            changed = True
+        elif index.modules.pop(modname, None) is not None:
+            changed = True
+    if changed:
+        index.save()
+
+
+def _process_single_module(modname: str) -> tuple[str, dict, bool] | None:
     """Process a single module and return its components.
 
     Args:
         modname: The full module name to process
 
     Returns:
-        A tuple of (top_level_package, components_dict) or None if processing failed
+        A tuple of (top_level_package, components_dict, complete) or None if processing failed, where complete
+        is False if any component class of the module failed to load
     """
     try:
         module = importlib.import_module(modname)
@@ -150,7 +234,7 @@ def _process_single_module(modname: str) -> tuple[str, dict] | None:
             f"in module '{modname}' due to instantiation failure: {', '.join(failed_count)}"
         )
     logger.debug(f"Processed module {modname}")
-    return (top_level, module_components)
+    return (top_level, module_components, not failed_count)
 
 
 async def _determine_loading_strategy(settings_service: SettingsService) -> dict:
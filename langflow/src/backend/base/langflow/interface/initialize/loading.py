@@ -10,6 +10,7 @@ from loguru import logger
 from pydantic import PydanticDeprecatedSince20
 
 from langflow.custom.eval import eval_custom_component_code
+from langflow.custom.result_cache import component_result_cache, result_cache_key
 from langflow.schema.artifact import get_artifact_type, post_process_raw
 from langflow.schema.data import Data
 from langflow.services.deps import get_tracing_service, session_scope
@@ -25,8 +26,12 @@ def instantiate_class(
     vertex: Vertex,
     user_id=None,
     event_manager: EventManager | None = None,
+    class_object: type[CustomComponent | Component] | None = None,
 ) -> Any:
-    """Instantiate class from module type and key, and params."""
+    """Instantiate class from module type and key, and params.
+
+    If `class_object` is given it is used instead of evaluating the code of the vertex again.
+    """
     vertex_type = vertex.vertex_type
     base_type = vertex.base_type
     logger.debug(f"Instantiating {vertex_type} of type {base_type}")
@@ -37,7 +42,8 @@ def instantiate_class(
 
     custom_params = get_params(vertex.params)
     code = custom_params.pop("code")
-    class_object: type[CustomComponent | Component] = eval_custom_component_code(code)
+    if class_object is None:
+        class_object = eval_custom_component_code(code)
     custom_component: CustomComponent | Component = class_object(
         _user_id=user_id,
         _parameters=custom_params,
@@ -149,7 +155,12 @@ async def build_component(
 ):
     # Now set the params as attributes of the custom_component
     custom_component.set_attributes(params)
+    key = result_cache_key(custom_component, params) if component_result_cache.enabled else None
+    if key is not None and (cached := await component_result_cache.get(key)) is not None:
+        return cached.restore(custom_component)
     build_results, artifacts = await custom_component.build_results()
+    if key is not None:
+        await component_result_cache.set(key, custom_component)
 
     return custom_component, build_results, artifacts
 
@@ -31,13 +31,16 @@ from langflow.initial_setup.setup import (
     load_bundles_from_urls,
     load_flows_from_directory,
     sync_flows_from_fs,
+    warm_up_component_class_cache,
 )
 from langflow.interface.components import get_and_cache_all_types_dict
 from langflow.interface.utils import setup_llm_caching
 from langflow.logging.logger import configure
 from langflow.middleware import ContentSizeLimitMiddleware
 from langflow.services.deps import (
+    get_auth_service,
     get_queue_service,
+    get_run_log_service,
     get_settings_service,
     get_telemetry_service,
 )
@@ -211,6 +214,9 @@ def get_lifespan(*, fix_migration=False, version=None):
             telemetry_service.start()
             logger.debug(f"started telemetry service in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
+            get_run_log_service().start()
+            get_auth_service().start()
+
             current_time = asyncio.get_event_loop().time()
             logger.debug("Loading flows")
             await load_flows_from_directory()
@@ -220,6 +226,11 @@ def get_lifespan(*, fix_migration=False, version=None):
                 queue_service.start()
             logger.debug(f"Flows loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
+            current_time = asyncio.get_event_loop().time()
+            logger.debug("Warming up component class cache")
+            await warm_up_component_class_cache()
+            logger.debug(f"Component class cache warmed up in {asyncio.get_event_loop().time() - current_time:.2f}s")
+
             current_time = asyncio.get_event_loop().time()
             logger.debug("Loading mcp servers for projects")
             await init_mcp_servers()
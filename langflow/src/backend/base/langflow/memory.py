@@ -1,20 +1,135 @@
 import asyncio
+import bisect
 import json
+import time
 from collections.abc import Sequence
+from typing import Any
 from uuid import UUID
 
+from cachetools import TTLCache
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage
 from loguru import logger
-from sqlalchemy import delete
+from sqlalchemy import delete, update
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.schema.message import Message
 from langflow.services.database.models.message.model import MessageRead, MessageTable
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_settings_service, session_scope
 from langflow.utils.async_helpers import run_until_complete
 
+MESSAGE_HISTORY_CACHE_SESSIONS = 1000
+
+
+class MessageHistoryCache:
+    """Keeps the most recent messages of the active sessions in memory.
+
+    Each entry holds the last `message_history_cache_size` messages of a session that are not errors, oldest
+    first, as dumped from the database. The messages stored, updated and deleted through this module update the
+    entries of this worker; messages written by other workers are seen once the entry expires.
+    """
+
+    def __init__(self) -> None:
+        self.tail_size = 0
+        # Maps a session id to its most recent messages and whether they are all the messages of the session
+        self._tails: TTLCache[str, tuple[list[dict[str, Any]], bool]] | None = None
+        self._configured = False
+        # Counts the writes, so a tail read from the database while a message was written is not cached
+        self.writes = 0
+
+    def configure(self, tail_size: int, ttl: float) -> None:
+        self.tail_size = tail_size if ttl > 0 else 0
+        self._tails = TTLCache(maxsize=MESSAGE_HISTORY_CACHE_SESSIONS, ttl=ttl) if self.tail_size > 0 else None
+        self._configured = True
+
+    @property
+    def enabled(self) -> bool:
+        if not self._configured:
+            settings = get_settings_service().settings
+            self.configure(settings.message_history_cache_size, settings.message_history_cache_ttl)
+        return self._tails is not None
+
+    def get(self, session_id: str) -> tuple[list[dict[str, Any]], bool] | None:
+        if not self.enabled or self._tails is None:
+            return None
+        return self._tails.get(session_id)
+
+    def set(self, session_id: str, messages: list[dict[str, Any]], writes: int) -> None:
+        """Caches the tail read from the database unless a message was written since `writes` was read."""
+        if self._tails is None or writes != self.writes:
+            return
+        self._tails[session_id] = (messages, len(messages) < self.tail_size)
+
+    def add(self, messages: list[dict[str, Any]]) -> None:
+        self.writes += 1
+        if self._tails is None:
+            return
+        for message in messages:
+            entry = self._tails.get(message["session_id"])
+            if entry is None or message["error"]:
+                continue
+            tail, complete = entry
+            timestamps = [cached["timestamp"] for cached in tail]
+            # Older messages than the tail would leave a gap if the tail is not the whole session
+            if not complete and timestamps and message["timestamp"] < timestamps[0]:
+                continue
+            tail.insert(bisect.bisect_right(timestamps, message["timestamp"]), message)
+            if len(tail) > self.tail_size:
+                del tail[: len(tail) - self.tail_size]
+                complete = False
+            self._tails[message["session_id"]] = (tail, complete)
+
+    def update(self, messages: list[dict[str, Any]]) -> None:
+        self.writes += 1
+        if self._tails is None:
+            return
+        for message in messages:
+            entry = self._tails.get(message["session_id"])
+            if entry is None:
+                continue
+            tail, _ = entry
+            for i, cached in enumerate(tail):
+                if cached["id"] == message["id"]:
+                    if message["error"]:
+                        del tail[i]
+                    else:
+                        tail[i] = message
+                    break
+
+    def remove(self, message_ids: Sequence[str | UUID]) -> None:
+        self.writes += 1
+        if self._tails is None:
+            return
+        removed = {str(message_id) for message_id in message_ids}
+        for session_id, (tail, complete) in list(self._tails.items()):
+            if any(str(message["id"]) in removed for message in tail):
+                kept = [message for message in tail if str(message["id"]) not in removed]
+                self._tails[session_id] = (kept, complete)
+
+    def evict_flow(self, flow_id: str | UUID) -> None:
+        """Evicts the sessions with messages of the flow."""
+        self.writes += 1
+        if self._tails is None:
+            return
+        for session_id, (tail, _) in list(self._tails.items()):
+            if any(str(message["flow_id"]) == str(flow_id) for message in tail):
+                self._tails.pop(session_id, None)
+
+    def evict(self, session_id: str | UUID) -> None:
+        self.writes += 1
+        if self._tails is not None:
+            self._tails.pop(str(session_id), None)
+
+    def reset(self) -> None:
+        """Drops every session; the settings are read again on the next lookup."""
+        self.writes += 1
+        self._tails = None
+        self._configured = False
+
+
+message_history_cache = MessageHistoryCache()
+
 
 def _get_variable_query(
     sender: str | None = None,
@@ -99,6 +214,62 @@ async def aget_messages(
         return [await Message.create(**d.model_dump()) for d in messages]
 
 
+async def aget_recent_messages(
+    session_id: str | UUID,
+    n_messages: int,
+    sender: str | None = None,
+    sender_name: str | None = None,
+    order: str | None = "DESC",
+) -> list[Message]:
+    """Retrieves the last messages of a session.
+
+    The messages are read from the message history cache when it holds enough of them, otherwise only
+    the last `n_messages` messages are read from the database.
+
+    Args:
+        session_id (str): The session ID associated with the messages.
+        n_messages (int): The number of messages to retrieve.
+        sender (Optional[str]): The sender of the messages (e.g., "Machine" or "User")
+        sender_name (Optional[str]): The name of the sender.
+        order (Optional[str]): The order in which to return the messages. Defaults to "DESC".
+
+    Returns:
+        List[Message]: The last `n_messages` messages, newest first if the order is "DESC".
+    """
+    session_id = str(session_id)
+    rows: list[dict[str, Any]] | None = None
+    if message_history_cache.enabled and n_messages <= message_history_cache.tail_size:
+        entry = message_history_cache.get(session_id)
+        if entry is None:
+            writes = message_history_cache.writes
+            tail = await _aget_message_rows(
+                _get_variable_query(session_id=session_id, limit=message_history_cache.tail_size)
+            )
+            tail.reverse()
+            message_history_cache.set(session_id, tail, writes)
+            entry = (tail, len(tail) < message_history_cache.tail_size)
+        tail, complete = entry
+        matched = [
+            row
+            for row in tail
+            if (not sender or row["sender"] == sender) and (not sender_name or row["sender_name"] == sender_name)
+        ]
+        if len(matched) >= n_messages or complete:
+            rows = matched[-n_messages:][::-1]
+    if rows is None:
+        rows = await _aget_message_rows(
+            _get_variable_query(sender, sender_name, session_id, order="DESC", limit=n_messages)
+        )
+    if order == "ASC":
+        rows.reverse()
+    return [await Message.create(**row) for row in rows]
+
+
+async def _aget_message_rows(stmt) -> list[dict[str, Any]]:
+    async with session_scope() as session:
+        return [message.model_dump() for message in await session.exec(stmt)]
+
+
 def add_messages(messages: Message | list[Message], flow_id: str | UUID | None = None):
     """DEPRECATED - Add a message to the monitor service.
 
@@ -148,9 +319,74 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
                 error_message = f"Message with id {message.id} not found"
                 logger.warning(error_message)
                 raise ValueError(error_message)
+        message_history_cache.update([message.model_dump() for message in updated_messages])
         return [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
 
 
+class MessageDeltaWriter:
+    """Writes the successive versions of a message that is still being built, such as the message of an agent.
+
+    A version is written at most once every `interval` seconds, the versions pushed in between are coalesced into
+    the next write. A write only sets the columns that changed since the previous one, and text that grew is
+    appended to the stored text instead of being written again. The writer does not update the message history
+    cache: the full message is written with `aupdate_messages` once it is complete.
+    """
+
+    def __init__(self, message: Message, interval: float) -> None:
+        self.message_id = UUID(str(message.id))
+        self.interval = interval
+        self._written = _dump_message_columns(message)
+        self._written_at = time.monotonic()
+        self._pending: Message | None = None
+
+    async def push(self, message: Message) -> None:
+        self._pending = message
+        if time.monotonic() - self._written_at >= self.interval:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if self._pending is None:
+            return
+        text, properties, content_blocks = columns = _dump_message_columns(self._pending)
+        written_text, written_properties, written_content_blocks = self._written
+        self._pending = None
+        self._written_at = time.monotonic()
+
+        values: dict[str, Any] = {}
+        if text != written_text:
+            if written_text and text.startswith(written_text):
+                values["text"] = col(MessageTable.text) + text[len(written_text) :]
+            else:
+                values["text"] = text
+        if properties != written_properties:
+            values["properties"] = properties
+        if content_blocks != written_content_blocks:
+            values["content_blocks"] = content_blocks
+        if not values:
+            return
+        async with session_scope() as session:
+            await session.exec(update(MessageTable).where(col(MessageTable.id) == self.message_id).values(**values))
+        self._written = columns
+
+    def discard(self) -> None:
+        """Drops the version not written yet, once the full message is written or deleted."""
+        self._pending = None
+
+
+def _dump_message_columns(message: Message) -> tuple[str, dict, list[dict]]:
+    text = message.text if isinstance(message.text, str) else ""
+    properties = (
+        message.properties.model_dump(mode="json")
+        if hasattr(message.properties, "model_dump")
+        else dict(message.properties or {})
+    )
+    content_blocks = [
+        block.model_dump(mode="json") if hasattr(block, "model_dump") else block
+        for block in message.content_blocks or []
+    ]
+    return text, properties, content_blocks
+
+
 async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession):
     try:
         try:
@@ -180,6 +416,7 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
         msg.category = msg.category or ""
         new_messages.append(msg)
 
+    message_history_cache.add([message.model_dump() for message in new_messages])
     return [MessageRead.model_validate(message, from_attributes=True) for message in new_messages]
 
 
@@ -207,6 +444,7 @@ async def adelete_messages(session_id: str) -> None:
             .execution_options(synchronize_session="fetch")
         )
         await session.exec(stmt)
+    message_history_cache.evict(session_id)
 
 
 async def delete_message(id_: str) -> None:
@@ -220,6 +458,7 @@ async def delete_message(id_: str) -> None:
         if message:
             await session.delete(message)
             await session.commit()
+    message_history_cache.remove([id_])
 
 
 def store_message(
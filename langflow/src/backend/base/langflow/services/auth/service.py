@@ -1,15 +1,132 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from cachetools import TTLCache
+from loguru import logger
 
 from langflow.services.base import Service
+from langflow.services.database.models.api_key.crud import add_api_key_uses, update_total_uses
+from langflow.services.database.models.user.model import User
+from langflow.services.deps import session_scope
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from langflow.services.settings.service import SettingsService
 
+API_KEY_CACHE_SIZE = 10000
+
 
 class AuthService(Service):
+    """Keeps the authentication state shared by the requests of a worker.
+
+    The users of the API keys are cached for `api_key_cache_ttl` seconds so authenticating a
+    request doesn't query the database, and the uses of the keys are counted in memory and
+    written every `api_key_usage_flush_interval` seconds in a single statement. Deleting a key or
+    updating its user evicts it from the cache of this worker; other workers keep it until it
+    expires.
+
+    Until the service is started, or if the flush interval is 0, every use is written immediately.
+    """
+
     name = "auth_service"
 
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        settings = settings_service.settings
+        ttl = settings.api_key_cache_ttl
+        # Maps an API key to its id and the columns of its user
+        self._api_keys: TTLCache[str, tuple[UUID, dict[str, Any]]] | None = (
+            TTLCache(maxsize=API_KEY_CACHE_SIZE, ttl=ttl) if ttl > 0 else None
+        )
+        self.usage_flush_interval = settings.api_key_usage_flush_interval
+        # Maps the id of an API key to the uses not written yet and the time of the last one
+        self._usage: dict[UUID, tuple[int, datetime]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._stopping = asyncio.Event()
+        self.running = False
+        self.flusher_task: asyncio.Task | None = None
+
+    def get_cached_api_key(self, api_key: str) -> tuple[UUID, User] | None:
+        """Returns the id of the API key and a copy of its user, if the key is cached."""
+        if self._api_keys is None or (cached := self._api_keys.get(api_key)) is None:
+            return None
+        api_key_id, user_data = cached
+        return api_key_id, User(**user_data)
+
+    def cache_api_key(self, api_key: str, api_key_id: UUID, user: User) -> None:
+        if self._api_keys is not None:
+            self._api_keys[api_key] = (api_key_id, user.model_dump())
+
+    def revoke_api_key(self, api_key_id: UUID) -> None:
+        """Evicts the API key from the cache."""
+        if self._api_keys is None:
+            return
+        for api_key, (cached_id, _) in list(self._api_keys.items()):
+            if cached_id == api_key_id:
+                self._api_keys.pop(api_key, None)
+
+    def revoke_user(self, user_id: UUID) -> None:
+        """Evicts the API keys of the user from the cache, so the next requests see the changes to the user."""
+        if self._api_keys is None:
+            return
+        for api_key, (_, user_data) in list(self._api_keys.items()):
+            if str(user_data["id"]) == str(user_id):
+                self._api_keys.pop(api_key, None)
+
+    async def record_api_key_usage(self, api_key_id: UUID) -> None:
+        if not self.running:
+            await update_total_uses(api_key_id)
+            return
+        uses, _ = self._usage.get(api_key_id, (0, None))
+        self._usage[api_key_id] = (uses + 1, datetime.now(timezone.utc))
+
+    async def flush_api_key_usage(self) -> None:
+        """Writes the pending uses of the API keys to the database.
+
+        Uses that fail to be written are added back to be written by the next flush.
+        """
+        async with self._flush_lock:
+            usage, self._usage = self._usage, {}
+            if not usage:
+                return
+            try:
+                async with session_scope() as session:
+                    await add_api_key_uses(session, usage)
+            except Exception:  # noqa: BLE001
+                logger.exception(f"Error writing the usage of {len(usage)} API keys")
+                for api_key_id, (uses, last_used_at) in usage.items():
+                    pending_uses, pending_last_used_at = self._usage.get(api_key_id, (0, last_used_at))
+                    self._usage[api_key_id] = (uses + pending_uses, max(last_used_at, pending_last_used_at))
+
+    async def _run_flusher(self) -> None:
+        while self.running:
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.usage_flush_interval)
+            except asyncio.TimeoutError:
+                await self.flush_api_key_usage()
+
+    def start(self) -> None:
+        if self.running or self.usage_flush_interval <= 0:
+            return
+        self._flush_lock = asyncio.Lock()
+        self._stopping = asyncio.Event()
+        self.running = True
+        self.flusher_task = asyncio.create_task(self._run_flusher())
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        # Let the flusher finish the batch it is writing instead of cancelling it
+        self.running = False
+        self._stopping.set()
+        if self.flusher_task is not None:
+            await self.flusher_task
+            self.flusher_task = None
+        await self.flush_api_key_usage()
+
+    async def teardown(self) -> None:
+        await self.stop()
@@ -11,13 +11,18 @@ from langflow.services.cache.utils import CACHE_MISS
 
 
 class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
-    def __init__(self, cache_dir, max_size=None, expiration_time=3600) -> None:
-        self.cache = Cache(cache_dir)
+    def __init__(self, cache_dir, max_size=None, expiration_time=3600, *, persistent=False, size_limit=None) -> None:
+        """Open the cache in `cache_dir`.
+
+        Unless it is `persistent`, the items written before are cleared. `size_limit` is the number of bytes
+        above which the least recently stored items are evicted, 1GB by default.
+        """
+        self.cache = Cache(cache_dir) if size_limit is None else Cache(cache_dir, size_limit=size_limit)
         # Let's clear the cache for now to maintain a similar
         # behavior as the in-memory cache
         # Later we should implement endpoints for the frontend to grab
         # output logs from the cache
-        if len(self.cache) > 0:
+        if not persistent and len(self.cache) > 0:
             self.cache.clear()
         self.lock = asyncio.Lock()
         self.max_size = max_size
@@ -1,11 +1,67 @@
+from __future__ import annotations
+
 import asyncio
-from collections import defaultdict
+import time
 from threading import RLock
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
-from langflow.services.deps import get_cache_service
+from langflow.services.deps import get_cache_service, get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class CacheLocks:
+    """The locks of the cache keys, created on first use and dropped once unused for `ttl` seconds.
+
+    Every run caches its graph under its own keys, so the locks are bounded rather than kept for every key ever
+    used. Using a lock postpones its expiry, and a held lock never expires: dropping it would hand the next caller
+    a fresh lock and let two builds of the same key run concurrently.
+    """
+
+    def __init__(self, factory: Callable[[], Any], ttl: float, timer: Callable[[], float] = time.monotonic) -> None:
+        self._factory = factory
+        self._ttl = ttl
+        self._timer = timer
+        # Ordered from the least to the most recently used.
+        self._locks: dict[str, tuple[Any, float]] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        now = self._timer()
+        self._expire(now)
+        entry = self._locks.pop(key, None)
+        lock = entry[0] if entry is not None else self._factory()
+        self._locks[key] = (lock, now)
+        return lock
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._locks
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        entry = self._locks.pop(key, None)
+        return entry[0] if entry is not None else default
+
+    def _expire(self, now: float) -> None:
+        for key, (lock, used_at) in list(self._locks.items()):
+            if now - used_at < self._ttl:
+                # The rest were used more recently.
+                break
+            if not _is_held(lock):
+                del self._locks[key]
+
+
+def _is_held(lock: Any) -> bool:
+    if isinstance(lock, asyncio.Lock):
+        return lock.locked()
+    if not lock.acquire(blocking=False):
+        return True
+    lock.release()
+    return False
 
 
 class ChatService(Service):
@@ -14,8 +70,9 @@ class ChatService(Service):
     name = "chat_service"
 
     def __init__(self) -> None:
-        self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
-        self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
+        ttl = get_settings_service().settings.cache_expire
+        self.async_cache_locks: CacheLocks = CacheLocks(asyncio.Lock, ttl)
+        self._sync_cache_locks: CacheLocks = CacheLocks(RLock, ttl)
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
@@ -63,5 +120,8 @@ class ChatService(Service):
             lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
         """
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
-        return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
+            await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
+        else:
+            await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
+        self.async_cache_locks.pop(key, None)
+        self._sync_cache_locks.pop(key, None)
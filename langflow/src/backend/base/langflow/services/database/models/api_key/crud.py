@@ -3,13 +3,14 @@ import secrets
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from sqlalchemy import bindparam, update
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models.api_key.model import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
 from langflow.services.database.models.user.model import User
-from langflow.services.deps import get_settings_service, session_scope
+from langflow.services.deps import get_auth_service, get_settings_service, session_scope
 
 if TYPE_CHECKING:
     from sqlmodel.sql.expression import SelectOfScalar
@@ -47,18 +48,28 @@ async def delete_api_key(session: AsyncSession, api_key_id: UUID) -> None:
         raise ValueError(msg)
     await session.delete(api_key)
     await session.commit()
+    get_auth_service().revoke_api_key(api_key_id)
 
 
 async def check_key(session: AsyncSession, api_key: str) -> User | None:
-    """Check if the API key is valid."""
-    query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
-    api_key_object: ApiKey | None = (await session.exec(query)).first()
-    if api_key_object is not None:
-        settings_service = get_settings_service()
-        if settings_service.settings.disable_track_apikey_usage is not True:
-            await update_total_uses(api_key_object.id)
-        return api_key_object.user
-    return None
+    """Check if the API key is valid.
+
+    Valid keys are cached by the auth service, which also counts their uses, see `AuthService`.
+    """
+    auth_service = get_auth_service()
+    if (cached := auth_service.get_cached_api_key(api_key)) is not None:
+        api_key_id, user = cached
+    else:
+        query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
+        api_key_object: ApiKey | None = (await session.exec(query)).first()
+        if api_key_object is None:
+            return None
+        api_key_id, user = api_key_object.id, api_key_object.user
+        auth_service.cache_api_key(api_key, api_key_id, user)
+    settings_service = get_settings_service()
+    if settings_service.settings.disable_track_apikey_usage is not True:
+        await auth_service.record_api_key_usage(api_key_id)
+    return user
 
 
 async def update_total_uses(api_key_id: UUID):
@@ -72,3 +83,26 @@ async def update_total_uses(api_key_id: UUID):
         new_api_key.last_used_at = datetime.datetime.now(datetime.timezone.utc)
         session.add(new_api_key)
         await session.commit()
+
+
+async def add_api_key_uses(session: AsyncSession, usage: dict[UUID, tuple[int, datetime.datetime]]) -> None:
+    """Adds uses to several API keys in a single UPDATE.
+
+    Args:
+        session: The database session.
+        usage: The number of uses to add to each API key and the time it was last used.
+    """
+    table = ApiKey.__table__  # type: ignore[attr-defined]
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("api_key_id"))
+        .values(total_uses=table.c.total_uses + bindparam("uses"), last_used_at=bindparam("used_at"))
+    )
+    await session.execute(
+        stmt,
+        [
+            {"api_key_id": api_key_id, "uses": uses, "used_at": last_used_at}
+            for api_key_id, (uses, last_used_at) in usage.items()
+        ],
+    )
+    await session.commit()
@@ -0,0 +1,281 @@
+"""In-memory index of the headers of the flows of each user.
+
+Listing flows only needs their headers, so they are read with a projection that never loads the data of the
+flows, except for components whose data is part of the header. The headers of a user are kept in memory and
+dropped when a flow of the user is written through an ORM session of this worker. Paginated listings read only
+their page with a keyset query instead.
+"""
+
+from __future__ import annotations
+
+import base64
+import threading
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from cachetools import TTLCache
+from sqlalchemy import and_, case, event, func, or_
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import PASSIVE_NO_INITIALIZE, get_history
+from sqlmodel import col, select
+
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.orm import ORMExecuteState
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+FLOW_HEADER_CACHE_USERS = 1024
+_WRITTEN_USERS_KEY = "flow_header_written_users"
+_MIN_UPDATED_AT = datetime.min.replace(tzinfo=timezone.utc)
+
+HeaderKey = tuple[datetime, str]
+
+_HEADER_COLUMNS = (
+    Flow.id,
+    Flow.name,
+    Flow.folder_id,
+    Flow.is_component,
+    Flow.endpoint_name,
+    Flow.description,
+    Flow.access_type,
+    Flow.tags,
+    Flow.mcp_enabled,
+    Flow.action_name,
+    Flow.action_description,
+    Flow.updated_at,
+)
+
+
+class FlowHeaderIndex:
+    """Keeps the headers of the flows of the active users in memory.
+
+    Each entry holds the headers of the flows a user can list, newest first, keyed by the user id and whether
+    the flows without a user are included. Flows written by other workers are seen once the entry expires.
+    """
+
+    def __init__(self) -> None:
+        self._headers: TTLCache[tuple[UUID, bool], list[dict[str, Any]]] | None = None
+        self._configured = False
+        self._lock = threading.Lock()
+        # Counts the writes, so headers read from the database while a flow was written are not cached
+        self.writes = 0
+
+    def configure(self, ttl: float) -> None:
+        self._headers = TTLCache(maxsize=FLOW_HEADER_CACHE_USERS, ttl=ttl) if ttl > 0 else None
+        self._configured = True
+
+    @property
+    def enabled(self) -> bool:
+        if not self._configured:
+            self.configure(get_settings_service().settings.flow_header_cache_ttl)
+        return self._headers is not None
+
+    def get(self, user_id: UUID, *, include_unowned: bool = False) -> list[dict[str, Any]] | None:
+        if not self.enabled or self._headers is None:
+            return None
+        with self._lock:
+            return self._headers.get((user_id, include_unowned))
+
+    def set(self, user_id: UUID, headers: list[dict[str, Any]], writes: int, *, include_unowned: bool = False) -> None:
+        """Caches the headers read from the database unless a flow was written since `writes` was read."""
+        with self._lock:
+            if self._headers is None or writes != self.writes:
+                return
+            self._headers[user_id, include_unowned] = headers
+
+    def invalidate(self, user_ids: Iterable[UUID | None]) -> None:
+        """Drops the headers of the users. The flows without a user are listed by every user, so None drops all."""
+        user_ids = set(user_ids)
+        with self._lock:
+            self.writes += 1
+            if self._headers is None:
+                return
+            if None in user_ids:
+                self._headers.clear()
+                return
+            for user_id in user_ids:
+                self._headers.pop((user_id, False), None)
+                self._headers.pop((user_id, True), None)
+
+    def reset(self) -> None:
+        """Drops every user; the settings are read again on the next lookup."""
+        with self._lock:
+            self.writes += 1
+            self._headers = None
+            self._configured = False
+
+
+flow_header_index = FlowHeaderIndex()
+
+
+async def aget_flow_headers(
+    session: AsyncSession, user_id: UUID, *, include_unowned: bool = False
+) -> list[dict[str, Any]]:
+    """Returns the headers of the flows of a user, newest first.
+
+    Args:
+        session (AsyncSession): The database session.
+        user_id (UUID): The user whose flows are listed.
+        include_unowned (bool): Whether the flows without a user are listed too.
+
+    Returns:
+        list[dict[str, Any]]: The fields of `FlowHeader` and `updated_at` of each flow. The list is shared with
+        the cache and must not be modified.
+    """
+    if (headers := flow_header_index.get(user_id, include_unowned=include_unowned)) is not None:
+        return headers
+
+    writes = flow_header_index.writes
+    rows = (await session.exec(_select_headers(user_id, include_unowned=include_unowned))).all()
+
+    headers = sorted((_header_from_row(row._asdict()) for row in rows), key=header_key, reverse=True)
+    flow_header_index.set(user_id, headers, writes, include_unowned=include_unowned)
+    return headers
+
+
+async def aget_flow_headers_page(
+    session: AsyncSession,
+    user_id: UUID,
+    *,
+    include_unowned: bool = False,
+    folder_id: UUID | None = None,
+    exclude_folder_id: UUID | None = None,
+    components_only: bool = False,
+    limit: int | None = None,
+    position: HeaderKey | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Returns a page of the headers of the flows of a user, newest first, and the cursor of the next page.
+
+    The page is read with a keyset query, so only its rows are loaded rather than every flow of the user. Pages
+    are delimited by the last header they hold rather than an offset, so flows created or deleted while
+    paginating don't shift the next pages. A page of components can hold fewer than `limit` headers when flows
+    saved without the `is_component` flag turn out not to be components.
+
+    Args:
+        session (AsyncSession): The database session.
+        user_id (UUID): The user whose flows are listed.
+        include_unowned (bool): Whether the flows without a user are listed too.
+        folder_id (UUID | None): Only lists the flows of this folder.
+        exclude_folder_id (UUID | None): Leaves out the flows of this folder.
+        components_only (bool): Only lists the components.
+        limit (int | None): Maximum number of headers of the page. None returns all the remaining headers.
+        position (HeaderKey | None): The decoded cursor of the page. None starts from the newest header.
+
+    Returns:
+        tuple[list[dict[str, Any]], str | None]: The headers of the page and the cursor of the next page, None if
+        it is the last one.
+    """
+    stmt = _select_headers(user_id, include_unowned=include_unowned)
+    if folder_id is not None:
+        stmt = stmt.where(Flow.folder_id == folder_id)
+    if exclude_folder_id is not None:
+        stmt = stmt.where(or_(col(Flow.folder_id).is_(None), Flow.folder_id != exclude_folder_id))
+    if components_only:
+        stmt = stmt.where(or_(col(Flow.is_component).is_(True), col(Flow.is_component).is_(None)))
+    updated_at = func.coalesce(col(Flow.updated_at), _MIN_UPDATED_AT)
+    if position is not None:
+        position_updated_at, position_id = position[0], UUID(position[1])
+        stmt = stmt.where(
+            or_(
+                updated_at < position_updated_at,
+                and_(updated_at == position_updated_at, col(Flow.id) < position_id),
+            )
+        )
+    stmt = stmt.order_by(updated_at.desc(), col(Flow.id).desc())
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    headers = [_header_from_row(row._asdict()) for row in (await session.exec(stmt)).all()]
+
+    next_cursor = None
+    if limit is not None and len(headers) > limit:
+        headers = headers[:limit]
+        next_cursor = encode_cursor(headers[-1])
+    if components_only:
+        headers = [header for header in headers if header["is_component"]]
+    return headers, next_cursor
+
+
+def _select_headers(user_id: UUID, *, include_unowned: bool):
+    # The data is only needed for components, and to tell whether flows saved without the flag are components
+    data = case((or_(col(Flow.is_component).is_(True), col(Flow.is_component).is_(None)), Flow.data), else_=None)
+    stmt = select(*_HEADER_COLUMNS, data.label("data"))
+    if include_unowned:
+        return stmt.where(or_(col(Flow.user_id).is_(None), Flow.user_id == user_id))
+    return stmt.where(Flow.user_id == user_id)
+
+
+def _header_from_row(header: dict[str, Any]) -> dict[str, Any]:
+    if header["updated_at"] is not None and header["updated_at"].tzinfo is None:
+        header["updated_at"] = header["updated_at"].replace(tzinfo=timezone.utc)
+    data = header["data"]
+    if header["is_component"] is None and data:
+        # Same inference as `validate_is_component` for the flows saved before the flag existed
+        is_component = data.get("is_component")
+        header["is_component"] = is_component if is_component is not None else len(data.get("nodes", [])) == 1
+    if not header["is_component"]:
+        header["data"] = None
+    return header
+
+
+def header_key(header: dict[str, Any]) -> HeaderKey:
+    """Sort key of a header; the headers are listed from the greatest key."""
+    return header["updated_at"] or _MIN_UPDATED_AT, str(header["id"])
+
+
+def encode_cursor(header: dict[str, Any]) -> str:
+    """Returns the cursor of the page that starts after the header."""
+    updated_at, flow_id = header_key(header)
+    return base64.urlsafe_b64encode(f"{updated_at.isoformat()}|{flow_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> HeaderKey:
+    """Returns the sort key of the last header before the page of the cursor.
+
+    Raises:
+        ValueError: If the cursor was not returned by `encode_cursor`.
+    """
+    try:
+        updated_at, flow_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        position = datetime.fromisoformat(updated_at), str(UUID(flow_id))
+    except (ValueError, UnicodeDecodeError) as e:
+        msg = f"Invalid cursor: {cursor}"
+        raise ValueError(msg) from e
+    if position[0].tzinfo is None:
+        msg = f"Invalid cursor: {cursor}"
+        raise ValueError(msg)
+    return position
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_written_flows(session: Session, _flush_context) -> None:
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, Flow):
+            # An unloaded user drops the headers of every user rather than loading it
+            history = get_history(instance, "user_id", passive=PASSIVE_NO_INITIALIZE)
+            user_ids = {*history.added, *history.unchanged, *history.deleted} or {None}
+            session.info.setdefault(_WRITTEN_USERS_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_written_flows(orm_execute_state: ORMExecuteState) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if any(mapper.class_ is Flow for mapper in orm_execute_state.all_mappers):
+        # The users of the rows are unknown, None drops the headers of every user
+        orm_execute_state.session.info.setdefault(_WRITTEN_USERS_KEY, set()).add(None)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_written_flows(session: Session) -> None:
+    if user_ids := session.info.pop(_WRITTEN_USERS_KEY, None):
+        flow_header_index.invalidate(user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_written_flows(session: Session) -> None:
+    session.info.pop(_WRITTEN_USERS_KEY, None)
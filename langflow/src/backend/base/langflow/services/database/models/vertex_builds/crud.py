@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Sequence
 from uuid import UUID
 
 from sqlmodel import col, delete, func, select
@@ -130,6 +131,83 @@ async def log_vertex_build(
     return table
 
 
+async def log_vertex_builds(db: AsyncSession, vertex_builds: Sequence[VertexBuildBase]) -> list[VertexBuildTable]:
+    """Insert many vertex builds in a single commit.
+
+    Unlike `log_vertex_build`, this function doesn't enforce the build history limits. Call
+    `trim_vertex_builds` for the affected vertices afterwards.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        vertex_builds (Sequence[VertexBuildBase]): The vertex builds to log.
+
+    Returns:
+        list[VertexBuildTable]: The newly created vertex build records.
+    """
+    tables = [VertexBuildTable(**vertex_build.model_dump()) for vertex_build in vertex_builds]
+    if not tables:
+        return []
+    try:
+        db.add_all(tables)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return tables
+
+
+async def trim_vertex_builds(
+    db: AsyncSession,
+    vertices: Iterable[tuple[UUID, str]],
+    *,
+    max_builds_to_keep: int | None = None,
+    max_builds_per_vertex: int | None = None,
+) -> None:
+    """Enforce the build history limits for the given vertices and globally.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        vertices (Iterable[tuple[UUID, str]]): Pairs of flow ID and vertex ID whose history should be trimmed.
+        max_builds_to_keep (int | None, optional): Maximum number of builds to keep globally.
+            If None, uses system settings.
+        max_builds_per_vertex (int | None, optional): Maximum number of builds to keep per vertex.
+            If None, uses system settings.
+    """
+    settings = get_settings_service().settings
+    max_global = max_builds_to_keep or settings.max_vertex_builds_to_keep
+    max_per_vertex = max_builds_per_vertex or settings.max_vertex_builds_per_vertex
+
+    try:
+        for flow_id, vertex_id in vertices:
+            keep_vertex_subq = (
+                select(VertexBuildTable.build_id)
+                .where(
+                    VertexBuildTable.flow_id == flow_id,
+                    VertexBuildTable.id == vertex_id,
+                )
+                .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+                .limit(max_per_vertex)
+            )
+            delete_vertex_older = delete(VertexBuildTable).where(
+                VertexBuildTable.flow_id == flow_id,
+                VertexBuildTable.id == vertex_id,
+                col(VertexBuildTable.build_id).not_in(keep_vertex_subq),
+            )
+            await db.exec(delete_vertex_older)
+
+        keep_global_subq = (
+            select(VertexBuildTable.build_id)
+            .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+            .limit(max_global)
+        )
+        delete_global_older = delete(VertexBuildTable).where(col(VertexBuildTable.build_id).not_in(keep_global_subq))
+        await db.exec(delete_global_older)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
 async def delete_vertex_builds_by_flow_id(db: AsyncSession, flow_id: UUID) -> None:
     """Delete all vertex builds associated with a specific flow ID.
 
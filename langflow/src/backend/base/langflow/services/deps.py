@@ -12,10 +12,15 @@ if TYPE_CHECKING:
 
     from sqlmodel.ext.asyncio.session import AsyncSession
 
+    from langflow.services.auth.service import AuthService
     from langflow.services.cache.service import AsyncBaseCacheService, CacheService
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
+    from langflow.services.flow_template.service import FlowTemplateService
+    from langflow.services.http_client.service import HttpClientService
     from langflow.services.job_queue.service import JobQueueService
+    from langflow.services.llm_cache.service import LLMCacheService
+    from langflow.services.run_log.service import RunLogService
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
     from langflow.services.socket.service import SocketIOService
@@ -247,3 +252,38 @@ def get_queue_service() -> JobQueueService:
     from langflow.services.job_queue.factory import JobQueueServiceFactory
 
     return get_service(ServiceType.JOB_QUEUE_SERVICE, JobQueueServiceFactory())
+
+
+def get_flow_template_service() -> FlowTemplateService:
+    """Retrieves the FlowTemplateService instance from the service manager."""
+    from langflow.services.flow_template.factory import FlowTemplateServiceFactory
+
+    return get_service(ServiceType.FLOW_TEMPLATE_SERVICE, FlowTemplateServiceFactory())
+
+
+def get_run_log_service() -> RunLogService:
+    """Retrieves the RunLogService instance from the service manager."""
+    from langflow.services.run_log.factory import RunLogServiceFactory
+
+    return get_service(ServiceType.RUN_LOG_SERVICE, RunLogServiceFactory())
+
+
+def get_llm_cache_service() -> LLMCacheService:
+    """Retrieves the LLMCacheService instance from the service manager."""
+    from langflow.services.llm_cache.factory import LLMCacheServiceFactory
+
+    return get_service(ServiceType.LLM_CACHE_SERVICE, LLMCacheServiceFactory())
+
+
+def get_http_client_service() -> HttpClientService:
+    """Retrieves the HttpClientService instance from the service manager."""
+    from langflow.services.http_client.factory import HttpClientServiceFactory
+
+    return get_service(ServiceType.HTTP_CLIENT_SERVICE, HttpClientServiceFactory())
+
+
+def get_auth_service() -> AuthService:
+    """Retrieves the AuthService instance from the service manager."""
+    from langflow.services.auth.factory import AuthServiceFactory
+
+    return get_service(ServiceType.AUTH_SERVICE, AuthServiceFactory())
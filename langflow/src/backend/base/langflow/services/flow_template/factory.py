@@ -0,0 +1,21 @@
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from langflow.services.factory import ServiceFactory
+from langflow.services.flow_template.service import FlowTemplateService
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+
+class FlowTemplateServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(FlowTemplateService)
+
+    @override
+    def create(self, settings_service: "SettingsService"):
+        settings = settings_service.settings
+        return FlowTemplateService(
+            max_size=settings.flow_template_cache_size, prometheus_enabled=settings.prometheus_enabled
+        )
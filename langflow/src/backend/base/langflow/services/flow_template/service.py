@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.graph.graph.base import Graph
+    from langflow.schema.graph import Tweaks
+    from langflow.services.database.models.flow.model import Flow
+
+TemplateKey = tuple[str, str | None, str, bool]
+
+
+class FlowTemplateService(Service):
+    """Keeps compiled graphs of flows in memory so runs don't have to parse the flow payload again.
+
+    A template is the graph built from the flow data with the request tweaks applied. It is never
+    run; every request gets its own graph cloned from it. Templates are keyed by flow id, the
+    `updated_at` of the flow, the hash of the tweaks and the stream flag, so an edited flow never
+    reuses an outdated template. When the cache is full, the least recently used template is evicted.
+
+    Attributes:
+        max_size (int): Maximum number of templates kept. 0 disables the cache.
+        hits (int): Number of runs served from a cached template.
+        misses (int): Number of runs that had to build a new template.
+        evictions (int): Number of templates dropped because the cache was full.
+        invalidations (int): Number of templates dropped because their flow changed.
+    """
+
+    name = "flow_template_service"
+
+    def __init__(self, max_size: int = 128, *, prometheus_enabled: bool = True) -> None:
+        self.max_size = max_size
+        self.ot = OpenTelemetry(prometheus_enabled=prometheus_enabled)
+        self._templates: OrderedDict[TemplateKey, Graph] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def hash_tweaks(tweaks: Tweaks | dict[str, Any] | None) -> str:
+        if tweaks is not None and not isinstance(tweaks, dict):
+            tweaks = tweaks.model_dump()
+        serialized = json.dumps(tweaks or {}, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def get_graph(
+        self,
+        flow: Flow,
+        tweaks: Tweaks | dict[str, Any] | None = None,
+        *,
+        stream: bool = False,
+        user_id: str | None = None,
+    ) -> Graph:
+        """Returns a new graph of the flow with the tweaks applied, ready to be run.
+
+        Args:
+            flow: The flow to build the graph from.
+            tweaks: The tweaks to apply to the flow data.
+            stream: Whether the components should stream their results.
+            user_id: The ID of the user running the flow.
+
+        Returns:
+            Graph: A graph that is not shared with any other run.
+        """
+        flow_id = str(flow.id)
+        if flow.data is None:
+            msg = f"Flow {flow_id} has no data"
+            raise ValueError(msg)
+        updated_at = flow.updated_at.isoformat() if flow.updated_at else None
+        key: TemplateKey = (flow_id, updated_at, self.hash_tweaks(tweaks), stream)
+
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        self.ot.increment_counter("flow_template_requests", {"result": "hit" if template is not None else "miss"})
+        if template is not None:
+            logger.debug(f"Using cached template for flow {flow_id}")
+            return template.clone(user_id=user_id)
+
+        from langflow.graph.graph.base import Graph
+        from langflow.processing.process import process_tweaks
+
+        graph_data = process_tweaks(copy.deepcopy(flow.data), copy.deepcopy(tweaks) or {}, stream=stream)
+        template = Graph.from_payload(graph_data, flow_id=flow_id, user_id=user_id, flow_name=flow.name)
+        if self.max_size <= 0:
+            return template
+        self._set(key, template)
+        return template.clone(user_id=user_id)
+
+    def _set(self, key: TemplateKey, template: Graph) -> None:
+        with self._lock:
+            # Templates of previous versions of the flow can't be hit anymore
+            for stale_key in [k for k in self._templates if k[0] == key[0] and k[1] != key[1]]:
+                del self._templates[stale_key]
+                self.invalidations += 1
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, flow_id: str | UUID) -> None:
+        """Drops every template of the given flow."""
+        flow_key = str(flow_id)
+        with self._lock:
+            for key in [key for key in self._templates if key[0] == flow_key]:
+                del self._templates[key]
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._templates),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    async def teardown(self) -> None:
+        self.clear()
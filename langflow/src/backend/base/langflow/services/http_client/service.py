@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING
+
+import httpx
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+# Seconds an evicted client is kept open, so the requests it is still sending can finish
+EVICTED_CLIENT_GRACE_PERIOD = 60
+REQUEST_START = "langflow_request_start"
+# Host label of the metrics of the requests to the hosts that are not in `HttpClientService.metric_hosts`
+OTHER_HOST = "other"
+
+
+@dataclass(frozen=True)
+class HttpClientPolicy:
+    """How the client of a host connects to it. Timeouts and redirects are set per request."""
+
+    http2: bool
+    max_connections: int
+    keepalive_expiry: float
+    verify: bool = True
+
+
+class HttpClientService(Service):
+    """Shared, pooled `httpx.AsyncClient`s for the components and the services.
+
+    There is one client per host and policy, so connections and TLS sessions are reused across runs and the
+    number of connections to a host is bounded by `http_client_max_connections_per_host`. Clients are bound
+    to the event loop they are used in. The least recently used ones are closed once more than
+    `http_client_max_hosts` hosts are in use.
+
+    The clients are shared by every user, so they never keep cookies. Requests are counted and timed in the
+    `http_client_requests` and `http_client_response_latency` metrics. Their host label is bounded to
+    `metric_hosts`, the hosts of the store and of `http_client_metric_hosts`, the others are labeled 'other'.
+    """
+
+    name = "http_client_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        settings = settings_service.settings
+        self.default_policy = HttpClientPolicy(
+            http2=settings.http_client_http2,
+            max_connections=settings.http_client_max_connections_per_host,
+            keepalive_expiry=settings.http_client_keepalive_expiry,
+        )
+        self.timeout = settings.http_client_timeout
+        self.max_hosts = settings.http_client_max_hosts
+        store_urls = (settings.store_url, settings.download_webhook_url, settings.like_webhook_url)
+        self.metric_hosts = {*settings.http_client_metric_hosts, *(httpx.URL(url).host for url in store_urls if url)}
+        self.ot = OpenTelemetry(prometheus_enabled=settings.prometheus_enabled)
+
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, OrderedDict[tuple[str, HttpClientPolicy], httpx.AsyncClient]
+        ] = weakref.WeakKeyDictionary()
+        self._closing: set[asyncio.Task] = set()
+
+    def get_client(self, url: str | httpx.URL, *, verify: bool = True) -> httpx.AsyncClient:
+        """Returns the shared client of the host of `url`; it must not be closed by the caller.
+
+        Args:
+            url (str | httpx.URL): A URL of the host the client sends requests to.
+            verify (bool): Whether the TLS certificates of the host are verified.
+        """
+        url = httpx.URL(url)
+        origin = f"{url.scheme}://{url.netloc.decode('ascii')}"
+        policy = self.default_policy if verify else replace(self.default_policy, verify=False)
+        clients = self._clients.setdefault(asyncio.get_running_loop(), OrderedDict())
+        key = (origin, policy)
+        if (client := clients.get(key)) is not None and not client.is_closed:
+            clients.move_to_end(key)
+            return client
+        clients[key] = client = self._create_client(policy)
+        while len(clients) > self.max_hosts:
+            _, evicted = clients.popitem(last=False)
+            task = asyncio.create_task(self._close_later(evicted))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        return client
+
+    def _create_client(self, policy: HttpClientPolicy) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            transport=self._create_transport(policy),
+            timeout=self.timeout,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            event_hooks={"request": [self._on_request], "response": [self._on_response]},
+        )
+
+    @staticmethod
+    def _create_transport(policy: HttpClientPolicy) -> httpx.AsyncBaseTransport:
+        limits = httpx.Limits(
+            max_connections=policy.max_connections,
+            max_keepalive_connections=policy.max_connections,
+            keepalive_expiry=policy.keepalive_expiry,
+        )
+        return httpx.AsyncHTTPTransport(http2=policy.http2, limits=limits, verify=policy.verify)
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        request.extensions[REQUEST_START] = time.perf_counter()
+
+    async def _on_response(self, response: httpx.Response) -> None:
+        host = response.request.url.host if response.request.url.host in self.metric_hosts else OTHER_HOST
+        labels = {"host": host, "status": f"{response.status_code // 100}xx"}
+        self.ot.increment_counter("http_client_requests", labels)
+        if (start := response.request.extensions.get(REQUEST_START)) is not None:
+            self.ot.observe_histogram("http_client_response_latency", time.perf_counter() - start, {"host": host})
+
+    @staticmethod
+    async def _close_later(client: httpx.AsyncClient) -> None:
+        try:
+            await asyncio.sleep(EVICTED_CLIENT_GRACE_PERIOD)
+        finally:
+            await client.aclose()
+
+    async def teardown(self) -> None:
+        """Closes the clients of the current event loop; the ones of other loops are dropped with their loop."""
+        for task in list(self._closing):
+            task.cancel()
+        loop = asyncio.get_running_loop()
+        for client in self._clients.pop(loop, {}).values():
+            try:
+                await client.aclose()
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).debug("Error closing an HTTP client")
+        self._clients.clear()
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import overload
+
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_COMPLETED = "completed"
+JOB_STATUS_FAILED = "failed"
+JOB_STATUS_CANCELLED = "cancelled"
+
+StreamEntry = tuple[str, bytes | None]
+"""An event of a job: its id in the stream and its payload. A payload of None marks the end of the stream."""
+
+
+class JobEventStore(ABC):
+    """Storage shared by every worker for the events of the build jobs.
+
+    Each job has an append-only stream of events identified by Redis Streams style ids
+    (`<milliseconds>-<sequence>`), a status, and a cursor that remembers the last event delivered
+    to a consumer. Cancel requests go through a stream shared by all the jobs so the worker that
+    runs a job can stop it, whichever worker received the request.
+    """
+
+    @abstractmethod
+    async def create(self, job_id: str, owner: str) -> None:
+        """Registers a running job owned by the worker `owner`."""
+
+    @abstractmethod
+    async def get_status(self, job_id: str) -> str | None:
+        """Returns the status of the job, or None if the job doesn't exist or expired."""
+
+    @abstractmethod
+    async def append(self, job_id: str, events: list[bytes | None]) -> list[str]:
+        """Appends events to the stream of the job and returns their ids."""
+
+    @abstractmethod
+    async def read(self, job_id: str, after: str, *, block: float | None = None) -> list[StreamEntry]:
+        """Returns the events that come after the event `after`.
+
+        If there are none and `block` is set, waits up to `block` seconds for new events.
+        """
+
+    @abstractmethod
+    async def get_cursor(self, job_id: str) -> str | None:
+        """Returns the id of the last event delivered to a consumer of the job."""
+
+    @abstractmethod
+    async def set_cursor(self, job_id: str, event_id: str) -> None:
+        """Stores the id of the last event delivered to a consumer of the job."""
+
+    @abstractmethod
+    async def finish(self, job_id: str, status: str) -> None:
+        """Sets the final status of the job. Its events expire after the retention period."""
+
+    @abstractmethod
+    async def request_cancel(self, job_id: str) -> None:
+        """Asks the worker running the job to cancel it."""
+
+    @abstractmethod
+    async def read_cancel_requests(self, after: str, *, block: float | None = None) -> list[tuple[str, str]]:
+        """Returns the ids of the cancel requests that come after `after` along with their job ids."""
+
+    @abstractmethod
+    async def cleanup(self) -> int:
+        """Removes the jobs past their retention period and returns how many were removed."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Releases the resources held by the store."""
+
+
+def parse_event_id(event_id: str) -> tuple[int, int]:
+    milliseconds, _, sequence = event_id.partition("-")
+    return int(milliseconds), int(sequence or 0)
+
+
+def new_event_id_after(last_event_id: str | None) -> str:
+    """Returns a time based event id greater than `last_event_id`."""
+    milliseconds = int(time.time() * 1000)
+    if last_event_id is None:
+        return f"{milliseconds}-0"
+    last_milliseconds, last_sequence = parse_event_id(last_event_id)
+    if milliseconds > last_milliseconds:
+        return f"{milliseconds}-0"
+    return f"{last_milliseconds}-{last_sequence + 1}"
+
+
+@dataclass
+class _InMemoryJob:
+    owner: str
+    status: str = JOB_STATUS_RUNNING
+    entries: list[StreamEntry] = field(default_factory=list)
+    cursor: str | None = None
+    expires_at: float | None = None
+
+
+class InMemoryJobEventStore(JobEventStore):
+    """A JobEventStore that lives in the memory of the process.
+
+    It has the same semantics as `RedisJobEventStore` but is only shared by the job queue services
+    of a single process, which makes it a stand-in for Redis in tests and single worker setups.
+    """
+
+    def __init__(self, retention: float = 3600, max_events: int = 10000) -> None:
+        self.retention = retention
+        self.max_events = max_events
+        self._jobs: dict[str, _InMemoryJob] = {}
+        self._cancel_requests: list[tuple[str, str]] = []
+        self._changed: asyncio.Condition | None = None
+
+    def _condition(self) -> asyncio.Condition:
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        return self._changed
+
+    async def _notify(self) -> None:
+        condition = self._condition()
+        async with condition:
+            condition.notify_all()
+
+    async def _wait(self, block: float) -> None:
+        condition = self._condition()
+        async with condition:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(condition.wait(), timeout=block)
+
+    def _get_job(self, job_id: str) -> _InMemoryJob | None:
+        job = self._jobs.get(job_id)
+        if job is not None and job.expires_at is not None and job.expires_at <= time.monotonic():
+            return None
+        return job
+
+    async def create(self, job_id: str, owner: str) -> None:
+        self._jobs[job_id] = _InMemoryJob(owner=owner)
+
+    async def get_status(self, job_id: str) -> str | None:
+        job = self._get_job(job_id)
+        return job.status if job is not None else None
+
+    async def append(self, job_id: str, events: list[bytes | None]) -> list[str]:
+        job = self._get_job(job_id)
+        if job is None:
+            return []
+        event_ids = []
+        for data in events:
+            event_id = new_event_id_after(job.entries[-1][0] if job.entries else None)
+            job.entries.append((event_id, data))
+            event_ids.append(event_id)
+        del job.entries[: -self.max_events]
+        await self._notify()
+        return event_ids
+
+    def _entries_after(self, job_id: str, after: str) -> list[StreamEntry]:
+        job = self._get_job(job_id)
+        if job is None:
+            return []
+        after_key = parse_event_id(after)
+        return [entry for entry in job.entries if parse_event_id(entry[0]) > after_key]
+
+    async def read(self, job_id: str, after: str, *, block: float | None = None) -> list[StreamEntry]:
+        entries = self._entries_after(job_id, after)
+        if entries or not block:
+            return entries
+        await self._wait(block)
+        return self._entries_after(job_id, after)
+
+    async def get_cursor(self, job_id: str) -> str | None:
+        job = self._get_job(job_id)
+        return job.cursor if job is not None else None
+
+    async def set_cursor(self, job_id: str, event_id: str) -> None:
+        if (job := self._get_job(job_id)) is not None:
+            job.cursor = event_id
+
+    async def finish(self, job_id: str, status: str) -> None:
+        if (job := self._get_job(job_id)) is not None:
+            job.status = status
+            job.expires_at = time.monotonic() + self.retention
+            await self._notify()
+
+    async def request_cancel(self, job_id: str) -> None:
+        last_id = self._cancel_requests[-1][0] if self._cancel_requests else None
+        self._cancel_requests.append((new_event_id_after(last_id), job_id))
+        await self._notify()
+
+    def _cancel_requests_after(self, after: str) -> list[tuple[str, str]]:
+        after_key = parse_event_id(after)
+        return [request for request in self._cancel_requests if parse_event_id(request[0]) > after_key]
+
+    async def read_cancel_requests(self, after: str, *, block: float | None = None) -> list[tuple[str, str]]:
+        requests = self._cancel_requests_after(after)
+        if requests or not block:
+            return requests
+        await self._wait(block)
+        return self._cancel_requests_after(after)
+
+    async def cleanup(self) -> int:
+        expired = [job_id for job_id in self._jobs if self._get_job(job_id) is None]
+        for job_id in expired:
+            del self._jobs[job_id]
+        self._cancel_requests = self._cancel_requests[-1000:]
+        return len(expired)
+
+
+class RedisJobEventStore(JobEventStore):
+    """A JobEventStore backed by Redis Streams, shared by every worker connected to the same Redis.
+
+    The events of a job are kept in the stream `<prefix>:<job_id>:events`, capped to about
+    `max_events` entries, and its status and cursor in the hash `<prefix>:<job_id>:meta`. Both keys
+    expire `retention` seconds after the last event or the end of the job, so no worker has to
+    clean them up.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        url: str | None = None,
+        prefix: str = "langflow:jobs",
+        retention: int = 3600,
+        max_events: int = 10000,
+    ) -> None:
+        # Redis is a main dependency, no need to import check
+        from redis.asyncio import StrictRedis
+
+        if url:
+            self._client = StrictRedis.from_url(url)
+        else:
+            self._client = StrictRedis(host=host, port=port, db=db)
+        self.prefix = prefix
+        self.retention = retention
+        self.max_events = max_events
+
+    def _events_key(self, job_id: str) -> str:
+        return f"{self.prefix}:{job_id}:events"
+
+    def _meta_key(self, job_id: str) -> str:
+        return f"{self.prefix}:{job_id}:meta"
+
+    @property
+    def _control_key(self) -> str:
+        return f"{self.prefix}:control"
+
+    @overload
+    @staticmethod
+    def _decode(value: bytes | str) -> str: ...
+
+    @overload
+    @staticmethod
+    def _decode(value: bytes | str | None) -> str | None: ...
+
+    @staticmethod
+    def _decode(value: bytes | str | None) -> str | None:
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        return value
+
+    async def create(self, job_id: str, owner: str) -> None:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hset(self._meta_key(job_id), mapping={"status": JOB_STATUS_RUNNING, "owner": owner})
+            pipe.expire(self._meta_key(job_id), self.retention)
+            await pipe.execute()
+
+    async def get_status(self, job_id: str) -> str | None:
+        return self._decode(await self._client.hget(self._meta_key(job_id), "status"))
+
+    async def append(self, job_id: str, events: list[bytes | None]) -> list[str]:
+        events_key = self._events_key(job_id)
+        async with self._client.pipeline(transaction=False) as pipe:
+            for data in events:
+                fields = {"end": "1"} if data is None else {"data": data}
+                pipe.xadd(events_key, fields, maxlen=self.max_events, approximate=True)
+            pipe.expire(events_key, self.retention)
+            pipe.expire(self._meta_key(job_id), self.retention)
+            results = await pipe.execute()
+        return [self._decode(event_id) for event_id in results[: len(events)]]
+
+    async def read(self, job_id: str, after: str, *, block: float | None = None) -> list[StreamEntry]:
+        response = await self._client.xread(
+            {self._events_key(job_id): after},
+            block=int(block * 1000) if block else None,
+        )
+        entries: list[StreamEntry] = []
+        for _stream, messages in response or []:
+            for event_id, fields in messages:
+                entries.append((self._decode(event_id), None if b"end" in fields else fields[b"data"]))
+        return entries
+
+    async def get_cursor(self, job_id: str) -> str | None:
+        return self._decode(await self._client.hget(self._meta_key(job_id), "cursor"))
+
+    async def set_cursor(self, job_id: str, event_id: str) -> None:
+        await self._client.hset(self._meta_key(job_id), "cursor", event_id)
+
+    async def finish(self, job_id: str, status: str) -> None:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hset(self._meta_key(job_id), "status", status)
+            pipe.expire(self._meta_key(job_id), self.retention)
+            pipe.expire(self._events_key(job_id), self.retention)
+            await pipe.execute()
+
+    async def request_cancel(self, job_id: str) -> None:
+        await self._client.xadd(self._control_key, {"job_id": job_id}, maxlen=1000, approximate=True)
+
+    async def read_cancel_requests(self, after: str, *, block: float | None = None) -> list[tuple[str, str]]:
+        response = await self._client.xread({self._control_key: after}, block=int(block * 1000) if block else None)
+        return [
+            (self._decode(request_id), self._decode(fields[b"job_id"]))
+            for _stream, messages in response or []
+            for request_id, fields in messages
+        ]
+
+    async def cleanup(self) -> int:
+        # Keys expire on their own
+        return 0
+
+    async def close(self) -> None:
+        # types-redis predates aclose, which replaces the deprecated close in redis 5
+        await self._client.aclose()  # type: ignore[attr-defined]
@@ -1,11 +1,25 @@
 from langflow.services.base import Service
 from langflow.services.factory import ServiceFactory
-from langflow.services.job_queue.service import JobQueueService
+from langflow.services.job_queue.service import DistributedJobQueueService, JobQueueService
+from langflow.services.settings.service import SettingsService
 
 
 class JobQueueServiceFactory(ServiceFactory):
     def __init__(self):
         super().__init__(JobQueueService)
 
-    def create(self) -> Service:
+    def create(self, settings_service: SettingsService) -> Service:
+        settings = settings_service.settings
+        if settings.job_queue_backend == "redis":
+            from langflow.services.job_queue.event_store import RedisJobEventStore
+
+            event_store = RedisJobEventStore(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                db=settings.redis_db,
+                url=settings.redis_url,
+                retention=settings.job_queue_retention,
+                max_events=settings.job_queue_max_events,
+            )
+            return DistributedJobQueueService(event_store)
         return JobQueueService()
@@ -1,11 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import time
+import uuid
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
 from langflow.events.event_manager import EventManager
+from langflow.events.event_queue import EventQueue, create_event_queue
 from langflow.services.base import Service
+from langflow.services.job_queue.event_store import (
+    JOB_STATUS_CANCELLED,
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    JOB_STATUS_RUNNING,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from langflow.services.job_queue.event_store import JobEventStore
 
 
 class JobQueueNotFoundError(Exception):
@@ -20,7 +35,7 @@ class JobQueueService(Service):
     """Asynchronous service for managing job-specific queues and their associated tasks.
 
     This service allows clients to:
-      - Create dedicated asyncio queues for individual jobs.
+      - Create dedicated event queues for individual jobs, bounded by the `event_queue_*` settings.
       - Associate each queue with an EventManager, enabling event-driven handling.
       - Launch and manage asynchronous tasks that process these job queues.
       - Safely clean up resources by cancelling active tasks and emptying queues.
@@ -33,9 +48,9 @@ class JobQueueService(Service):
 
     Attributes:
         name (str): Unique identifier for the service.
-        _queues (dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]]):
+        _queues (dict[str, tuple[EventQueue, EventManager, asyncio.Task | None, float | None]]):
             Dictionary mapping job IDs to a tuple containing:
-              * The job's asyncio.Queue instance.
+              * The job's EventQueue instance.
               * The associated EventManager instance.
               * The asyncio.Task processing the job (if any).
               * The cleanup timestamp (if any).
@@ -67,7 +82,7 @@ class JobQueueService(Service):
         Sets up the internal registry for job queues, initializes the cleanup task, and sets the service state
         to active.
         """
-        self._queues: dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]] = {}
+        self._queues: dict[str, tuple[EventQueue, EventManager, asyncio.Task | None, float | None]] = {}
         self._cleanup_task: asyncio.Task | None = None
         self._closed = False
         self.ready = False
@@ -122,15 +137,15 @@ class JobQueueService(Service):
     async def teardown(self) -> None:
         await self.stop()
 
-    def create_queue(self, job_id: str) -> tuple[asyncio.Queue, EventManager]:
+    def create_queue(self, job_id: str) -> tuple[EventQueue, EventManager]:
         """Create and register a new queue along with its corresponding event manager for a job.
 
         Args:
             job_id (str): Unique identifier for the job.
 
         Returns:
-            tuple[asyncio.Queue, EventManager]: A tuple containing:
-                - The asyncio.Queue instance for handling the job's tasks or messages.
+            tuple[EventQueue, EventManager]: A tuple containing:
+                - The EventQueue instance for handling the job's tasks or messages.
                 - The EventManager instance for event handling tied to the queue.
         """
         if self._closed:
@@ -142,7 +157,7 @@ class JobQueueService(Service):
             msg = f"Queue for job_id {job_id} already exists"
             raise ValueError(msg)
 
-        main_queue: asyncio.Queue = asyncio.Queue()
+        main_queue = create_event_queue()
         event_manager: EventManager = self._create_default_event_manager(main_queue)
 
         # Register the queue without an active task.
@@ -184,14 +199,14 @@ class JobQueueService(Service):
         self._queues[job_id] = (main_queue, event_manager, task, None)
         logger.debug(f"New task started for job_id {job_id}")
 
-    def get_queue_data(self, job_id: str) -> tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]:
+    def get_queue_data(self, job_id: str) -> tuple[EventQueue, EventManager, asyncio.Task | None, float | None]:
         """Retrieve the complete data structure associated with a job's queue.
 
         Args:
             job_id (str): Unique identifier for the job.
 
         Returns:
-            tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]:
+            tuple[EventQueue, EventManager, asyncio.Task | None, float | None]:
                 A tuple containing the job's main queue, its linked event manager, the associated task (if any),
                 and the cleanup timestamp (if any).
 
@@ -233,7 +248,7 @@ class JobQueueService(Service):
             task.cancel()
             await asyncio.wait([task])
             # Log any exceptions that occurred during the task's execution.
-            if exc := task.exception():
+            if not task.cancelled() and (exc := task.exception()):
                 logger.error(f"Error in task for job_id {job_id}: {exc}")
             logger.debug(f"Task cancellation complete for job_id {job_id}")
 
@@ -300,11 +315,11 @@ class JobQueueService(Service):
                         logger.debug(f"Cleaning up job_id {job_id} after grace period")
                         await self.cleanup_job(job_id)
 
-    def _create_default_event_manager(self, queue: asyncio.Queue) -> EventManager:
+    def _create_default_event_manager(self, queue: EventQueue) -> EventManager:
         """Creates the default event manager with predefined events.
 
         Args:
-            queue (asyncio.Queue): The queue to be associated with the event manager.
+            queue (EventQueue): The queue to be associated with the event manager.
 
         Returns:
             EventManager: The configured EventManager instance.
@@ -325,3 +340,188 @@ class JobQueueService(Service):
         for name, event_type in event_names_types:
             manager.register_event(name, event_type)
         return manager
+
+
+class DistributedJobQueueService(JobQueueService):
+    """JobQueueService whose build events are kept in a JobEventStore shared by every worker.
+
+    The job still runs in the worker that created it and its EventManager still writes to a local
+    asyncio queue, but a publisher task forwards those events to the store. Consumers never read the
+    local queue: any worker serves the events of any job from the store, resuming after the last event
+    delivered or after a given event id. Cancel requests are forwarded to the worker running the job.
+
+    Attributes:
+        event_store (JobEventStore): The store shared by the workers.
+        worker_id (str): Identifier of this worker, recorded as the owner of the jobs it runs.
+        cancel_timeout (float): Number of seconds `cancel_job` waits for another worker to cancel a job.
+    """
+
+    def __init__(self, event_store: JobEventStore, *, cancel_timeout: float = 5.0) -> None:
+        super().__init__()
+        self.event_store = event_store
+        self.worker_id = str(uuid.uuid4())
+        self.cancel_timeout = cancel_timeout
+        self._publishers: dict[str, asyncio.Task] = {}
+        self._cancel_watcher: asyncio.Task | None = None
+
+    def start(self) -> None:
+        super().start()
+        self._cancel_watcher = asyncio.create_task(self._watch_cancel_requests())
+
+    async def stop(self) -> None:
+        if self._cancel_watcher:
+            self._cancel_watcher.cancel()
+            await asyncio.wait([self._cancel_watcher])
+            self._cancel_watcher = None
+        await super().stop()
+        await self.event_store.close()
+
+    async def register_job(self, job_id: str) -> None:
+        """Makes the job visible to the other workers. Must be called before `start_job`."""
+        await self.event_store.create(job_id, owner=self.worker_id)
+
+    def start_job(self, job_id: str, task_coro) -> None:
+        super().start_job(job_id, task_coro)
+        main_queue, _, task, _ = self._queues[job_id]
+        if task is None:
+            msg = f"Job {job_id} was not started"
+            raise RuntimeError(msg)
+        # Make sure the publisher stops even if the job ends without sending the end of stream
+        task.add_done_callback(lambda _: main_queue.put_nowait((None, None, time.time())))
+        self._publishers[job_id] = asyncio.create_task(self._publish_events(job_id, main_queue, task))
+
+    async def _publish_events(self, job_id: str, main_queue: EventQueue, task: asyncio.Task) -> None:
+        finished = False
+        while not finished:
+            items = [await main_queue.get()]
+            while not main_queue.empty():
+                items.append(main_queue.get_nowait())
+            events: list[bytes | None] = []
+            for _, value, _ in items:
+                if value is None:
+                    finished = True
+                    break
+                events.append(value)
+            if events:
+                await self.event_store.append(job_id, events)
+
+        await asyncio.wait([task])
+        if task.cancelled():
+            status = JOB_STATUS_CANCELLED
+        elif task.exception() is not None:
+            status = JOB_STATUS_FAILED
+        else:
+            status = JOB_STATUS_COMPLETED
+        await self.event_store.append(job_id, [None])
+        await self.event_store.finish(job_id, status)
+        # Consumers read from the store, the local queue is no longer needed
+        self._queues.pop(job_id, None)
+        self._publishers.pop(job_id, None)
+        logger.debug(f"Job {job_id} finished with status {status}")
+
+    async def cleanup_job(self, job_id: str) -> None:
+        is_local = job_id in self._queues
+        if publisher := self._publishers.pop(job_id, None):
+            publisher.cancel()
+            await asyncio.wait([publisher])
+        await super().cleanup_job(job_id)
+        if is_local:
+            await self.event_store.append(job_id, [None])
+            await self.event_store.finish(job_id, JOB_STATUS_CANCELLED)
+
+    async def get_job_status(self, job_id: str) -> str:
+        """Returns the status of a job run by any worker.
+
+        Raises:
+            JobQueueNotFoundError: If the job doesn't exist or expired.
+        """
+        status = await self.event_store.get_status(job_id)
+        if status is None:
+            raise JobQueueNotFoundError(job_id)
+        return status
+
+    async def read_events(
+        self, job_id: str, last_event_id: str | None = None, *, block: float | None = None
+    ) -> list[tuple[str, bytes | None]]:
+        """Returns the events of a job that have not been delivered yet.
+
+        Args:
+            job_id (str): Unique identifier for the job.
+            last_event_id (str | None): Resume after this event instead of after the last event delivered.
+            block (float | None): Number of seconds to wait for an event if there are none.
+
+        Returns:
+            list[tuple[str, bytes | None]]: The ids and payloads of the events. A None payload marks the end of the job.
+
+        Raises:
+            JobQueueNotFoundError: If the job doesn't exist or expired.
+        """
+        await self.get_job_status(job_id)
+        after = last_event_id or await self.event_store.get_cursor(job_id) or "0-0"
+        entries = await self.event_store.read(job_id, after, block=block)
+        if entries:
+            await self.event_store.set_cursor(job_id, entries[-1][0])
+        return entries
+
+    async def stream_events(self, job_id: str, last_event_id: str | None = None) -> AsyncIterator[tuple[str, bytes]]:
+        """Yields the events of a job as they are published, until the job ends."""
+        while True:
+            entries = await self.read_events(job_id, last_event_id, block=1.0)
+            if not entries:
+                if await self.get_job_status(job_id) == JOB_STATUS_RUNNING:
+                    continue
+                # The job ended, deliver what was published since the last read
+                entries = await self.read_events(job_id, last_event_id)
+                if not entries:
+                    return
+            for event_id, value in entries:
+                if value is None:
+                    return
+                yield event_id, value
+            if entries:
+                last_event_id = entries[-1][0]
+
+    async def cancel_job(self, job_id: str) -> bool:
+        """Cancels a job, whichever worker runs it.
+
+        Returns:
+            bool: True if the job is no longer running.
+
+        Raises:
+            JobQueueNotFoundError: If the job doesn't exist or expired.
+        """
+        if job_id in self._queues:
+            await self.cleanup_job(job_id)
+            return True
+        status = await self.get_job_status(job_id)
+        if status != JOB_STATUS_RUNNING:
+            return True
+        await self.event_store.request_cancel(job_id)
+        deadline = time.monotonic() + self.cancel_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+            if await self.event_store.get_status(job_id) != JOB_STATUS_RUNNING:
+                return True
+        return False
+
+    async def _watch_cancel_requests(self) -> None:
+        # Only the requests sent from now on matter
+        last_request_id = f"{int(time.time() * 1000) - 1}-0"
+        while not self._closed:
+            try:
+                requests = await self.event_store.read_cancel_requests(last_request_id, block=1.0)
+                for request_id, job_id in requests:
+                    last_request_id = request_id
+                    if job_id in self._queues:
+                        logger.debug(f"Cancelling job {job_id} at the request of another worker")
+                        await self.cleanup_job(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.error(f"Exception encountered while watching cancel requests: {exc}")
+                await asyncio.sleep(1)
+
+    async def _cleanup_old_queues(self) -> None:
+        await super()._cleanup_old_queues()
+        if removed := await self.event_store.cleanup():
+            logger.debug(f"Removed {removed} expired jobs from the event store")
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from langflow.services.factory import ServiceFactory
+from langflow.services.llm_cache.service import LLMCacheService
+
+if TYPE_CHECKING:
+    from langflow.services.settings.service import SettingsService
+
+
+class LLMCacheServiceFactory(ServiceFactory):
+    def __init__(self) -> None:
+        super().__init__(LLMCacheService)
+
+    @override
+    def create(self, settings_service: SettingsService):
+        return LLMCacheService(settings_service)
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from cachetools import LRUCache
+from langchain_core.language_models import BaseChatModel
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+    from langchain_core.messages import BaseMessage
+
+    from langflow.services.settings.service import SettingsService
+
+CACHE_MODES = ["Off", "Exact", "Semantic"]
+# Number of models, with their parameters, that get their own semantic index
+MAX_SEMANTIC_INDEXES = 100
+
+
+@dataclass
+class LLMCacheRequest:
+    """A prompt sent to a model, with the keys and the settings its response is cached under."""
+
+    mode: str
+    ttl: float
+    model_key: str
+    prompt_key: str
+    prompt_text: str
+    embeddings: Embeddings | None = None
+    embedding: np.ndarray | None = None
+
+
+@dataclass
+class CachedResponse:
+    text: str
+    created_at: float
+
+
+def _model_identity(model: Any) -> str:
+    """Identifies a model and the parameters it generates with, without its credentials."""
+    if isinstance(model, BaseChatModel):
+        # The same string LangChain caches chat models under, the secrets are masked
+        return model._get_llm_string()
+    params = getattr(model, "_identifying_params", {}) or {}
+    return f"{type(model).__module__}.{type(model).__qualname__}:{sorted(params.items())}"
+
+
+def _embeddings_identity(embeddings: Embeddings) -> str:
+    return f"{type(embeddings).__module__}.{type(embeddings).__qualname__}:{getattr(embeddings, 'model', None)}"
+
+
+def _text(content: str | list) -> str:
+    if isinstance(content, str):
+        return content
+    return " ".join(part if isinstance(part, str) else str(part.get("text", "")) for part in content)
+
+
+def _hash(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def _normalize(vector: list[float] | np.ndarray) -> np.ndarray:
+    array = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    return array / norm if norm else array
+
+
+class SemanticIndex:
+    """Normalized embeddings of the prompts sent to a model, searched by cosine similarity.
+
+    The oldest prompts are dropped once the index holds `max_entries` of them.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._vectors: np.ndarray | None = None
+        self._responses: list[CachedResponse] = []
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def add(self, vector: np.ndarray, response: CachedResponse) -> None:
+        if self._vectors is None or self._vectors.shape[1] != vector.shape[0]:
+            # First prompt, or the embedding model now has other dimensions
+            self._vectors = vector[np.newaxis]
+            self._responses = [response]
+            return
+        self._vectors = np.vstack([self._vectors, vector])[-self.max_entries :]
+        self._responses = [*self._responses, response][-self.max_entries :]
+
+    def search(self, vector: np.ndarray, threshold: float, ttl: float, now: float) -> CachedResponse | None:
+        """Returns the response to the most similar prompt that is not older than `ttl` seconds."""
+        if self._vectors is None or self._vectors.shape[1] != vector.shape[0]:
+            return None
+        scores = self._vectors @ vector
+        for index in np.argsort(scores)[::-1]:
+            if scores[index] < threshold:
+                break
+            if now - self._responses[index].created_at < ttl:
+                return self._responses[index]
+        return None
+
+
+class LLMCacheService(Service):
+    """Caches the responses of the language models of the components that enable 'Cache Responses'.
+
+    In the 'Exact' mode a response is reused for the same messages sent to the same model with the same
+    parameters. The 'Semantic' mode also reuses it for prompts whose embeddings are similar enough, searched in
+    a local index per model. The TTL is the one of the component reading the cache, so components sharing a
+    model can tolerate responses of different ages.
+
+    Attributes:
+        hits (Counter[str]): Number of reused responses by cache mode.
+        misses (Counter[str]): Number of prompts sent to the models by cache mode.
+    """
+
+    name = "llm_cache_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        settings = settings_service.settings
+        self.max_entries = settings.llm_cache_max_entries
+        self.similarity_threshold = settings.llm_cache_similarity_threshold
+        self.ot = OpenTelemetry(prometheus_enabled=settings.prometheus_enabled)
+
+        self._responses: LRUCache[str, CachedResponse] = LRUCache(maxsize=max(self.max_entries, 1))
+        self._indexes: LRUCache[str, SemanticIndex] = LRUCache(maxsize=MAX_SEMANTIC_INDEXES)
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def hit_rate(self, mode: str) -> float:
+        total = self.hits[mode] + self.misses[mode]
+        return self.hits[mode] / total if total else 0.0
+
+    def build_request(
+        self,
+        model: Any,
+        messages: list[BaseMessage],
+        *,
+        mode: str,
+        ttl: float,
+        embeddings: Embeddings | None = None,
+        output_parser: Any = None,
+        scope: str = "",
+    ) -> LLMCacheRequest | None:
+        """Returns what the response to `messages` is cached under, None if it is not cached.
+
+        Only the requests of the same `scope`, such as the flow, user and component they are sent from, share
+        their responses, so a response is never served to another tenant.
+        """
+        if not self.enabled or mode not in CACHE_MODES or mode == "Off":
+            return None
+        if mode == "Semantic" and embeddings is None:
+            logger.warning("The 'Semantic' cache mode needs an embedding model, using the 'Exact' mode")
+            mode = "Exact"
+        model_identity = _model_identity(model)
+        if output_parser is not None:
+            model_identity += f"|{type(output_parser).__qualname__}"
+        if mode == "Semantic":
+            model_identity += f"|{_embeddings_identity(embeddings)}"
+        contents = [[message.type, message.content] for message in messages]
+        canonical = json.dumps(contents, sort_keys=True, separators=(",", ":"), default=str)
+        model_key = _hash(f"{scope}|{model_identity}")
+        return LLMCacheRequest(
+            mode=mode,
+            ttl=ttl,
+            model_key=model_key,
+            prompt_key=_hash(f"{model_key}:{canonical}"),
+            prompt_text="\n".join(f"{message.type}: {_text(message.content)}" for message in messages),
+            embeddings=embeddings,
+        )
+
+    async def get(self, request: LLMCacheRequest) -> str | None:
+        """Returns the cached response to the prompt, None if the model has to be called."""
+        now = time.time()
+        cached = self._responses.get(request.prompt_key)
+        if cached is not None and now - cached.created_at >= request.ttl:
+            cached = None
+        if cached is None and request.mode == "Semantic":
+            cached = await self._search(request, now)
+        self._count(request.mode, hit=cached is not None)
+        return cached.text if cached is not None else None
+
+    async def set(self, request: LLMCacheRequest, text: str) -> None:
+        response = CachedResponse(text=text, created_at=time.time())
+        self._responses[request.prompt_key] = response
+        if request.mode == "Semantic" and (embedding := await self._embed(request)) is not None:
+            index = self._indexes.get(request.model_key)
+            if index is None:
+                index = self._indexes[request.model_key] = SemanticIndex(self.max_entries)
+            index.add(embedding, response)
+
+    async def _search(self, request: LLMCacheRequest, now: float) -> CachedResponse | None:
+        index = self._indexes.get(request.model_key)
+        if index is None or not len(index) or (embedding := await self._embed(request)) is None:
+            return None
+        return index.search(embedding, self.similarity_threshold, request.ttl, now)
+
+    async def _embed(self, request: LLMCacheRequest) -> np.ndarray | None:
+        if request.embedding is None and request.embeddings is not None:
+            try:
+                request.embedding = _normalize(await request.embeddings.aembed_query(request.prompt_text))
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).debug("Could not embed the prompt, skipping the semantic cache")
+                request.embeddings = None
+        return request.embedding
+
+    def _count(self, mode: str, *, hit: bool) -> None:
+        (self.hits if hit else self.misses)[mode] += 1
+        self.ot.increment_counter("llm_cache_requests", {"mode": mode, "result": "hit" if hit else "miss"})
+
+    def clear(self) -> None:
+        self._responses.clear()
+        self._indexes.clear()
+
+    async def teardown(self) -> None:
+        self.clear()
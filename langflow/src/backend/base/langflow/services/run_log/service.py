@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from langflow.services.base import Service
+from langflow.services.database.models.transactions.crud import (
+    log_transaction,
+    log_transactions,
+    trim_transactions,
+)
+from langflow.services.database.models.vertex_builds.crud import (
+    log_vertex_build,
+    log_vertex_builds,
+    trim_vertex_builds,
+)
+from langflow.services.deps import session_scope
+from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.services.database.models.transactions.model import TransactionBase
+    from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+    from langflow.services.settings.service import SettingsService
+
+
+class RunLogService(Service):
+    """Write-behind buffer for the transactions and vertex builds logged while flows run.
+
+    Entries are kept in memory and inserted in batches, either every `run_log_flush_interval` seconds
+    or as soon as `run_log_batch_size` entries are waiting. Retention limits are enforced by a sweeper
+    every `run_log_sweep_interval` seconds, only for the flows and vertices that got new entries,
+    instead of on every insert. Pending entries are flushed when the service stops.
+
+    Until the service is started, or if the flush interval is 0, every entry is written immediately.
+
+    Attributes:
+        flush_count (int): Number of batches written.
+        dropped (int): Number of entries lost because their batch failed to be written.
+        last_flush_latency (float | None): Seconds taken by the last batch.
+    """
+
+    name = "run_log_service"
+
+    def __init__(self, settings_service: SettingsService):
+        super().__init__()
+        settings = settings_service.settings
+        self.batch_size = settings.run_log_batch_size
+        self.flush_interval = settings.run_log_flush_interval
+        self.sweep_interval = settings.run_log_sweep_interval
+        self.ot = OpenTelemetry(prometheus_enabled=settings.prometheus_enabled)
+
+        self._transactions: list[TransactionBase] = []
+        self._vertex_builds: list[VertexBuildBase] = []
+        self._dirty_flows: set[UUID] = set()
+        self._dirty_vertices: set[tuple[UUID, str]] = set()
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self.running = False
+        self.flusher_task: asyncio.Task | None = None
+        self.sweeper_task: asyncio.Task | None = None
+
+        self.flush_count = 0
+        self.dropped = 0
+        self.last_flush_latency: float | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._transactions) + len(self._vertex_builds)
+
+    async def log_transaction(self, transaction: TransactionBase) -> None:
+        if not self.running:
+            async with session_scope() as session:
+                await log_transaction(session, transaction)
+            return
+        if not transaction.flow_id:
+            return
+        self._transactions.append(transaction)
+        self._on_enqueue()
+
+    async def log_vertex_build(self, vertex_build: VertexBuildBase) -> None:
+        if not self.running:
+            async with session_scope() as session:
+                await log_vertex_build(session, vertex_build)
+            return
+        self._vertex_builds.append(vertex_build)
+        self._on_enqueue()
+
+    def _on_enqueue(self) -> None:
+        self._report_queue_depth()
+        if self.queue_depth >= self.batch_size:
+            self._wakeup.set()
+
+    def _report_queue_depth(self) -> None:
+        self.ot.update_gauge("run_log_queue_depth", len(self._transactions), {"table": "transaction"})
+        self.ot.update_gauge("run_log_queue_depth", len(self._vertex_builds), {"table": "vertex_build"})
+
+    async def flush(self) -> None:
+        """Writes every pending entry to the database.
+
+        A batch that fails to be written is logged and dropped so a database outage can't make the
+        buffer grow without bound.
+        """
+        async with self._flush_lock:
+            transactions, self._transactions = self._transactions, []
+            vertex_builds, self._vertex_builds = self._vertex_builds, []
+            if not transactions and not vertex_builds:
+                return
+            self._report_queue_depth()
+
+            start_time = time.perf_counter()
+            try:
+                async with session_scope() as session:
+                    if transactions:
+                        await log_transactions(session, transactions)
+                        self.ot.observe_histogram(
+                            "run_log_flush_latency", time.perf_counter() - start_time, {"table": "transaction"}
+                        )
+                    if vertex_builds:
+                        vertex_builds_start_time = time.perf_counter()
+                        await log_vertex_builds(session, vertex_builds)
+                        self.ot.observe_histogram(
+                            "run_log_flush_latency",
+                            time.perf_counter() - vertex_builds_start_time,
+                            {"table": "vertex_build"},
+                        )
+            except Exception:  # noqa: BLE001
+                self.dropped += len(transactions) + len(vertex_builds)
+                logger.exception(f"Error flushing {len(transactions) + len(vertex_builds)} run logs")
+                return
+
+            self.last_flush_latency = time.perf_counter() - start_time
+            self.flush_count += 1
+            self._dirty_flows.update(transaction.flow_id for transaction in transactions)
+            self._dirty_vertices.update((vertex_build.flow_id, vertex_build.id) for vertex_build in vertex_builds)
+            logger.debug(
+                f"Flushed {len(transactions)} transactions and {len(vertex_builds)} vertex builds "
+                f"in {self.last_flush_latency:.3f}s"
+            )
+
+    async def sweep(self) -> None:
+        """Deletes the entries beyond the retention limits of the flows and vertices written since the last sweep."""
+        async with self._flush_lock:
+            dirty_flows, self._dirty_flows = self._dirty_flows, set()
+            dirty_vertices, self._dirty_vertices = self._dirty_vertices, set()
+            if not dirty_flows and not dirty_vertices:
+                return
+            try:
+                async with session_scope() as session:
+                    if dirty_flows:
+                        await trim_transactions(session, dirty_flows)
+                    if dirty_vertices:
+                        await trim_vertex_builds(session, dirty_vertices)
+            except Exception:  # noqa: BLE001
+                # Try again on the next sweep
+                self._dirty_flows.update(dirty_flows)
+                self._dirty_vertices.update(dirty_vertices)
+                logger.exception("Error trimming run logs")
+
+    async def _run_flusher(self) -> None:
+        while self.running:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            self._wakeup.clear()
+            await self.flush()
+
+    async def _run_sweeper(self) -> None:
+        while self.running:
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.sweep_interval)
+            except asyncio.TimeoutError:
+                await self.sweep()
+
+    def start(self) -> None:
+        if self.running or self.flush_interval <= 0:
+            return
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self.running = True
+        self.flusher_task = asyncio.create_task(self._run_flusher())
+        self.sweeper_task = asyncio.create_task(self._run_sweeper())
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        # Let the background tasks finish what they are writing instead of cancelling them mid-batch
+        self.running = False
+        self._stopping.set()
+        self._wakeup.set()
+        tasks = [task for task in (self.flusher_task, self.sweeper_task) if task is not None]
+        if tasks:
+            await asyncio.wait(tasks)
+        self.flusher_task = None
+        self.sweeper_task = None
+        try:
+            await self.flush()
+            await self.sweep()
+        except Exception:  # noqa: BLE001
+            logger.exception("Error flushing run logs on shutdown")
+
+    async def teardown(self) -> None:
+        await self.stop()
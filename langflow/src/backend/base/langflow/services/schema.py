@@ -20,3 +20,7 @@ class ServiceType(str, Enum):
     TRACING_SERVICE = "tracing_service"
     TELEMETRY_SERVICE = "telemetry_service"
     JOB_QUEUE_SERVICE = "job_queue_service"
+    FLOW_TEMPLATE_SERVICE = "flow_template_service"
+    RUN_LOG_SERVICE = "run_log_service"
+    LLM_CACHE_SERVICE = "llm_cache_service"
+    HTTP_CLIENT_SERVICE = "http_client_service"
@@ -113,7 +113,15 @@ class Settings(BaseSettings):
 
     mcp_session_cleanup_interval: int = 120  # seconds
     """Frequency (in seconds) at which the background cleanup task wakes up to
-    reap idle sessions."""
+    reap idle sessions and check the health of the sessions that were not used since."""
+
+    mcp_max_concurrent_calls_per_server: int = 20
+    """Maximum number of requests (tool calls and tool listings) running at the same
+    time on the sessions of one server. Further requests wait for one to finish."""
+
+    mcp_tools_cache_ttl: int = 300  # seconds
+    """How long (in seconds) the tools listed by a server are reused by the components
+    connecting to it. Set to 0 to list the tools every time a component is built."""
 
     # sqlite configuration
     sqlite_pragmas: dict | None = {"synchronous": "NORMAL", "journal_mode": "WAL"}
@@ -154,8 +162,49 @@ class Settings(BaseSettings):
     """The cache type can be 'async' or 'redis'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    flow_template_cache_size: int = 128
+    """Maximum number of compiled flow graphs kept in memory to serve /api/v1/run requests.
+    Set to 0 to build the graph of every request from the flow data."""
+    component_class_cache_size: int = 1024
+    """Maximum number of compiled component classes kept in memory, keyed by the hash of their code.
+    Set to 0 to compile the code of a component every time it is instantiated."""
+    warm_up_component_class_cache: bool = False
+    """If set to True, the components of every stored flow are compiled at startup."""
+    component_result_cache_size: int = 0
+    """Maximum number of bytes of results kept in memory for the components that set `cache_results`, keyed by
+    their code and their inputs, so they are not built again while neither changes. Set to 0 to disable."""
+    component_result_cache_backend: Literal["none", "disk", "redis"] = "none"
+    """Second tier of the component result cache, shared by the workers and kept across restarts. 'disk' keeps
+    the results in the config directory, up to `component_result_cache_disk_size` bytes, and 'redis' in the
+    Redis server of the `redis_*` settings."""
+    component_result_cache_disk_size: int = 1024**3
+    """Maximum number of bytes of the disk tier of the component result cache."""
+    component_result_cache_ttl: int = 3600
+    """Number of seconds the results of a component are cached, unless it sets `result_cache_ttl`. It is also
+    the longest the disk and Redis tiers keep a result."""
+    llm_cache_max_entries: int = 10_000
+    """Maximum number of responses of language models kept in memory for the model components that enable
+    'Cache Responses', and of prompts in the semantic index of each model. Set to 0 to disable the cache."""
+    llm_cache_similarity_threshold: float = 0.95
+    """Cosine similarity from which a prompt reuses the response to a previous prompt in the 'Semantic' mode."""
+    http_client_max_connections_per_host: int = 20
+    """Maximum number of connections the shared HTTP clients of the components and services open to a host."""
+    http_client_keepalive_expiry: float = 30
+    """Number of seconds an idle connection of the shared HTTP clients is kept open."""
+    http_client_timeout: float = 30
+    """Number of seconds the shared HTTP clients wait for a host, unless the request sets its own timeout."""
+    http_client_http2: bool = True
+    """If set to True, the shared HTTP clients use HTTP/2 with the hosts that support it."""
+    http_client_max_hosts: int = 256
+    """Number of hosts the shared HTTP clients keep connections to before closing the least recently used."""
+    http_client_metric_hosts: list[str] = []
+    """Hosts the metrics of the shared HTTP clients are labeled with, besides the hosts of the store. The
+    requests to the other hosts are labeled 'other', so URLs entered in components don't add metric series."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
+    variable_cache_ttl: float = 30
+    """Number of seconds the decrypted values of the variables of a user are kept in memory
+    to build components without querying and decrypting them again. Set to 0 to disable the cache."""
 
     prometheus_enabled: bool = False
     """If set to True, Langflow will expose Prometheus metrics."""
@@ -163,6 +212,12 @@ class Settings(BaseSettings):
     """The port on which Langflow will expose Prometheus metrics. 9090 is the default port."""
 
     disable_track_apikey_usage: bool = False
+    api_key_cache_ttl: float = 30
+    """Number of seconds the user of an API key is kept in memory after the key is checked. Deleting the key
+    evicts it from the worker that deletes it; other workers accept it until it expires. Set to 0 to disable."""
+    api_key_usage_flush_interval: float = 10
+    """The interval in seconds at which the usage counters of the API keys are written to the database in a
+    single batch. Set to 0 to write every use as it happens."""
     remove_api_keys: bool = False
     components_path: list[str] = []
     langchain_cache: str = "InMemoryCache"
@@ -175,6 +230,14 @@ class Settings(BaseSettings):
     redis_db: int = 0
     redis_url: str | None = None
     redis_cache_expire: int = 3600
+    job_queue_backend: Literal["memory", "redis"] = "memory"
+    """Where the events of the build jobs are kept. 'memory' keeps them in the worker that runs the build,
+    so the events can only be polled from that worker. 'redis' keeps them in Redis Streams, which lets any
+    worker serve the events of a build or cancel it."""
+    job_queue_retention: int = 3600
+    """Number of seconds the events of a build are kept in Redis after its last event."""
+    job_queue_max_events: int = 10000
+    """Approximate maximum number of events kept in Redis per build."""
 
     # Sentry
     sentry_dsn: str | None = None
@@ -187,6 +250,16 @@ class Settings(BaseSettings):
     like_webhook_url: str | None = "https://api.langflow.store/flows/trigger/64275852-ec00-45c1-984e-3bff814732da"
 
     storage_type: str = "local"
+    s3_bucket: str = "langflow"
+    """The bucket the files are stored in when the storage type is 's3'."""
+    s3_endpoint_url: str | None = None
+    """URL of the S3 API, to store the files in an S3-compatible service such as MinIO or LocalStack.
+    Defaults to AWS."""
+    s3_max_pool_connections: int = 50
+    """Maximum number of connections to S3 kept open and shared by the transfers."""
+    s3_multipart_chunk_size: int = 8 * 1024 * 1024
+    """Size in bytes of the parts files are uploaded to S3 in. Larger files are uploaded in several parts,
+    holding a single part in memory at a time. S3 requires parts of at least 5 MiB."""
 
     celery_enabled: bool = False
 
@@ -249,6 +322,25 @@ class Settings(BaseSettings):
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    run_log_batch_size: int = 500
+    """Number of pending transactions and vertex builds that triggers a write to the database."""
+    run_log_flush_interval: float = 1.0
+    """Maximum number of seconds transactions and vertex builds are kept in memory before being written.
+    Set to 0 to write each of them as soon as it is logged."""
+    run_log_sweep_interval: float = 30.0
+    """Number of seconds between two deletions of the transactions and vertex builds beyond the limits above."""
+    message_history_cache_size: int = 100
+    """Number of the most recent messages of each active session kept in memory to read the chat history
+    without querying the database. Set to 0 to disable the cache."""
+    message_history_cache_ttl: float = 60
+    """Number of seconds the recent messages of a session are kept in memory. Messages written by other
+    workers are seen once the entry expires."""
+    flow_header_cache_ttl: float = 60
+    """Number of seconds the headers of the flows of a user are kept in memory to list the flows without
+    querying the database. Flows written by other workers are seen once the entry expires. Set to 0 to
+    disable the cache."""
+    max_vertex_concurrency: int = 0
+    """The maximum number of vertices a single graph run builds at the same time. 0 means no limit."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
@@ -269,6 +361,10 @@ class Settings(BaseSettings):
     """If set to False, Langflow will not enable the MCP server."""
     mcp_server_enable_progress_notifications: bool = False
     """If set to False, Langflow will not send progress notifications in the MCP server."""
+    mcp_tool_catalog_ttl: float = 60
+    """Number of seconds the tools listed by the MCP server are kept in memory. Flows saved through this worker
+    rebuild the catalog on the next listing; flows saved by other workers are seen once it expires.
+    Set to 0 to list the flows on every request."""
 
     # Public Flow Settings
     public_flow_cleanup_interval: int = Field(default=3600, gt=600)
@@ -279,9 +375,30 @@ class Settings(BaseSettings):
     Default is 24 hours (86400 seconds). Minimum is 600 seconds (10 minutes)."""
     event_delivery: Literal["polling", "streaming", "direct"] = "streaming"
     """How to deliver build events to the frontend. Can be 'polling', 'streaming' or 'direct'."""
+    stream_token_frame_size: int = 64
+    """Number of characters of a streamed message sent together in a single token event.
+    Set to 1 to send every token as soon as it is generated."""
+    stream_token_frame_interval: float = 0.05
+    """Maximum number of seconds a streamed token waits for the next ones before its token event is sent."""
+    event_queue_max_size: int = 1000
+    """Maximum number of events of a build waiting to be read by the client. Once reached, the components sending
+    events wait for the client, and token events are handled according to `event_queue_overflow_policy`.
+    0 means no limit."""
+    event_queue_overflow_policy: Literal["merge", "drop", "wait"] = "merge"
+    """What to do with a token event when the event queue of a build is full: 'merge' it into the last waiting
+    token event of the same message, 'drop' it, or 'wait' for the client like the other events."""
+    event_queue_put_timeout: float = 30.0
+    """Maximum number of seconds a component waits for room in a full event queue before queueing its event anyway."""
+    message_persist_interval: float = 1.0
+    """Minimum number of seconds between two writes of a message that is still being built, such as the message of
+    an agent. Only what changed is written, and the full message is written once at the end of the turn.
+    Set to 0 to write the full message on every update."""
     lazy_load_components: bool = False
     """If set to True, Langflow will only partially load components at startup and fully load them on demand.
     This significantly reduces startup time but may cause a slight delay when a component is first used."""
+    use_component_index: bool = True
+    """If set to True, the templates of the built-in components are saved to an index in the config directory and,
+    on the next start, only the modules whose file changed are loaded again."""
 
     # Starter Projects
     create_starter_projects: bool = True
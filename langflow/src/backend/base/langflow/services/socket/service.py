@@ -57,8 +57,7 @@ class SocketIOService(Service):
             sid=sid,
             flow_id=flow_id,
             vertex_id=vertex_id,
-            get_cache=self.get_cache,
-            set_cache=self.set_cache,
+            chat_service=get_chat_service(),
         )
 
     async def get_cache(self, sid: str) -> Any:
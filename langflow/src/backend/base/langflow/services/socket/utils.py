@@ -1,5 +1,5 @@
 import time
-from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 import socketio
 from loguru import logger
@@ -8,12 +8,16 @@ from sqlmodel import select
 from langflow.api.utils import format_elapsed_time
 from langflow.api.v1.schemas import ResultDataResponse, VertexBuildResponse
 from langflow.graph.graph.base import Graph
+from langflow.graph.graph.checkpoint import cache_legacy_run, get_legacy_run_key, load_graph_checkpoint
 from langflow.graph.graph.utils import layered_topological_sort
 from langflow.graph.utils import log_vertex_build
 from langflow.graph.vertex.base import Vertex
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.deps import get_session
 
+if TYPE_CHECKING:
+    from langflow.services.chat.service import ChatService
+
 
 def set_socketio_server(socketio_server) -> None:
     from langflow.services.deps import get_socket_service
@@ -31,8 +35,9 @@ async def get_vertices(sio, sid, flow_id, chat_service) -> None:
             await sio.emit("error", data="Invalid flow ID", to=sid)
             return
 
-        graph = Graph.from_payload(flow.data)
-        chat_service.set_cache(flow_id, graph)
+        graph = Graph.from_payload(flow.data, str(flow_id))
+        graph.set_run_id()
+        await cache_legacy_run(chat_service, graph)
         vertices = layered_topological_sort(
             set(graph.get_vertex_ids()),
             graph.in_degree_map,
@@ -53,12 +58,10 @@ async def build_vertex(
     sid: str,
     flow_id: str,
     vertex_id: str,
-    get_cache: Callable,
-    set_cache: Callable,
+    chat_service: "ChatService",
 ) -> None:
     try:
-        cache = await get_cache(flow_id)
-        graph = cache.get("result")
+        graph = await load_graph_checkpoint(chat_service, await get_legacy_run_key(chat_service, flow_id))
 
         if not isinstance(graph, Graph):
             await sio.emit("error", data="Invalid graph", to=sid)
@@ -93,7 +96,7 @@ async def build_vertex(
             valid = False
             result_dict = ResultDataResponse(results={})
             artifacts = {}
-        await set_cache(flow_id, graph)
+        await graph.checkpointer.save(graph, [vertex_id])
         await log_vertex_build(
             flow_id=flow_id,
             vertex_id=vertex_id,
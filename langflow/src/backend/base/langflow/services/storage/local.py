@@ -1,3 +1,6 @@
+import contextlib
+from collections.abc import AsyncIterable, AsyncIterator
+
 import anyio
 from aiofile import async_open
 from loguru import logger
@@ -17,13 +20,13 @@ class LocalStorageService(StorageService):
         """Build the full path of a file in the local storage."""
         return str(self.data_dir / flow_id / file_name)
 
-    async def save_file(self, flow_id: str, file_name: str, data: bytes) -> None:
+    async def save_file(self, flow_id: str, file_name: str, data: bytes | AsyncIterable[bytes]) -> None:
         """Save a file in the local storage.
 
         Args:
             flow_id: The identifier for the flow.
             file_name: The name of the file to be saved.
-            data: The byte content of the file.
+            data: The byte content of the file, or an iterable over it that is written chunk by chunk.
 
         Raises:
             FileNotFoundError: If the specified flow does not exist.
@@ -36,10 +39,17 @@ class LocalStorageService(StorageService):
 
         try:
             async with async_open(str(file_path), "wb") as f:
-                await f.write(data)
+                if isinstance(data, bytes | bytearray | memoryview):
+                    await f.write(data)
+                else:
+                    async for chunk in data:
+                        await f.write(chunk)
             logger.info(f"File {file_name} saved successfully in flow {flow_id}.")
         except Exception:
             logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            # Don't leave a partially written file behind
+            with contextlib.suppress(OSError):
+                await file_path.unlink()
             raise
 
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
@@ -67,6 +77,25 @@ class LocalStorageService(StorageService):
         logger.debug(f"File {file_name} retrieved successfully from flow {flow_id}.")
         return content
 
+    async def get_file_stream(self, flow_id: str, file_name: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """Open a file of the local storage and return an iterator over its content.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            logger.warning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+
+        async def iter_content() -> AsyncIterator[bytes]:
+            async with async_open(str(file_path), "rb") as f:
+                while chunk := await f.read(chunk_size):
+                    yield chunk
+
+        return iter_content()
+
     async def list_files(self, flow_id: str):
         """List all files in a specified flow.
 
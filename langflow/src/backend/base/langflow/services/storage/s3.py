@@ -1,4 +1,9 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterable, AsyncIterator
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from loguru import logger
 
@@ -6,41 +11,91 @@ from .service import StorageService
 
 
 class S3StorageService(StorageService):
-    """A service class for handling operations with AWS S3 storage."""
+    """A service class for handling operations with AWS S3 storage.
+
+    boto3 is blocking, so each request to S3 runs in a worker thread and the event loop keeps serving other
+    requests during transfers. The connections are pooled by the client, up to `s3_max_pool_connections`. Files
+    larger than `s3_multipart_chunk_size` are uploaded in parts and files are downloaded in chunks, so a transfer
+    only holds a part of the file in memory.
+    """
 
     def __init__(self, session_service, settings_service) -> None:
         """Initialize the S3 storage service with session and settings services."""
         super().__init__(session_service, settings_service)
-        self.bucket = "langflow"
-        self.s3_client = boto3.client("s3")
+        settings = settings_service.settings
+        self.bucket = settings.s3_bucket
+        self.chunk_size = settings.s3_multipart_chunk_size
+        self.s3_client = boto3.client(
+            "s3",
+            endpoint_url=settings.s3_endpoint_url or None,
+            config=Config(max_pool_connections=settings.s3_max_pool_connections),
+        )
         self.set_ready()
 
-    async def save_file(self, folder: str, file_name: str, data) -> None:
+    async def save_file(self, flow_id: str, file_name: str, data: bytes | AsyncIterable[bytes]) -> None:
         """Save a file to the S3 bucket.
 
         Args:
-            folder: The folder in the bucket to save the file.
+            flow_id: The folder in the bucket to save the file.
             file_name: The name of the file to be saved.
-            data: The byte content of the file.
+            data: The byte content of the file, or an iterable over it.
 
         Raises:
             Exception: If an error occurs during file saving.
         """
+        key = f"{flow_id}/{file_name}"
         try:
-            self.s3_client.put_object(Bucket=self.bucket, Key=f"{folder}/{file_name}", Body=data)
-            logger.info(f"File {file_name} saved successfully in folder {folder}.")
+            chunks = _iter_parts(data, self.chunk_size)
+            first_part = await anext(chunks, b"")
+            second_part = await anext(chunks, None)
+            if second_part is None:
+                await asyncio.to_thread(self.s3_client.put_object, Bucket=self.bucket, Key=key, Body=first_part)
+            else:
+                await self._upload_parts(key, _prepend([first_part, second_part], chunks))
+            logger.info(f"File {file_name} saved successfully in folder {flow_id}.")
         except NoCredentialsError:
             logger.exception("Credentials not available for AWS S3.")
             raise
         except ClientError:
-            logger.exception(f"Error saving file {file_name} in folder {folder}")
+            logger.exception(f"Error saving file {file_name} in folder {flow_id}")
+            raise
+
+    async def _upload_parts(self, key: str, parts: AsyncIterator[bytes]) -> None:
+        """Upload a file with a multipart upload, aborted if any part fails."""
+        upload = await asyncio.to_thread(self.s3_client.create_multipart_upload, Bucket=self.bucket, Key=key)
+        upload_id = upload["UploadId"]
+        uploaded_parts: list[dict] = []
+        try:
+            async for part in parts:
+                part_number = len(uploaded_parts) + 1
+                response = await asyncio.to_thread(
+                    self.s3_client.upload_part,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=part,
+                )
+                uploaded_parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+            await asyncio.to_thread(
+                self.s3_client.complete_multipart_upload,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": uploaded_parts},
+            )
+        except BaseException:
+            with contextlib.suppress(ClientError):
+                await asyncio.to_thread(
+                    self.s3_client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id
+                )
             raise
 
-    async def get_file(self, folder: str, file_name: str):
+    async def get_file(self, flow_id: str, file_name: str):
         """Retrieve a file from the S3 bucket.
 
         Args:
-            folder: The folder in the bucket where the file is stored.
+            flow_id: The folder in the bucket where the file is stored.
             file_name: The name of the file to be retrieved.
 
         Returns:
@@ -50,18 +105,45 @@ class S3StorageService(StorageService):
             Exception: If an error occurs during file retrieval.
         """
         try:
-            response = self.s3_client.get_object(Bucket=self.bucket, Key=f"{folder}/{file_name}")
-            logger.info(f"File {file_name} retrieved successfully from folder {folder}.")
-            return response["Body"].read()
+            response = await asyncio.to_thread(
+                self.s3_client.get_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}"
+            )
+            content = await asyncio.to_thread(response["Body"].read)
+        except ClientError:
+            logger.exception(f"Error retrieving file {file_name} from folder {flow_id}")
+            raise
+        logger.info(f"File {file_name} retrieved successfully from folder {flow_id}.")
+        return content
+
+    async def get_file_stream(self, flow_id: str, file_name: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """Open a file of the S3 bucket and return an iterator over its content.
+
+        Raises:
+            Exception: If an error occurs opening the file.
+        """
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.get_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}"
+            )
         except ClientError:
-            logger.exception(f"Error retrieving file {file_name} from folder {folder}")
+            logger.exception(f"Error retrieving file {file_name} from folder {flow_id}")
             raise
+        body = response["Body"]
+
+        async def iter_content() -> AsyncIterator[bytes]:
+            try:
+                while chunk := await asyncio.to_thread(body.read, chunk_size):
+                    yield chunk
+            finally:
+                body.close()
+
+        return iter_content()
 
-    async def list_files(self, folder: str):
+    async def list_files(self, flow_id: str):
         """List all files in a specified folder of the S3 bucket.
 
         Args:
-            folder: The folder in the bucket to list files from.
+            flow_id: The folder in the bucket to list files from.
 
         Returns:
             A list of file names.
@@ -70,35 +152,72 @@ class S3StorageService(StorageService):
             Exception: If an error occurs during file listing.
         """
         try:
-            response = self.s3_client.list_objects_v2(Bucket=self.bucket, Prefix=folder)
+            keys = await asyncio.to_thread(self._list_keys, flow_id)
         except ClientError:
-            logger.exception(f"Error listing files in folder {folder}")
+            logger.exception(f"Error listing files in folder {flow_id}")
             raise
 
-        files = [item["Key"] for item in response.get("Contents", []) if "/" not in item["Key"][len(folder) :]]
-        logger.info(f"{len(files)} files listed in folder {folder}.")
+        files = [key for key in keys if "/" not in key[len(flow_id) :]]
+        logger.info(f"{len(files)} files listed in folder {flow_id}.")
         return files
 
-    async def delete_file(self, folder: str, file_name: str) -> None:
+    def _list_keys(self, prefix: str) -> list[str]:
+        # A listing returns at most 1000 keys, the paginator follows the continuation tokens
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(Bucket=self.bucket, Prefix=prefix)
+        return [item["Key"] for page in pages for item in page.get("Contents", [])]
+
+    async def delete_file(self, flow_id: str, file_name: str) -> None:
         """Delete a file from the S3 bucket.
 
         Args:
-            folder: The folder in the bucket where the file is stored.
+            flow_id: The folder in the bucket where the file is stored.
             file_name: The name of the file to be deleted.
 
         Raises:
             Exception: If an error occurs during file deletion.
         """
         try:
-            self.s3_client.delete_object(Bucket=self.bucket, Key=f"{folder}/{file_name}")
-            logger.info(f"File {file_name} deleted successfully from folder {folder}.")
+            await asyncio.to_thread(self.s3_client.delete_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}")
+            logger.info(f"File {file_name} deleted successfully from folder {flow_id}.")
         except ClientError:
-            logger.exception(f"Error deleting file {file_name} from folder {folder}")
+            logger.exception(f"Error deleting file {file_name} from folder {flow_id}")
             raise
 
     async def teardown(self) -> None:
-        """Perform any cleanup operations when the service is being torn down."""
-        # No specific teardown actions required for S3 storage at the moment.
+        """Close the connections of the client."""
+        await asyncio.to_thread(self.s3_client.close)
 
     async def get_file_size(self, flow_id: str, file_name: str):
-        raise NotImplementedError
+        """Get the size of a file in the S3 bucket."""
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}"
+            )
+        except ClientError:
+            logger.exception(f"Error getting the size of file {file_name} in folder {flow_id}")
+            raise
+        return response["ContentLength"]
+
+
+async def _iter_parts(data: bytes | AsyncIterable[bytes], part_size: int) -> AsyncIterator[bytes]:
+    """Yield the content in parts of `part_size` bytes, the last one can be smaller."""
+    if isinstance(data, bytes | bytearray | memoryview):
+        for i in range(0, len(data), part_size):
+            yield bytes(data[i : i + part_size])
+        return
+    buffer = bytearray()
+    async for chunk in data:
+        buffer += chunk
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _prepend(parts: list[bytes], rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+    async for part in rest:
+        yield part
@@ -8,6 +8,8 @@ import anyio
 from langflow.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
 
@@ -28,13 +30,26 @@ class StorageService(Service):
         self.ready = True
 
     @abstractmethod
-    async def save_file(self, flow_id: str, file_name: str, data) -> None:
+    async def save_file(self, flow_id: str, file_name: str, data: bytes | AsyncIterable[bytes]) -> None:
         raise NotImplementedError
 
     @abstractmethod
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         raise NotImplementedError
 
+    async def get_file_stream(self, flow_id: str, file_name: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """Open a file and return an iterator over its content, so it doesn't have to be held in memory.
+
+        Errors opening the file, such as a missing file, are raised by this call rather than by the iterator.
+        """
+        content = await self.get_file(flow_id, file_name)
+
+        async def iter_content() -> AsyncIterator[bytes]:
+            for i in range(0, len(content), chunk_size):
+                yield content[i : i + chunk_size]
+
+        return iter_content()
+
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
         raise NotImplementedError
@@ -9,6 +9,7 @@ from httpx import HTTPError, HTTPStatusError
 from loguru import logger
 
 from langflow.services.base import Service
+from langflow.services.deps import get_http_client_service
 from langflow.services.store.exceptions import APIKeyError, FilterError, ForbiddenError
 from langflow.services.store.schema import (
     CreateComponentResponse,
@@ -129,15 +130,15 @@ class StoreService(Service):
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
         """Utility method to perform GET requests."""
         headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=headers, params=params, timeout=self.timeout)
-                response.raise_for_status()
-            except HTTPError:
-                raise
-            except Exception as exc:
-                msg = f"GET failed: {exc}"
-                raise ValueError(msg) from exc
+        client = get_http_client_service().get_client(url)
+        try:
+            response = await client.get(url, headers=headers, params=params, timeout=self.timeout)
+            response.raise_for_status()
+        except HTTPError:
+            raise
+        except Exception as exc:
+            msg = f"GET failed: {exc}"
+            raise ValueError(msg) from exc
         json_response = response.json()
         result = json_response["data"]
         metadata = {}
@@ -153,11 +154,11 @@ class StoreService(Service):
         # For now we are calling it just for testing
         try:
             headers = {"Authorization": f"Bearer {api_key}"}
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    webhook_url, headers=headers, json={"component_id": str(component_id)}, timeout=self.timeout
-                )
-                response.raise_for_status()
+            client = get_http_client_service().get_client(webhook_url)
+            response = await client.post(
+                webhook_url, headers=headers, json={"component_id": str(component_id)}, timeout=self.timeout
+            )
+            response.raise_for_status()
             return response.json()
         except HTTPError:
             raise
@@ -377,11 +378,11 @@ class StoreService(Service):
         try:
             # response = httpx.post(self.components_url, headers=headers, json=component_dict)
             # response.raise_for_status()
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.components_url, headers=headers, json=component_dict, timeout=self.timeout
-                )
-                response.raise_for_status()
+            client = get_http_client_service().get_client(self.components_url)
+            response = await client.post(
+                self.components_url, headers=headers, json=component_dict, timeout=self.timeout
+            )
+            response.raise_for_status()
             component = response.json()["data"]
             return CreateComponentResponse(**component)
         except HTTPError as exc:
@@ -414,11 +415,11 @@ class StoreService(Service):
         try:
             # response = httpx.post(self.components_url, headers=headers, json=component_dict)
             # response.raise_for_status()
-            async with httpx.AsyncClient() as client:
-                response = await client.patch(
-                    self.components_url + f"/{component_id}", headers=headers, json=component_dict, timeout=self.timeout
-                )
-                response.raise_for_status()
+            client = get_http_client_service().get_client(self.components_url)
+            response = await client.patch(
+                self.components_url + f"/{component_id}", headers=headers, json=component_dict, timeout=self.timeout
+            )
+            response.raise_for_status()
             component = response.json()["data"]
             return CreateComponentResponse(**component)
         except HTTPError as exc:
@@ -484,14 +485,14 @@ class StoreService(Service):
         # )
 
         # response.raise_for_status()
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.like_webhook_url,
-                json={"component_id": str(component_id)},
-                headers=headers,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
+        client = get_http_client_service().get_client(self.like_webhook_url)
+        response = await client.post(
+            self.like_webhook_url,
+            json={"component_id": str(component_id)},
+            headers=headers,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
         if response.status_code == httpx.codes.OK:
             result = response.json()
 
@@ -140,6 +140,69 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             metric_type=MetricType.COUNTER,
             labels={"flow_id": mandatory_label},
         )
+        self._add_metric(
+            name="run_log_queue_depth",
+            description="The number of run logs waiting to be written to the database",
+            unit="",
+            metric_type=MetricType.OBSERVABLE_GAUGE,
+            labels={"table": mandatory_label},
+        )
+        self._add_metric(
+            name="run_log_flush_latency",
+            description="The time taken to write a batch of run logs to the database",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"table": mandatory_label},
+        )
+        self._add_metric(
+            name="event_queue_depth",
+            description="The number of build events waiting to be read by the clients",
+            unit="",
+            metric_type=MetricType.UP_DOWN_COUNTER,
+            labels={"event_type": mandatory_label},
+        )
+        self._add_metric(
+            name="event_queue_lag",
+            description="The time build events wait before being read by the client",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"event_type": mandatory_label},
+        )
+        self._add_metric(
+            name="event_queue_overflow",
+            description="The number of build events merged, dropped or queued late because the queue was full",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"action": mandatory_label},
+        )
+        self._add_metric(
+            name="llm_cache_requests",
+            description="The number of prompts looked up in the LLM cache, by cache mode and result",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"mode": mandatory_label, "result": mandatory_label},
+        )
+        self._add_metric(
+            name="flow_template_requests",
+            description="The number of runs that looked up a compiled flow template, by result",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"result": mandatory_label},
+        )
+        self._add_metric(
+            name="http_client_requests",
+            description="The number of responses received by the shared HTTP clients, by host and status class",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"host": mandatory_label, "status": mandatory_label},
+        )
+        self._add_metric(
+            name="http_client_response_latency",
+            description="The time until the shared HTTP clients receive the headers of a response",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"host": mandatory_label},
+        )
 
     def __init__(self, *, prometheus_enabled: bool = True):
         # Only initialize once
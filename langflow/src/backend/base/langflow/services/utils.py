@@ -129,12 +129,26 @@ async def teardown_superuser(settings_service, session: AsyncSession) -> None:
 
 async def teardown_services() -> None:
     """Teardown all the services."""
+    from langflow.api.v1.mcp_utils import mcp_tool_catalog
+    from langflow.custom.result_cache import component_result_cache
+    from langflow.memory import message_history_cache
+    from langflow.services.database.models.flow.header_index import flow_header_index
+    from langflow.services.manager import service_manager
+
+    # Pending run logs and API key uses must be written before the database service is torn down
+    for service_type in (ServiceType.RUN_LOG_SERVICE, ServiceType.AUTH_SERVICE):
+        service = service_manager.services.get(service_type)
+        if service is not None:
+            await service.teardown()
+
     async with get_db_service().with_session() as session:
         await teardown_superuser(get_settings_service(), session)
 
-    from langflow.services.manager import service_manager
-
     await service_manager.teardown()
+    message_history_cache.reset()
+    flow_header_index.reset()
+    mcp_tool_catalog.reset()
+    component_result_cache.reset()
 
 
 def initialize_settings_service() -> None:
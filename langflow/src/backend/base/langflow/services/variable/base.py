@@ -1,4 +1,5 @@
 import abc
+from collections.abc import Collection
 from uuid import UUID
 
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -35,6 +36,17 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    async def load_variables(self, user_id: UUID | str, names: Collection[str], session: AsyncSession) -> None:
+        """Fetch several variables at once so that `get_variable` doesn't have to fetch them one by one.
+
+        Does nothing unless the service caches the variables it fetches.
+
+        Args:
+            user_id: The user ID.
+            names: The names of the variables.
+            session: The database session.
+        """
+
     @abc.abstractmethod
     async def list_variables(self, user_id: UUID | str, session: AsyncSession) -> list[str | None]:
         """List all variables.
@@ -3,9 +3,11 @@ from __future__ import annotations
 import os
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
+from uuid import UUID
 
+from cachetools import TTLCache
 from loguru import logger
-from sqlmodel import select
+from sqlmodel import col, select
 from typing_extensions import override
 
 from langflow.services.auth import utils as auth_utils
@@ -15,17 +17,42 @@ from langflow.services.variable.base import VariableService
 from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
-    from uuid import UUID
+    from collections.abc import Collection, Sequence
 
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from langflow.services.settings.service import SettingsService
 
 
+VARIABLE_CACHE_SIZE = 10000
+
+
 class DatabaseVariableService(VariableService, Service):
+    """Stores the variables of the users encrypted in the database.
+
+    The decrypted values read by `get_variable` and `load_variables` are cached for
+    `variable_cache_ttl` seconds per user and variable name. Updating or deleting a variable
+    evicts it from the cache of this worker; other workers see the change once the entry expires.
+    """
+
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        ttl = settings_service.settings.variable_cache_ttl
+        # Maps (user id, variable name) to the type and the decrypted value of the variable
+        self._cache: TTLCache[tuple[str, str], tuple[str | None, str]] | None = (
+            TTLCache(maxsize=VARIABLE_CACHE_SIZE, ttl=ttl) if ttl > 0 else None
+        )
+
+    def _cache_variable(self, user_id: UUID | str, variable: Variable) -> str:
+        value = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        if self._cache is not None:
+            self._cache[str(user_id), variable.name] = (variable.type, value)
+        return value
+
+    def _evict(self, user_id: UUID | str, *names: str) -> None:
+        if self._cache is not None:
+            for name in names:
+                self._cache.pop((str(user_id), name), None)
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -60,24 +87,49 @@ class DatabaseVariableService(VariableService, Service):
         field: str,
         session: AsyncSession,
     ) -> str:
-        # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
-        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
-        variable = (await session.exec(stmt)).first()
-
-        if not variable or not variable.value:
-            msg = f"{name} variable not found."
-            raise ValueError(msg)
-
-        if variable.type == CREDENTIAL_TYPE and field == "session_id":
+        cached = self._cache.get((str(user_id), name)) if self._cache is not None else None
+        if cached is not None:
+            type_, value = cached
+        else:
+            # we get the credential from the database
+            stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
+            variable = (await session.exec(stmt)).first()
+
+            if not variable or not variable.value:
+                msg = f"{name} variable not found."
+                raise ValueError(msg)
+            type_, value = variable.type, None
+
+        if type_ == CREDENTIAL_TYPE and field == "session_id":
             msg = (
                 f"variable {name} of type 'Credential' cannot be used in a Session ID field "
                 "because its purpose is to prevent the exposure of values."
             )
             raise TypeError(msg)
 
+        if cached is not None:
+            return value
         # we decrypt the value
-        return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+        return self._cache_variable(user_id, variable)
+
+    @override
+    async def load_variables(self, user_id: UUID | str, names: Collection[str], session: AsyncSession) -> None:
+        if self._cache is None:
+            return
+        missing = {name for name in names if (str(user_id), name) not in self._cache}
+        if not missing:
+            return
+        if isinstance(user_id, str):
+            user_id = UUID(user_id)
+        stmt = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(missing))
+        for variable in (await session.exec(stmt)).all():
+            if not variable.value:
+                continue
+            try:
+                self._cache_variable(user_id, variable)
+            except Exception as e:  # noqa: BLE001
+                # get_variable will raise the error if a component actually uses the variable
+                logger.debug(f"Could not decrypt variable '{variable.name}': {e}")
 
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
@@ -120,6 +172,7 @@ class DatabaseVariableService(VariableService, Service):
         variable.value = encrypted
         session.add(variable)
         await session.commit()
+        self._evict(user_id, name)
         await session.refresh(variable)
         return variable
 
@@ -132,6 +185,7 @@ class DatabaseVariableService(VariableService, Service):
     ):
         query = select(Variable).where(Variable.id == variable_id, Variable.user_id == user_id)
         db_variable = (await session.exec(query)).one()
+        previous_name = db_variable.name
         db_variable.updated_at = datetime.now(timezone.utc)
 
         variable.value = variable.value or ""
@@ -145,6 +199,7 @@ class DatabaseVariableService(VariableService, Service):
         session.add(db_variable)
         await session.commit()
         await session.refresh(db_variable)
+        self._evict(user_id, previous_name, db_variable.name)
         return db_variable
 
     @override
@@ -161,6 +216,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self._evict(user_id, name)
 
     @override
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
@@ -169,8 +225,10 @@ class DatabaseVariableService(VariableService, Service):
         if not variable:
             msg = f"{variable_id} variable not found."
             raise ValueError(msg)
+        name = variable.name
         await session.delete(variable)
         await session.commit()
+        self._evict(user_id, name)
 
     async def create_variable(
         self,
@@ -191,5 +249,6 @@ class DatabaseVariableService(VariableService, Service):
         variable = Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
         session.add(variable)
         await session.commit()
+        self._evict(user_id, name)
         await session.refresh(variable)
         return variable
@@ -0,0 +1,311 @@
+"""In-process benchmarks of the hot paths of graph execution, with a mock language model.
+
+Unlike `tests/locust`, no server and no model provider are needed: the OpenAI model of the starter projects
+answers through `MockLanguageModel` and the database is a temporary SQLite file. The results are emitted as
+JSON so that runs can be compared offline:
+
+    cd src/backend && uv run python -m tests.performance.benchmark_suite --output benchmarks.json
+
+`test_benchmark_suite.py` runs the same benchmarks with pytest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import inspect
+import json
+import platform
+import statistics
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+from uuid import uuid4
+
+from fastapi import BackgroundTasks
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langflow import initial_setup
+from langflow.api.build import generate_flow_events
+from langflow.api.v1.schemas import FlowDataRequest, InputValueRequest
+from langflow.components.helpers.memory import MemoryComponent
+from langflow.components.input_output import ChatInput, ChatOutput
+from langflow.components.openai.openai_chat_model import OpenAIModelComponent
+from langflow.components.processing import PromptComponent
+from langflow.components.processing.converter import TypeConverterComponent
+from langflow.events.event_manager import create_default_event_manager
+from langflow.graph import Graph
+from langflow.services.auth.utils import get_password_hash
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.database.models.user.model import User
+from langflow.services.deps import get_run_log_service, get_settings_service, session_scope
+from typing_extensions import override
+
+from tests.unit.mock_language_model import MockLanguageModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from uuid import UUID
+
+# The JSON files only, the Python starter projects import components whose dependencies are optional
+STARTER_PROJECTS_DIR = Path(initial_setup.__file__).parent / "starter_projects"
+PAYLOAD_PROJECTS = ("Basic Prompting", "Memory Chatbot", "Document Q&A", "Vector Store RAG", "Simple Agent")
+ANSWER_TOKENS = 200
+ANSWER_CHUNK = "tok "
+PROMPT = "Hello, how are you?"
+
+
+class BenchmarkLanguageModel(MockLanguageModel):
+    """`MockLanguageModel` answering every prompt with `ANSWER_TOKENS` tokens, whole or streamed."""
+
+    @override
+    def invoke(self, *args, **kwargs):
+        return AIMessage(content=ANSWER_CHUNK * ANSWER_TOKENS)
+
+    @override
+    async def ainvoke(self, *args, **kwargs):
+        return self.invoke()
+
+    @override
+    async def astream(self, *args, **kwargs):
+        for _ in range(ANSWER_TOKENS):
+            yield AIMessageChunk(content=ANSWER_CHUNK)
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of a benchmark in seconds, without the warmup runs."""
+
+    name: str
+    iterations: int
+    mean: float
+    median: float
+    p95: float
+    min: float
+    max: float
+    extra: dict[str, float] = field(default_factory=dict)
+
+
+async def measure(
+    name: str, run: Callable[[Any], Any], *, iterations: int, prepare: Callable[[], Any] | None = None, warmup: int = 1
+) -> BenchmarkResult:
+    """Time `run`, sync or async, called with a fresh value of `prepare` that is built outside of the timings."""
+    timings = []
+    for i in range(warmup + iterations):
+        argument = prepare() if prepare is not None else None
+        start = time.perf_counter()
+        result = run(argument)
+        if inspect.isawaitable(result):
+            await result
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            timings.append(elapsed)
+    return BenchmarkResult(
+        name=name,
+        iterations=iterations,
+        mean=statistics.fmean(timings),
+        median=statistics.median(timings),
+        p95=statistics.quantiles(timings, n=20)[18] if len(timings) > 1 else timings[0],
+        min=min(timings),
+        max=max(timings),
+    )
+
+
+def mock_language_model():
+    return patch.object(OpenAIModelComponent, "build_model", lambda _self: BenchmarkLanguageModel())
+
+
+def basic_prompting_graph(*, stream: bool = False) -> Graph:
+    """The Basic Prompting starter project."""
+    chat_input = ChatInput()
+    prompt_component = PromptComponent()
+    prompt_component.set(
+        template="Answer the user.\n\nUser: {user_input}\n\nAnswer:",
+        user_input=chat_input.message_response,
+    )
+    openai_component = OpenAIModelComponent()
+    openai_component.set(input_value=prompt_component.build_prompt, stream=stream)
+    chat_output = ChatOutput()
+    chat_output.set(input_value=openai_component.text_response)
+    return Graph(start=chat_input, end=chat_output)
+
+
+def memory_chatbot_graph() -> Graph:
+    """The Memory Chatbot starter project, whose prompt holds the messages of the session."""
+    memory_component = MemoryComponent()
+    chat_input = ChatInput()
+    type_converter = TypeConverterComponent()
+    type_converter.set(input_data=memory_component.retrieve_messages_dataframe)
+    prompt_component = PromptComponent()
+    prompt_component.set(
+        template="{context}\n\nUser: {user_message}\nAI: ",
+        user_message=chat_input.message_response,
+        context=type_converter.convert_to_message,
+    )
+    openai_component = OpenAIModelComponent()
+    openai_component.set(input_value=prompt_component.build_prompt)
+    chat_output = ChatOutput()
+    chat_output.set(input_value=openai_component.text_response)
+    return Graph(start=chat_input, end=chat_output)
+
+
+def streaming_graph() -> Graph:
+    """The Basic Prompting starter project with a streaming model."""
+    return basic_prompting_graph(stream=True)
+
+
+async def bench_graph_from_payload(iterations: int) -> list[BenchmarkResult]:
+    results = []
+    for project in PAYLOAD_PROJECTS:
+        payload = json.loads((STARTER_PROJECTS_DIR / f"{project}.json").read_text(encoding="utf-8"))["data"]
+        result = await measure(
+            f"graph_from_payload[{project}]",
+            lambda data: Graph.from_payload(data, flow_id=str(uuid4())),
+            iterations=iterations,
+            prepare=lambda payload=payload: copy.deepcopy(payload),
+        )
+        result.extra["vertices"] = len(payload["nodes"])
+        results.append(result)
+    return results
+
+
+async def bench_graph_arun(iterations: int) -> list[BenchmarkResult]:
+    with mock_language_model():
+        return [
+            await measure(
+                f"graph_arun[{builder.__name__.removesuffix('_graph')}]",
+                lambda graph: graph.arun(inputs=[{"input_value": PROMPT}]),
+                iterations=iterations,
+                prepare=builder,
+            )
+            for builder in (basic_prompting_graph, memory_chatbot_graph)
+        ]
+
+
+async def bench_token_streaming(iterations: int) -> BenchmarkResult:
+    with mock_language_model():
+        result = await measure(
+            "token_streaming",
+            lambda graph: graph.arun(
+                inputs=[{"input_value": PROMPT}],
+                # The streamed message is stored, which needs a session
+                session_id=str(uuid4()),
+                event_manager=create_default_event_manager(asyncio.Queue()),
+            ),
+            iterations=iterations,
+            prepare=streaming_graph,
+        )
+    result.extra["tokens"] = ANSWER_TOKENS
+    result.extra["tokens_per_second"] = ANSWER_TOKENS / result.mean
+    return result
+
+
+async def create_benchmark_flow() -> tuple[UUID, str, SimpleNamespace]:
+    """Saves the user and the flow the builds of `generate_flow_events` are logged for."""
+    user = User(username=f"benchmark-{uuid4().hex}", password=get_password_hash("benchmark"), is_active=True)
+    flow = Flow(name="Benchmark Flow", data={"nodes": [], "edges": []}, user_id=user.id)
+    # Read before the commit expires the attributes
+    flow_id, flow_name, user_id = flow.id, flow.name, user.id
+    async with session_scope() as session:
+        session.add(user)
+        session.add(flow)
+    return flow_id, flow_name, SimpleNamespace(id=user_id)
+
+
+async def bench_flow_events(iterations: int) -> list[BenchmarkResult]:
+    """Benchmark a playground build of the Basic Prompting flow, with and without logging the builds."""
+    flow_id, flow_name, current_user = await create_benchmark_flow()
+
+    async def build_graph_from_data(flow_id, payload, **kwargs):  # noqa: ARG001
+        # The graph is built from the components rather than from the payload, so the mock model is used
+        graph = basic_prompting_graph()
+        graph.flow_id = str(flow_id)
+        graph.flow_name = kwargs.get("flow_name")
+        graph.user_id = kwargs.get("user_id")
+        graph.session_id = kwargs.get("session_id") or str(flow_id)
+        await graph.initialize_run()
+        return graph
+
+    def build(log_builds: bool):  # noqa: FBT001
+        async def run(_) -> None:
+            queue: asyncio.Queue = asyncio.Queue()
+            background_tasks = BackgroundTasks()
+            await generate_flow_events(
+                flow_id=flow_id,
+                background_tasks=background_tasks,
+                event_manager=create_default_event_manager(queue),
+                inputs=InputValueRequest(input_value=PROMPT, session=str(flow_id)),
+                data=FlowDataRequest(nodes=[], edges=[]),
+                files=None,
+                stop_component_id=None,
+                start_component_id=None,
+                log_builds=log_builds,
+                current_user=current_user,
+                flow_name=flow_name,
+            )
+            # The builds are logged by background tasks and written by the run log service
+            await background_tasks()
+            await get_run_log_service().flush()
+
+        return run
+
+    with mock_language_model(), patch("langflow.api.build.build_graph_from_data", build_graph_from_data):
+        results = [
+            await measure(f"flow_events[log_builds={log_builds}]", build(log_builds), iterations=iterations)
+            for log_builds in (False, True)
+        ]
+    results[1].extra["logging_overhead"] = results[1].mean - results[0].mean
+    return results
+
+
+async def run_suite(iterations: int = 20) -> dict[str, Any]:
+    """Run every benchmark; the services, with the database, must be initialized."""
+    results = [
+        *await bench_graph_from_payload(iterations),
+        *await bench_graph_arun(iterations),
+        await bench_token_streaming(iterations),
+        *await bench_flow_events(iterations),
+    ]
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": iterations,
+        "results": [asdict(result) for result in results],
+    }
+
+
+async def _run_with_services(iterations: int) -> dict[str, Any]:
+    from langflow.services.utils import initialize_services, teardown_services
+
+    await initialize_services(fix_migration=False)
+    try:
+        return await run_suite(iterations)
+    finally:
+        await teardown_services()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the graph execution benchmarks and report them as JSON.")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed runs of each benchmark.")
+    parser.add_argument("--output", type=Path, help="File the JSON report is written to, stdout by default.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        get_settings_service().set("database_url", f"sqlite:///{Path(tmp_dir) / 'benchmarks.db'}")
+        report = asyncio.run(_run_with_services(args.iterations))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output, encoding="utf-8")
+    else:
+        print(output)  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
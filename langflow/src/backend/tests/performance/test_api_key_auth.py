@@ -0,0 +1,89 @@
+"""Benchmark of the API key authentication path.
+
+Without the cache every authenticated request looks the key up with a join on its user and
+commits a usage increment in another session. With the cache of `AuthService` the lookup is
+served from memory and the uses are written in one batched UPDATE per flush interval.
+"""
+
+import statistics
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from langflow.services.auth.service import AuthService
+from langflow.services.database.models.api_key.crud import check_key
+from langflow.services.database.models.api_key.model import ApiKey
+from langflow.services.database.models.user.model import User
+from loguru import logger
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+REQUESTS = 500
+
+
+@asynccontextmanager
+async def patched_auth_service(async_session: AsyncSession, *, cache_ttl: float, flush_interval: float):
+    @asynccontextmanager
+    async def session_scope():
+        yield async_session
+
+    settings_service = SimpleNamespace(
+        settings=SimpleNamespace(
+            api_key_cache_ttl=cache_ttl,
+            api_key_usage_flush_interval=flush_interval,
+            disable_track_apikey_usage=False,
+        )
+    )
+    service = AuthService(settings_service)
+    with (
+        patch("langflow.services.auth.service.session_scope", session_scope),
+        patch("langflow.services.database.models.api_key.crud.session_scope", session_scope),
+        patch("langflow.services.database.models.api_key.crud.get_settings_service", return_value=settings_service),
+        patch("langflow.services.database.models.api_key.crud.get_auth_service", return_value=service),
+    ):
+        service.start()
+        try:
+            yield service
+        finally:
+            await service.stop()
+
+
+async def authenticate(async_session: AsyncSession) -> list[float]:
+    latencies = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        user = await check_key(async_session, "sk-bench")
+        latencies.append(time.perf_counter() - start)
+        assert user is not None
+    return latencies
+
+
+def summarize(latencies: list[float]) -> tuple[float, float]:
+    return len(latencies) / sum(latencies), statistics.quantiles(latencies, n=100)[98]
+
+
+@pytest.mark.benchmark
+async def test_cached_api_key_auth_is_faster(async_session: AsyncSession):
+    user = User(username="bench-user", password="password", is_active=True)  # noqa: S106
+    api_key = ApiKey(api_key="sk-bench", name="bench", user=user)
+    async_session.add(api_key)
+    await async_session.commit()
+    await async_session.refresh(api_key)
+
+    async with patched_auth_service(async_session, cache_ttl=0, flush_interval=0):
+        uncached = await authenticate(async_session)
+    async with patched_auth_service(async_session, cache_ttl=60, flush_interval=60):
+        cached = await authenticate(async_session)
+
+    uncached_rate, uncached_p99 = summarize(uncached)
+    cached_rate, cached_p99 = summarize(cached)
+    logger.info(
+        f"{REQUESTS} API key checks: uncached={uncached_rate:.0f} req/s p99={uncached_p99 * 1000:.2f}ms "
+        f"cached={cached_rate:.0f} req/s p99={cached_p99 * 1000:.2f}ms"
+    )
+
+    total_uses = (await async_session.exec(select(ApiKey.total_uses).where(ApiKey.id == api_key.id))).one()
+    assert total_uses == 2 * REQUESTS
+    assert cached_rate > uncached_rate
@@ -0,0 +1,46 @@
+"""Runs the offline graph execution benchmarks of `benchmark_suite` and checks their JSON report."""
+
+import json
+
+import pytest
+from langflow.services.deps import get_settings_service
+
+from tests.performance.benchmark_suite import PAYLOAD_PROJECTS, run_suite
+
+
+@pytest.fixture(autouse=True)
+def setup_database_url(tmp_path, monkeypatch):
+    """Setup a temporary database URL for the benchmarks."""
+    settings_service = get_settings_service()
+    original_value = settings_service.settings.database_url
+    test_db_url = f"sqlite:///{tmp_path / 'benchmarks.db'}"
+    monkeypatch.setenv("LANGFLOW_DATABASE_URL", test_db_url)
+    settings_service.set("database_url", test_db_url)
+    yield
+    settings_service.set("database_url", original_value)
+
+
+@pytest.mark.benchmark
+async def test_benchmark_suite_reports_json(tmp_path):
+    from langflow.services.utils import initialize_services
+
+    await initialize_services(fix_migration=False)
+    report = await run_suite(iterations=3)
+
+    output = tmp_path / "benchmarks.json"
+    output.write_text(json.dumps(report))
+    results = {result["name"]: result for result in json.loads(output.read_text())["results"]}
+
+    assert set(results) == {
+        *(f"graph_from_payload[{project}]" for project in PAYLOAD_PROJECTS),
+        "graph_arun[basic_prompting]",
+        "graph_arun[memory_chatbot]",
+        "token_streaming",
+        "flow_events[log_builds=False]",
+        "flow_events[log_builds=True]",
+    }
+    for result in results.values():
+        assert result["iterations"] == 3
+        assert 0 < result["min"] <= result["median"] <= result["max"]
+    assert results["token_streaming"]["extra"]["tokens_per_second"] > 0
+    assert "logging_overhead" in results["flow_events[log_builds=True]"]["extra"]
@@ -0,0 +1,57 @@
+"""Benchmark of loading the built-in components at startup.
+
+Each start runs in a fresh interpreter, as a worker would. Without the component index every module
+under `langflow.components` is imported and every component is instantiated to build its template.
+With the index the templates are read from the config directory, and only the modules whose file
+changed are imported.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+from loguru import logger
+
+LOAD_COMPONENTS = """
+import asyncio
+import time
+
+from langflow.interface.components import import_langflow_components
+
+start = time.perf_counter()
+result = asyncio.run(import_langflow_components())
+print(time.perf_counter() - start, sum(len(components) for components in result["components"].values()))
+"""
+
+
+def start_worker(config_dir, *, use_index: bool) -> tuple[float, float, int]:
+    env = {
+        **os.environ,
+        "LANGFLOW_CONFIG_DIR": str(config_dir),
+        "LANGFLOW_USE_COMPONENT_INDEX": str(use_index).lower(),
+    }
+    start = time.perf_counter()
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", LOAD_COMPONENTS], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    wall_time = time.perf_counter() - start
+    load_time, component_count = output.split()[-2:]
+    return wall_time, float(load_time), int(component_count)
+
+
+@pytest.mark.benchmark
+def test_component_index_speeds_up_startup(tmp_path):
+    without_index = start_worker(tmp_path, use_index=False)
+    cold_index = start_worker(tmp_path, use_index=True)
+    warm_index = start_worker(tmp_path, use_index=True)
+
+    for label, (wall_time, load_time, component_count) in (
+        ("without index", without_index),
+        ("building index", cold_index),
+        ("with index", warm_index),
+    ):
+        logger.info(f"Startup {label}: {wall_time:.2f}s total, {load_time:.2f}s loading {component_count} components")
+
+    assert warm_index[1] < without_index[1]
@@ -0,0 +1,88 @@
+"""Memory ceiling of the uploads and of the ZIP downloads of the files API with a 64 MiB file.
+
+The uploads were read whole before being saved, and the ZIP of a batch download was built in memory before
+the response was sent. Both are now streamed, so their peak memory depends on the chunk size rather than on
+the size of the files.
+"""
+
+import io
+import tracemalloc
+import zipfile
+from types import SimpleNamespace
+
+import anyio
+import pytest
+from fastapi import UploadFile
+from langflow.api.v2.files import UPLOAD_CHUNK_SIZE, UploadDigest, save_file_routine, zip_stream_generator
+from langflow.services.storage.local import LocalStorageService
+from loguru import logger
+
+FILE_SIZE = 64 * 1024 * 1024
+USER = SimpleNamespace(id="benchmark-user")
+
+
+def measure_peak(func):
+    async def measured() -> int:
+        tracemalloc.start()
+        try:
+            await func()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return measured
+
+
+@pytest.mark.benchmark
+async def test_streamed_files_have_a_memory_ceiling(tmp_path):
+    source = tmp_path / "source.bin"
+    with source.open("wb") as f:
+        for i in range(FILE_SIZE // UPLOAD_CHUNK_SIZE):
+            f.write(bytes([i % 256]) * UPLOAD_CHUNK_SIZE)
+    storage = LocalStorageService(None, SimpleNamespace(settings=SimpleNamespace(config_dir=str(tmp_path))))
+
+    @measure_peak
+    async def upload_whole():
+        with source.open("rb") as f:
+            content = await UploadFile(filename="whole.bin", file=f).read()
+        await storage.save_file(flow_id=USER.id, file_name="whole.bin", data=content)
+
+    @measure_peak
+    async def upload_streamed():
+        digest = UploadDigest()
+        with source.open("rb") as f:
+            await save_file_routine(UploadFile(filename="streamed.bin", file=f), storage, USER, digest=digest)
+        assert digest.size == FILE_SIZE
+
+    @measure_peak
+    async def zip_whole():
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w") as zip_file:
+            zip_file.writestr("whole.bin", await storage.get_file(USER.id, "whole.bin"))
+        assert zip_buffer.getbuffer().nbytes > FILE_SIZE
+
+    @measure_peak
+    async def zip_streamed():
+        async def iter_entries():
+            zip_info = zipfile.ZipInfo("streamed.bin")
+            zip_info.file_size = FILE_SIZE
+            yield zip_info, await storage.get_file_stream(USER.id, "streamed.bin")
+
+        size = 0
+        async for chunk in zip_stream_generator(iter_entries()):
+            size += len(chunk)
+        assert size > FILE_SIZE
+
+    whole_upload = await upload_whole()
+    streamed_upload = await upload_streamed()
+    assert await anyio.Path(tmp_path / USER.id / "streamed.bin").read_bytes() == source.read_bytes()
+    whole_zip = await zip_whole()
+    streamed_zip = await zip_streamed()
+
+    logger.info(
+        f"Peak memory with a {FILE_SIZE // 2**20}MiB file: upload whole={whole_upload / 2**20:.1f}MiB "
+        f"streamed={streamed_upload / 2**20:.1f}MiB, zip whole={whole_zip / 2**20:.1f}MiB "
+        f"streamed={streamed_zip / 2**20:.1f}MiB"
+    )
+    assert streamed_upload < 4 * UPLOAD_CHUNK_SIZE < whole_upload
+    assert streamed_zip < 4 * UPLOAD_CHUNK_SIZE < whole_zip
@@ -0,0 +1,128 @@
+"""Benchmark of the dependency-driven scheduler in `Graph.process` against layer barriers.
+
+Every branch of the benchmark graph has one slow and one fast stage, but the slow stage is
+placed first in half of the branches and last in the other half. Running layer by layer pays
+for the slow stage twice, while the ready-queue scheduler only pays for the longest branch.
+"""
+
+import asyncio
+import time
+from collections import deque
+from unittest.mock import patch
+
+import pytest
+from langflow.custom.custom_component.component import Component
+from langflow.graph import Graph
+from langflow.io import FloatInput, MessageTextInput, Output
+from langflow.schema.message import Message
+from loguru import logger
+
+SLOW = 0.3
+FAST = 0.02
+WIDTH = 16
+
+
+class SleepComponent(Component):
+    display_name = "Sleep"
+    description = "Waits for a while and forwards its input."
+
+    inputs = [
+        MessageTextInput(name="input_value", display_name="Input"),
+        FloatInput(name="delay", display_name="Delay", value=0.0),
+    ]
+    outputs = [
+        Output(display_name="Message", name="message", method="run"),
+    ]
+
+    async def run(self) -> Message:
+        await asyncio.sleep(self.delay)
+        return Message(text=f"{self.input_value or ''}.")
+
+
+def build_skewed_graph(width: int = WIDTH) -> Graph:
+    graph = Graph()
+    source = SleepComponent(_id="source", input_value="x", delay=0.0)
+    graph.add_component(source)
+    for i in range(width):
+        first_delay, second_delay = (SLOW, FAST) if i % 2 else (FAST, SLOW)
+        first = SleepComponent(_id=f"first_{i}", delay=first_delay)
+        second = SleepComponent(_id=f"second_{i}", delay=second_delay)
+        graph.add_component(first)
+        graph.add_component(second)
+        graph.add_component_edge("source", ("message", "input_value"), first._id)
+        graph.add_component_edge(first._id, ("message", "input_value"), second._id)
+    graph.prepare()
+    return graph
+
+
+async def run_in_layers(graph: Graph) -> None:
+    """Reproduces the previous layer-barrier loop of `Graph.process`."""
+    to_process = deque(graph.sort_vertices())
+    await graph.initialize_run()
+    lock = asyncio.Lock()
+    while to_process:
+        current_batch = list(to_process)
+        to_process.clear()
+        tasks = [
+            asyncio.create_task(
+                graph.build_vertex(vertex_id=vertex_id, inputs_dict={}, fallback_to_env_vars=False),
+                name=f"{vertex_id} Run 0",
+            )
+            for vertex_id in current_batch
+        ]
+        next_runnable_vertices = await graph._execute_tasks(tasks, lock=lock)
+        to_process.extend(next_runnable_vertices)
+
+
+async def timed(coro) -> float:
+    start = time.perf_counter()
+    await coro
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+async def test_ready_queue_scheduler_beats_layer_barriers():
+    layered = await timed(run_in_layers(build_skewed_graph()))
+    ready_queue = await timed(build_skewed_graph().process(fallback_to_env_vars=False))
+    logger.info(f"Skewed graph ({WIDTH} branches): layered={layered:.3f}s ready_queue={ready_queue:.3f}s")
+
+    assert layered >= 2 * SLOW
+    assert ready_queue < layered
+
+
+@pytest.mark.benchmark
+async def test_ready_queue_scheduler_respects_concurrency_cap():
+    unbounded = await timed(build_skewed_graph().process(fallback_to_env_vars=False, max_concurrency=0))
+    capped = await timed(build_skewed_graph().process(fallback_to_env_vars=False, max_concurrency=2))
+    logger.info(f"Skewed graph ({WIDTH} branches): unbounded={unbounded:.3f}s max_concurrency=2 {capped:.3f}s")
+
+    assert capped > unbounded
+
+
+async def test_vertices_activated_while_running_run_again():
+    graph = Graph()
+    graph.add_component(SleepComponent(_id="slow", input_value="x", delay=SLOW))
+    graph.add_component(SleepComponent(_id="fast", input_value="x", delay=0.0))
+    graph.prepare()
+    builds: list[str] = []
+    build_vertex = graph.build_vertex
+    collect_task_results = graph._collect_task_results
+
+    async def count_builds(vertex_id, **kwargs):
+        builds.append(vertex_id)
+        return await build_vertex(vertex_id, **kwargs)
+
+    async def activate_slow(tasks, results, **kwargs):
+        next_vertices = await collect_task_results(tasks, results, **kwargs)
+        # Like a cycle activating the slow vertex again before its first run is over
+        if any(task.get_name().startswith("fast ") for task in tasks):
+            next_vertices = [*next_vertices, "slow"]
+        return next_vertices
+
+    with (
+        patch.object(graph, "build_vertex", count_builds),
+        patch.object(graph, "_collect_task_results", activate_slow),
+    ):
+        await graph.process(fallback_to_env_vars=False)
+
+    assert sorted(builds) == ["fast", "slow", "slow"]
@@ -0,0 +1,107 @@
+"""Benchmark of the chat history lookups of the Memory component with 1M messages.
+
+Without the history indexes every lookup scans the message table, and the Memory component read up to
+10000 messages of the session to keep the last `n_messages`. With the indexes the last messages are read
+with a bounded query, and the recent messages of the session are then served from the message history
+cache.
+"""
+
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from langflow.memory import aget_messages, aget_recent_messages, message_history_cache
+from langflow.services.database.models.message.model import MessageTable
+from loguru import logger
+from sqlalchemy import insert, text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+MESSAGES = 1_000_000
+SESSIONS = 100
+N_MESSAGES = 100
+BATCH_SIZE = 50_000
+
+
+async def create_history(async_session: AsyncSession) -> None:
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    rows = (
+        {
+            "id": uuid4(),
+            "timestamp": start + timedelta(seconds=i),
+            "sender": "User" if i % 2 == 0 else "Machine",
+            "sender_name": "User" if i % 2 == 0 else "AI",
+            "session_id": f"session-{i % SESSIONS}",
+            "text": f"message {i}",
+            "files": [],
+            "error": False,
+            "edit": False,
+            "properties": {},
+            "category": "message",
+            "content_blocks": [],
+        }
+        for i in range(MESSAGES)
+    )
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            await async_session.exec(insert(MessageTable), params=batch)
+            batch = []
+    await async_session.commit()
+
+
+async def time_lookups(lookup, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        messages = await lookup(f"session-{i % SESSIONS}")
+        assert len(messages) == N_MESSAGES
+    return (time.perf_counter() - start) / count
+
+
+async def scan_lookup(session_id: str):
+    """The lookup of the Memory component before the indexes."""
+    messages = await aget_messages(session_id=session_id, limit=10000, order="ASC")
+    return messages[-N_MESSAGES:]
+
+
+async def recent_lookup(session_id: str):
+    return await aget_recent_messages(session_id, N_MESSAGES, order="ASC")
+
+
+@pytest.mark.benchmark
+async def test_indexed_history_lookups_are_faster(async_session: AsyncSession):
+    @asynccontextmanager
+    async def session_scope():
+        yield async_session
+
+    await create_history(async_session)
+
+    with patch("langflow.memory.session_scope", session_scope):
+        for index in ("ix_message_session_id_timestamp", "ix_message_flow_id_timestamp"):
+            await async_session.exec(text(f"DROP INDEX {index}"))
+        scan = await time_lookups(scan_lookup, 3)
+
+        for index, columns in (
+            ("ix_message_session_id_timestamp", "session_id, timestamp"),
+            ("ix_message_flow_id_timestamp", "flow_id, timestamp"),
+        ):
+            await async_session.exec(text(f"CREATE INDEX {index} ON message ({columns})"))
+        message_history_cache.configure(tail_size=0, ttl=0)
+        indexed = await time_lookups(recent_lookup, 100)
+
+        message_history_cache.configure(tail_size=N_MESSAGES, ttl=60)
+        try:
+            await time_lookups(recent_lookup, SESSIONS)
+            cached = await time_lookups(recent_lookup, 1000)
+        finally:
+            message_history_cache.reset()
+
+    logger.info(
+        f"History lookups of {N_MESSAGES} messages in {MESSAGES} messages: scan={scan * 1000:.1f}ms "
+        f"indexed={indexed * 1000:.2f}ms cached={cached * 1000:.2f}ms"
+    )
+    assert indexed < scan
+    assert cached < indexed
@@ -0,0 +1,90 @@
+"""Benchmark of token coalescing against one token event per token.
+
+The previous streaming path sent every token through a thread hop, a playground event model and
+the JSON encoder, and accumulated the answer with string concatenation. `TokenCoalescer` groups
+the tokens into frames sent from the event loop, so the throughput goes up while the time between
+two frames stays bounded by the frame interval.
+"""
+
+import asyncio
+import itertools
+import statistics
+import time
+
+import pytest
+from langflow.events.event_manager import TokenCoalescer, create_default_event_manager
+from loguru import logger
+
+TOKENS = 5000
+CHUNK = "tok "
+FRAME_SIZE = 64
+FRAME_INTERVAL = 0.05
+
+
+async def generate_tokens(count: int = TOKENS, delay: float = 0.0):
+    for _ in range(count):
+        await asyncio.sleep(delay)
+        yield CHUNK
+
+
+async def stream_per_token(queue: asyncio.Queue, **kwargs) -> str:
+    """Reproduces the previous `Component._process_chunk` loop."""
+    manager = create_default_event_manager(queue)
+    complete_message = ""
+    async for chunk in generate_tokens(**kwargs):
+        complete_message += chunk
+        await asyncio.to_thread(manager.on_token, data={"chunk": chunk, "id": "message-id"})
+    return complete_message
+
+
+async def stream_coalesced(queue: asyncio.Queue, **kwargs) -> str:
+    manager = create_default_event_manager(queue)
+    tokens = TokenCoalescer(manager, "message-id", frame_size=FRAME_SIZE, frame_interval=FRAME_INTERVAL)
+    async for chunk in generate_tokens(**kwargs):
+        tokens.push(chunk)
+    return tokens.close()
+
+
+def p99(values: list[float]) -> float:
+    return statistics.quantiles(values, n=100)[98]
+
+
+def inter_frame_latencies(queue: asyncio.Queue) -> list[float]:
+    timestamps = []
+    while not queue.empty():
+        _, _, timestamp = queue.get_nowait()
+        timestamps.append(timestamp)
+    return [later - earlier for earlier, later in itertools.pairwise(timestamps)]
+
+
+async def measure(stream, **kwargs) -> tuple[float, list[float]]:
+    queue: asyncio.Queue = asyncio.Queue()
+    start = time.perf_counter()
+    text = await stream(queue, **kwargs)
+    elapsed = time.perf_counter() - start
+    count = kwargs.get("count", TOKENS)
+    assert text == CHUNK * count
+    return count / elapsed, inter_frame_latencies(queue)
+
+
+@pytest.mark.benchmark
+async def test_coalescing_increases_tokens_per_second():
+    per_token_rate, per_token_gaps = await measure(stream_per_token)
+    coalesced_rate, coalesced_gaps = await measure(stream_coalesced)
+    logger.info(
+        f"{TOKENS} tokens: per_token={per_token_rate:.0f} tokens/s ({len(per_token_gaps) + 1} frames) "
+        f"coalesced={coalesced_rate:.0f} tokens/s ({len(coalesced_gaps) + 1} frames)"
+    )
+
+    assert len(coalesced_gaps) + 1 <= TOKENS * len(CHUNK) // FRAME_SIZE + 1
+    assert coalesced_rate > per_token_rate
+
+
+@pytest.mark.benchmark
+async def test_coalescing_bounds_inter_frame_latency():
+    # Tokens arriving slower than the frame fills up are sent when the frame interval elapses
+    _, gaps = await measure(stream_coalesced, count=100, delay=0.005)
+    logger.info(f"100 paced tokens: {len(gaps) + 1} frames, p99 inter-frame latency={p99(gaps) * 1000:.1f}ms")
+
+    assert len(gaps) + 1 < 100
+    assert p99(gaps) < FRAME_INTERVAL * 3
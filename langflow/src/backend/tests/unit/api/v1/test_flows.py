@@ -66,6 +66,76 @@ async def test_read_flows(client: AsyncClient, logged_in_headers):
     assert isinstance(result, list), "The result must be a list"
 
 
+async def test_read_flow_headers_by_cursor(client: AsyncClient, logged_in_headers):
+    flow_ids = []
+    for i in range(3):
+        flow = {
+            "name": f"Header Flow {i}",
+            "data": {"nodes": [{"id": "node-a"}, {"id": "node-b"}], "edges": []},
+            "is_component": False,
+        }
+        response = await client.post("api/v1/flows/", json=flow, headers=logged_in_headers)
+        flow_ids.append(response.json()["id"])
+    params = {"header_flows": True, "remove_example_flows": True}
+
+    response = await client.get("api/v1/flows/", params={**params, "limit": 2}, headers=logged_in_headers)
+    first_page = response.json()
+    assert response.status_code == status.HTTP_200_OK
+    assert [header["id"] for header in first_page] == flow_ids[:0:-1]
+    assert all(header["data"] is None for header in first_page)
+
+    cursor = response.headers["X-Next-Cursor"]
+    response = await client.get(
+        "api/v1/flows/", params={**params, "limit": 2, "cursor": cursor}, headers=logged_in_headers
+    )
+    assert [header["id"] for header in response.json()] == flow_ids[:1]
+    assert "X-Next-Cursor" not in response.headers
+
+    # Writing a flow drops the cached headers of the user
+    response = await client.patch(f"api/v1/flows/{flow_ids[0]}", json={"name": "Renamed"}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK
+    response = await client.get("api/v1/flows/", params=params, headers=logged_in_headers)
+    headers = response.json()
+    assert headers[0]["id"] == flow_ids[0]
+    assert headers[0]["name"] == "Renamed"
+
+    response = await client.get("api/v1/flows/", params={**params, "cursor": "invalid"}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+async def test_read_flow_headers_by_cursor_with_equal_updated_at(client: AsyncClient, logged_in_headers):
+    from datetime import datetime, timezone
+
+    from langflow.services.deps import session_scope
+    from sqlmodel import col, update
+
+    flow_ids = []
+    for i in range(3):
+        flow = {"name": f"Tied Flow {i}", "data": {"nodes": [], "edges": []}, "is_component": False}
+        response = await client.post("api/v1/flows/", json=flow, headers=logged_in_headers)
+        flow_ids.append(response.json()["id"])
+    async with session_scope() as session:
+        await session.exec(
+            update(Flow)
+            .where(col(Flow.id).in_([uuid.UUID(flow_id) for flow_id in flow_ids]))
+            .values(updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        )
+    params = {"header_flows": True, "remove_example_flows": True, "limit": 1}
+
+    listed = []
+    cursor = None
+    for _ in flow_ids:
+        response = await client.get(
+            "api/v1/flows/", params={**params, **({"cursor": cursor} if cursor else {})}, headers=logged_in_headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        listed.extend(header["id"] for header in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+
+    assert listed == sorted(flow_ids, reverse=True)
+    assert cursor is None
+
+
 async def test_read_flow(client: AsyncClient, logged_in_headers):
     basic_case = {
         "name": "string",
@@ -111,3 +111,26 @@ async def test_mcp_post_endpoint_server_error(client: AsyncClient, logged_in_hea
 
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
     assert "Internal server error" in response.json()["detail"]
+
+
+async def test_list_tools_reuses_catalog_until_a_flow_is_saved(client: AsyncClient, logged_in_headers):
+    from langflow.api.v1.mcp_utils import handle_list_tools
+    from langflow.helpers import flow as flow_helpers
+
+    flow = {"name": "Catalog Flow", "data": {"nodes": [], "edges": []}, "is_component": False}
+    response = await client.post("api/v1/flows/", json=flow, headers=logged_in_headers)
+    flow_id = response.json()["id"]
+
+    with patch.object(
+        flow_helpers, "_json_schema_from_flow_data", wraps=flow_helpers._json_schema_from_flow_data
+    ) as build_schema:
+        tools = await handle_list_tools()
+        assert "catalog_flow" in [tool.name for tool in tools]
+        await handle_list_tools()
+        assert build_schema.call_count == 1
+
+        await client.patch(f"api/v1/flows/{flow_id}", json={"name": "Renamed Flow"}, headers=logged_in_headers)
+        names = [tool.name for tool in await handle_list_tools()]
+        assert "renamed_flow" in names
+        assert "catalog_flow" not in names
+        assert build_schema.call_count == 2
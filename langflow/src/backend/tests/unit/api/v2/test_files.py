@@ -1,5 +1,7 @@
 import asyncio
+import io
 import tempfile
+import zipfile
 from contextlib import suppress
 from pathlib import Path
 
@@ -521,3 +523,67 @@ async def test_unique_filename_path_storage(files_client, files_created_api_key)
     download2 = await files_client.get(f"api/v2/files/{file2['id']}", headers=headers)
     assert download2.status_code == 200
     assert download2.content == b"path content 2"
+
+
+async def test_upload_file_in_chunks_and_download_batch_as_zip(files_client, files_created_api_key):
+    """Files larger than a chunk are streamed to the storage and streamed back in a ZIP archive."""
+    from langflow.api.v2.files import UPLOAD_CHUNK_SIZE
+
+    headers = {"x-api-key": files_created_api_key.api_key}
+    large_content = bytes(range(256)) * (UPLOAD_CHUNK_SIZE // 256 * 2 + 1)
+
+    response = await files_client.post(
+        "api/v2/files",
+        files={"file": ("large.bin", large_content)},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    large_file = response.json()
+    assert large_file["size"] == len(large_content)
+
+    response = await files_client.post(
+        "api/v2/files",
+        files={"file": ("small.txt", b"small content")},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    small_file = response.json()
+
+    response = await files_client.post(
+        "api/v2/files/batch/",
+        json=[large_file["id"], small_file["id"]],
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
+        assert zip_file.testzip() is None
+        assert zip_file.read("large.bin") == large_content
+        assert zip_file.read("small.txt") == b"small content"
+
+
+async def test_upload_file_larger_than_announced_is_rejected():
+    """The size of an upload is checked while it is read, not only against the size sent by the client."""
+    from types import SimpleNamespace
+
+    from fastapi import HTTPException, UploadFile
+    from langflow.api.v2.files import UploadDigest, save_file_routine
+
+    saved: dict[str, bytes] = {}
+
+    class StorageService:
+        async def save_file(self, flow_id: str, file_name: str, data):
+            saved[f"{flow_id}/{file_name}"] = b"".join([chunk async for chunk in data])
+
+    content = b"x" * (3 * 1024 * 1024)
+    upload = UploadFile(filename="large.bin", file=io.BytesIO(content))
+    digest = UploadDigest()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await save_file_routine(
+            upload, StorageService(), SimpleNamespace(id="user"), digest=digest, max_size=1024 * 1024
+        )
+
+    assert exc_info.value.status_code == 413
+    assert not saved
+    assert digest.size > 1024 * 1024
@@ -1,5 +1,14 @@
+from unittest.mock import patch
+
 import pytest
-from langflow.base.data.kb_utils import compute_bm25, compute_tfidf
+from langflow.base.data.kb_utils import (
+    KB_STATS_FILE,
+    compute_bm25,
+    compute_tfidf,
+    read_kb_stats,
+    reconcile_kb_stats,
+    update_kb_stats,
+)
 
 
 class TestKBUtils:
@@ -456,3 +465,79 @@ class TestKBUtils:
         assert scores[1] > 0.0
         # Third document only contains "bird", so should have zero score
         assert scores[2] == 0.0
+
+
+class FakeCollection:
+    """In-memory stand-in of a Chroma collection."""
+
+    def __init__(self, documents: list[str]):
+        self.documents = documents
+        self.reads = 0
+
+    def get(self, include, limit, offset):
+        assert include == ["documents"]
+        self.reads += 1
+        return {"documents": self.documents[offset : offset + limit]}
+
+    def count(self):
+        return len(self.documents)
+
+
+class TestKBStats:
+    """Test suite for the statistics of knowledge bases."""
+
+    def test_update_kb_stats_adds_the_ingested_chunks(self, tmp_path):
+        collection = FakeCollection(["the cat sat", "on the mat"])
+        stats = update_kb_stats(tmp_path, collection.documents, collection)
+        assert stats["chunks"] == 2
+        assert stats["words"] == 6
+        assert stats["characters"] == 21
+
+        collection.documents.append("a dog")
+        reads = collection.reads
+        stats = update_kb_stats(tmp_path, ["a dog"], collection)
+
+        # The chunks already counted are not read again
+        assert collection.reads == reads
+        assert stats["chunks"] == 3
+        assert stats["words"] == 8
+        assert stats["characters"] == 26
+        assert read_kb_stats(tmp_path) == {**stats, "version": 1}
+
+    def test_update_kb_stats_recomputes_stats_out_of_sync(self, tmp_path):
+        collection = FakeCollection(["one", "two"])
+        update_kb_stats(tmp_path, collection.documents, collection)
+
+        # Chunks added without updating the statistics
+        collection.documents.extend(["three", "four"])
+        collection.documents.append("five")
+        stats = update_kb_stats(tmp_path, ["five"], collection)
+
+        assert stats["chunks"] == 5
+        assert stats["words"] == 5
+        assert stats["characters"] == len("onetwothreefourfive")
+
+    def test_read_kb_stats_of_legacy_or_invalid_file(self, tmp_path):
+        assert read_kb_stats(tmp_path) is None
+        (tmp_path / KB_STATS_FILE).write_text("not json")
+        assert read_kb_stats(tmp_path) is None
+        (tmp_path / KB_STATS_FILE).write_text('{"chunks": 1}')
+        assert read_kb_stats(tmp_path) is None
+
+    def test_reconcile_kb_stats_reads_the_collection_in_pages(self, tmp_path):
+        collection = FakeCollection([f"chunk {i}" for i in range(25)])
+        with (
+            patch("langflow.base.data.kb_utils.KB_STATS_PAGE_SIZE", 10),
+            patch("langflow.base.data.kb_utils.Chroma") as mock_chroma,
+        ):
+            mock_chroma.return_value._collection = collection
+            stats = reconcile_kb_stats(tmp_path)
+
+            assert stats["chunks"] == 25
+            assert stats["words"] == 50
+            assert collection.reads == 3
+            assert read_kb_stats(tmp_path)["chunks"] == 25
+
+            # Once recorded, the statistics are not computed again
+            assert reconcile_kb_stats(tmp_path)["chunks"] == 25
+            assert collection.reads == 3
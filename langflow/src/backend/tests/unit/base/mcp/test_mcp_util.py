@@ -113,6 +113,73 @@ class TestMCPSessionManager:
             assert session1 != session2
             assert mock_create.call_count == 2
 
+    @pytest.fixture
+    def running_session(self, session_manager):
+        """Patch session creation to return sessions that appear to be running."""
+        mock_task = AsyncMock()
+        mock_task.done = MagicMock(return_value=False)
+        mock_task.cancel = MagicMock()
+        with patch.object(session_manager, "_create_stdio_session") as mock_create:
+            mock_create.side_effect = lambda *_: (AsyncMock(), mock_task)
+            yield mock_create
+
+    @pytest.fixture
+    def server_params(self):
+        params = MagicMock()
+        params.command = "test-server"
+        return params
+
+    async def test_reused_session_is_not_checked(self, session_manager, running_session, server_params):
+        """Test that reusing a session does not send a request to the server."""
+        with patch.object(session_manager, "_validate_session_connectivity") as mock_validate:
+            session1 = await session_manager.get_session("context1", server_params, "stdio")
+            session2 = await session_manager.get_session("context2", server_params, "stdio")
+
+        assert session1 is session2
+        running_session.assert_called_once()
+        mock_validate.assert_not_called()
+
+    async def test_session_is_replaced_after_connection_error(self, session_manager, running_session, server_params):
+        """Test that a connection error reported for a request gets its session replaced."""
+        from anyio import ClosedResourceError
+
+        session1 = await session_manager.get_session("test_context", server_params, "stdio")
+        request = await session_manager.start_request("test_context")
+        await session_manager.finish_request(request, ClosedResourceError())
+
+        session2 = await session_manager.get_session("test_context", server_params, "stdio")
+
+        assert session1 is not session2
+        assert running_session.call_count == 2
+
+    @pytest.mark.usefixtures("running_session")
+    async def test_busy_sessions_open_another_session(self, session_manager, server_params):
+        """Test that requests share a session until it runs MAX_CALLS_PER_SESSION requests."""
+        session1 = await session_manager.get_session("test_context", server_params, "stdio")
+        requests = [await session_manager.start_request("test_context") for _ in range(util.MAX_CALLS_PER_SESSION)]
+
+        session2 = await session_manager.get_session("other_context", server_params, "stdio")
+        assert session1 is not session2
+
+        for request in requests:
+            await session_manager.finish_request(request)
+        assert await session_manager.get_session("test_context", server_params, "stdio") is session1
+
+    @pytest.mark.usefixtures("running_session")
+    async def test_tools_are_listed_once(self, session_manager, server_params):
+        """Test that the tools of a server are reused by the contexts connecting to it."""
+        session = await session_manager.get_session("test_context", server_params, "stdio")
+        list_tools_result = MagicMock()
+        list_tools_result.tools = [MagicMock()]
+        session.list_tools = AsyncMock(return_value=list_tools_result)
+
+        tools1 = await session_manager.list_tools("test_context", session)
+        await session_manager.get_session("other_context", server_params, "stdio")
+        tools2 = await session_manager.list_tools("other_context", session)
+
+        assert tools1 == tools2 == list_tools_result.tools
+        session.list_tools.assert_called_once()
+
 
 class TestHeaderValidation:
     """Test the header validation functionality."""
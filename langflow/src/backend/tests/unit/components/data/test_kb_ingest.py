@@ -243,55 +243,88 @@ class TestKBIngestionComponent(ComponentTestBaseWithoutClient):
         assert "text" in metadata["summary"]["vectorized_columns"]
         assert "category" in metadata["summary"]["identifier_columns"]
 
-    async def test_convert_df_to_data_objects(self, component_class, default_kwargs):
-        """Test converting DataFrame to Data objects."""
+    def test_prepare_rows(self, component_class, default_kwargs):
+        """Test building the text and the metadata of the document of each row."""
         component = component_class(**default_kwargs)
         data_df = default_kwargs["input_df"]
         config_list = default_kwargs["column_config"]
 
-        # Mock Chroma to avoid actual vector store operations
-        with patch("langflow.components.data.kb_ingest.Chroma") as mock_chroma:
-            mock_chroma_instance = MagicMock()
-            mock_chroma_instance.get.return_value = {"metadatas": []}
-            mock_chroma.return_value = mock_chroma_instance
+        texts, metadatas = component._prepare_rows(data_df, config_list)
 
-            data_objects = await component._convert_df_to_data_objects(data_df, config_list)
+        assert texts == data_df["text"].tolist()
+        assert len(metadatas) == 2
 
-        assert len(data_objects) == 2
-        assert all(isinstance(obj, Data) for obj in data_objects)
+        # Check first row
+        first_metadata = metadatas[0]
+        assert "text" not in first_metadata
+        assert "title" in first_metadata
+        assert "category" in first_metadata
+        assert "_id" in first_metadata
 
-        # Check first data object
-        first_obj = data_objects[0]
-        assert "text" in first_obj.data
-        assert "title" in first_obj.data
-        assert "category" in first_obj.data
-        assert "_id" in first_obj.data
-
-    async def test_convert_df_to_data_objects_no_duplicates(self, component_class, default_kwargs):
-        """Test converting DataFrame to Data objects with duplicate prevention."""
+    async def test_new_rows_skips_duplicates(self, component_class, default_kwargs):
+        """Test that the rows already in the knowledge base, or repeated, are not added again."""
         default_kwargs["allow_duplicates"] = False
         component = component_class(**default_kwargs)
-        data_df = default_kwargs["input_df"]
+
+        # Simulate an existing document with the hash of the first row
+        existing_hash = "some_existing_hash"
+        chroma = MagicMock()
+        chroma.get.return_value = {"metadatas": [{"_id": existing_hash}]}
+        ids = [existing_hash, "different_hash", "different_hash"]
+
+        new_rows = await component._new_rows(chroma, ids, range(len(ids)), set())
+
+        # Should only return the second row, the first is in the knowledge base and the third repeats the second
+        assert new_rows == [1]
+
+    async def test_create_vector_store_resumes_after_a_failed_batch(self, component_class, default_kwargs, tmp_path):
+        """Rows are written batch by batch, and a failed ingestion resumes after the rows already written."""
+        from langchain_chroma import Chroma
+
+        class Embeddings:
+            def __init__(self, fail_on_call: int | None = None):
+                self.calls = 0
+                self.fail_on_call = fail_on_call
+
+            def embed_documents(self, texts):
+                self.calls += 1
+                if self.calls == self.fail_on_call:
+                    msg = "Embedding failed"
+                    raise RuntimeError(msg)
+                return [[float(len(text)), 1.0] for text in texts]
+
+            def embed_query(self, text):
+                return [float(len(text)), 1.0]
+
+        default_kwargs["chunk_size"] = 1
+        default_kwargs["allow_duplicates"] = True
+        component = component_class(**default_kwargs)
+        data_df = pd.DataFrame(
+            {
+                "text": [f"Sample text {i}" for i in range(10)],
+                "title": [f"Title {i}" for i in range(10)],
+                "category": [f"cat{i}" for i in range(10)],
+            }
+        )
         config_list = default_kwargs["column_config"]
 
-        # Mock Chroma with existing hash
-        with patch("langflow.components.data.kb_ingest.Chroma") as mock_chroma:
-            # Simulate existing document with same hash
-            existing_hash = "some_existing_hash"
-            mock_chroma_instance = MagicMock()
-            mock_chroma_instance.get.return_value = {"metadatas": [{"_id": existing_hash}]}
-            mock_chroma.return_value = mock_chroma_instance
+        with patch("langflow.components.data.kb_ingest.MAX_CONCURRENT_EMBEDDING_BATCHES", 2):
+            # The first window of 2 rows is written, the second one fails
+            with patch.object(component, "_build_embeddings", return_value=Embeddings(fail_on_call=3)):
+                await component._create_vector_store(data_df, config_list, embedding_model="model", api_key=None)
 
-            # Mock hashlib to return the existing hash for first row
-            with patch("langflow.components.data.kb_ingest.hashlib.sha256") as mock_hash:
-                mock_hash_obj = MagicMock()
-                mock_hash_obj.hexdigest.side_effect = [existing_hash, "different_hash"]
-                mock_hash.return_value = mock_hash_obj
+            kb_path = tmp_path / "langflow" / default_kwargs["knowledge_base"]
+            collection = Chroma(persist_directory=str(kb_path), collection_name=default_kwargs["knowledge_base"])
+            assert collection._collection.count() == 2
 
-                data_objects = await component._convert_df_to_data_objects(data_df, config_list)
+            embeddings = Embeddings()
+            with patch.object(component, "_build_embeddings", return_value=embeddings):
+                await component._create_vector_store(data_df, config_list, embedding_model="model", api_key=None)
 
-        # Should only return one object (second row) since first is duplicate
-        assert len(data_objects) == 1
+        # Only the remaining rows were embedded, even though duplicates are allowed
+        assert embeddings.calls == 8
+        assert collection._collection.count() == 10
+        assert not (kb_path / ".ingestion_checkpoint.json").exists()
 
     def test_is_valid_collection_name(self, component_class, default_kwargs):
         """Test collection name validation."""
@@ -34,9 +34,9 @@ class TestWebSearchComponent(ComponentTestBaseWithoutClient):
         with pytest.raises(ValueError, match="Invalid URL"):
             component.ensure_url(invalid_url)
 
-    def test_successful_web_search(self):
+    async def test_successful_web_search(self):
         component = WebSearchComponent()
         component.query = "OpenAI GPT-4"
-        result = component.perform_search()
+        result = await component.perform_search()
         assert isinstance(result, DataFrame)
         assert not result.empty
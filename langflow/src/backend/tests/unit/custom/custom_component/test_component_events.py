@@ -7,6 +7,7 @@ from uuid import uuid4
 import pytest
 from langflow.custom.custom_component.component import Component
 from langflow.events.event_manager import EventManager
+from langflow.memory import aget_messages
 from langflow.schema.content_block import ContentBlock
 from langflow.schema.content_types import TextContent, ToolContent
 from langflow.schema.message import Message
@@ -261,3 +262,67 @@ async def test_component_streaming_message():
             tokens.append(event)
 
     assert len(tokens) > 0
+
+
+@pytest.mark.usefixtures("client")
+async def test_component_partial_message_updates_are_materialized_once():
+    """Test that the updates of a partial message are coalesced and the full message is written at the end."""
+    component = ComponentForTesting()
+    message = Message(
+        sender="test_sender",
+        session_id="partial_session",
+        sender_name="test_sender_name",
+        text="",
+        properties=Properties(state="partial"),
+    )
+    message = await component.send_message(message)
+    assert component._message_writer is not None
+    component._message_writer.interval = 60
+
+    message.text += "Hello"
+    message = await component.send_message(message)
+    message.text += " World"
+    message.content_blocks = [ContentBlock(title="Agent Steps", contents=[TextContent(type="text", text="Step")])]
+    message = await component.send_message(message)
+
+    stored_messages = await aget_messages(session_id="partial_session")
+    assert stored_messages[0].text == ""
+
+    message.properties.state = "complete"
+    message = await component._materialize_message(message)
+    stored_messages = await aget_messages(session_id="partial_session")
+    assert len(stored_messages) == 1
+    assert stored_messages[0].text == "Hello World"
+    assert stored_messages[0].properties.state == "complete"
+    assert stored_messages[0].content_blocks[0].contents[0].text == "Step"
+
+
+@pytest.mark.usefixtures("client")
+async def test_component_failed_build_discards_the_partial_message_update():
+    """Test that a build that fails after a partial update does not leave the update to the next build."""
+
+    class FailingComponent(ComponentForTesting):
+        async def get_text(self) -> str:
+            message = await self.send_message(
+                Message(
+                    sender="test_sender",
+                    sender_name="test_sender_name",
+                    session_id="failed_session",
+                    text="",
+                    properties={"state": "partial"},
+                )
+            )
+            message.text = "Half written"
+            await self.send_message(message)
+            assert self._message_writer is not None
+            msg = "Build failed"
+            raise ValueError(msg)
+
+    component = FailingComponent()
+    component.outputs = [Output(name="text_output", method="get_text")]
+    component._outputs_map = {"text_output": component.outputs[0]}
+
+    with pytest.raises(ValueError, match="Build failed"):
+        await component._build_results()
+
+    assert component._message_writer is None
@@ -0,0 +1,79 @@
+import pytest
+from langflow.custom.eval import ComponentClassCache, eval_custom_component_code, get_code_hash
+
+CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class EchoComponent(Component):
+    inputs = [MessageTextInput(name="input_value")]
+    outputs = [Output(name="message", method="echo")]
+
+    def echo(self) -> Message:
+        return Message(text=self.input_value)
+"""
+
+
+def test_same_code_compiles_once():
+    cache = ComponentClassCache(maxsize=4)
+
+    first = cache.get_or_create(CODE)
+    second = cache.get_or_create(CODE)
+
+    assert first is second
+    assert first.__name__ == "EchoComponent"
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_different_code_compiles_a_new_class():
+    cache = ComponentClassCache(maxsize=4)
+
+    first = cache.get_or_create(CODE)
+    second = cache.get_or_create(CODE + "\n# changed\n")
+
+    assert first is not second
+    assert cache.misses == 2
+
+
+def test_least_recently_used_class_is_evicted():
+    cache = ComponentClassCache(maxsize=1)
+
+    first = cache.get_or_create(CODE)
+    cache.get_or_create(CODE + "\n# changed\n")
+
+    assert len(cache) == 1
+    assert cache.get_or_create(CODE) is not first
+
+
+def test_disabled_cache_always_compiles():
+    cache = ComponentClassCache(maxsize=0)
+
+    assert cache.get_or_create(CODE) is not cache.get_or_create(CODE)
+    assert len(cache) == 0
+
+
+def test_errors_are_not_cached():
+    cache = ComponentClassCache(maxsize=4)
+
+    with pytest.raises(ValueError, match="Name error"):
+        cache.get_or_create(CODE.replace("    inputs = [", "    broken = undefined_name\n    inputs = ["))
+
+    assert len(cache) == 0
+
+
+def test_warm_up_skips_invalid_and_cached_code():
+    cache = ComponentClassCache(maxsize=4)
+    cache.get_or_create(CODE)
+
+    compiled = cache.warm_up([CODE, "class Broken(:\n    pass", CODE + "\n# changed\n"])
+
+    assert compiled == 1
+    assert len(cache) == 2
+
+
+def test_eval_custom_component_code_reuses_classes():
+    assert eval_custom_component_code(CODE) is eval_custom_component_code(CODE)
+    assert get_code_hash(CODE) != get_code_hash(CODE + " ")
@@ -0,0 +1,104 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from langflow.custom.custom_component.component import Component
+from langflow.custom.result_cache import component_result_cache, fingerprint_inputs
+from langflow.graph import Graph
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+from langflow.services.cache.base import AsyncBaseCacheService
+from langflow.services.cache.disk import AsyncDiskCache
+
+
+class CountingComponent(Component):
+    cache_results = True
+    builds = 0
+
+    inputs = [MessageTextInput(name="input_value")]
+    outputs = [Output(name="message", method="build_message")]
+
+    def build_message(self) -> Message:
+        type(self).builds += 1
+        return Message(text=f"{self.input_value}!")
+
+
+@pytest.fixture
+def result_cache():
+    CountingComponent.builds = 0
+    component_result_cache.configure(max_bytes=1024 * 1024, ttl=60)
+    yield component_result_cache
+    component_result_cache.reset()
+
+
+async def build(input_value: str) -> Message:
+    graph = Graph(flow_id="flow")
+    graph.add_component(CountingComponent(_id="counting", input_value=input_value))
+    graph.prepare()
+    result = await graph.build_vertex("counting", inputs_dict={})
+    return result.vertex.results["message"]
+
+
+def test_fingerprint_ignores_the_volatile_fields_of_messages():
+    first = fingerprint_inputs({"input_value": Message(text="hi")})
+    second = fingerprint_inputs({"input_value": Message(text="hi")})
+
+    assert first is not None
+    assert first == second
+    assert first != fingerprint_inputs({"input_value": Message(text="hello")})
+    assert first != fingerprint_inputs({"input_value": Message(text="hi")}, outputs=["message"])
+
+
+def test_inputs_without_a_canonical_form_are_not_fingerprinted():
+    assert fingerprint_inputs({"client": object()}) is None
+
+
+async def test_results_are_reused_while_the_inputs_do_not_change(result_cache):
+    assert (await build("hi")).text == "hi!"
+    assert (await build("hi")).text == "hi!"
+    assert CountingComponent.builds == 1
+    assert result_cache.hits == 1
+
+    assert (await build("hello")).text == "hello!"
+    assert CountingComponent.builds == 2
+
+
+async def test_expired_results_are_built_again(result_cache):
+    result_cache.configure(max_bytes=1024 * 1024, ttl=-1)
+
+    await build("hi")
+    await build("hi")
+
+    assert CountingComponent.builds == 2
+
+
+async def test_results_larger_than_the_memory_tier_are_not_kept(result_cache):
+    result_cache.configure(max_bytes=16, ttl=60)
+
+    await build("hi")
+    await build("hi")
+
+    assert CountingComponent.builds == 2
+
+
+async def test_disk_tier_outlives_the_memory_tier(result_cache, tmp_path):
+    result_cache.configure(max_bytes=0, ttl=60, backend=AsyncDiskCache(tmp_path, persistent=True))
+    await build("hi")
+
+    # The same worker after a restart, or another worker
+    result_cache.reset()
+    result_cache.configure(max_bytes=1024 * 1024, ttl=60, backend=AsyncDiskCache(tmp_path, persistent=True))
+
+    assert (await build("hi")).text == "hi!"
+    assert CountingComponent.builds == 1
+
+
+async def test_backend_errors_do_not_fail_the_build(result_cache):
+    backend = AsyncMock(spec=AsyncBaseCacheService)
+    backend.get.side_effect = ConnectionError("backend is down")
+    backend.set.side_effect = ConnectionError("backend is down")
+    result_cache.configure(max_bytes=1024 * 1024, ttl=60, backend=backend)
+
+    assert (await build("hi")).text == "hi!"
+    assert (await build("hi")).text == "hi!"
+    assert CountingComponent.builds == 1
+    backend.set.assert_awaited_once()
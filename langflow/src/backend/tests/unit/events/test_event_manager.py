@@ -4,8 +4,9 @@ import time
 import uuid
 
 import pytest
-from langflow.events.event_manager import EventManager
+from langflow.events.event_manager import EventManager, TokenCoalescer
 from langflow.schema.log import LoggableType
+from langflow.schema.playground_events import TokenEvent
 
 
 class TestEventManager:
@@ -210,3 +211,70 @@ class TestEventManager:
         # Accessing a non-registered event callback should return the 'noop' function
         callback = event_manager.on_non_existing_event
         assert callback.__name__ == "noop"
+
+
+def token_events(queue: asyncio.Queue) -> list[dict]:
+    events = []
+    while not queue.empty():
+        _, str_data, _ = queue.get_nowait()
+        events.append(json.loads(str_data.decode("utf-8")))
+    return events
+
+
+class TestTokenCoalescer:
+    def test_token_event_matches_playground_event(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+        message_id = uuid.uuid4()
+
+        manager.on_token(data={"chunk": "Hello", "id": message_id})
+
+        [event] = token_events(queue)
+        expected = TokenEvent(chunk="Hello", id=str(message_id)).model_dump()
+        assert event["event"] == "token"
+        assert event["data"].keys() == expected.keys()
+        assert event["data"]["chunk"] == "Hello"
+        assert event["data"]["id"] == str(message_id)
+
+    async def test_frames_are_sent_by_size(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+        tokens = TokenCoalescer(manager, "message-id", frame_size=6, frame_interval=60)
+
+        for chunk in ["Hel", "lo", " ", "World", "!"]:
+            tokens.push(chunk)
+
+        assert [event["data"]["chunk"] for event in token_events(queue)] == ["Hello ", "World!"]
+        assert tokens.close() == "Hello World!"
+        assert tokens.frames_sent == 2
+
+    async def test_frames_are_sent_after_interval(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+        tokens = TokenCoalescer(manager, "message-id", frame_size=1000, frame_interval=0.01)
+
+        tokens.push("Hello")
+        tokens.push(" World")
+        assert queue.empty()
+
+        await asyncio.sleep(0.05)
+
+        assert [event["data"]["chunk"] for event in token_events(queue)] == ["Hello World"]
+        tokens.push("!")
+        assert tokens.close() == "Hello World!"
+        assert [event["data"]["chunk"] for event in token_events(queue)] == ["!"]
+
+    async def test_frame_size_of_one_sends_every_token(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+        tokens = TokenCoalescer(manager, "message-id", frame_size=1, frame_interval=60)
+
+        for chunk in ["Hello", "", " ", "World"]:
+            tokens.push(chunk)
+
+        assert [event["data"]["chunk"] for event in token_events(queue)] == ["Hello", " ", "World"]
+        assert tokens.close() == "Hello World"
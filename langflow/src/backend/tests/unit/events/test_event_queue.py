@@ -0,0 +1,90 @@
+import asyncio
+import json
+import threading
+import time
+
+from langflow.events.event_manager import EventManager
+from langflow.events.event_queue import EventQueue
+
+
+def create_manager(queue: EventQueue) -> EventManager:
+    manager = EventManager(queue)
+    manager.register_event("on_token", "token")
+    manager.register_event("on_message", "add_message")
+    return manager
+
+
+def drain(queue: EventQueue) -> list[dict]:
+    events = []
+    while not queue.empty():
+        _, value, _ = queue.get_nowait()
+        events.append(json.loads(value))
+    return events
+
+
+class TestEventQueue:
+    async def test_tokens_are_merged_when_full(self):
+        queue = EventQueue(2, overflow_policy="merge")
+        manager = create_manager(queue)
+
+        manager.on_message(data={"text": "Hello"})
+        for chunk in ["Hel", "lo", " World"]:
+            manager.on_token(data={"chunk": chunk, "id": "message-1"})
+        manager.on_token(data={"chunk": "!", "id": "message-2"})
+
+        events = drain(queue)
+        assert [event["event"] for event in events] == ["add_message", "token", "token"]
+        assert events[1]["data"]["chunk"] == "Hello World"
+        assert events[2]["data"]["chunk"] == "!"
+        assert queue.merged == 2
+
+    async def test_tokens_are_dropped_when_full(self):
+        queue = EventQueue(1, overflow_policy="drop")
+        manager = create_manager(queue)
+
+        for chunk in ["Hello", " World"]:
+            manager.on_token(data={"chunk": chunk, "id": "message-1"})
+        manager.on_message(data={"text": "Hello World"})
+
+        assert [event["event"] for event in drain(queue)] == ["token", "add_message"]
+        assert queue.dropped == 1
+
+    async def test_put_waits_for_room(self):
+        queue = EventQueue(1)
+        await queue.put(("first", b"1", time.time()))
+        put = asyncio.create_task(queue.put(("second", b"2", time.time())))
+        await asyncio.sleep(0.01)
+        assert not put.done()
+
+        assert (await queue.get())[0] == "first"
+        await put
+        assert (await queue.get())[0] == "second"
+
+    async def test_put_gives_up_after_timeout(self):
+        queue = EventQueue(1, put_timeout=0.01)
+        await queue.put(("first", b"1", time.time()))
+        await queue.put(("second", b"2", time.time()))
+        # The end of the stream never waits
+        await queue.put((None, None, time.time()))
+        assert queue.qsize() == 3
+
+    async def test_threads_wait_for_room(self):
+        queue = EventQueue(1)
+        manager = create_manager(queue)
+        sent = threading.Event()
+
+        def send():
+            manager.on_message(data={"text": "first"})
+            manager.on_message(data={"text": "second"})
+            sent.set()
+
+        thread = asyncio.create_task(asyncio.to_thread(send))
+        await asyncio.sleep(0.05)
+        assert not sent.is_set()
+        assert queue.qsize() == 1
+
+        _, value, _ = await queue.get()
+        assert json.loads(value)["data"]["text"] == "first"
+        await thread
+        _, value, _ = await queue.get()
+        assert json.loads(value)["data"]["text"] == "second"
@@ -0,0 +1,190 @@
+from unittest.mock import patch
+
+import pytest
+from langflow.custom.custom_component.component import Component
+from langflow.graph import Graph
+from langflow.graph.graph.checkpoint import (
+    GraphCheckpointer,
+    cache_legacy_run,
+    decode_checkpoint,
+    encode_checkpoint,
+    frozen_result_key,
+    get_legacy_run_key,
+    load_graph_checkpoint,
+    manifest_key,
+    run_cache_key,
+    vertex_checkpoint_key,
+)
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.chat.service import ChatService
+
+
+class EchoComponent(Component):
+    display_name = "Echo"
+
+    inputs = [MessageTextInput(name="input_value", display_name="Input")]
+    outputs = [Output(display_name="Message", name="message", method="echo")]
+
+    def echo(self) -> Message:
+        return Message(text=f"{self.input_value}!")
+
+
+@pytest.fixture
+def chat_service(tmp_path):
+    service = ChatService()
+    service.cache_service = AsyncDiskCache(cache_dir=tmp_path)
+    return service
+
+
+def build_graph(run_id: str = "00000000-0000-0000-0000-000000000001") -> Graph:
+    graph = Graph(flow_id="flow")
+    graph.add_component(EchoComponent(_id="first", input_value="hi"))
+    graph.add_component(EchoComponent(_id="second"))
+    graph.add_component_edge("first", ("message", "input_value"), "second")
+    graph.prepare()
+    graph.set_run_id(run_id)
+    return graph
+
+
+@pytest.fixture
+def graph():
+    return build_graph()
+
+
+def test_encode_decode_roundtrip():
+    blob = encode_checkpoint({"a": {1, 2}, "b": [Message(text="x")]})
+
+    assert blob.startswith(b"LFCP")
+    assert decode_checkpoint(blob) == {"a": {1, 2}, "b": [Message(text="x")]}
+
+
+def test_decode_rejects_foreign_blobs():
+    with pytest.raises(ValueError, match="Invalid graph checkpoint"):
+        decode_checkpoint(b"not a checkpoint")
+
+
+async def test_save_writes_only_changed_vertices(chat_service, graph):
+    checkpointer = GraphCheckpointer(chat_service, "flow")
+    await checkpointer.save_base(graph)
+
+    await graph.build_vertex("first", inputs_dict={})
+    graph.run_manager.remove_vertex_from_runnables("first")
+    await checkpointer.save(graph, ["first"])
+
+    assert await chat_service.cache_service.contains(vertex_checkpoint_key("flow", "first"))
+    assert not await chat_service.cache_service.contains(vertex_checkpoint_key("flow", "second"))
+    manifest = decode_checkpoint((await chat_service.get_cache(manifest_key("flow")))["result"])
+    assert manifest["vertices"] == ["first"]
+    assert manifest["run_id"] == graph._run_id
+
+
+async def test_load_restores_vertex_results_lazily(chat_service, graph):
+    checkpointer = GraphCheckpointer(chat_service, "flow")
+    await checkpointer.save_base(graph)
+    await graph.build_vertex("first", inputs_dict={})
+    graph.run_manager.remove_vertex_from_runnables("first")
+    await checkpointer.save(graph, ["first"])
+
+    loaded = await load_graph_checkpoint(chat_service, "flow")
+
+    assert "first" in loaded._pending_vertex_checkpoints
+    assert "first" not in loaded.run_manager.vertices_being_run
+    vertex = loaded.get_vertex("first")
+    assert not loaded._pending_vertex_checkpoints
+    assert vertex.built
+    assert vertex.results["message"].text == "hi!"
+    assert loaded.checkpointer.checkpointed_vertices == {"first"}
+
+
+async def test_load_ignores_deltas_from_previous_run(chat_service, graph):
+    checkpointer = GraphCheckpointer(chat_service, "flow")
+    await checkpointer.save_base(graph)
+    await graph.build_vertex("first", inputs_dict={})
+    await checkpointer.save(graph, ["first"])
+
+    graph.set_run_id("00000000-0000-0000-0000-000000000002")
+    await chat_service.set_cache("flow", graph)
+
+    loaded = await load_graph_checkpoint(chat_service, "flow")
+
+    assert not loaded._pending_vertex_checkpoints
+
+
+def test_runs_of_a_flow_have_their_own_cache_key(graph):
+    other_run = build_graph("00000000-0000-0000-0000-000000000002")
+
+    assert graph.checkpointer.key == run_cache_key("flow", "00000000-0000-0000-0000-000000000001")
+    assert other_run.checkpointer.key == run_cache_key("flow", "00000000-0000-0000-0000-000000000002")
+
+
+async def test_clear_deletes_the_run(chat_service, graph):
+    checkpointer = GraphCheckpointer(chat_service, run_cache_key("flow", graph.run_id))
+    await checkpointer.save_base(graph)
+    await graph.build_vertex("first", inputs_dict={})
+    await checkpointer.save(graph, ["first"])
+
+    await checkpointer.clear()
+
+    for key in (checkpointer.key, manifest_key(checkpointer.key), vertex_checkpoint_key(checkpointer.key, "first")):
+        assert not await chat_service.cache_service.contains(key)
+        assert key not in chat_service.async_cache_locks
+    assert not checkpointer.has_base
+
+
+async def test_load_keeps_the_checkpoints_under_the_loaded_key(chat_service, graph):
+    await chat_service.set_cache("flow", graph)
+
+    loaded = await load_graph_checkpoint(chat_service, "flow")
+
+    assert loaded.checkpointer.key == "flow"
+    assert loaded.checkpointer.has_base
+
+
+async def test_frozen_results_are_shared_by_the_runs_of_a_flow(chat_service, graph):
+    other_run = build_graph("00000000-0000-0000-0000-000000000002")
+    for run in (graph, other_run):
+        run.get_vertex("first").frozen = True
+
+    await graph.build_vertex(
+        "first", inputs_dict={}, get_cache=chat_service.get_cache, set_cache=chat_service.set_cache
+    )
+    result = await other_run.build_vertex(
+        "first", inputs_dict={}, get_cache=chat_service.get_cache, set_cache=chat_service.set_cache
+    )
+
+    assert await chat_service.cache_service.contains(frozen_result_key("flow", "first"))
+    assert result.vertex.result.used_frozen_result
+    assert result.vertex.results["message"].text == "hi!"
+
+
+async def test_frozen_results_are_not_shared_across_versions_of_a_flow(chat_service, graph):
+    edited = build_graph("00000000-0000-0000-0000-000000000002")
+    graph.flow_version = "2024-01-01T00:00:00"
+    edited.flow_version = "2024-01-02T00:00:00"
+    for run in (graph, edited):
+        run.get_vertex("first").frozen = True
+
+    await graph.build_vertex(
+        "first", inputs_dict={}, get_cache=chat_service.get_cache, set_cache=chat_service.set_cache
+    )
+    result = await edited.build_vertex(
+        "first", inputs_dict={}, get_cache=chat_service.get_cache, set_cache=chat_service.set_cache
+    )
+
+    assert graph.frozen_result_key("first") == frozen_result_key("flow", "first", "2024-01-01T00:00:00")
+    assert not result.vertex.result.used_frozen_result
+
+
+async def test_legacy_runs_are_found_by_flow_or_run_id(chat_service, graph):
+    later_run = build_graph("00000000-0000-0000-0000-000000000002")
+    with patch("langflow.graph.graph.base.get_chat_service", return_value=chat_service):
+        await cache_legacy_run(chat_service, graph)
+        await cache_legacy_run(chat_service, later_run)
+
+    assert await get_legacy_run_key(chat_service, "flow") == later_run.checkpointer.key
+    assert await get_legacy_run_key(chat_service, "flow", graph.run_id) == graph.checkpointer.key
+    loaded = await load_graph_checkpoint(chat_service, await get_legacy_run_key(chat_service, "flow"))
+    assert loaded.run_id == later_run.run_id
+    assert not await chat_service.cache_service.contains("flow")
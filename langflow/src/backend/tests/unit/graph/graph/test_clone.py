@@ -0,0 +1,33 @@
+from langflow.components.input_output import ChatInput, ChatOutput
+from langflow.graph import Graph
+
+
+def build_graph() -> Graph:
+    chat_input = ChatInput(_id="chat_input", input_value="hello", should_store_message=False)
+    chat_output = ChatOutput(_id="chat_output", should_store_message=False)
+    chat_output.set(input_value=chat_input.message_response)
+    return Graph(chat_input, chat_output)
+
+
+async def test_clone_runs_independently_of_the_original():
+    graph = build_graph()
+
+    clone = graph.clone(user_id="other")
+    await clone.process(fallback_to_env_vars=False)
+
+    assert clone.user_id == "other"
+    assert clone.get_vertex("chat_output").built
+    assert clone.get_vertex("chat_output").results["message"].text == "hello"
+    assert not graph.get_vertex("chat_output").built
+    assert not graph.get_vertex("chat_output").results
+
+
+def test_clone_does_not_share_run_state():
+    graph = build_graph()
+
+    clone = graph.clone()
+
+    assert clone.run_manager is not graph.run_manager
+    assert clone.predecessor_map == graph.predecessor_map
+    assert clone.predecessor_map["chat_output"] is not graph.predecessor_map["chat_output"]
+    assert clone.get_vertex("chat_output").params["input_value"] is clone.get_vertex("chat_input")
@@ -0,0 +1,97 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from langflow.interface import component_index
+from langflow.interface import components as components_module
+from langflow.interface.component_index import ComponentIndex, hash_base_packages
+from langflow.interface.components import import_langflow_components
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return tmp_path / "component_index.json"
+
+
+@pytest.fixture
+def use_index(index_path):
+    with patch.object(components_module, "_load_component_index", side_effect=lambda: ComponentIndex.load(index_path)):
+        yield
+
+
+@pytest.fixture
+def processed_modules():
+    processed = []
+    process_single_module = components_module._process_single_module
+
+    def spy(modname):
+        processed.append(modname)
+        return process_single_module(modname)
+
+    with patch.object(components_module, "_process_single_module", side_effect=spy):
+        yield processed
+
+
+@pytest.mark.no_blockbuster
+@pytest.mark.usefixtures("use_index")
+async def test_unchanged_modules_are_read_from_the_index(index_path, processed_modules):
+    cold = await import_langflow_components()
+    assert index_path.exists()
+    indexed = ComponentIndex.load(index_path).modules
+    assert indexed
+
+    processed_modules.clear()
+    warm = await import_langflow_components()
+
+    assert warm == cold
+    assert not set(processed_modules) & set(indexed)
+
+
+@pytest.mark.no_blockbuster
+@pytest.mark.usefixtures("use_index")
+async def test_changed_modules_are_processed_again(index_path, processed_modules):
+    cold = await import_langflow_components()
+    data = json.loads(index_path.read_text())
+    modname, entry = next((name, entry) for name, entry in data["modules"].items() if entry["components"])
+    entry["hash"] = "stale"
+    index_path.write_text(json.dumps(data))
+
+    processed_modules.clear()
+    warm = await import_langflow_components()
+
+    assert warm == cold
+    assert modname in processed_modules
+    assert ComponentIndex.load(index_path).modules[modname]["hash"] != "stale"
+
+
+def test_index_of_another_version_is_discarded(index_path):
+    index = ComponentIndex(index_path)
+    index.set("langflow.components.example", "hash", "example", {"Example": {}})
+    index.save()
+    assert ComponentIndex.load(index_path).get("langflow.components.example", "hash") == ("example", {"Example": {}})
+
+    with patch("langflow.interface.component_index.get_index_key", return_value="another-version"):
+        assert ComponentIndex.load(index_path).modules == {}
+
+
+def test_invalid_index_is_ignored(index_path):
+    index_path.write_text("{not json")
+    assert ComponentIndex.load(index_path).modules == {}
+
+
+def test_index_key_changes_with_the_base_packages(tmp_path):
+    base = tmp_path / "base"
+    base.mkdir()
+    (base / "model.py").write_text("class Model: ...")
+    fake_module = tmp_path / "interface" / "component_index.py"
+    hash_base_packages.cache_clear()
+    try:
+        with patch.object(component_index, "__file__", str(fake_module)):
+            before = hash_base_packages()
+            hash_base_packages.cache_clear()
+            (base / "model.py").write_text("class Model:\n    cache_mode = 'Off'")
+            after = hash_base_packages()
+    finally:
+        hash_base_packages.cache_clear()
+
+    assert before != after
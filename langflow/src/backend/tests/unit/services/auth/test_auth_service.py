@@ -0,0 +1,113 @@
+from contextlib import asynccontextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from langflow.services.auth.service import AuthService
+from langflow.services.database.models.api_key.crud import check_key, delete_api_key
+from langflow.services.database.models.api_key.model import ApiKey
+from langflow.services.database.models.user.model import User
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+@pytest.fixture
+def settings():
+    return SimpleNamespace(
+        api_key_cache_ttl=60,
+        api_key_usage_flush_interval=60,
+        disable_track_apikey_usage=False,
+    )
+
+
+@pytest.fixture
+def service(async_session: AsyncSession, settings):
+    @asynccontextmanager
+    async def session_scope():
+        yield async_session
+
+    settings_service = SimpleNamespace(settings=settings)
+    service = AuthService(settings_service)
+    with (
+        patch("langflow.services.auth.service.session_scope", session_scope),
+        patch("langflow.services.database.models.api_key.crud.session_scope", session_scope),
+        patch("langflow.services.database.models.api_key.crud.get_settings_service", return_value=settings_service),
+        patch("langflow.services.database.models.api_key.crud.get_auth_service", return_value=service),
+    ):
+        yield service
+
+
+@pytest.fixture
+async def api_key(async_session: AsyncSession) -> ApiKey:
+    user = User(username="api-key-user", password="password", is_active=True)  # noqa: S106
+    api_key = ApiKey(api_key="sk-test", name="test", user=user)
+    async_session.add(api_key)
+    await async_session.commit()
+    await async_session.refresh(api_key)
+    return api_key
+
+
+async def get_usage(async_session: AsyncSession, api_key: ApiKey) -> tuple[int, datetime | None]:
+    query = select(ApiKey.total_uses, ApiKey.last_used_at).where(ApiKey.id == api_key.id)
+    return tuple((await async_session.exec(query)).one())
+
+
+@pytest.mark.usefixtures("service", "api_key")
+async def test_check_key_caches_the_user(async_session):
+    user = await check_key(async_session, "sk-test")
+    assert user.username == "api-key-user"
+
+    with patch.object(async_session, "exec", side_effect=AssertionError("check_key should not query")):
+        cached_user = await check_key(async_session, "sk-test")
+
+    assert cached_user.id == user.id
+    assert cached_user.username == user.username
+    assert await check_key(async_session, "sk-unknown") is None
+
+
+async def test_deleting_a_key_revokes_it(service, async_session, api_key):
+    assert await check_key(async_session, "sk-test") is not None
+
+    await delete_api_key(async_session, api_key.id)
+
+    assert service.get_cached_api_key("sk-test") is None
+    assert await check_key(async_session, "sk-test") is None
+
+
+@pytest.mark.usefixtures("service")
+async def test_uses_are_written_immediately_until_started(async_session, api_key):
+    await check_key(async_session, "sk-test")
+    await check_key(async_session, "sk-test")
+
+    total_uses, last_used_at = await get_usage(async_session, api_key)
+    assert total_uses == 2
+    assert last_used_at is not None
+
+
+async def test_uses_are_aggregated_until_flush(service, async_session, api_key):
+    service.start()
+    try:
+        for _ in range(5):
+            await check_key(async_session, "sk-test")
+        assert await get_usage(async_session, api_key) == (0, None)
+
+        await service.flush_api_key_usage()
+
+        total_uses, last_used_at = await get_usage(async_session, api_key)
+        assert total_uses == 5
+        assert last_used_at is not None
+    finally:
+        await service.stop()
+
+
+async def test_stop_flushes_pending_uses(service, async_session, api_key):
+    service.start()
+    for _ in range(3):
+        await check_key(async_session, "sk-test")
+
+    await service.stop()
+
+    assert not service.running
+    total_uses, _ = await get_usage(async_session, api_key)
+    assert total_uses == 3
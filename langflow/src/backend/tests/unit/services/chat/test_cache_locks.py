@@ -0,0 +1,96 @@
+import asyncio
+from threading import RLock
+
+from langflow.services.chat.service import CacheLocks
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_returns_the_same_lock_for_a_key():
+    locks = CacheLocks(asyncio.Lock, ttl=10)
+
+    assert locks["flow"] is locks["flow"]
+    assert locks["flow"] is not locks["other"]
+
+
+def test_drops_the_locks_unused_for_the_ttl():
+    timer = FakeTimer()
+    locks = CacheLocks(asyncio.Lock, ttl=10, timer=timer)
+    locks["old"]
+    timer.now = 5
+    locks["recent"]
+
+    timer.now = 12
+    locks["new"]
+
+    assert "old" not in locks
+    assert "recent" in locks
+
+
+def test_using_a_lock_postpones_its_expiry():
+    timer = FakeTimer()
+    locks = CacheLocks(asyncio.Lock, ttl=10, timer=timer)
+    lock = locks["flow"]
+
+    timer.now = 8
+    locks["flow"]
+    timer.now = 15
+
+    assert locks["flow"] is lock
+
+
+async def test_keeps_a_held_async_lock_past_the_ttl():
+    timer = FakeTimer()
+    locks = CacheLocks(asyncio.Lock, ttl=10, timer=timer)
+    lock = locks["flow"]
+
+    async with lock:
+        timer.now = 20
+        locks["other"]
+
+        assert locks["flow"] is lock
+
+
+def test_keeps_a_held_thread_lock_past_the_ttl():
+    timer = FakeTimer()
+    locks = CacheLocks(RLock, ttl=10, timer=timer)
+    lock = locks["flow"]
+    held = asyncio.run(_hold_in_thread(lock, timer, locks))
+
+    assert held is lock
+
+
+async def _hold_in_thread(lock, timer, locks):
+    # An RLock is reentrant, so it must be held by another thread to count as held.
+    acquired = asyncio.Event()
+    release = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def hold():
+        with lock:
+            loop.call_soon_threadsafe(acquired.set)
+            asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+
+    holder = asyncio.create_task(asyncio.to_thread(hold))
+    await acquired.wait()
+    timer.now = 20
+    locks["other"]
+    held = locks["flow"]
+    release.set()
+    await holder
+    return held
+
+
+def test_pop_removes_the_lock():
+    locks = CacheLocks(asyncio.Lock, ttl=10)
+    lock = locks["flow"]
+
+    assert locks.pop("flow") is lock
+    assert locks.pop("flow") is None
+    assert len(locks) == 0
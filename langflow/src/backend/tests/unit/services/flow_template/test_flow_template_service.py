@@ -0,0 +1,106 @@
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import call, patch
+from uuid import uuid4
+
+import pytest
+from langflow.graph.vertex.base import Vertex
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.flow_template.service import FlowTemplateService
+
+
+@pytest.fixture
+def flow():
+    data = json.loads(pytest.MEMORY_CHATBOT_NO_LLM.read_text(encoding="utf-8"))["data"]
+    return Flow(id=uuid4(), name="Memory Chatbot", data=data, updated_at=datetime.now(timezone.utc))
+
+
+def test_cached_template_is_cloned_for_every_run(flow):
+    service = FlowTemplateService()
+
+    first = service.get_graph(flow, user_id="user")
+    second = service.get_graph(flow, user_id="user")
+
+    assert service.hits == 1
+    assert service.misses == 1
+    assert first is not second
+    assert [vertex.id for vertex in first.vertices] == [vertex.id for vertex in second.vertices]
+    for vertex in second.vertices:
+        assert vertex is not first.get_vertex(vertex.id)
+        assert vertex.graph is second
+        assert vertex.custom_component is not first.get_vertex(vertex.id).custom_component
+        assert vertex.custom_component._vertex is vertex
+        for value in vertex.params.values():
+            if isinstance(value, Vertex):
+                assert value is second.get_vertex(value.id)
+
+
+def test_lookups_are_exported_as_metrics(flow):
+    service = FlowTemplateService()
+
+    with patch.object(service.ot, "increment_counter") as increment_counter:
+        service.get_graph(flow)
+        service.get_graph(flow)
+
+    assert increment_counter.call_args_list == [
+        call("flow_template_requests", {"result": "miss"}),
+        call("flow_template_requests", {"result": "hit"}),
+    ]
+
+
+def test_tweaks_are_part_of_the_key(flow):
+    service = FlowTemplateService()
+
+    graph = service.get_graph(flow, {"ChatInput-vsgM1": {"input_value": "tweaked"}})
+    service.get_graph(flow, {"ChatInput-vsgM1": {"input_value": "other"}})
+
+    assert service.misses == 2
+    assert graph.get_vertex("ChatInput-vsgM1").params["input_value"] == "tweaked"
+    chat_input = next(node for node in flow.data["nodes"] if node["id"] == "ChatInput-vsgM1")
+    assert chat_input["data"]["node"]["template"]["input_value"]["value"] != "tweaked"
+
+
+def test_updated_flow_replaces_previous_template(flow):
+    service = FlowTemplateService()
+    service.get_graph(flow)
+
+    flow.updated_at += timedelta(seconds=1)
+    service.get_graph(flow)
+
+    assert service.misses == 2
+    assert service.invalidations == 1
+    assert service.stats()["size"] == 1
+
+
+def test_invalidate_drops_templates_of_the_flow(flow):
+    service = FlowTemplateService()
+    service.get_graph(flow)
+    service.get_graph(flow, {"ChatInput-vsgM1": {"input_value": "tweaked"}})
+
+    service.invalidate(flow.id)
+    service.get_graph(flow)
+
+    assert service.invalidations == 2
+    assert service.hits == 0
+
+
+def test_least_recently_used_template_is_evicted(flow):
+    service = FlowTemplateService(max_size=1)
+    other_flow = Flow(id=uuid4(), name="Other", data=flow.data, updated_at=flow.updated_at)
+
+    service.get_graph(flow)
+    service.get_graph(other_flow)
+    service.get_graph(flow)
+
+    assert service.evictions == 2
+    assert service.hits == 0
+
+
+def test_disabled_cache_keeps_nothing(flow):
+    service = FlowTemplateService(max_size=0)
+
+    service.get_graph(flow)
+    service.get_graph(flow)
+
+    assert service.stats()["size"] == 0
+    assert service.misses == 2
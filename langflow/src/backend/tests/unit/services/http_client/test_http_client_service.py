@@ -0,0 +1,86 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import respx
+from httpx import Response
+from langflow.services.http_client.service import HttpClientService
+
+
+@pytest.fixture
+async def service():
+    settings = SimpleNamespace(
+        http_client_http2=True,
+        http_client_max_connections_per_host=5,
+        http_client_keepalive_expiry=30,
+        http_client_timeout=10,
+        http_client_max_hosts=2,
+        http_client_metric_hosts=["example.com"],
+        store_url="https://api.langflow.store",
+        download_webhook_url=None,
+        like_webhook_url=None,
+        prometheus_enabled=False,
+    )
+    service = HttpClientService(SimpleNamespace(settings=settings))
+    yield service
+    await service.teardown()
+
+
+async def test_clients_are_shared_by_host_and_policy(service):
+    client = service.get_client("https://example.com/a")
+
+    assert service.get_client("https://example.com/b?q=1") is client
+    assert service.get_client("http://example.com/a") is not client
+    assert service.get_client("https://example.com/a", verify=False) is not client
+
+
+async def test_least_recently_used_hosts_are_closed(service):
+    with patch("langflow.services.http_client.service.EVICTED_CLIENT_GRACE_PERIOD", 0):
+        first = service.get_client("https://first.example.com")
+        second = service.get_client("https://second.example.com")
+        assert service.get_client("https://first.example.com") is first
+
+        service.get_client("https://third.example.com")
+        await asyncio.gather(*service._closing)
+
+    assert not first.is_closed
+    assert second.is_closed
+    assert service.get_client("https://second.example.com") is not second
+
+
+@respx.mock
+async def test_responses_are_measured_and_cookies_are_not_kept(service):
+    respx.get("https://example.com/login").mock(return_value=Response(200, headers={"Set-Cookie": "session=secret"}))
+    client = service.get_client("https://example.com")
+
+    with (
+        patch.object(service.ot, "increment_counter") as increment_counter,
+        patch.object(service.ot, "observe_histogram") as observe_histogram,
+    ):
+        response = await client.get("https://example.com/login")
+
+    assert response.status_code == 200
+    assert not client.cookies
+    increment_counter.assert_called_once_with("http_client_requests", {"host": "example.com", "status": "2xx"})
+    assert observe_histogram.call_args.args[0] == "http_client_response_latency"
+
+
+@respx.mock
+async def test_unknown_hosts_share_a_metric_label(service):
+    respx.get("https://unknown.example.org/").mock(return_value=Response(404))
+    client = service.get_client("https://unknown.example.org")
+
+    with patch.object(service.ot, "increment_counter") as increment_counter:
+        await client.get("https://unknown.example.org/")
+
+    assert service.metric_hosts == {"example.com", "api.langflow.store"}
+    increment_counter.assert_called_once_with("http_client_requests", {"host": "other", "status": "4xx"})
+
+
+async def test_teardown_closes_the_clients(service):
+    client = service.get_client("https://example.com")
+
+    await service.teardown()
+
+    assert client.is_closed
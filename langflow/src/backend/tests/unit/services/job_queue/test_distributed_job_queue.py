@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+from langflow.services.job_queue.event_store import (
+    JOB_STATUS_CANCELLED,
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    InMemoryJobEventStore,
+)
+from langflow.services.job_queue.service import DistributedJobQueueService, JobQueueNotFoundError
+
+
+@pytest.fixture
+def event_store():
+    return InMemoryJobEventStore()
+
+
+@pytest.fixture
+async def workers(event_store):
+    """Two services sharing the same store, as two workers sharing the same Redis would."""
+    services = [DistributedJobQueueService(event_store, cancel_timeout=2), DistributedJobQueueService(event_store)]
+    for service in services:
+        service.start()
+    yield services
+    for service in services:
+        await service.stop()
+
+
+async def start_job(
+    service: DistributedJobQueueService, job_id: str, *, tokens: int = 3, wait: asyncio.Event | None = None
+):
+    _, event_manager = service.create_queue(job_id)
+    await service.register_job(job_id)
+
+    async def build():
+        for i in range(tokens):
+            event_manager.on_token(data={"chunk": str(i)})
+        if wait is not None:
+            await wait.wait()
+        event_manager.on_end(data={})
+        await event_manager.queue.put((None, None, 0))
+
+    service.start_job(job_id, build())
+
+
+async def wait_for_status(service: DistributedJobQueueService, job_id: str, status: str) -> None:
+    for _ in range(100):
+        if await service.get_job_status(job_id) == status:
+            return
+        await asyncio.sleep(0.01)
+    pytest.fail(f"Job {job_id} never reached status {status}")
+
+
+async def test_any_worker_serves_the_events(workers):
+    owner, other = workers
+    await start_job(owner, "job")
+    await wait_for_status(other, "job", JOB_STATUS_COMPLETED)
+
+    events = [value async for _, value in other.stream_events("job")]
+
+    assert [b'"token"' in event for event in events] == [True, True, True, False]
+    assert b'"end"' in events[-1]
+    assert "job" not in owner._queues
+
+
+async def test_polling_resumes_after_the_last_delivered_event(workers):
+    owner, other = workers
+    wait = asyncio.Event()
+    await start_job(owner, "job", wait=wait)
+
+    first = []
+    while len(first) < 3:
+        first += await other.read_events("job", block=1)
+    wait.set()
+    await wait_for_status(owner, "job", JOB_STATUS_COMPLETED)
+    rest = await owner.read_events("job")
+
+    assert len(first) == 3
+    assert [value is None for _, value in rest] == [False, True]
+    # An explicit event id replays the events after it
+    replayed = await other.read_events("job", first[0][0])
+    assert [event_id for event_id, _ in replayed] == [event_id for event_id, _ in first[1:] + rest]
+
+
+async def test_any_worker_cancels_the_job(workers):
+    owner, other = workers
+    await start_job(owner, "job", wait=asyncio.Event())
+    _, _, task, _ = owner.get_queue_data("job")
+
+    assert await other.cancel_job("job")
+
+    assert task.cancelled()
+    assert await other.get_job_status("job") == JOB_STATUS_CANCELLED
+    assert "job" not in owner._queues
+
+
+async def test_failed_job(workers):
+    owner, _ = workers
+    _, event_manager = owner.create_queue("job")
+    await owner.register_job("job")
+
+    async def build():
+        event_manager.on_token(data={"chunk": "0"})
+        msg = "boom"
+        raise ValueError(msg)
+
+    owner.start_job("job", build())
+    await wait_for_status(owner, "job", JOB_STATUS_FAILED)
+
+    events = [value async for _, value in owner.stream_events("job")]
+    assert len(events) == 1
+
+
+async def test_unknown_job(workers):
+    _, other = workers
+    with pytest.raises(JobQueueNotFoundError):
+        await other.read_events("missing")
+    with pytest.raises(JobQueueNotFoundError):
+        await other.cancel_job("missing")
+
+
+async def test_finished_jobs_expire(workers, event_store):
+    owner, other = workers
+    event_store.retention = 0
+    await start_job(owner, "job")
+    for _ in range(100):
+        if "job" not in owner._queues:
+            break
+        await asyncio.sleep(0.01)
+
+    assert await event_store.cleanup() == 1
+    with pytest.raises(JobQueueNotFoundError):
+        await other.read_events("job")
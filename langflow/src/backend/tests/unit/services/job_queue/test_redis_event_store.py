@@ -0,0 +1,55 @@
+import pytest
+from fakeredis import FakeAsyncRedis
+from langflow.services.job_queue.event_store import JOB_STATUS_COMPLETED, JOB_STATUS_RUNNING, RedisJobEventStore
+
+
+@pytest.fixture
+async def event_store():
+    store = RedisJobEventStore(prefix="test:jobs", retention=60, max_events=100)
+    store._client = FakeAsyncRedis()
+    yield store
+    await store.close()
+
+
+async def test_jobs_are_created_and_finished(event_store):
+    await event_store.create("job", owner="worker-1")
+    assert await event_store.get_status("job") == JOB_STATUS_RUNNING
+
+    await event_store.finish("job", JOB_STATUS_COMPLETED)
+
+    assert await event_store.get_status("job") == JOB_STATUS_COMPLETED
+    assert await event_store.get_status("unknown") is None
+
+
+async def test_events_are_read_after_an_event_id(event_store):
+    await event_store.create("job", owner="worker-1")
+    event_ids = await event_store.append("job", [b"first", b"second", None])
+
+    assert await event_store.read("job", "0") == [
+        (event_ids[0], b"first"),
+        (event_ids[1], b"second"),
+        (event_ids[2], None),
+    ]
+    assert await event_store.read("job", event_ids[1]) == [(event_ids[2], None)]
+    assert await event_store.read("job", event_ids[2], block=0.01) == []
+
+    await event_store.set_cursor("job", event_ids[0])
+    assert await event_store.get_cursor("job") == event_ids[0]
+
+
+async def test_cancel_requests_are_read_by_every_worker(event_store):
+    await event_store.request_cancel("job")
+    await event_store.request_cancel("other-job")
+
+    requests = await event_store.read_cancel_requests("0")
+
+    assert [job_id for _, job_id in requests] == ["job", "other-job"]
+    assert await event_store.read_cancel_requests(requests[0][0]) == requests[1:]
+
+
+async def test_job_keys_expire_after_the_retention(event_store):
+    await event_store.create("job", owner="worker-1")
+    await event_store.append("job", [b"first"])
+
+    assert 0 < await event_store._client.ttl(event_store._meta_key("job")) <= 60
+    assert 0 < await event_store._client.ttl(event_store._events_key("job")) <= 60
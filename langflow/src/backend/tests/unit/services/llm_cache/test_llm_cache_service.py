@@ -0,0 +1,114 @@
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import HumanMessage, SystemMessage
+from langflow.base.models.model import LCModelComponent
+from langflow.services.llm_cache.service import LLMCacheService
+
+VOCABULARY = ["what", "is", "the", "capital", "of", "france", "germany", "weather", "today"]
+
+
+class BagOfWordsEmbeddings(Embeddings):
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        words = re.findall(r"\w+", text.lower())
+        return [float(words.count(word)) for word in VOCABULARY]
+
+
+class ModelComponent(LCModelComponent):
+    inputs = LCModelComponent._base_inputs
+
+    def build_model(self):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def service():
+    settings = SimpleNamespace(llm_cache_max_entries=100, llm_cache_similarity_threshold=0.9, prometheus_enabled=False)
+    return LLMCacheService(SimpleNamespace(settings=settings))
+
+
+def question(text: str) -> list:
+    return [SystemMessage(content="Answer briefly."), HumanMessage(content=text)]
+
+
+async def test_exact_mode_reuses_responses_to_the_same_messages_and_parameters(service):
+    model = FakeListChatModel(responses=["Paris"])
+    request = service.build_request(model, question("What is the capital of France?"), mode="Exact", ttl=60)
+
+    assert await service.get(request) is None
+    await service.set(request, "Paris")
+
+    same = service.build_request(model, question("What is the capital of France?"), mode="Exact", ttl=60)
+    assert await service.get(same) == "Paris"
+    other_model = FakeListChatModel(responses=["Berlin"])
+    other = service.build_request(other_model, question("What is the capital of France?"), mode="Exact", ttl=60)
+    assert await service.get(other) is None
+    assert service.hits["Exact"] == 1
+    assert service.hit_rate("Exact") == pytest.approx(1 / 3)
+
+
+async def test_responses_older_than_the_ttl_of_the_reader_are_not_reused(service):
+    model = FakeListChatModel(responses=["Paris"])
+    await service.set(service.build_request(model, question("France?"), mode="Exact", ttl=60), "Paris")
+
+    assert await service.get(service.build_request(model, question("France?"), mode="Exact", ttl=0)) is None
+    assert await service.get(service.build_request(model, question("France?"), mode="Exact", ttl=60)) == "Paris"
+
+
+async def test_semantic_mode_reuses_responses_to_similar_messages(service):
+    model = FakeListChatModel(responses=["Paris"])
+    embeddings = BagOfWordsEmbeddings()
+
+    def request(text):
+        return service.build_request(model, question(text), mode="Semantic", ttl=60, embeddings=embeddings)
+
+    await service.set(request("What is the capital of France?"), "Paris")
+
+    assert await service.get(request("what is the capital of france")) == "Paris"
+    assert await service.get(request("What is the capital of Germany?")) is None
+    assert await service.get(request("What is the weather today?")) is None
+
+
+async def test_disabled_service_caches_nothing():
+    settings = SimpleNamespace(llm_cache_max_entries=0, llm_cache_similarity_threshold=0.9, prometheus_enabled=False)
+    service = LLMCacheService(SimpleNamespace(settings=settings))
+
+    assert service.build_request(FakeListChatModel(responses=[]), question("France?"), mode="Exact", ttl=60) is None
+
+
+@pytest.mark.parametrize(("cache_mode", "expected"), [("Off", "second"), ("Exact", "first")])
+async def test_model_components_only_call_the_model_once_when_caching(service, cache_mode, expected):
+    model = FakeListChatModel(responses=["first", "second"])
+    component = ModelComponent(cache_mode=cache_mode, cache_ttl=60)
+
+    with patch("langflow.base.models.model.get_llm_cache_service", return_value=service):
+        first = await component._get_chat_result(runnable=model, stream=False, input_value="France?")
+        second = await component._get_chat_result(runnable=model, stream=False, input_value="France?")
+
+    assert first.text == "first"
+    assert second.text == expected
+
+
+async def test_flows_sending_the_same_prompt_do_not_share_responses(service):
+    def component_of(flow_id):
+        component = ModelComponent(_id="model-1", cache_mode="Semantic", cache_ttl=60)
+        component.cache_embedding = BagOfWordsEmbeddings()
+        component._vertex = SimpleNamespace(graph=SimpleNamespace(flow_id=flow_id, user_id="user-1"))
+        return component
+
+    model = FakeListChatModel(responses=["first", "second", "third"])
+    with patch("langflow.base.models.model.get_llm_cache_service", return_value=service):
+        first = await component_of("flow-1")._get_chat_result(runnable=model, stream=False, input_value="France?")
+        other_flow = await component_of("flow-2")._get_chat_result(runnable=model, stream=False, input_value="France?")
+        same_flow = await component_of("flow-1")._get_chat_result(runnable=model, stream=False, input_value="France?")
+
+    assert first.text == "first"
+    assert other_flow.text == "second"
+    assert same_flow.text == "first"
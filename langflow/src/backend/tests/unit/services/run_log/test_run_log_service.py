@@ -0,0 +1,153 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from langflow.services.database.models.transactions.model import TransactionBase, TransactionTable
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+from langflow.services.run_log.service import RunLogService
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.fixture
+def settings():
+    return SimpleNamespace(
+        max_transactions_to_keep=3,
+        max_vertex_builds_to_keep=10,
+        max_vertex_builds_per_vertex=2,
+        run_log_batch_size=100,
+        run_log_flush_interval=60,
+        run_log_sweep_interval=60,
+        prometheus_enabled=False,
+    )
+
+
+@pytest.fixture
+def service(async_session: AsyncSession, settings):
+    @asynccontextmanager
+    async def session_scope():
+        yield async_session
+
+    settings_service = SimpleNamespace(settings=settings)
+    with (
+        patch("langflow.services.run_log.service.session_scope", session_scope),
+        patch(
+            "langflow.services.database.models.transactions.crud.get_settings_service", return_value=settings_service
+        ),
+        patch(
+            "langflow.services.database.models.vertex_builds.crud.get_settings_service", return_value=settings_service
+        ),
+    ):
+        yield RunLogService(settings_service)
+
+
+def make_transaction(flow_id, offset: int = 0) -> TransactionBase:
+    return TransactionBase(
+        vertex_id="ChatInput-1",
+        status="success",
+        flow_id=flow_id,
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=offset),
+    )
+
+
+def make_vertex_build(flow_id, vertex_id: str = "ChatInput-1", offset: int = 0) -> VertexBuildBase:
+    return VertexBuildBase(
+        id=vertex_id,
+        flow_id=flow_id,
+        valid=True,
+        timestamp=datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=offset),
+    )
+
+
+async def count(async_session: AsyncSession, table, flow_id) -> int:
+    result = await async_session.execute(select(func.count()).select_from(table).where(table.flow_id == flow_id))
+    return result.scalar()
+
+
+async def test_writes_through_until_started(service, async_session):
+    flow_id = uuid4()
+
+    await service.log_transaction(make_transaction(flow_id))
+    await service.log_vertex_build(make_vertex_build(flow_id))
+
+    assert service.queue_depth == 0
+    assert await count(async_session, TransactionTable, flow_id) == 1
+    assert await count(async_session, VertexBuildTable, flow_id) == 1
+
+
+async def test_entries_are_buffered_until_flush(service, async_session):
+    flow_id = uuid4()
+    service.start()
+    try:
+        for i in range(5):
+            await service.log_transaction(make_transaction(flow_id, i))
+        await service.log_vertex_build(make_vertex_build(flow_id))
+
+        assert service.queue_depth == 6
+        assert await count(async_session, TransactionTable, flow_id) == 0
+
+        await service.flush()
+
+        assert service.queue_depth == 0
+        assert service.flush_count == 1
+        assert service.last_flush_latency is not None
+        assert await count(async_session, TransactionTable, flow_id) == 5
+        assert await count(async_session, VertexBuildTable, flow_id) == 1
+    finally:
+        await service.stop()
+
+
+async def test_sweep_enforces_retention(service, async_session):
+    flow_id = uuid4()
+    service.start()
+    try:
+        for i in range(5):
+            await service.log_transaction(make_transaction(flow_id, i))
+            await service.log_vertex_build(make_vertex_build(flow_id, offset=i))
+        await service.flush()
+        await service.sweep()
+
+        assert await count(async_session, TransactionTable, flow_id) == 3
+        assert await count(async_session, VertexBuildTable, flow_id) == 2
+        timestamps = (
+            await async_session.execute(select(TransactionTable.timestamp).where(TransactionTable.flow_id == flow_id))
+        ).scalars()
+        assert min(timestamps).replace(tzinfo=timezone.utc) == datetime(2024, 1, 1, 0, 0, 2, tzinfo=timezone.utc)
+    finally:
+        await service.stop()
+
+
+async def test_batch_size_triggers_flush(service, async_session, settings):
+    settings.run_log_batch_size = 3
+    service = RunLogService(SimpleNamespace(settings=settings))
+    flow_id = uuid4()
+    service.start()
+    try:
+        for i in range(3):
+            await service.log_transaction(make_transaction(flow_id, i))
+        for _ in range(50):
+            if service.flush_count:
+                break
+            await asyncio.sleep(0.01)
+
+        assert service.flush_count == 1
+        assert await count(async_session, TransactionTable, flow_id) == 3
+    finally:
+        await service.stop()
+
+
+async def test_stop_flushes_pending_entries(service, async_session):
+    flow_id = uuid4()
+    service.start()
+    for i in range(5):
+        await service.log_transaction(make_transaction(flow_id, i))
+
+    await service.stop()
+
+    assert not service.running
+    assert service.queue_depth == 0
+    assert await count(async_session, TransactionTable, flow_id) == 3
@@ -0,0 +1,139 @@
+import io
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+from langflow.services.storage.s3 import S3StorageService
+
+
+class LocalS3:
+    """In-memory stand-in for the S3 client, which records the thread of each request.
+
+    Objects are stored under `<bucket>/<key>`, and the parts of an upload must be sent to its bucket and key.
+    """
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, list[bytes]] = {}
+        self.upload_paths: dict[str, str] = {}
+        self.threads: set[int] = set()
+        self.aborted = 0
+
+    def _record(self):
+        self.threads.add(threading.get_ident())
+
+    def put_object(self, Bucket, Key, Body):  # noqa: N803
+        self._record()
+        self.objects[f"{Bucket}/{Key}"] = bytes(Body)
+
+    def create_multipart_upload(self, Bucket, Key):  # noqa: N803
+        self._record()
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = []
+        self.upload_paths[upload_id] = f"{Bucket}/{Key}"
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):  # noqa: N803
+        self._record()
+        assert self.upload_paths[UploadId] == f"{Bucket}/{Key}"
+        if Body == b"fail":
+            raise ClientError({"Error": {"Code": "500"}}, "UploadPart")
+        self.uploads[UploadId].append(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):  # noqa: N803
+        self._record()
+        assert self.upload_paths.pop(UploadId) == f"{Bucket}/{Key}"
+        assert [part["PartNumber"] for part in MultipartUpload["Parts"]] == list(
+            range(1, len(self.uploads[UploadId]) + 1)
+        )
+        self.objects[f"{Bucket}/{Key}"] = b"".join(self.uploads.pop(UploadId))
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):  # noqa: N803
+        self._record()
+        assert self.upload_paths.pop(UploadId) == f"{Bucket}/{Key}"
+        self.uploads.pop(UploadId)
+        self.aborted += 1
+
+    def get_object(self, Bucket, Key):  # noqa: N803
+        self._record()
+        if (path := f"{Bucket}/{Key}") not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": io.BytesIO(self.objects[path])}
+
+    def head_object(self, Bucket, Key):  # noqa: N803
+        return {"ContentLength": len(self.get_object(Bucket, Key)["Body"].getvalue())}
+
+    def delete_object(self, Bucket, Key):  # noqa: N803
+        self._record()
+        self.objects.pop(f"{Bucket}/{Key}", None)
+
+
+@pytest.fixture
+def s3():
+    return LocalS3()
+
+
+@pytest.fixture
+def service(s3, tmp_path):
+    settings = SimpleNamespace(
+        config_dir=str(tmp_path),
+        s3_bucket="langflow",
+        s3_endpoint_url=None,
+        s3_max_pool_connections=10,
+        s3_multipart_chunk_size=4,
+    )
+    with patch("langflow.services.storage.s3.boto3.client", return_value=s3):
+        return S3StorageService(None, SimpleNamespace(settings=settings))
+
+
+async def chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def test_small_file_is_put_in_one_request(service, s3):
+    await service.save_file("folder", "small.txt", b"abc")
+
+    assert s3.objects == {"langflow/folder/small.txt": b"abc"}
+    assert s3.uploads == {}
+    assert threading.get_ident() not in s3.threads
+
+
+async def test_large_stream_is_uploaded_in_parts(service, s3):
+    await service.save_file("folder", "large.txt", chunks(b"ab", b"cdefg", b"hij"))
+
+    assert s3.objects["langflow/folder/large.txt"] == b"abcdefghij"
+    assert s3.uploads == {}
+
+
+async def test_failed_part_aborts_the_upload(service, s3):
+    with pytest.raises(ClientError):
+        await service.save_file("folder", "broken.txt", chunks(b"abcd", b"fail"))
+
+    assert "langflow/folder/broken.txt" not in s3.objects
+    assert s3.aborted == 1
+
+
+async def test_file_is_streamed_in_chunks(service, s3):
+    s3.objects["langflow/folder/file.txt"] = b"abcdefghij"
+
+    stream = await service.get_file_stream("folder", "file.txt", chunk_size=3)
+
+    assert [chunk async for chunk in stream] == [b"abc", b"def", b"ghi", b"j"]
+    with pytest.raises(ClientError):
+        await service.get_file_stream("folder", "missing.txt")
+
+
+async def test_files_are_addressed_by_flow_id_keyword(service, s3):
+    # The API calls the storage service with keywords, which must match the names of the base class
+    await service.save_file(flow_id="flow", file_name="file.txt", data=b"abc")
+
+    assert await service.get_file(flow_id="flow", file_name="file.txt") == b"abc"
+    stream = await service.get_file_stream(flow_id="flow", file_name="file.txt")
+    assert [chunk async for chunk in stream] == [b"abc"]
+    assert await service.get_file_size(flow_id="flow", file_name="file.txt") == 3
+    await service.delete_file(flow_id="flow", file_name="file.txt")
+    assert s3.objects == {}
@@ -240,3 +240,62 @@ async def test_create_variable(service, session: AsyncSession):
     assert result.type == CREDENTIAL_TYPE
     assert isinstance(result.created_at, datetime)
     assert isinstance(result.updated_at, datetime)
+
+
+async def test_load_variables__get_variable_does_not_query(service, session: AsyncSession):
+    user_id = uuid4()
+    field = ""
+    values = {f"VAR_{i}": f"value{i}" for i in range(3)}
+    for name, value in values.items():
+        await service.create_variable(user_id, name, value, session=session)
+
+    await service.load_variables(str(user_id), [*values, "MISSING"], session=session)
+
+    with patch.object(session, "exec", side_effect=AssertionError("get_variable should not query")):
+        for name, value in values.items():
+            assert await service.get_variable(user_id, name, field, session=session) == value
+    with pytest.raises(ValueError, match="MISSING variable not found."):
+        await service.get_variable(user_id, "MISSING", field, session=session)
+
+
+async def test_load_variables__credential_check_applies_to_cached_values(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", type_=CREDENTIAL_TYPE, session=session)
+    await service.load_variables(user_id, ["name"], session=session)
+
+    with pytest.raises(TypeError, match="cannot be used in a Session ID field"):
+        await service.get_variable(user_id, "name", "session_id", session=session)
+
+
+async def test_update_and_delete_evict_cached_variables(service, session: AsyncSession):
+    user_id = uuid4()
+    field = ""
+    saved = await service.create_variable(user_id, "name", "value", session=session)
+    assert await service.get_variable(user_id, "name", field, session=session) == "value"
+
+    await service.update_variable(user_id, "name", "new_value", session=session)
+    assert await service.get_variable(user_id, "name", field, session=session) == "new_value"
+
+    await service.update_variable_fields(
+        user_id, saved.id, VariableUpdate(id=saved.id, name="renamed", value="renamed_value"), session=session
+    )
+    assert await service.get_variable(user_id, "renamed", field, session=session) == "renamed_value"
+    with pytest.raises(ValueError, match="name variable not found."):
+        await service.get_variable(user_id, "name", field, session=session)
+
+    await service.delete_variable(user_id, "renamed", session=session)
+    with pytest.raises(ValueError, match="renamed variable not found."):
+        await service.get_variable(user_id, "renamed", field, session=session)
+
+
+async def test_variable_cache_can_be_disabled(session: AsyncSession):
+    settings_service = get_settings_service()
+    with patch.object(settings_service.settings, "variable_cache_ttl", 0):
+        service = DatabaseVariableService(settings_service)
+    user_id = uuid4()
+    await service.create_variable(user_id, "name", "value", session=session)
+
+    await service.load_variables(user_id, ["name"], session=session)
+
+    assert service._cache is None
+    assert await service.get_variable(user_id, "name", "", session=session) == "value"
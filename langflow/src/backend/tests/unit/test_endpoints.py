@@ -281,6 +281,25 @@ async def test_get_vertices(client, added_flow_webhook_test, logged_in_headers):
     assert set(ids) == {"ChatInput"}
 
 
+async def test_build_vertex_reads_the_run_of_the_vertices_order(client, added_flow_webhook_test, logged_in_headers):
+    from langflow.graph.graph.checkpoint import run_cache_key
+    from langflow.services.deps import get_chat_service
+
+    flow_id = added_flow_webhook_test["id"]
+    response = await client.post(f"/api/v1/build/{flow_id}/vertices", headers=logged_in_headers)
+    order = response.json()
+    run_key = run_cache_key(flow_id, order["run_id"])
+    assert await get_chat_service().cache_service.contains(run_key)
+    assert not await get_chat_service().cache_service.contains(flow_id)
+
+    for params in ({"run_id": order["run_id"]}, {}):
+        response = await client.post(
+            f"/api/v1/build/{flow_id}/vertices/{order['ids'][0]}", params=params, headers=logged_in_headers
+        )
+        assert response.status_code == 200, response.text
+        assert response.json()["valid"]
+
+
 async def test_build_vertex_invalid_flow_id(client, logged_in_headers):
     uuid = uuid4()
     response = await client.post(f"/api/v1/build/{uuid}/vertices/vertex_id", headers=logged_in_headers)
@@ -1,17 +1,22 @@
 from datetime import datetime, timezone
+from unittest.mock import patch
 from uuid import UUID, uuid4
 
 import pytest
 from langflow.memory import (
+    MessageDeltaWriter,
     aadd_messages,
     aadd_messagetables,
     add_messages,
     adelete_messages,
     aget_messages,
+    aget_recent_messages,
     astore_message,
     aupdate_messages,
+    delete_message,
     delete_messages,
     get_messages,
+    message_history_cache,
 )
 from langflow.schema.content_block import ContentBlock
 from langflow.schema.content_types import TextContent, ToolContent
@@ -25,6 +30,22 @@ from langflow.services.deps import session_scope
 from langflow.services.tracing.utils import convert_to_langchain_type
 
 
+@pytest.fixture
+def history_cache():
+    message_history_cache.configure(tail_size=5, ttl=60)
+    yield message_history_cache
+    message_history_cache.reset()
+
+
+async def store_history(session_id: str, start: int, stop: int) -> None:
+    for i in range(start, stop):
+        sender = "User" if i % 2 == 0 else "Machine"
+        timestamp = f"2025-01-01 00:00:{i:02d} UTC"
+        await astore_message(
+            Message(text=f"{i}", sender=sender, sender_name=sender, session_id=session_id, timestamp=timestamp)
+        )
+
+
 @pytest.fixture
 async def created_message():
     async with session_scope() as session:
@@ -51,11 +72,23 @@ async def created_messages(async_session):  # noqa: ARG001
 def test_get_messages():
     add_messages(
         [
-            Message(text="Test message 1", sender="User", sender_name="User", session_id="session_id2"),
-            Message(text="Test message 2", sender="User", sender_name="User", session_id="session_id2"),
+            Message(
+                text="Test message 1",
+                sender="User",
+                sender_name="User",
+                session_id="session_id2",
+                timestamp="2025-01-01 00:00:00 UTC",
+            ),
+            Message(
+                text="Test message 2",
+                sender="User",
+                sender_name="User",
+                session_id="session_id2",
+                timestamp="2025-01-01 00:00:01 UTC",
+            ),
         ]
     )
-    messages = get_messages(sender="User", session_id="session_id2", limit=2)
+    messages = get_messages(sender="User", session_id="session_id2", order="ASC", limit=2)
     assert len(messages) == 2
     assert messages[0].text == "Test message 1"
     assert messages[1].text == "Test message 2"
@@ -65,11 +98,23 @@ def test_get_messages():
 async def test_aget_messages():
     await aadd_messages(
         [
-            Message(text="Test message 1", sender="User", sender_name="User", session_id="session_id2"),
-            Message(text="Test message 2", sender="User", sender_name="User", session_id="session_id2"),
+            Message(
+                text="Test message 1",
+                sender="User",
+                sender_name="User",
+                session_id="session_id2",
+                timestamp="2025-01-01 00:00:00 UTC",
+            ),
+            Message(
+                text="Test message 2",
+                sender="User",
+                sender_name="User",
+                session_id="session_id2",
+                timestamp="2025-01-01 00:00:01 UTC",
+            ),
         ]
     )
-    messages = await aget_messages(sender="User", session_id="session_id2", limit=2)
+    messages = await aget_messages(sender="User", session_id="session_id2", order="ASC", limit=2)
     assert len(messages) == 2
     assert messages[0].text == "Test message 1"
     assert messages[1].text == "Test message 2"
@@ -143,6 +188,93 @@ async def test_astore_message():
     assert stored_messages[0].text == "Stored message"
 
 
+@pytest.mark.usefixtures("client")
+@pytest.mark.parametrize("tail_size", [0, 5])
+async def test_aget_recent_messages(tail_size):
+    message_history_cache.configure(tail_size=tail_size, ttl=60)
+    try:
+        await store_history("recent_session_id", 0, 8)
+
+        messages = await aget_recent_messages("recent_session_id", 3)
+        assert [m.text for m in messages] == ["7", "6", "5"]
+        messages = await aget_recent_messages("recent_session_id", 3, order="ASC")
+        assert [m.text for m in messages] == ["5", "6", "7"]
+        messages = await aget_recent_messages("recent_session_id", 2, sender="User")
+        assert [m.text for m in messages] == ["6", "4"]
+        # More messages than the cache holds are read from the database
+        messages = await aget_recent_messages("recent_session_id", 6, sender="User")
+        assert [m.text for m in messages] == ["6", "4", "2", "0"]
+    finally:
+        message_history_cache.reset()
+
+
+@pytest.mark.usefixtures("client")
+async def test_stored_messages_update_the_history_cache(history_cache):
+    await store_history("cached_session_id", 0, 3)
+    await aget_recent_messages("cached_session_id", 1)
+    assert history_cache.get("cached_session_id") is not None
+
+    with patch("langflow.memory._aget_message_rows", side_effect=AssertionError("queried the database")):
+        await store_history("cached_session_id", 3, 7)
+        messages = await aget_recent_messages("cached_session_id", 5, order="ASC")
+    assert [m.text for m in messages] == ["2", "3", "4", "5", "6"]
+
+    await adelete_messages("cached_session_id")
+    assert history_cache.get("cached_session_id") is None
+    assert await aget_recent_messages("cached_session_id", 5) == []
+
+
+@pytest.mark.usefixtures("client")
+async def test_updated_and_deleted_messages_update_the_history_cache(history_cache):
+    await store_history("cached_session_id", 0, 2)
+    messages = await aget_recent_messages("cached_session_id", 2)
+
+    messages[0].text = "edited"
+    await aupdate_messages(messages[0])
+    await delete_message(messages[1].id)
+
+    with patch("langflow.memory._aget_message_rows", side_effect=AssertionError("queried the database")):
+        assert [m.text for m in await aget_recent_messages("cached_session_id", 2)] == ["edited"]
+    assert history_cache.get("cached_session_id") is not None
+
+
+@pytest.mark.usefixtures("client")
+async def test_message_delta_writer():
+    stored = await astore_message(
+        Message(
+            text="Hello",
+            sender="AI",
+            sender_name="AI",
+            session_id="delta_session_id",
+            properties={"state": "partial"},
+        )
+    )
+    message = stored[0]
+    writer = MessageDeltaWriter(message, interval=60)
+
+    message.text += " world"
+    await writer.push(message)
+    assert (await aget_messages(session_id="delta_session_id"))[0].text == "Hello"
+
+    message.content_blocks = [ContentBlock(title="Agent Steps", contents=[TextContent(type="text", text="Step")])]
+    await writer.flush()
+    stored_message = (await aget_messages(session_id="delta_session_id"))[0]
+    assert stored_message.text == "Hello world"
+    assert stored_message.content_blocks[0].contents[0].text == "Step"
+    assert stored_message.properties.state == "partial"
+
+    # Nothing changed since the last write
+    with patch("langflow.memory.session_scope", side_effect=AssertionError("wrote the message")):
+        await writer.push(message)
+        await writer.flush()
+
+    message.text = "Rewritten"
+    await writer.push(message)
+    writer.discard()
+    await writer.flush()
+    assert (await aget_messages(session_id="delta_session_id"))[0].text == "Hello world"
+
+
 @pytest.mark.parametrize("method_name", ["message", "convert_to_langchain_type"])
 def test_convert_to_langchain(method_name):
     def convert(value):